@@ -0,0 +1,26 @@
+"""Compact scenario draft event logs that have gone quiet past retention."""
+
+from __future__ import annotations
+
+import argparse
+from types import SimpleNamespace
+
+from backend.scenario_drafts import compact_stale_events
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description='Delete scenario draft events older than SCENARIO_DRAFT_EVENT_RETENTION_HOURS.')
+    parser.add_argument('--workspace-id', help='Only compact drafts of this workspace (default: every workspace).')
+    parser.add_argument('--database-url')
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    removed = compact_stale_events(SimpleNamespace(workspace_id=args.workspace_id, database_url=args.database_url))
+    print(f'Compacted {sum(removed.values())} events across {len(removed)} scenario drafts')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
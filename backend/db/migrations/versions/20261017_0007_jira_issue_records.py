@@ -0,0 +1,37 @@
+"""jira issue store
+
+Revision ID: 20261017_0007
+Revises: 20260604_0006
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '20261017_0007'
+down_revision = '20260604_0006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'jira_issue_records',
+        sa.Column('id', sa.String(length=36), nullable=False),
+        sa.Column('site', sa.String(length=255), nullable=False),
+        sa.Column('issue_key', sa.String(length=64), nullable=False),
+        sa.Column('issue_id', sa.String(length=64), nullable=True),
+        sa.Column('jira_updated', sa.String(length=64), nullable=False),
+        sa.Column('fields', sa.JSON(), nullable=False),
+        sa.Column('field_names', sa.JSON(), nullable=False),
+        sa.Column('fetched_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('site', 'issue_key', name='uq_jira_issue_records_site_key'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('jira_issue_records')
@@ -0,0 +1,81 @@
+"""scenario draft version deltas
+
+Revision ID: 20261017_0008
+Revises: 20261017_0007
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '20261017_0008'
+down_revision = '20261017_0007'
+branch_labels = None
+depends_on = None
+
+
+versions = sa.table(
+    'scenario_draft_versions',
+    sa.column('id', sa.String()),
+    sa.column('scenario_draft_id', sa.String()),
+    sa.column('version_number', sa.Integer()),
+    sa.column('overrides', sa.JSON()),
+    sa.column('is_checkpoint', sa.Boolean()),
+    sa.column('overrides_delta', sa.JSON()),
+    sa.column('override_count', sa.Integer()),
+)
+
+
+def upgrade() -> None:
+    op.add_column(
+        'scenario_draft_versions',
+        sa.Column('is_checkpoint', sa.Boolean(), nullable=False, server_default=sa.true()),
+    )
+    op.add_column('scenario_draft_versions', sa.Column('overrides_delta', sa.JSON(), nullable=True))
+    op.add_column('scenario_draft_versions', sa.Column('override_count', sa.Integer(), nullable=True))
+    connection = op.get_bind()
+    for row in connection.execute(sa.select(versions.c.id, versions.c.overrides)):
+        connection.execute(
+            versions.update().where(versions.c.id == row.id).values(override_count=len(row.overrides or {}))
+        )
+
+
+def downgrade() -> None:
+    connection = op.get_bind()
+    rows = connection.execute(
+        sa.select(
+            versions.c.id,
+            versions.c.scenario_draft_id,
+            versions.c.overrides,
+            versions.c.is_checkpoint,
+            versions.c.overrides_delta,
+        ).order_by(versions.c.scenario_draft_id, versions.c.version_number)
+    )
+    draft_id = None
+    overrides = {}
+    for row in rows.fetchall():
+        if row.scenario_draft_id != draft_id:
+            draft_id = row.scenario_draft_id
+            overrides = {}
+        if row.is_checkpoint:
+            overrides = row.overrides or {}
+        else:
+            overrides = _apply_patch(overrides, row.overrides_delta)
+            connection.execute(versions.update().where(versions.c.id == row.id).values(overrides=overrides))
+    op.drop_column('scenario_draft_versions', 'override_count')
+    op.drop_column('scenario_draft_versions', 'overrides_delta')
+    op.drop_column('scenario_draft_versions', 'is_checkpoint')
+
+
+def _apply_patch(overrides, operations):
+    result = dict(overrides)
+    for operation in operations or []:
+        key = operation['path'][1:].replace('~1', '/').replace('~0', '~')
+        if operation['op'] == 'remove':
+            result.pop(key, None)
+        else:
+            result[key] = operation.get('value')
+    return result
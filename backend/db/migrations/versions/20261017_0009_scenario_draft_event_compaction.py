@@ -0,0 +1,28 @@
+"""scenario draft event compaction
+
+Revision ID: 20261017_0009
+Revises: 20261017_0008
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '20261017_0009'
+down_revision = '20261017_0008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'scenario_drafts',
+        sa.Column('compacted_event_number', sa.Integer(), nullable=False, server_default='0'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('scenario_drafts', 'compacted_event_number')
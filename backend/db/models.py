@@ -248,6 +248,8 @@ class ScenarioDraft(Base):
     scenario_source_hash: Mapped[Optional[str]] = mapped_column(String(128))
     overrides: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
     draft_revision: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+    # Events up to this number may have been pruned; joins below it start from a snapshot.
+    compacted_event_number: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default=text('0'))
     created_by: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey('users.id', ondelete='SET NULL'))
     updated_by: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey('users.id', ondelete='SET NULL'))
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=_utcnow)
@@ -272,7 +274,11 @@ class ScenarioDraftVersion(Base):
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     scope_payload: Mapped[dict] = mapped_column(JSON, nullable=False)
     scenario_source_hash: Mapped[Optional[str]] = mapped_column(String(128))
+    # Full overrides on checkpoints; ``{}`` on delta versions, which store a JSON patch from the previous version.
     overrides: Mapped[dict] = mapped_column(JSON, nullable=False)
+    is_checkpoint: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True, server_default=text('true'))
+    overrides_delta: Mapped[Optional[list]] = mapped_column(JSON)
+    override_count: Mapped[Optional[int]] = mapped_column(Integer)
     created_by: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey('users.id', ondelete='SET NULL'))
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=_utcnow)
     change_note: Mapped[Optional[str]] = mapped_column(String(255))
@@ -501,6 +507,22 @@ class JiraProjectAccess(Base):
     checked_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=_utcnow)
 
 
+class JiraIssueRecord(Base):
+    __tablename__ = 'jira_issue_records'
+    __table_args__ = (
+        UniqueConstraint('site', 'issue_key', name='uq_jira_issue_records_site_key'),
+    )
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=_uuid)
+    site: Mapped[str] = mapped_column(String(255), nullable=False)
+    issue_key: Mapped[str] = mapped_column(String(64), nullable=False)
+    issue_id: Mapped[Optional[str]] = mapped_column(String(64))
+    jira_updated: Mapped[str] = mapped_column(String(64), nullable=False, default='')
+    fields: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
+    field_names: Mapped[list] = mapped_column(JSON, nullable=False, default=list)
+    fetched_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=_utcnow, onupdate=_utcnow)
+
+
 class AuditEvent(Base):
     __tablename__ = 'audit_events'
 
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 import logging
 import time
 from typing import Callable
 
+from backend.services.jira_fanout import shared_jira_fanout
+
+
+EPM_AGGREGATE_ROLLUP_WORKERS = 8
+
 
 @dataclass
 class EpmAggregateDependencies:
@@ -77,6 +81,7 @@ def build_all_epm_projects_rollup(tab, sprint, deps: EpmAggregateDependencies, s
     rollup_dependencies = deps.build_epm_rollup_dependencies(sub_goal_keys=sub_goal_keys)
     entries_by_project_id = {}
     issue_memberships = {}
+    stale_project_ids = set()
 
     def build_entry(project):
         project_id = deps.get_epm_project_payload_identity(project)
@@ -85,7 +90,9 @@ def build_all_epm_projects_rollup(tab, sprint, deps: EpmAggregateDependencies, s
                 'project': project,
                 'rollup': deps.build_empty_epm_rollup_payload(project, metadata_only=True),
             }
-        rollup, status, _headers = deps.build_per_project_rollup(project_id, tab, sprint, rollup_dependencies)
+        rollup, status, headers = deps.build_per_project_rollup(project_id, tab, sprint, rollup_dependencies)
+        if 'cache-stale' in str((headers or {}).get('Server-Timing') or ''):
+            stale_project_ids.add(project_id)
         if status != 200:
             rollup = deps.build_empty_epm_rollup_payload(project, metadata_only=True)
         return project_id, {'project': project, 'rollup': rollup}
@@ -99,11 +106,12 @@ def build_all_epm_projects_rollup(tab, sprint, deps: EpmAggregateDependencies, s
             entries_by_project_id[project_id] = entry
 
     rollups_started = deps.now()
-    with ThreadPoolExecutor(max_workers=8) as executor:
-        future_to_project = {executor.submit(build_entry, project): project for project in labeled_projects}
-        for future in as_completed(future_to_project):
-            project_id, entry = future.result()
-            entries_by_project_id[project_id] = entry
+    outcome = shared_jira_fanout().run(
+        ((index, build_entry, (project,)) for index, project in enumerate(labeled_projects)),
+        max_parallel=EPM_AGGREGATE_ROLLUP_WORKERS,
+    )
+    for project_id, entry in outcome.results.values():
+        entries_by_project_id[project_id] = entry
     rollups_ms = round((deps.now() - rollups_started) * 1000, 1)
 
     ordered_entries = []
@@ -139,6 +147,8 @@ def build_all_epm_projects_rollup(tab, sprint, deps: EpmAggregateDependencies, s
         rollups_ms,
         total_ms,
     )
-    return payload, 200, {
-        'Server-Timing': f'home-projects;dur={projects_ms}, epm-rollups;dur={rollups_ms}, total;dur={total_ms}'
-    }
+    server_timing = f'home-projects;dur={projects_ms}, epm-rollups;dur={rollups_ms}, total;dur={total_ms}'
+    if stale_project_ids:
+        # At least one project rollup was served stale and is refreshing in the background.
+        server_timing = f'cache-stale;desc="{len(stale_project_ids)} projects", {server_timing}'
+    return payload, 200, {'Server-Timing': server_timing}
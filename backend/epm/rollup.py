@@ -7,6 +7,14 @@ from backend.auth.cache_policy import (
     jira_home_partitioned_process_cache_enabled,
 )
 from backend.epm.scope import build_rollup_jqls, should_apply_epm_sprint
+from backend.services.cache_revalidation import (
+    CACHE_EXPIRED,
+    CACHE_FRESH,
+    CACHE_STALE,
+    STALE_SERVER_TIMING,
+    classify_cache_entry,
+    revalidate_in_background,
+)
 
 
 @dataclass
@@ -35,6 +43,8 @@ class EpmRollupDependencies:
     cache_ttl_seconds: int
     context: object = None
     now: Callable = time.time
+    single_flight: object = None
+    cache_hard_ttl_seconds: int = 0
 
 
 def _issue_type_name(issue, normalize_text):
@@ -145,12 +155,29 @@ def build_per_project_rollup(project_id, tab, sprint, deps):
     cache_enabled = jira_home_partitioned_process_cache_enabled(deps.context)
     cache_key = build_jira_home_process_cache_key(deps.context, f"{project_id}::{tab}::{sprint}::{label}::{base_jql}")
     cached = None
+    cache_state = CACHE_EXPIRED
     if cache_enabled:
         with deps.cache_lock:
             cached = deps.cache.get(cache_key)
-    if cache_enabled and cached and (deps.now() - cached['timestamp']) < deps.cache_ttl_seconds:
+        cache_state = classify_cache_entry(cached, deps.cache_ttl_seconds, deps.cache_hard_ttl_seconds, deps.now())
+    if cache_state == CACHE_FRESH:
         return cached['data'], 200, {'Server-Timing': 'cache;dur=1'}
 
+    def build():
+        return _build_uncached_project_rollup(project, label, rollup_jqls, tab, sprint, base_jql, cache_enabled, cache_key, deps)
+
+    if cache_state == CACHE_STALE and deps.single_flight is not None:
+        # Serve the stale rollup now; one background rebuild per key repopulates the cache.
+        revalidate_in_background(deps.single_flight, ('epm-rollup', cache_key), build)
+        return cached['data'], 200, {'Server-Timing': STALE_SERVER_TIMING}
+    if cache_enabled and deps.single_flight is not None:
+        # Concurrent misses for the same partitioned key share one Jira fan-out.
+        payload, status, headers = deps.single_flight.do(('epm-rollup', cache_key), build)
+        return payload, status, dict(headers)
+    return build()
+
+
+def _build_uncached_project_rollup(project, label, rollup_jqls, tab, sprint, base_jql, cache_enabled, cache_key, deps):
     started = time.perf_counter()
     s1_jql, child_predicate = rollup_jqls
     headers = deps.build_jira_headers()
@@ -1,5 +1,6 @@
 """Jira request helpers shared by the Flask server."""
 
+from email.utils import parsedate_to_datetime
 import json
 import random
 import threading
@@ -7,6 +8,8 @@ import time
 
 import requests
 
+from backend.services.jira_fanout import shared_jira_fanout
+
 
 RETRYABLE_JIRA_STATUS_CODES = {429, 500, 502, 503, 504}
 
@@ -15,6 +18,17 @@ RETRYABLE_JIRA_STATUS_CODES = {429, 500, 502, 503, 504}
 # the retry budget is spent on actual retries instead of one long hang.
 DEFAULT_CONNECT_TIMEOUT_SECONDS = 5.0
 
+# Upper bound on concurrent search shards per request. Jira token pagination is
+# strictly serial, so parallelism comes from splitting one JQL into disjoint
+# slices (team-ID chunks, projects, key chunks) and walking each slice alone.
+DEFAULT_SEARCH_SHARD_WORKERS = 4
+
+# Process-wide outbound pacing. Jira Cloud publishes no fixed quota, so the
+# limiter starts generous, halves on 429/Retry-After and recovers additively.
+DEFAULT_RATE_LIMIT_PER_SECOND = 25.0
+DEFAULT_RATE_LIMIT_MIN_PER_SECOND = 1.0
+DEFAULT_RATE_LIMIT_RECOVERY_PER_SECOND = 1.0
+
 
 def _noop_log(*_parts):
     return None
@@ -87,6 +101,143 @@ class JiraCircuitBreaker:
             self._opened_until = 0.0
 
 
+def parse_retry_after_seconds(value, now=None):
+    """Seconds to wait from a ``Retry-After`` header (delta-seconds or HTTP-date)."""
+    if not isinstance(value, (str, int, float)) or isinstance(value, bool):
+        return None
+    text = str(value).strip()
+    if not text:
+        return None
+    try:
+        return max(0.0, float(text))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(text)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - (time.time() if now is None else now))
+
+
+class JiraRateLimiter:
+    """AIMD token bucket shared by every outbound Jira call in the process.
+
+    Callers reserve a token before each request; when the bucket is empty the
+    reservation is scheduled ``1 / rate`` after the previous one, so waiting
+    threads are spaced out instead of waking together. A 429 (or any
+    ``Retry-After``) halves the rate, at most once per ``decrease_cooldown``
+    so one burst of rejections counts once, and pauses every caller until the
+    server's deadline. Without throttling the rate climbs back by
+    ``recovery_per_second`` each second up to ``max_rate``. ``max_rate <= 0``
+    disables pacing.
+    """
+
+    def __init__(self, max_rate=DEFAULT_RATE_LIMIT_PER_SECOND, *, burst=None,
+                 min_rate=DEFAULT_RATE_LIMIT_MIN_PER_SECOND,
+                 recovery_per_second=DEFAULT_RATE_LIMIT_RECOVERY_PER_SECOND,
+                 decrease_factor=0.5, decrease_cooldown=1.0,
+                 clock=time.monotonic, sleep_fn=time.sleep):
+        self.max_rate = float(max_rate)
+        self.enabled = self.max_rate > 0
+        self.min_rate = min(max(0.01, float(min_rate)), self.max_rate) if self.enabled else 0.0
+        self.burst = max(1.0, float(burst if burst is not None else self.max_rate or 1.0))
+        self.recovery_per_second = max(0.0, float(recovery_per_second))
+        self.decrease_factor = min(0.95, max(0.05, float(decrease_factor)))
+        self.decrease_cooldown = max(0.0, float(decrease_cooldown))
+        self._clock = clock
+        self._sleep = sleep_fn
+        self._lock = threading.Lock()
+        self._rate = self.max_rate
+        self._tokens = self.burst
+        self._updated_at = clock()
+        self._paused_until = 0.0
+        self._last_decrease_at = None
+        self._counters = {
+            'acquired': 0,
+            'throttledWaits': 0,
+            'throttledWaitSeconds': 0.0,
+            'maxWaitSeconds': 0.0,
+            'rejectedOverBudget': 0,
+            'rateLimitedResponses': 0,
+            'rateDecreases': 0,
+        }
+
+    def _refill_locked(self, now):
+        elapsed = max(0.0, now - self._updated_at)
+        self._updated_at = now
+        if now >= self._paused_until and self._rate < self.max_rate:
+            self._rate = min(self.max_rate, self._rate + self.recovery_per_second * elapsed)
+        self._tokens = min(self.burst, self._tokens + self._rate * elapsed)
+
+    def acquire(self, max_wait=None, sleep_fn=None):
+        """Reserve one request slot; returns seconds waited, or None if over ``max_wait``."""
+        if not self.enabled:
+            return 0.0
+        with self._lock:
+            now = self._clock()
+            self._refill_locked(now)
+            wait = max(0.0, self._paused_until - now)
+            if self._tokens < 1:
+                wait = max(wait, (1 - self._tokens) / self._rate)
+            if max_wait is not None and wait > max_wait:
+                self._counters['rejectedOverBudget'] += 1
+                return None
+            self._tokens -= 1
+            self._counters['acquired'] += 1
+            if wait > 0:
+                self._counters['throttledWaits'] += 1
+                self._counters['throttledWaitSeconds'] += wait
+                self._counters['maxWaitSeconds'] = max(self._counters['maxWaitSeconds'], wait)
+        if wait > 0:
+            (sleep_fn or self._sleep)(wait)
+        return wait
+
+    def record_throttle(self, retry_after_seconds=None):
+        if not self.enabled:
+            return
+        with self._lock:
+            now = self._clock()
+            self._refill_locked(now)
+            self._counters['rateLimitedResponses'] += 1
+            if retry_after_seconds:
+                self._paused_until = max(self._paused_until, now + float(retry_after_seconds))
+            if self._last_decrease_at is None or now - self._last_decrease_at >= self.decrease_cooldown:
+                self._rate = max(self.min_rate, self._rate * self.decrease_factor)
+                self._tokens = min(self._tokens, 0.0)
+                self._last_decrease_at = now
+                self._counters['rateDecreases'] += 1
+
+    def observe(self, response):
+        """Feed a response back: 429s and ``Retry-After`` shrink the rate and pause callers.
+
+        Returns the ``Retry-After`` delay in seconds when the response carried one.
+        """
+        status = getattr(response, 'status_code', None)
+        headers = getattr(response, 'headers', None)
+        retry_after = None
+        if isinstance(headers, dict) or hasattr(headers, 'lower_items'):
+            retry_after = parse_retry_after_seconds(headers.get('Retry-After'))
+        if status == 429 or retry_after is not None:
+            self.record_throttle(retry_after)
+        return retry_after
+
+    def stats(self):
+        with self._lock:
+            now = self._clock()
+            self._refill_locked(now)
+            return {
+                'enabled': self.enabled,
+                'ratePerSecond': round(self._rate, 3),
+                'maxRatePerSecond': self.max_rate,
+                'minRatePerSecond': self.min_rate,
+                'burst': self.burst,
+                'pausedForSeconds': round(max(0.0, self._paused_until - now), 3),
+                **{key: round(value, 3) if isinstance(value, float) else value for key, value in self._counters.items()},
+            }
+
+
 def _build_jira_unavailable_response(message, attempts=0, elapsed_seconds=0.0, upstream_status=None, circuit=None,
                                      response_cls=None):
     payload = {
@@ -104,13 +255,19 @@ def _build_jira_unavailable_response(message, attempts=0, elapsed_seconds=0.0, u
 
 
 def resilient_jira_get(url, *, params=None, headers=None, timeout=30, connect_timeout=None,
-                       session=None, breaker=None,
+                       session=None, breaker=None, limiter=None,
                        now_fn=None, sleep_fn=None, rand_fn=None,
                        max_attempts=None, max_elapsed_seconds=None,
                        base_delay_seconds=None, max_delay_seconds=None,
                        log_debug_fn=None, log_info_fn=None, log_warning_fn=None, log_error_fn=None,
                        unavailable_response_fn=None, retryable_status_codes=None):
-    """GET with bounded retries + circuit breaker for Jira upstream calls."""
+    """GET with bounded retries + circuit breaker for Jira upstream calls.
+
+    With a ``limiter`` every attempt is paced by the shared rate limiter. A
+    retry after a ``Retry-After`` response waits in the limiter (with every
+    other caller) instead of in its own backoff sleep; a 429 without one lowers
+    the shared rate and still backs off exponentially.
+    """
     if session is None:
         raise ValueError('session is required')
     if breaker is None:
@@ -150,12 +307,27 @@ def resilient_jira_get(url, *, params=None, headers=None, timeout=30, connect_ti
     attempts = 0
 
     while attempts < max_attempts:
+        if limiter is not None:
+            waited = limiter.acquire(max_wait=max(0.0, max_elapsed_seconds - (now_fn() - started_at)), sleep_fn=sleep_fn)
+            if waited is None:
+                log_warning_fn(f'Jira GET rate limit wait exceeds retry budget attempt={attempts + 1}')
+                return unavailable_response_fn(
+                    'Jira is rate limiting requests. Please retry shortly.',
+                    attempts=attempts,
+                    elapsed_seconds=now_fn() - started_at,
+                    upstream_status=last_status,
+                    circuit=breaker_state
+                )
         attempts += 1
         attempt_started = now_fn()
+        paced_by_limiter = False
         try:
             response = session.get(url, params=params, headers=headers, timeout=request_timeout)
             latency_ms = round((now_fn() - attempt_started) * 1000, 1)
             last_status = getattr(response, 'status_code', None)
+            # Only a Retry-After the limiter will wait out replaces the backoff; a bare 429 just
+            # lowers the shared rate, which alone would space retries ~1/rate apart.
+            paced_by_limiter = limiter is not None and limiter.observe(response) is not None
             if last_status not in retryable_status_codes:
                 breaker.record_success()
                 log_debug_fn(f'Jira GET ok status={last_status} attempt={attempts} latency_ms={latency_ms}')
@@ -187,6 +359,9 @@ def resilient_jira_get(url, *, params=None, headers=None, timeout=30, connect_ti
                 circuit=state
             )
 
+        if paced_by_limiter:
+            log_info_fn(f'Jira GET retry paced by rate limiter attempt={attempts + 1}')
+            continue
         delay = min(max_delay_seconds, base_delay_seconds * (2 ** (attempts - 1)))
         jitter = min(0.25, delay * 0.25) * rand_fn()
         total_delay = delay + jitter
@@ -265,29 +440,195 @@ def fetch_issues_by_jql(jql, fields_list, *, max_results=500, search_request, co
     """Fetch issues by JQL with Jira search nextPageToken pagination."""
     log_warning_fn = log_warning_fn or _noop_log
 
-    results = []
+    page = fetch_search_pages(
+        jql,
+        fields_list,
+        search_request=lambda payload: search_request(payload, context=context),
+        max_results=max_results,
+    )
+    if page.error is not None:
+        log_warning_fn(f'Scenario fetch error: status={page.error.status_code}')
+    return page.issues
+
+
+def chunk_values(values, chunk_size):
+    values = list(values or [])
+    size = max(1, int(chunk_size))
+    return [values[start:start + size] for start in range(0, len(values), size)]
+
+
+class JqlShard:
+    """One independent slice of a search; ``max_results`` caps this slice only."""
+    __slots__ = ('label', 'jql', 'max_results')
+
+    def __init__(self, label, jql, max_results=None):
+        self.label = str(label)
+        self.jql = jql
+        self.max_results = max_results
+
+
+class JqlSearchPages:
+    """Issues collected from one JQL page walk, plus the first failing response."""
+    __slots__ = ('issues', 'names', 'total', 'error', 'pages', 'duration_ms', 'label', 'jql', 'truncated')
+
+    def __init__(self, label='', jql=''):
+        self.label = label
+        self.jql = jql
+        self.truncated = False
+        self.issues = []
+        self.names = {}
+        self.total = None
+        self.error = None
+        self.pages = 0
+        self.duration_ms = 0.0
+
+
+def fetch_search_pages(jql, fields_list, *, search_request, max_results=None, page_size=100, expand=None,
+                       label='', now_fn=None):
+    """Walk ``nextPageToken`` pages for one JQL until ``isLast`` or ``max_results``.
+
+    ``search_request(payload)`` is called once per page. A non-200 page stops the
+    walk and is kept on ``error`` with whatever was collected before it;
+    ``truncated`` is set when ``max_results`` stopped the walk before Jira's last page.
+    """
+    now_fn = now_fn or time.perf_counter
+    started_at = now_fn()
+    result = JqlSearchPages(label, jql)
     next_page_token = None
-    page_size = 100
-    while len(results) < max_results:
-        remaining = max_results - len(results)
-        page_limit = min(page_size, remaining)
+    while max_results is None or len(result.issues) < max_results:
+        page_limit = page_size if max_results is None else min(page_size, max_results - len(result.issues))
         payload = {
             'jql': jql,
             'maxResults': page_limit,
             'fields': fields_list,
         }
+        if expand:
+            payload['expand'] = expand
         if next_page_token:
             payload['nextPageToken'] = next_page_token
-        response = search_request(payload, context=context)
+        response = search_request(payload)
+        result.pages += 1
         if response.status_code != 200:
-            log_warning_fn(f'Scenario fetch error: status={response.status_code}')
+            result.error = response
             break
         data = response.json() or {}
+        if not result.names:
+            result.names = data.get('names', {}) or {}
+        result.total = data.get('total', result.total)
         issues = data.get('issues', []) or []
         if not issues:
             break
-        results.extend(issues)
+        result.issues.extend(issues)
         next_page_token = data.get('nextPageToken')
         if data.get('isLast', not next_page_token) or not next_page_token:
             break
-    return results
+    else:
+        result.truncated = True
+    result.duration_ms = round((now_fn() - started_at) * 1000, 1)
+    return result
+
+
+class ShardedSearchResult:
+    """Merged output of ``run_sharded_jql_search``.
+
+    Issues keep shard order (and page order within a shard); across shards an
+    issue key seen earlier wins. ``error`` is the first failing response in
+    shard order and ``error_shard`` the page walk that produced it.
+    """
+    __slots__ = ('issues', 'names', 'total', 'error', 'error_shard', 'shards', 'truncated')
+
+    def __init__(self, shards):
+        self.shards = shards
+        self.truncated = any(shard.truncated for shard in shards)
+        self.issues = []
+        self.names = {}
+        self.total = None
+        self.error_shard = next((shard for shard in shards if shard.error is not None), None)
+        self.error = self.error_shard.error if self.error_shard is not None else None
+        if len(shards) == 1:
+            self.issues, self.names, self.total = shards[0].issues, shards[0].names, shards[0].total
+            return
+        seen_keys = set()
+        for shard in shards:
+            for name_key, name_value in shard.names.items():
+                self.names.setdefault(name_key, name_value)
+            if shard.total is not None:
+                self.total = (self.total or 0) + int(shard.total)
+            for issue in shard.issues:
+                issue_key = (issue or {}).get('key')
+                if issue_key:
+                    if issue_key in seen_keys:
+                        continue
+                    seen_keys.add(issue_key)
+                self.issues.append(issue)
+
+    def server_timing(self, prefix='jira-shard'):
+        """``Server-Timing`` entries, one per shard, e.g. ``jira-shard-0;dur=12.5;desc="team 1/3"``."""
+        if len(self.shards) < 2:
+            return []
+        return [
+            f'{prefix}-{index};dur={shard.duration_ms};desc="{shard.label.replace(chr(34), chr(39))}"'
+            for index, shard in enumerate(self.shards)
+        ]
+
+
+def build_team_ids_jql_clause(team_ids):
+    if len(team_ids) == 1:
+        return f'"Team[Team]" = "{team_ids[0]}"'
+    quoted = ', '.join(f'"{team_id}"' for team_id in team_ids)
+    return f'"Team[Team]" in ({quoted})'
+
+
+def build_team_jql_shards(jql, team_ids, *, shard_count, max_results=None):
+    """Split a query scoped by ``build_team_ids_jql_clause(team_ids)`` into team-ID chunks.
+
+    Each shard swaps that clause for the clause of its own chunk, so shards are
+    disjoint and together cover the original query. Queries without the exact
+    clause (for example a user template) stay a single shard, and so do capped
+    queries (``max_results``): the first ``max_results`` issues of the query's
+    ``ORDER BY`` can come from any chunk, so a split would fetch pages only to
+    drop them.
+    """
+    team_ids = list(team_ids or [])
+    shard_count = max(1, int(shard_count or 1))
+    team_clause = build_team_ids_jql_clause(team_ids) if team_ids else ''
+    if max_results is not None or shard_count < 2 or len(team_ids) < 2 or not team_clause or jql.count(team_clause) != 1:
+        return [JqlShard('all', jql, max_results)]
+    chunks = chunk_values(team_ids, -(-len(team_ids) // shard_count))
+    return [
+        JqlShard(f'teams {index}/{len(chunks)}', jql.replace(team_clause, build_team_ids_jql_clause(chunk)), max_results)
+        for index, chunk in enumerate(chunks, start=1)
+    ]
+
+
+def run_sharded_jql_search(shards, fields_list, *, search_request, max_workers=DEFAULT_SEARCH_SHARD_WORKERS,
+                           page_size=100, expand=None, now_fn=None):
+    """Run each shard's page walk on the shared Jira fan-out and merge the results in shard order.
+
+    Shards must be disjoint slices of the same logical query; at most
+    ``max_workers`` of them are in flight. A single shard, or ``max_workers <= 1``
+    (for example when ``search_request`` depends on the calling thread's request
+    context), runs inline on the calling thread.
+    """
+    shards = list(shards or [])
+
+    def walk(shard):
+        return fetch_search_pages(
+            shard.jql,
+            fields_list,
+            search_request=search_request,
+            max_results=shard.max_results,
+            page_size=page_size,
+            expand=expand,
+            label=shard.label,
+            now_fn=now_fn,
+        )
+
+    workers = min(max(1, int(max_workers or 1)), len(shards))
+    if workers <= 1:
+        return ShardedSearchResult([walk(shard) for shard in shards])
+    outcome = shared_jira_fanout().run(
+        ((index, walk, (shard,)) for index, shard in enumerate(shards)),
+        max_parallel=workers,
+    )
+    return ShardedSearchResult(list(outcome.results.values()))
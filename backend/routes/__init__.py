@@ -1,4 +1,4 @@
-"""Backend route blueprints and lazy access to the legacy server module."""
+"""Backend route blueprints and access to the legacy server module."""
 
 import importlib
 import os
@@ -21,11 +21,43 @@ def get_jira_server():
     return importlib.import_module("jira_server")
 
 
-def bind_server_globals(target_globals):
-    server = get_jira_server()
-    for name, value in server.__dict__.items():
-        if name.startswith("__") or name in {"bp", "bind_server_globals", "get_jira_server"}:
-            continue
-        target_globals[name] = value
-    target_globals["_jira_server_module"] = server
-    return server
+class ServerFacade:
+    """Attribute access to the legacy ``jira_server`` module.
+
+    Blueprints read server state and helpers as ``server.NAME``. The module
+    is resolved once, when a blueprint is registered on the app, and each
+    attribute is read from it at call time, so state the server reassigns
+    (and ``patch.object(jira_server, ...)`` in tests) is seen without copying
+    anything per request.
+    """
+
+    __slots__ = ("_module",)
+
+    def __init__(self):
+        object.__setattr__(self, "_module", None)
+
+    def _bind(self, module):
+        object.__setattr__(self, "_module", module)
+
+    def _resolve(self):
+        module = self._module
+        if module is None:
+            # Route helpers called before any blueprint is registered.
+            module = get_jira_server()
+            self._bind(module)
+        return module
+
+    def __getattr__(self, name):
+        return getattr(self._resolve(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._resolve(), name, value)
+
+
+server = ServerFacade()
+
+
+def bind_server(blueprint):
+    """Resolve ``server`` to the app's server module when ``blueprint`` is registered."""
+    blueprint.record_once(lambda state: server._bind(get_jira_server()))
+    return blueprint
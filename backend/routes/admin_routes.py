@@ -10,26 +10,23 @@ from backend.auth.service_integrations import (
 )
 from backend.db import models
 from backend.db.engine import session_scope
+from backend.services.jira_fanout import shared_jira_fanout
+from backend.services.process_cache import process_cache_stats
 
-from . import bind_server_globals
+from . import bind_server, server
 
 
-bp = Blueprint("admin_routes", __name__)
-
-
-@bp.before_request
-def _sync_server_globals():
-    bind_server_globals(globals())
+bp = bind_server(Blueprint("admin_routes", __name__))
 
 
 @bp.before_request
 def _require_admin():
     try:
-        context = current_request_auth_context()
+        context = server.current_request_auth_context()
     except AuthError as error:
-        return auth_error_response(error, 401)
+        return server.auth_error_response(error, 401)
     if not context.is_admin:
-        payload, status = admin_required_payload()
+        payload, status = server.admin_required_payload()
         return jsonify(payload), status
     g.auth_context = context
     return None
@@ -173,6 +170,20 @@ def api_admin_service_integration(service_integration_id):
         return jsonify({'serviceIntegration': get_service_integration_summary(db_session, integration.id)})
 
 
+
+@bp.route('/api/admin/diagnostics/pools', methods=['GET'])
+def api_admin_diagnostics_pools():
+    return jsonify({
+        'changelogCache': server.JIRA_CHANGELOGS.stats(),
+        'httpSessions': server.HTTP_SESSION.stats(),
+        'issueStore': server.JIRA_ISSUE_STORE.stats() if server.JIRA_ISSUE_STORE is not None else None,
+        'jiraFanout': shared_jira_fanout().stats(),
+        'jiraRateLimiter': server.JIRA_RATE_LIMITER.stats(),
+        'processCaches': process_cache_stats(),
+        'scenarioForecastPool': server.SCENARIO_FORECAST_POOL.stats(),
+        'singleFlight': server.JIRA_FETCH_SINGLE_FLIGHT.stats(),
+    })
+
 def _load_workspace_user(session, workspace_id, user_id):
     user = session.get(models.User, user_id)
     if user is None:
@@ -202,7 +213,7 @@ def api_admin_user_status(user_id):
         ))
         db_session.flush()
         invalidate_auth_status_cache(user_id=user.id)
-        clear_auth_sensitive_caches('user_status_update')
+        server.clear_auth_sensitive_caches('user_status_update')
         return jsonify({'user': _user_summary(db_session, user, context.workspace_id)})
 
 
@@ -223,7 +234,7 @@ def api_admin_user_grant(user_id):
         ))
         db_session.flush()
         invalidate_auth_status_cache(user_id=user.id)
-        clear_auth_sensitive_caches('admin_grant')
+        server.clear_auth_sensitive_caches('admin_grant')
         return jsonify({'user': _user_summary(db_session, user, context.workspace_id)})
 
 
@@ -244,5 +255,5 @@ def api_admin_user_revoke(user_id):
         ))
         db_session.flush()
         invalidate_auth_status_cache(user_id=user.id)
-        clear_auth_sensitive_caches('admin_revoke')
+        server.clear_auth_sensitive_caches('admin_revoke')
         return jsonify({'user': _user_summary(db_session, user, context.workspace_id)})
@@ -5,38 +5,34 @@ import os
 from flask import Blueprint, jsonify, redirect, request, session
 
 from backend.auth.csrf import issue_csrf_token
-from backend.auth.jira_auth import ensure_oauth_token, missing_oauth_scopes
+from backend.auth.jira_auth import AUTH_MODE_ATLASSIAN_OAUTH, AuthError, ensure_oauth_token, missing_oauth_scopes
+from backend.db.engine import DatabaseConfigurationError
 from backend.epm import home as epm_home
 
-from . import bind_server_globals
+from . import bind_server, server
 
 
-bp = Blueprint("auth_routes", __name__)
-
-
-@bp.before_request
-def _sync_server_globals():
-    bind_server_globals(globals())
+bp = bind_server(Blueprint("auth_routes", __name__))
 
 
 @bp.route('/api/auth/status', methods=['GET'])
 def api_auth_status():
-    if JIRA_AUTH_MODE == AUTH_MODE_BASIC:
+    if server.JIRA_AUTH_MODE == server.AUTH_MODE_BASIC:
         return jsonify({
-            'authMode': AUTH_MODE_BASIC,
-            'authenticated': bool(JIRA_URL and JIRA_EMAIL and JIRA_TOKEN),
+            'authMode': server.AUTH_MODE_BASIC,
+            'authenticated': bool(server.JIRA_URL and server.JIRA_EMAIL and server.JIRA_TOKEN),
             'loginRequired': False,
         })
-    if database_storage_enabled() and db_oauth_browser_session_data():
+    if server.database_storage_enabled() and server.db_oauth_browser_session_data():
         try:
-            context = current_request_auth_context()
+            context = server.current_request_auth_context()
         except AuthError as error:
             payload = {
                 'authMode': AUTH_MODE_ATLASSIAN_OAUTH,
                 'authenticated': False,
                 'loginRequired': True,
             }
-            recovery_url = auth_recovery_url(error.code)
+            recovery_url = server.auth_recovery_url(error.code)
             if recovery_url:
                 payload['recoveryUrl'] = recovery_url
             if error.code == 'auth_required':
@@ -50,9 +46,9 @@ def api_auth_status():
             'loginRequired': False,
             'siteUrl': context.site_url,
         })
-    data = oauth_session_data()
+    data = server.oauth_session_data()
     authenticated = bool(data.get('access_token') and data.get('cloudid'))
-    if authenticated and missing_oauth_scopes(data, ATLASSIAN_SCOPES):
+    if authenticated and missing_oauth_scopes(data, server.ATLASSIAN_SCOPES):
         return jsonify({
             'authMode': AUTH_MODE_ATLASSIAN_OAUTH,
             'authenticated': False,
@@ -72,15 +68,15 @@ def api_auth_status():
 
 @bp.route('/login', methods=['GET'])
 def auth_entry_page():
-    if JIRA_AUTH_MODE != AUTH_MODE_ATLASSIAN_OAUTH:
+    if server.JIRA_AUTH_MODE != AUTH_MODE_ATLASSIAN_OAUTH:
         return redirect('/')
-    if database_storage_enabled() and db_oauth_browser_session_data():
+    if server.database_storage_enabled() and server.db_oauth_browser_session_data():
         try:
-            current_request_auth_context()
+            server.current_request_auth_context()
             return redirect('/')
         except AuthError:
             pass
-    data = oauth_session_data()
+    data = server.oauth_session_data()
     if data.get('access_token') and data.get('cloudid'):
         return redirect('/')
     message = ''
@@ -323,11 +319,11 @@ def auth_service_credentials_page():
 
 @bp.route('/api/auth/csrf', methods=['GET'])
 def api_auth_csrf():
-    if JIRA_AUTH_MODE != AUTH_MODE_ATLASSIAN_OAUTH:
+    if server.JIRA_AUTH_MODE != AUTH_MODE_ATLASSIAN_OAUTH:
         return jsonify({'csrfToken': issue_csrf_token(session, {})})
-    if database_storage_enabled() and db_oauth_browser_session_data():
+    if server.database_storage_enabled() and server.db_oauth_browser_session_data():
         try:
-            context = current_request_auth_context()
+            context = server.current_request_auth_context()
             csrf_data = {
                 'db_auth_connection_id': context.auth_connection_id,
                 'db_token_version': context.token_version,
@@ -335,45 +331,45 @@ def api_auth_csrf():
             }
             token = issue_csrf_token(session, csrf_data)
         except AuthError as error:
-            return auth_error_response(error, 401)
+            return server.auth_error_response(error, 401)
         except DatabaseConfigurationError:
             return jsonify({
                 'error': 'config_storage_unavailable',
                 'message': 'Database-backed authentication is unavailable.',
             }), 503
         return jsonify({'csrfToken': token})
-    data = oauth_session_data()
+    data = server.oauth_session_data()
     if not data.get('access_token') or not data.get('cloudid'):
-        save_oauth_session({})
+        server.save_oauth_session({})
         return jsonify({
             'error': 'auth_required',
             'message': 'Your Jira sign-in expired. Sign in again to continue.',
             'loginUrl': '/login?reason=session_expired',
         }), 401
     try:
-        current_request_auth_context()
+        server.current_request_auth_context()
     except AuthError as error:
-        return auth_error_response(error, 401)
+        return server.auth_error_response(error, 401)
     token = issue_csrf_token(session, data)
     return jsonify({'csrfToken': token})
 
 
 @bp.route('/api/auth/atlassian/login', methods=['GET'])
 def api_atlassian_login():
-    if JIRA_AUTH_MODE != AUTH_MODE_ATLASSIAN_OAUTH:
-        return auth_error_response(AuthError('oauth_not_enabled', 'Atlassian OAuth auth mode is not enabled'), 400)
-    config = current_auth_config()
+    if server.JIRA_AUTH_MODE != AUTH_MODE_ATLASSIAN_OAUTH:
+        return server.auth_error_response(AuthError('oauth_not_enabled', 'Atlassian OAuth auth mode is not enabled'), 400)
+    config = server.current_auth_config()
     try:
-        validate_auth_config(config)
-        validate_local_token_store_allowed()
+        server.validate_auth_config(config)
+        server.validate_local_token_store_allowed()
     except AuthError as error:
-        return auth_error_response(error, 400)
-    state = new_oauth_state()
-    verifier = new_pkce_verifier()
+        return server.auth_error_response(error, 400)
+    state = server.new_oauth_state()
+    verifier = server.new_pkce_verifier()
     session['oauth_state'] = state
     session['oauth_pkce_verifier'] = verifier
     force_consent = str(request.args.get('prompt') or '').strip().lower() == 'consent'
-    return redirect(build_authorize_url(config, state, build_pkce_challenge(verifier), force_consent=force_consent))
+    return redirect(server.build_authorize_url(config, state, server.build_pkce_challenge(verifier), force_consent=force_consent))
 
 
 @bp.route('/api/auth/atlassian/callback', methods=['GET'])
@@ -390,49 +386,49 @@ def api_atlassian_callback():
         return jsonify({'error': 'missing_oauth_code'}), 400
     if not code_verifier:
         return jsonify({'error': 'missing_pkce_verifier'}), 400
-    config = current_auth_config()
+    config = server.current_auth_config()
     try:
-        validate_auth_config(config)
-        validate_local_token_store_allowed()
-        token_data = exchange_authorization_code(config, code, code_verifier)
-        user_profile = fetch_current_user(token_data.get('access_token', ''))
+        server.validate_auth_config(config)
+        server.validate_local_token_store_allowed()
+        token_data = server.exchange_authorization_code(config, code, code_verifier)
+        user_profile = server.fetch_current_user(token_data.get('access_token', ''))
         if user_profile.get('account_status') != 'active':
-            save_oauth_session({})
+            server.save_oauth_session({})
             return jsonify({'error': 'user_inactive'}), 403
-        resources = fetch_accessible_resources(token_data.get('access_token', ''))
-        resource = choose_accessible_resource(resources, config.jira_url)
+        resources = server.fetch_accessible_resources(token_data.get('access_token', ''))
+        resource = server.choose_accessible_resource(resources, config.jira_url)
         session_token_data = dict(token_data or {})
         if not session_token_data.get('scope'):
-            session_token_data['scope'] = ATLASSIAN_SCOPES
-        session_payload = token_session_payload(session_token_data, resource, user_profile)
-        session_payload.update(store_db_oauth_callback_session_metadata(session_token_data, resource, user_profile))
-        save_oauth_session(session_payload)
+            session_token_data['scope'] = server.ATLASSIAN_SCOPES
+        session_payload = server.token_session_payload(session_token_data, resource, user_profile)
+        session_payload.update(server.store_db_oauth_callback_session_metadata(session_token_data, resource, user_profile))
+        server.save_oauth_session(session_payload)
     except AuthError as error:
-        save_oauth_session({})
+        server.save_oauth_session({})
         if error.code in {'missing_jira_url', 'missing_oauth_config', 'missing_flask_secret_key', 'invalid_auth_mode', 'local_token_store_not_allowed'}:
-            return auth_error_response(error, 400)
-        return auth_error_response(error, 401 if error.code != 'jira_site_not_accessible' else 403)
+            return server.auth_error_response(error, 400)
+        return server.auth_error_response(error, 401 if error.code != 'jira_site_not_accessible' else 403)
     return redirect('/')
 
 
 @bp.route('/api/auth/refresh', methods=['POST'])
 def api_auth_refresh():
-    if JIRA_AUTH_MODE != AUTH_MODE_ATLASSIAN_OAUTH:
-        return jsonify({'authenticated': True, 'authMode': AUTH_MODE_BASIC})
-    if database_storage_enabled() and db_oauth_browser_session_data():
+    if server.JIRA_AUTH_MODE != AUTH_MODE_ATLASSIAN_OAUTH:
+        return jsonify({'authenticated': True, 'authMode': server.AUTH_MODE_BASIC})
+    if server.database_storage_enabled() and server.db_oauth_browser_session_data():
         try:
-            context = current_request_auth_context()
-            active = current_jira_session_data(context)
-            remember_db_oauth_browser_session(active)
+            context = server.current_request_auth_context()
+            active = server.current_jira_session_data(context)
+            server.remember_db_oauth_browser_session(active)
         except AuthError as error:
             if error.code == 'auth_required':
-                save_oauth_session({})
+                server.save_oauth_session({})
                 return jsonify({
                     'error': 'auth_required',
                     'message': 'Your Jira sign-in expired. Sign in again to continue.',
                     'loginUrl': '/login?reason=session_expired',
                 }), 401
-            return auth_error_response(error, 401)
+            return server.auth_error_response(error, 401)
         return jsonify({
             'authMode': AUTH_MODE_ATLASSIAN_OAUTH,
             'authenticated': True,
@@ -441,9 +437,9 @@ def api_auth_refresh():
             'siteUrl': active.get('site_url'),
             'siteName': active.get('site_name'),
         })
-    data = oauth_session_data()
+    data = server.oauth_session_data()
     if not data.get('access_token') or not data.get('cloudid'):
-        save_oauth_session({})
+        server.save_oauth_session({})
         return jsonify({
             'error': 'auth_required',
             'message': 'Your Jira sign-in expired. Sign in again to continue.',
@@ -451,21 +447,21 @@ def api_auth_refresh():
         }), 401
     try:
         active = ensure_oauth_token(
-            current_auth_config(),
+            server.current_auth_config(),
             data,
-            save_oauth_session,
-            reload_session=oauth_session_data,
-            refresh_lock=oauth_refresh_lock(),
+            server.save_oauth_session,
+            reload_session=server.oauth_session_data,
+            refresh_lock=server.oauth_refresh_lock(),
         )
     except AuthError as error:
         if error.code == 'auth_required':
-            save_oauth_session({})
+            server.save_oauth_session({})
             return jsonify({
                 'error': 'auth_required',
                 'message': 'Your Jira sign-in expired. Sign in again to continue.',
                 'loginUrl': '/login?reason=session_expired',
             }), 401
-        return auth_error_response(error, 401)
+        return server.auth_error_response(error, 401)
     return jsonify({
         'authMode': AUTH_MODE_ATLASSIAN_OAUTH,
         'authenticated': True,
@@ -478,32 +474,32 @@ def api_auth_refresh():
 
 @bp.route('/api/auth/dev/home-graphql-oauth-probe', methods=['GET'])
 def api_dev_home_graphql_oauth_probe():
-    if APP_ENVIRONMENT_KEY.strip().lower() not in {'local', 'dev'}:
+    if server.APP_ENVIRONMENT_KEY.strip().lower() not in {'local', 'dev'}:
         return jsonify({'error': 'not_found'}), 404
     if os.getenv('ALLOW_DEV_DIAGNOSTIC_ENDPOINTS', '').strip().lower() not in {'1', 'true', 'yes'}:
         return jsonify({'error': 'not_found'}), 404
     if (request.remote_addr or '').strip().lower() not in {'127.0.0.1', '::1', 'localhost'}:
         return jsonify({'error': 'not_found'}), 404
-    if JIRA_AUTH_MODE != AUTH_MODE_ATLASSIAN_OAUTH:
+    if server.JIRA_AUTH_MODE != AUTH_MODE_ATLASSIAN_OAUTH:
         return jsonify({'error': 'oauth_required'}), 400
-    if database_storage_enabled() and db_oauth_browser_session_data():
+    if server.database_storage_enabled() and server.db_oauth_browser_session_data():
         try:
-            context = current_request_auth_context()
-            active = current_jira_session_data(context)
-            remember_db_oauth_browser_session(active)
+            context = server.current_request_auth_context()
+            active = server.current_jira_session_data(context)
+            server.remember_db_oauth_browser_session(active)
         except AuthError as error:
             if error.code == 'auth_required':
-                save_oauth_session({})
+                server.save_oauth_session({})
                 return jsonify({
                     'error': 'auth_required',
                     'message': 'Your Jira sign-in expired. Sign in again to continue.',
                     'loginUrl': '/login?reason=session_expired',
                 }), 401
-            return auth_error_response(error, 401)
+            return server.auth_error_response(error, 401)
     else:
-        data = oauth_session_data()
+        data = server.oauth_session_data()
         if not data.get('access_token') or not data.get('cloudid'):
-            save_oauth_session({})
+            server.save_oauth_session({})
             return jsonify({
                 'error': 'auth_required',
                 'message': 'Your Jira sign-in expired. Sign in again to continue.',
@@ -511,27 +507,27 @@ def api_dev_home_graphql_oauth_probe():
             }), 401
         try:
             active = ensure_oauth_token(
-                current_auth_config(),
+                server.current_auth_config(),
                 data,
-                save_oauth_session,
-                reload_session=oauth_session_data,
-                refresh_lock=oauth_refresh_lock(),
+                server.save_oauth_session,
+                reload_session=server.oauth_session_data,
+                refresh_lock=server.oauth_refresh_lock(),
             )
         except AuthError as error:
             if error.code == 'auth_required':
-                save_oauth_session({})
+                server.save_oauth_session({})
                 return jsonify({
                     'error': 'auth_required',
                     'message': 'Your Jira sign-in expired. Sign in again to continue.',
                     'loginUrl': '/login?reason=session_expired',
                 }), 401
-            return auth_error_response(error, 401)
+            return server.auth_error_response(error, 401)
 
-    epm_config = get_epm_config()
+    epm_config = server.get_epm_config()
     scope = epm_config.get('scope') or {}
-    sub_goal_keys = normalize_epm_sub_goal_keys(scope.get('subGoalKeys') or scope.get('subGoalKey'))
-    root_goal_key = normalize_epm_upper_text(request.args.get('rootGoalKey') or scope.get('rootGoalKey'))
-    sub_goal_key = normalize_epm_upper_text(
+    sub_goal_keys = server.normalize_epm_sub_goal_keys(scope.get('subGoalKeys') or scope.get('subGoalKey'))
+    root_goal_key = server.normalize_epm_upper_text(request.args.get('rootGoalKey') or scope.get('rootGoalKey'))
+    sub_goal_key = server.normalize_epm_upper_text(
         request.args.get('subGoalKey') or (sub_goal_keys[0] if sub_goal_keys else '')
     )
     payload = epm_home.run_home_graphql_oauth_probe(
@@ -541,14 +537,14 @@ def api_dev_home_graphql_oauth_probe():
         root_goal_key=root_goal_key,
         sub_goal_key=sub_goal_key,
         home_project_id=str(request.args.get('homeProjectId') or '').strip(),
-        jira_url=str(active.get('site_url') or JIRA_URL or '').strip(),
+        jira_url=str(active.get('site_url') or server.JIRA_URL or '').strip(),
     )
     return jsonify(epm_home.redact_home_oauth_probe_payload(payload))
 
 
 @bp.route('/api/auth/logout', methods=['POST'])
 def api_auth_logout():
-    save_oauth_session({})
+    server.save_oauth_session({})
     session.pop('oauth_state', None)
     session.pop('oauth_pkce_verifier', None)
     return jsonify({'ok': True})
@@ -4,15 +4,10 @@ from flask import Blueprint, jsonify, request
 
 from backend.auth.jira_auth import AuthError
 
-from . import bind_server_globals
+from . import bind_server, server
 
 
-bp = Blueprint("capacity_routes", __name__)
-
-
-@bp.before_request
-def _sync_server_globals():
-    bind_server_globals(globals())
+bp = bind_server(Blueprint("capacity_routes", __name__))
 
 
 @bp.route('/api/capacity', methods=['GET'])
@@ -24,19 +19,19 @@ def get_capacity():
     if not sprint_name:
         return jsonify({'error': 'Sprint name is required'}), 400
 
-    if not get_effective_capacity_project():
+    if not server.get_effective_capacity_project():
         return jsonify({
             'enabled': False,
             'capacities': {}
         })
 
     try:
-        payload, error_message = fetch_capacity_for_sprint(sprint_name, None, debug=debug, team_names=team_names)
+        payload, error_message = server.fetch_capacity_for_sprint(sprint_name, None, debug=debug, team_names=team_names)
         if error_message:
             return jsonify({'error': error_message}), 500
         return jsonify(payload)
     except AuthError:
-        payload, status = oauth_auth_required_payload()
+        payload, status = server.oauth_auth_required_payload()
         return jsonify(payload), status
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -2,9 +2,18 @@
 
 import time
 
-from flask import Blueprint
+from flask import Blueprint, copy_current_request_context, jsonify, request
 
+from backend.auth.jira_auth import AUTH_MODE_ATLASSIAN_OAUTH, AuthError
 from backend.auth.cache_policy import build_jira_home_process_cache_key, jira_home_partitioned_process_cache_enabled
+from backend.services.cache_revalidation import (
+    CACHE_EXPIRED,
+    CACHE_STALE,
+    STALE_SERVER_TIMING,
+    classify_cache_entry,
+)
+from backend.services.dependency_graph import DOWNSTREAM, UPSTREAM
+from backend.services.process_cache import register_process_cache
 from backend.services.eng_subtasks import (
     SUBTASK_FIELDS,
     SubtasksFetchError,
@@ -34,24 +43,19 @@ from backend.services.jira_issue_transitions import (
     transition_issues,
 )
 
-from . import bind_server_globals
+from . import bind_server, server
 
 
-bp = Blueprint("eng_routes", __name__)
-SUBTASKS_CACHE = {}
+bp = bind_server(Blueprint("eng_routes", __name__))
 SUBTASKS_CACHE_TTL_SECONDS = 300
-
-
-@bp.before_request
-def _sync_server_globals():
-    bind_server_globals(globals())
+SUBTASKS_CACHE = register_process_cache('story-subtasks', ttl_seconds=SUBTASKS_CACHE_TTL_SECONDS, max_entries=1024)
 
 
 def _eng_auth_error_response(error):
     if error.code == "auth_required":
-        payload, status = oauth_auth_required_payload()
+        payload, status = server.oauth_auth_required_payload()
         return jsonify(payload), status
-    return auth_error_response(error, 401)
+    return server.auth_error_response(error, 401)
 
 
 def clear_jira_issue_status_caches(reason='issue_status_transition'):
@@ -61,13 +65,13 @@ def clear_jira_issue_status_caches(reason='issue_status_transition'):
     jira_server.py does not grow) and additionally clears the local
     SUBTASKS_CACHE, which neither of those touches.
     """
-    clear_auth_sensitive_caches(reason=reason)
-    clear_epm_caches()
+    server.clear_auth_sensitive_caches(reason=reason)
+    server.clear_epm_caches()
     try:
-        with _cache_lock:
+        with server._cache_lock:
             SUBTASKS_CACHE.clear()
     except Exception:
-        log_warning(f'Unable to clear subtask cache after {reason}')
+        server.log_warning(f'Unable to clear subtask cache after {reason}')
 
 
 def _missing_write_jira_work_scope(auth_context):
@@ -80,9 +84,9 @@ def _missing_write_jira_work_scope(auth_context):
     DB-backed session). This only re-checks local (non-DB) OAuth sessions,
     mirroring backend/routes/auth_routes.py::api_auth_status().
     """
-    if is_db_auth_context(auth_context):
+    if server.is_db_auth_context(auth_context):
         return False
-    return bool(missing_oauth_scopes(oauth_session_data(), {'write:jira-work'}))
+    return bool(server.missing_oauth_scopes(server.oauth_session_data(), {'write:jira-work'}))
 
 
 @bp.route('/api/dependencies', methods=['POST'])
@@ -95,24 +99,30 @@ def get_dependencies():
             return jsonify({'dependencies': {}})
 
         started_at = time.perf_counter()
-        auth_context = current_request_auth_context()
+        auth_context = server.current_request_auth_context()
         cache_enabled = jira_home_partitioned_process_cache_enabled(auth_context)
         cache_key = build_jira_home_process_cache_key(auth_context, 'dependencies', ','.join(keys))
         cached_entry = None
         if cache_enabled:
-            with _cache_lock:
-                cached_entry = DEPENDENCIES_CACHE.get(cache_key)
-        if cache_enabled and cached_entry and (time.time() - cached_entry.get('timestamp', 0)) < DEPENDENCIES_CACHE_TTL_SECONDS:
+            with server._cache_lock:
+                cached_entry = server.DEPENDENCIES_CACHE.get(cache_key)
+        if cache_enabled and cached_entry and (time.time() - cached_entry.get('timestamp', 0)) < server.DEPENDENCIES_CACHE_TTL_SECONDS:
             response = jsonify({'dependencies': cached_entry.get('data') or {}})
             response.headers['Server-Timing'] = 'cache;dur=1'
             return response
 
         collect_started_at = time.perf_counter()
-        dependencies = collect_dependencies(keys, context=auth_context)
+        if cache_enabled:
+            dependencies = server.JIRA_FETCH_SINGLE_FLIGHT.do(
+                ('dependencies', cache_key),
+                lambda: server.collect_dependencies(keys, context=auth_context),
+            )
+        else:
+            dependencies = server.collect_dependencies(keys, context=auth_context)
         collect_ms = round((time.perf_counter() - collect_started_at) * 1000, 1)
         if cache_enabled:
-            with _cache_lock:
-                DEPENDENCIES_CACHE[cache_key] = {
+            with server._cache_lock:
+                server.DEPENDENCIES_CACHE[cache_key] = {
                     'timestamp': time.time(),
                     'data': dependencies,
                 }
@@ -123,10 +133,44 @@ def get_dependencies():
     except AuthError as error:
         return _eng_auth_error_response(error)
     except Exception as e:
-        logger.exception('Dependencies endpoint error')
+        server.logger.exception('Dependencies endpoint error')
         return jsonify({'error': 'Failed to fetch dependencies', 'message': str(e)}), 500
 
 
+@bp.route('/api/dependencies/graph', methods=['POST'])
+def get_dependency_graph():
+    """Multi-hop dependency lookups from the dependency graph index, without Jira calls.
+
+    Keys the index has not seen yet come back in ``missing``; loading them
+    through ``/api/dependencies`` first records their links.
+    """
+    try:
+        payload = request.get_json(silent=True) or {}
+        keys = sorted({str(key).strip() for key in (payload.get('keys') or []) if str(key).strip()})
+        graph = server.dependency_graph_for(server.current_request_auth_context())
+        if graph is None:
+            return jsonify({'graph': {}, 'issues': {}, 'missing': keys})
+        result = {}
+        referenced = set()
+        for key in keys:
+            if not graph.known(key):
+                continue
+            entry = {
+                'prerequisites': sorted(graph.prerequisites(key)),
+                'dependents': sorted(graph.dependents(key)),
+                'upstream': sorted(graph.closure(key, UPSTREAM)),
+                'downstream': sorted(graph.closure(key, DOWNSTREAM)),
+                'cycle': list(graph.cycle_of(key)),
+            }
+            result[key] = entry
+            referenced.add(key)
+            referenced.update(entry['upstream'], entry['downstream'])
+        issues = {key: graph.snapshot(key) for key in sorted(referenced) if graph.snapshot(key)}
+        return jsonify({'graph': result, 'issues': issues, 'missing': [key for key in keys if key not in result]})
+    except AuthError as error:
+        return _eng_auth_error_response(error)
+
+
 @bp.route('/api/issues/lookup', methods=['GET'])
 def lookup_issues():
     """Lookup issues by key/id for dependency popovers."""
@@ -138,16 +182,16 @@ def lookup_issues():
         if not keys and not ids:
             return jsonify({'issues': []})
 
-        auth_context = current_request_auth_context()
-        team_field_id = resolve_team_field_id(None, context=auth_context)
-        epic_link_field_id = resolve_epic_link_field_id(None, context=auth_context)
+        auth_context = server.current_request_auth_context()
+        team_field_id = server.resolve_team_field_id(None, context=auth_context)
+        epic_link_field_id = server.resolve_epic_link_field_id(None, context=auth_context)
 
         fields_list = [
             'summary',
             'status',
             'issuetype',
             'assignee',
-            get_story_points_field_id(),
+            server.get_story_points_field_id(),
             'parent'
         ]
         if epic_link_field_id and epic_link_field_id not in fields_list:
@@ -158,7 +202,7 @@ def lookup_issues():
         issues = []
         if keys:
             unique_keys = sorted({str(k).strip() for k in keys if str(k).strip()})
-            issues.extend(fetch_issues_by_keys(unique_keys, fields_list))
+            issues.extend(server.fetch_issues_by_keys(unique_keys, fields_list))
 
         if ids:
             unique_ids = sorted({str(i).strip() for i in ids if str(i).strip()})
@@ -168,16 +212,16 @@ def lookup_issues():
                 'maxResults': len(unique_ids),
                 'fields': fields_list
             }
-            response = jira_search_request(payload)
+            response = server.jira_search_request(payload)
             if response.status_code == 200:
                 data = response.json() or {}
                 issues.extend(data.get('issues', []) or [])
             else:
-                log_warning(f'Lookup fetch error: status={response.status_code}')
+                server.log_warning(f'Lookup fetch error: status={response.status_code}')
 
         snapshots = []
         for issue in issues:
-            snapshot = build_issue_snapshot(issue, team_field_id, epic_link_field_id)
+            snapshot = server.build_issue_snapshot(issue, team_field_id, epic_link_field_id)
             snapshot['id'] = issue.get('id')
             snapshots.append(snapshot)
 
@@ -185,7 +229,7 @@ def lookup_issues():
     except AuthError as error:
         return _eng_auth_error_response(error)
     except Exception as e:
-        logger.exception('Issue lookup error')
+        server.logger.exception('Issue lookup error')
         return jsonify({'error': 'Failed to lookup issues', 'message': str(e)}), 500
 
 
@@ -206,7 +250,7 @@ def get_story_subtasks():
             return jsonify({'error': 'invalid_sprint'}), 400
 
         started_at = time.perf_counter()
-        auth_context = current_request_auth_context()
+        auth_context = server.current_request_auth_context()
         cache_enabled = jira_home_partitioned_process_cache_enabled(auth_context)
         cache_key = build_jira_home_process_cache_key(
             auth_context,
@@ -215,7 +259,7 @@ def get_story_subtasks():
             sprint_id,
         )
         if cache_enabled and not refresh:
-            with _cache_lock:
+            with server._cache_lock:
                 cached_entry = SUBTASKS_CACHE.get(cache_key)
             if cached_entry and (time.time() - cached_entry.get('timestamp', 0)) < SUBTASKS_CACHE_TTL_SECONDS:
                 response = jsonify(shape_subtasks_payload(
@@ -234,13 +278,13 @@ def get_story_subtasks():
         issues = fetch_subtask_issues_by_jql(
             build_subtasks_jql(parent_key, sprint_id),
             SUBTASK_FIELDS,
-            search_request=jira_search_request,
+            search_request=server.jira_search_request,
             context=auth_context,
             max_results=500,
-            log_warning_fn=log_warning,
+            log_warning_fn=server.log_warning,
         )
         if cache_enabled:
-            with _cache_lock:
+            with server._cache_lock:
                 SUBTASKS_CACHE[cache_key] = {
                     'timestamp': time.time(),
                     'issues': issues,
@@ -256,10 +300,10 @@ def get_story_subtasks():
     except AuthError as error:
         return _eng_auth_error_response(error)
     except SubtasksFetchError:
-        logger.exception('Story subtasks Jira fetch failed')
+        server.logger.exception('Story subtasks Jira fetch failed')
         return jsonify({'error': 'subtasks_fetch_failed', 'message': 'Failed to fetch subtasks from Jira.'}), 502
     except Exception:
-        logger.exception('Story subtasks endpoint error')
+        server.logger.exception('Story subtasks endpoint error')
         return jsonify({'error': 'subtasks_fetch_failed', 'message': 'Failed to fetch subtasks from Jira.'}), 502
 
 
@@ -269,15 +313,15 @@ def get_issue_transition_options():
     payload = request.get_json(silent=True)
     if not isinstance(payload, dict):
         return jsonify({'error': 'invalid_json'}), 400
-    if JIRA_AUTH_MODE != AUTH_MODE_ATLASSIAN_OAUTH:
+    if server.JIRA_AUTH_MODE != AUTH_MODE_ATLASSIAN_OAUTH:
         return jsonify({'error': 'jira_oauth_required'}), 403
 
     try:
-        auth_context = current_request_auth_context()
+        auth_context = server.current_request_auth_context()
         result = load_transition_options(
             payload.get('issueKeys'),
-            jira_request=current_jira_request,
-            search_request=current_jira_search,
+            jira_request=server.current_jira_request,
+            search_request=server.current_jira_search,
             context=auth_context,
         )
     except AuthError as error:
@@ -285,10 +329,10 @@ def get_issue_transition_options():
     except IssueTransitionInputError as error:
         return jsonify({'error': error.code}), 400
     except IssueTransitionServiceError:
-        logger.exception('Issue transition options Jira fetch failed')
+        server.logger.exception('Issue transition options Jira fetch failed')
         return jsonify({'error': 'jira_transition_options_failed'}), 502
     except Exception:
-        logger.exception('Issue transition options endpoint error')
+        server.logger.exception('Issue transition options endpoint error')
         return jsonify({'error': 'jira_transition_options_failed'}), 502
 
     return jsonify(result)
@@ -300,18 +344,18 @@ def post_issue_transitions():
     payload = request.get_json(silent=True)
     if not isinstance(payload, dict):
         return jsonify({'error': 'invalid_json'}), 400
-    if JIRA_AUTH_MODE != AUTH_MODE_ATLASSIAN_OAUTH:
+    if server.JIRA_AUTH_MODE != AUTH_MODE_ATLASSIAN_OAUTH:
         return jsonify({'error': 'jira_oauth_required'}), 403
 
     try:
-        auth_context = current_request_auth_context()
+        auth_context = server.current_request_auth_context()
         if _missing_write_jira_work_scope(auth_context):
             raise AuthError('missing_oauth_scope', 'Your Jira sign-in needs updated permissions.')
         result = transition_issues(
             payload.get('issueKeys'),
             payload.get('targetStatus'),
-            jira_request=current_jira_request,
-            search_request=current_jira_search,
+            jira_request=server.current_jira_request,
+            search_request=server.current_jira_search,
             context=auth_context,
         )
     except AuthError as error:
@@ -319,10 +363,10 @@ def post_issue_transitions():
     except IssueTransitionInputError as error:
         return jsonify({'error': error.code}), 400
     except IssueTransitionServiceError:
-        logger.exception('Issue transition write Jira fetch failed')
+        server.logger.exception('Issue transition write Jira fetch failed')
         return jsonify({'error': 'jira_transition_failed'}), 502
     except Exception:
-        logger.exception('Issue transition write endpoint error')
+        server.logger.exception('Issue transition write endpoint error')
         return jsonify({'error': 'jira_transition_failed'}), 502
 
     if result.get('succeeded', 0) > 0:
@@ -338,18 +382,18 @@ def get_issue_priority_options():
     priority scheme via editmeta (OAuth read:jira-work only); without it, the full site
     catalog is returned (backward-compatible).
     """
-    if JIRA_AUTH_MODE != AUTH_MODE_ATLASSIAN_OAUTH:
+    if server.JIRA_AUTH_MODE != AUTH_MODE_ATLASSIAN_OAUTH:
         return jsonify({'error': 'jira_oauth_required'}), 403
 
     issue_key = (request.args.get('issueKey') or '').strip()
     try:
-        auth_context = current_request_auth_context()
+        auth_context = server.current_request_auth_context()
         if issue_key:
             result = load_priority_options_for_issue(
-                issue_key, jira_request=current_jira_request, context=auth_context
+                issue_key, jira_request=server.current_jira_request, context=auth_context
             )
         else:
-            result = load_priority_options(jira_request=current_jira_request, context=auth_context)
+            result = load_priority_options(jira_request=server.current_jira_request, context=auth_context)
     except AuthError as error:
         return _eng_auth_error_response(error)
     except IssuePriorityInputError as error:
@@ -357,10 +401,10 @@ def get_issue_priority_options():
     except IssuePriorityServiceError as error:
         if error.code == 'issue_not_found':
             return jsonify({'error': 'issue_not_found'}), 404
-        logger.exception('Issue priority options Jira fetch failed')
+        server.logger.exception('Issue priority options Jira fetch failed')
         return jsonify({'error': 'jira_priority_options_failed'}), 502
     except Exception:
-        logger.exception('Issue priority options endpoint error')
+        server.logger.exception('Issue priority options endpoint error')
         return jsonify({'error': 'jira_priority_options_failed'}), 502
 
     result['cached'] = False
@@ -373,18 +417,18 @@ def post_issue_priorities():
     payload = request.get_json(silent=True)
     if not isinstance(payload, dict):
         return jsonify({'error': 'invalid_json'}), 400
-    if JIRA_AUTH_MODE != AUTH_MODE_ATLASSIAN_OAUTH:
+    if server.JIRA_AUTH_MODE != AUTH_MODE_ATLASSIAN_OAUTH:
         return jsonify({'error': 'jira_oauth_required'}), 403
 
     try:
-        auth_context = current_request_auth_context()
+        auth_context = server.current_request_auth_context()
         if _missing_write_jira_work_scope(auth_context):
             raise AuthError('missing_oauth_scope', 'Your Jira sign-in needs updated permissions.')
         result = update_issue_priorities(
             payload.get('issueKeys'),
             payload.get('targetPriorityId'),
-            jira_request=current_jira_request,
-            search_request=current_jira_search,
+            jira_request=server.current_jira_request,
+            search_request=server.current_jira_search,
             context=auth_context,
         )
     except AuthError as error:
@@ -392,10 +436,10 @@ def post_issue_priorities():
     except IssuePriorityInputError as error:
         return jsonify({'error': error.code}), 400
     except IssuePriorityServiceError:
-        logger.exception('Issue priority write Jira fetch failed')
+        server.logger.exception('Issue priority write Jira fetch failed')
         return jsonify({'error': 'jira_priority_update_failed'}), 502
     except Exception:
-        logger.exception('Issue priority write endpoint error')
+        server.logger.exception('Issue priority write endpoint error')
         return jsonify({'error': 'jira_priority_update_failed'}), 502
 
     if result.get('succeeded', 0) > 0:
@@ -413,24 +457,24 @@ def _project_track_service_error_response(error, failure_code):
         return jsonify({'error': 'issue_not_found'}), 404
     if error.code in _PROJECT_TRACK_CONFLICT_CODES:
         return jsonify({'error': error.code}), 409
-    logger.exception('Issue project track Jira call failed')
+    server.logger.exception('Issue project track Jira call failed')
     return jsonify({'error': failure_code}), 502
 
 
 @bp.route('/api/issues/project-track/options', methods=['GET'])
 def get_issue_project_track_options():
     """Canonical Project Track options from this issue's Jira editmeta."""
-    if JIRA_AUTH_MODE != AUTH_MODE_ATLASSIAN_OAUTH:
+    if server.JIRA_AUTH_MODE != AUTH_MODE_ATLASSIAN_OAUTH:
         return jsonify({'error': 'jira_oauth_required'}), 403
     issue_key = (request.args.get('issueKey') or '').strip()
     if not issue_key:
         return jsonify({'error': 'invalid_issue_key'}), 400
     try:
-        auth_context = current_request_auth_context()
+        auth_context = server.current_request_auth_context()
         result = load_project_track_options_for_issue(
             issue_key,
-            jira_request=current_jira_request,
-            get_project_track_field_id=get_project_track_field_id,
+            jira_request=server.current_jira_request,
+            get_project_track_field_id=server.get_project_track_field_id,
             context=auth_context,
         )
     except AuthError as error:
@@ -440,7 +484,7 @@ def get_issue_project_track_options():
     except ProjectTrackServiceError as error:
         return _project_track_service_error_response(error, 'jira_project_track_options_failed')
     except Exception:
-        logger.exception('Issue project track options endpoint error')
+        server.logger.exception('Issue project track options endpoint error')
         return jsonify({'error': 'jira_project_track_options_failed'}), 502
     return jsonify(result)
 
@@ -451,17 +495,17 @@ def post_issue_project_track():
     payload = request.get_json(silent=True)
     if not isinstance(payload, dict):
         return jsonify({'error': 'invalid_json'}), 400
-    if JIRA_AUTH_MODE != AUTH_MODE_ATLASSIAN_OAUTH:
+    if server.JIRA_AUTH_MODE != AUTH_MODE_ATLASSIAN_OAUTH:
         return jsonify({'error': 'jira_oauth_required'}), 403
     try:
-        auth_context = current_request_auth_context()
+        auth_context = server.current_request_auth_context()
         if _missing_write_jira_work_scope(auth_context):
             raise AuthError('missing_oauth_scope', 'Your Jira sign-in needs updated permissions.')
         result = update_issue_project_track(
             payload.get('issueKey'),
             payload.get('targetTrack'),
-            jira_request=current_jira_request,
-            get_project_track_field_id=get_project_track_field_id,
+            jira_request=server.current_jira_request,
+            get_project_track_field_id=server.get_project_track_field_id,
             context=auth_context,
         )
     except AuthError as error:
@@ -471,7 +515,7 @@ def post_issue_project_track():
     except ProjectTrackServiceError as error:
         return _project_track_service_error_response(error, 'jira_project_track_update_failed')
     except Exception:
-        logger.exception('Issue project track write endpoint error')
+        server.logger.exception('Issue project track write endpoint error')
         return jsonify({'error': 'jira_project_track_update_failed'}), 502
     if result.get('result') == 'success':
         clear_jira_issue_status_caches(reason='issue_project_track_update')
@@ -481,19 +525,19 @@ def post_issue_project_track():
 @bp.route('/api/issues/statuses/catalog', methods=['GET'])
 def get_issue_status_catalog():
     """Fetch the full Jira workflow status catalog once per app session."""
-    if JIRA_AUTH_MODE != AUTH_MODE_ATLASSIAN_OAUTH:
+    if server.JIRA_AUTH_MODE != AUTH_MODE_ATLASSIAN_OAUTH:
         return jsonify({'error': 'jira_oauth_required'}), 403
 
     try:
-        auth_context = current_request_auth_context()
-        result = load_status_catalog(jira_request=current_jira_request, context=auth_context)
+        auth_context = server.current_request_auth_context()
+        result = load_status_catalog(jira_request=server.current_jira_request, context=auth_context)
     except AuthError as error:
         return _eng_auth_error_response(error)
     except IssueTransitionServiceError:
-        logger.exception('Issue status catalog Jira fetch failed')
+        server.logger.exception('Issue status catalog Jira fetch failed')
         return jsonify({'error': 'jira_status_catalog_failed'}), 502
     except Exception:
-        logger.exception('Issue status catalog endpoint error')
+        server.logger.exception('Issue status catalog endpoint error')
         return jsonify({'error': 'jira_status_catalog_failed'}), 502
 
     result['cached'] = False
@@ -503,18 +547,23 @@ def get_issue_status_catalog():
 @bp.route('/api/missing-info', methods=['GET'])
 def get_missing_info():
     """Find stories under epics in a given sprint that are missing key planning fields (sprint/SP/team)."""
+    return _missing_info_response()
+
+
+def _missing_info_response(revalidate=False):
+    flight = None
     try:
         started_at = time.perf_counter()
         sprint = request.args.get('sprint', '').strip()
         team_ids_param = request.args.get('teamIds', '').strip()
-        team_ids = normalize_team_ids([t.strip() for t in team_ids_param.split(',') if t.strip()])
+        team_ids = server.normalize_team_ids([t.strip() for t in team_ids_param.split(',') if t.strip()])
         components_param = [c.strip() for c in request.args.get('components', '').split(',') if c.strip()]
         if not sprint:
             return jsonify({'error': 'Missing required query param: sprint'}), 400
 
-        auth_context = current_request_auth_context()
-        effective_components = components_param or ([MISSING_INFO_COMPONENT] if MISSING_INFO_COMPONENT else [])
-        effective_team_ids = normalize_team_ids(team_ids or MISSING_INFO_TEAM_IDS)
+        auth_context = server.current_request_auth_context()
+        effective_components = components_param or ([server.MISSING_INFO_COMPONENT] if server.MISSING_INFO_COMPONENT else [])
+        effective_team_ids = server.normalize_team_ids(team_ids or server.MISSING_INFO_TEAM_IDS)
         cache_enabled = jira_home_partitioned_process_cache_enabled(auth_context)
         cache_key = build_jira_home_process_cache_key(
             auth_context,
@@ -524,35 +573,47 @@ def get_missing_info():
             ','.join(sorted(effective_components)),
         )
         cached_entry = None
-        if cache_enabled:
-            with _cache_lock:
-                cached_entry = MISSING_INFO_CACHE.get(cache_key)
-        if cache_enabled and cached_entry and (time.time() - cached_entry.get('timestamp', 0)) < MISSING_INFO_CACHE_TTL_SECONDS:
+        cache_state = CACHE_EXPIRED
+        if cache_enabled and not revalidate:
+            with server._cache_lock:
+                cached_entry = server.MISSING_INFO_CACHE.get(cache_key)
+            cache_state = classify_cache_entry(cached_entry, server.MISSING_INFO_CACHE_TTL_SECONDS, server.MISSING_INFO_CACHE_HARD_TTL_SECONDS)
+            if cache_state == CACHE_EXPIRED:
+                # Coalesce identical concurrent misses: followers wait for the leader, then re-read its cache entry.
+                flight = server.JIRA_FETCH_SINGLE_FLIGHT.join_and_wait(('missing-info', cache_key))
+                with server._cache_lock:
+                    cached_entry = server.MISSING_INFO_CACHE.get(cache_key)
+                cache_state = classify_cache_entry(cached_entry, server.MISSING_INFO_CACHE_TTL_SECONDS, server.MISSING_INFO_CACHE_HARD_TTL_SECONDS)
+        if cache_enabled and cache_state != CACHE_EXPIRED:
             response = jsonify(cached_entry.get('data') or {'issues': [], 'epics': [], 'count': 0})
             response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
             response.headers['Pragma'] = 'no-cache'
             response.headers['Expires'] = '0'
             response.headers['Server-Timing'] = 'cache;dur=1'
+            if cache_state == CACHE_STALE:
+                server.revalidate_in_background(server.JIRA_FETCH_SINGLE_FLIGHT, ('missing-info', cache_key), copy_current_request_context(
+                    lambda: _missing_info_response(revalidate=True)))
+                response.headers['Server-Timing'] = STALE_SERVER_TIMING
             return response
 
         # Resolve fields
-        team_field_id = resolve_team_field_id(None, context=auth_context)
-        epic_link_field_id = resolve_epic_link_field_id(None, context=auth_context)
+        team_field_id = server.resolve_team_field_id(None, context=auth_context)
+        epic_link_field_id = server.resolve_epic_link_field_id(None, context=auth_context)
 
-        scope_clause = build_missing_info_scope_clause(effective_team_ids, effective_components)
+        scope_clause = server.build_missing_info_scope_clause(effective_team_ids, effective_components)
 
         # 1) Fetch epics that are in the sprint (future sprint planning), scoped by component/team.
         epic_jql = f'Sprint = {sprint} AND issuetype = Epic'
         if scope_clause:
-            epic_jql = add_clause_to_jql(epic_jql, scope_clause)
-        epic_jql = add_clause_to_jql(epic_jql, 'status not in ("Killed","Done","Incomplete")')
-        epic_jql = add_clause_to_jql(epic_jql, f'project in ("{JIRA_PRODUCT_PROJECT}","{JIRA_TECH_PROJECT}")')
+            epic_jql = server.add_clause_to_jql(epic_jql, scope_clause)
+        epic_jql = server.add_clause_to_jql(epic_jql, 'status not in ("Killed","Done","Incomplete")')
+        epic_jql = server.add_clause_to_jql(epic_jql, f'project in ("{server.JIRA_PRODUCT_PROJECT}","{server.JIRA_TECH_PROJECT}")')
 
         epic_fields = ['summary', 'status', 'assignee', 'parent', 'components']
         if team_field_id:
             epic_fields.append(team_field_id)
 
-        epics_resp = jira_search_request({
+        epics_resp = server.jira_search_request({
             'jql': epic_jql,
             'maxResults': 250,
             'fields': epic_fields
@@ -566,8 +627,8 @@ def get_missing_info():
         if not epic_keys:
             payload = {'issues': [], 'epics': [], 'count': 0}
             if cache_enabled:
-                with _cache_lock:
-                    MISSING_INFO_CACHE[cache_key] = {
+                with server._cache_lock:
+                    server.MISSING_INFO_CACHE[cache_key] = {
                         'timestamp': time.time(),
                         'data': payload,
                     }
@@ -584,10 +645,10 @@ def get_missing_info():
             raw_team = None
             if team_field_id and ef.get(team_field_id) is not None:
                 raw_team = ef.get(team_field_id)
-            epic_team_name = extract_team_name(raw_team) if raw_team else ''
+            epic_team_name = server.extract_team_name(raw_team) if raw_team else ''
             epic_team_id = None
             if raw_team:
-                tv = build_team_value(raw_team)
+                tv = server.build_team_value(raw_team)
                 epic_team_id = tv.get('id') if isinstance(tv, dict) else None
             epics_summary.append({
                 'key': epic.get('key'),
@@ -606,8 +667,8 @@ def get_missing_info():
             'issuetype',
             'assignee',
             'updated',
-            get_story_points_field_id(),  # Story Points
-            get_sprint_field_id(),  # Sprint
+            server.get_story_points_field_id(),  # Story Points
+            server.get_sprint_field_id(),  # Sprint
             'parent'
         ]
         if epic_link_field_id and epic_link_field_id not in story_fields:
@@ -635,7 +696,7 @@ def get_missing_info():
                 }
                 if next_page_token:
                     payload['nextPageToken'] = next_page_token
-                resp = jira_search_request(payload)
+                resp = server.jira_search_request(payload)
                 if resp.status_code != 200:
                     break
 
@@ -655,8 +716,8 @@ def get_missing_info():
                     if team_field_id and fields.get(team_field_id) is not None:
                         raw_team = fields.get(team_field_id)
                     if raw_team is not None:
-                        team_name = extract_team_name(raw_team)
-                        fields['team'] = build_team_value(raw_team)
+                        team_name = server.extract_team_name(raw_team)
+                        fields['team'] = server.build_team_value(raw_team)
                         fields['teamName'] = team_name
                         fields['teamId'] = fields['team'].get('id') if isinstance(fields['team'], dict) else None
 
@@ -670,14 +731,14 @@ def get_missing_info():
                     if epic_key:
                         fields['epicKey'] = epic_key
 
-                    sp = fields.get(get_story_points_field_id())
+                    sp = fields.get(server.get_story_points_field_id())
                     try:
                         sp_num = float(sp) if sp not in (None, '', []) else 0.0
                     except Exception:
                         sp_num = 0.0
                     has_sp = sp_num > 0
 
-                    sprint_value = fields.get(get_sprint_field_id())
+                    sprint_value = fields.get(server.get_sprint_field_id())
                     has_sprint = bool(sprint_value)
                     has_team = bool(fields.get('teamName'))
 
@@ -705,8 +766,8 @@ def get_missing_info():
                             'issuetype': {'name': issuetype.get('name')} if issuetype else None,
                             'assignee': {'displayName': assignee.get('displayName')} if assignee else None,
                             'updated': fields.get('updated'),
-                            'customfield_10004': fields.get(get_story_points_field_id()),
-                            'customfield_10101': fields.get(get_sprint_field_id()),
+                            'customfield_10004': fields.get(server.get_story_points_field_id()),
+                            'customfield_10101': fields.get(server.get_sprint_field_id()),
                             'team': fields.get('team'),
                             'teamName': fields.get('teamName'),
                             'teamId': fields.get('teamId'),
@@ -721,8 +782,8 @@ def get_missing_info():
 
         payload = {'issues': missing, 'epics': epics_summary, 'count': len(missing), 'epicCount': len(epic_keys)}
         if cache_enabled:
-            with _cache_lock:
-                MISSING_INFO_CACHE[cache_key] = {
+            with server._cache_lock:
+                server.MISSING_INFO_CACHE[cache_key] = {
                     'timestamp': time.time(),
                     'data': payload,
                 }
@@ -735,20 +796,23 @@ def get_missing_info():
     except AuthError as error:
         return _eng_auth_error_response(error)
     except Exception as e:
-        logger.exception('Missing-info error')
+        server.logger.exception('Missing-info error')
         return jsonify({'error': 'Failed to compute missing-info', 'message': str(e)}), 500
+    finally:
+        if flight is not None:
+            flight.done()
 
 
 @bp.route('/api/tasks', methods=['GET'])
 def get_tasks():
     """Fetch tasks from Jira API."""
-    return fetch_tasks(include_team_name=False)
+    return server.fetch_tasks(include_team_name=False)
 
 
 @bp.route('/api/tasks-with-team-name', methods=['GET'])
 def get_tasks_with_team_name():
     """Fetch tasks with team name derived from Jira Team field."""
-    return fetch_tasks(include_team_name=True)
+    return server.fetch_tasks(include_team_name=True)
 
 
 @bp.route('/api/teams', methods=['GET'])
@@ -758,16 +822,16 @@ def get_teams():
         sprint = request.args.get('sprint', '')
         team_ids_param = request.args.get('teamIds', '').strip()
         fetch_all = request.args.get('all', '').lower() == 'true'
-        team_ids = normalize_team_ids([t.strip() for t in team_ids_param.split(',') if t.strip()])
-        use_template = bool(team_ids and JQL_QUERY_TEMPLATE) and not fetch_all
+        team_ids = server.normalize_team_ids([t.strip() for t in team_ids_param.split(',') if t.strip()])
+        use_template = bool(team_ids and server.JQL_QUERY_TEMPLATE) and not fetch_all
 
         # Build JQL query from env or dashboard config
         if use_template:
-            jql = apply_team_ids_to_template(team_ids)
+            jql = server.apply_team_ids_to_template(team_ids)
             if not jql:
-                jql = build_base_jql()
+                jql = server.build_base_jql()
         else:
-            jql = build_base_jql()
+            jql = server.build_base_jql()
 
         if not jql:
             return jsonify({'error': 'No projects configured', 'teams': []}), 400
@@ -775,15 +839,15 @@ def get_teams():
         # If fetching all teams, remove team filter but keep sprint scope
         project_scope_jql = None
         if fetch_all:
-            jql = remove_team_filter_from_jql(jql)
+            jql = server.remove_team_filter_from_jql(jql)
             project_scope_jql = jql
             if sprint:
-                jql = add_clause_to_jql(jql, f"Sprint = {sprint}")
+                jql = server.add_clause_to_jql(jql, f"Sprint = {sprint}")
         elif sprint:
-            jql = add_clause_to_jql(jql, f"Sprint = {sprint}")
+            jql = server.add_clause_to_jql(jql, f"Sprint = {sprint}")
 
-        auth_context = current_request_auth_context()
-        team_field_id = resolve_team_field_id(None, context=auth_context)
+        auth_context = server.current_request_auth_context()
+        team_field_id = server.resolve_team_field_id(None, context=auth_context)
 
         # Fetch tasks - paginate through all issues
         fields_list = ['summary', 'status']
@@ -807,7 +871,7 @@ def get_teams():
                 if next_page_token:
                     payload['nextPageToken'] = next_page_token
 
-                response = jira_search_request(payload)
+                response = server.jira_search_request(payload)
                 if response.status_code != 200:
                     return all_issues, names_map, response
 
@@ -847,9 +911,9 @@ def get_teams():
                     raw_team = fields.get(effective_team_field_id)
 
                 if raw_team is not None:
-                    team_value = build_team_value(raw_team)
+                    team_value = server.build_team_value(raw_team)
                     team_id = team_value.get('id') if isinstance(team_value, dict) else None
-                    team_name = extract_team_name(raw_team)
+                    team_name = server.extract_team_name(raw_team)
 
                     if team_id and team_name:
                         teams_map[team_id] = {
@@ -868,7 +932,7 @@ def get_teams():
         # When fetching all teams, also query Jira Teams API directly
         # to catch teams that have no issues in PRODUCT/TECH projects
         if fetch_all:
-            api_teams = fetch_teams_from_jira_api()
+            api_teams = server.fetch_teams_from_jira_api()
             for tid, tval in api_teams.items():
                 if tid not in teams_map:
                     teams_map[tid] = tval
@@ -894,18 +958,18 @@ def resolve_team_names():
     """Resolve team names for a list of team IDs."""
     try:
         team_ids_param = request.args.get('teamIds', '').strip()
-        team_ids = normalize_team_ids([t.strip() for t in team_ids_param.split(',') if t.strip()])
+        team_ids = server.normalize_team_ids([t.strip() for t in team_ids_param.split(',') if t.strip()])
         if not team_ids:
             return jsonify({'error': 'teamIds is required'}), 400
 
-        auth_context = current_request_auth_context()
-        team_field_id = resolve_team_field_id(None, context=auth_context)
+        auth_context = server.current_request_auth_context()
+        team_field_id = server.resolve_team_field_id(None, context=auth_context)
         if not team_field_id:
-            team_field_id = TEAM_FIELD_DEFAULT
+            team_field_id = server.TEAM_FIELD_DEFAULT
 
-        base_jql = remove_team_filter_from_jql(build_base_jql())
+        base_jql = server.remove_team_filter_from_jql(server.build_base_jql())
         quoted = ', '.join(f'"{team_id}"' for team_id in team_ids)
-        jql = add_clause_to_jql(base_jql, f'"Team[Team]" in ({quoted})')
+        jql = server.add_clause_to_jql(base_jql, f'"Team[Team]" in ({quoted})')
 
         fields_list = ['summary']
         if team_field_id and team_field_id not in fields_list:
@@ -923,7 +987,7 @@ def resolve_team_names():
             }
             if next_page_token:
                 payload['nextPageToken'] = next_page_token
-            response = jira_search_request(payload)
+            response = server.jira_search_request(payload)
             if response.status_code != 200:
                 return jsonify({'error': 'Failed to resolve teams', 'details': response.text}), response.status_code
             data = response.json() or {}
@@ -938,9 +1002,9 @@ def resolve_team_names():
                     raw_team = fields.get(team_field_id)
                 if raw_team is None:
                     continue
-                team_value = build_team_value(raw_team)
+                team_value = server.build_team_value(raw_team)
                 team_id = team_value.get('id') if isinstance(team_value, dict) else None
-                team_name = extract_team_name(raw_team)
+                team_name = server.extract_team_name(raw_team)
                 if team_id and team_name and team_id in team_ids:
                     teams_map[team_id] = {'id': team_id, 'name': team_name}
 
@@ -967,12 +1031,12 @@ def get_all_teams_list():
         sprint = request.args.get('sprint', '')
 
         # Build JQL query - remove team filter to get ALL teams
-        jql = remove_team_filter_from_jql(build_base_jql())
+        jql = server.remove_team_filter_from_jql(server.build_base_jql())
         if sprint:
-            jql = add_clause_to_jql(jql, f"Sprint = {sprint}")
+            jql = server.add_clause_to_jql(jql, f"Sprint = {sprint}")
 
-        auth_context = current_request_auth_context()
-        team_field_id = resolve_team_field_id(None, context=auth_context)
+        auth_context = server.current_request_auth_context()
+        team_field_id = server.resolve_team_field_id(None, context=auth_context)
 
         # Fetch tasks
         fields_list = ['summary', 'status']
@@ -993,7 +1057,7 @@ def get_all_teams_list():
             if next_page_token:
                 payload['nextPageToken'] = next_page_token
 
-            response = jira_search_request(payload)
+            response = server.jira_search_request(payload)
             if response.status_code != 200:
                 return jsonify({'error': 'Failed to fetch teams', 'details': response.text}), response.status_code
 
@@ -1028,9 +1092,9 @@ def get_all_teams_list():
                 raw_team = fields.get(team_field_id)
 
             if raw_team is not None:
-                team_value = build_team_value(raw_team)
+                team_value = server.build_team_value(raw_team)
                 team_id = team_value.get('id') if isinstance(team_value, dict) else None
-                team_name = extract_team_name(raw_team)
+                team_name = server.extract_team_name(raw_team)
 
                 if team_id and team_name:
                     teams_map[team_id] = {
@@ -1062,45 +1126,45 @@ def get_backlog_epics():
     try:
         project_filter = request.args.get('project', '').strip().lower()
         team_ids_param = request.args.get('teamIds', '').strip()
-        team_ids = normalize_team_ids([t.strip() for t in team_ids_param.split(',') if t.strip()])
+        team_ids = server.normalize_team_ids([t.strip() for t in team_ids_param.split(',') if t.strip()])
 
-        if team_ids and JQL_QUERY_TEMPLATE:
-            jql = apply_team_ids_to_template(team_ids) or build_base_jql()
+        if team_ids and server.JQL_QUERY_TEMPLATE:
+            jql = server.apply_team_ids_to_template(team_ids) or server.build_base_jql()
         elif team_ids:
-            jql = remove_team_filter_from_jql(build_base_jql())
+            jql = server.remove_team_filter_from_jql(server.build_base_jql())
             if len(team_ids) == 1:
-                jql = add_clause_to_jql(jql, f'"Team[Team]" = "{team_ids[0]}"')
+                jql = server.add_clause_to_jql(jql, f'"Team[Team]" = "{team_ids[0]}"')
             else:
                 quoted_teams = ', '.join(f'"{tid}"' for tid in team_ids)
-                jql = add_clause_to_jql(jql, f'"Team[Team]" in ({quoted_teams})')
+                jql = server.add_clause_to_jql(jql, f'"Team[Team]" in ({quoted_teams})')
         else:
-            jql = build_base_jql()
+            jql = server.build_base_jql()
 
         if project_filter in ('product', 'tech'):
-            typed = get_selected_projects_typed()
+            typed = server.get_selected_projects_typed()
             if typed:
                 matching_keys = [item['key'] for item in typed if item['type'] == project_filter]
                 if matching_keys:
-                    jql = remove_project_filter_from_jql(jql)
+                    jql = server.remove_project_filter_from_jql(jql)
                     if len(matching_keys) == 1:
-                        jql = add_clause_to_jql(jql, f'project = "{matching_keys[0]}"')
+                        jql = server.add_clause_to_jql(jql, f'project = "{matching_keys[0]}"')
                     else:
                         quoted = ', '.join(f'"{key}"' for key in matching_keys)
-                        jql = add_clause_to_jql(jql, f'project in ({quoted})')
+                        jql = server.add_clause_to_jql(jql, f'project in ({quoted})')
 
-        issue_types = get_configured_issue_types()
+        issue_types = server.get_configured_issue_types()
         if issue_types:
             if len(issue_types) == 1:
-                jql = add_clause_to_jql(jql, f'type = "{issue_types[0]}"')
+                jql = server.add_clause_to_jql(jql, f'type = "{issue_types[0]}"')
             else:
                 quoted_types = ', '.join(f'"{issue_type}"' for issue_type in issue_types)
-                jql = add_clause_to_jql(jql, f'type in ({quoted_types})')
+                jql = server.add_clause_to_jql(jql, f'type in ({quoted_types})')
 
-        auth_context = current_request_auth_context()
-        team_field_id = resolve_team_field_id(None, context=auth_context)
-        epic_link_field_id = resolve_epic_link_field_id(None, context=auth_context)
-        sprint_field_id = get_sprint_field_id()
-        epics = fetch_backlog_epics_for_alert(
+        auth_context = server.current_request_auth_context()
+        team_field_id = server.resolve_team_field_id(None, context=auth_context)
+        epic_link_field_id = server.resolve_epic_link_field_id(None, context=auth_context)
+        sprint_field_id = server.get_sprint_field_id()
+        epics = server.fetch_backlog_epics_for_alert(
             jql,
             headers=None,
             team_field_id=team_field_id,
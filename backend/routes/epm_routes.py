@@ -1,22 +1,20 @@
 """EPM API route blueprint."""
 
-from flask import Blueprint
+import time
+import uuid
+
+from flask import Blueprint, jsonify, request
 
 from backend.auth.jira_auth import AuthError
 from backend.epm import issues as epm_issues
 
-from . import bind_server_globals
+from . import bind_server, server
 
 
-bp = Blueprint("epm_routes", __name__)
+bp = bind_server(Blueprint("epm_routes", __name__))
 HOME_USER_TOKEN_CONNECT_URL = '/settings/connections/home-token'
 
 
-@bp.before_request
-def _sync_server_globals():
-    bind_server_globals(globals())
-
-
 def _is_home_user_token_required(error):
     return isinstance(error, AuthError) and error.code == 'home_user_token_required'
 
@@ -38,27 +36,27 @@ def _home_user_token_required_response(error):
 
 
 def build_epm_project_issues_response(home_project_id, tab, sprint, sub_goal_keys=None):
-    auth_context = current_request_auth_context()
+    auth_context = server.current_request_auth_context()
     deps = epm_issues.EpmIssuesDependencies(
-        find_epm_project_or_404=lambda project_id: find_epm_project_or_404(
+        find_epm_project_or_404=lambda project_id: server.find_epm_project_or_404(
             project_id,
             sub_goal_keys=sub_goal_keys,
             context=auth_context,
         ),
-        validate_epm_tab_sprint=validate_epm_tab_sprint,
-        build_epm_scope_clause=build_epm_scope_clause,
-        build_base_jql=build_base_jql,
-        add_clause_to_jql=add_clause_to_jql,
+        validate_epm_tab_sprint=server.validate_epm_tab_sprint,
+        build_epm_scope_clause=server.build_epm_scope_clause,
+        build_base_jql=server.build_base_jql,
+        add_clause_to_jql=server.add_clause_to_jql,
         fetch_issues_by_jql=(
             lambda jql, fields_list, context=None:
-            fetch_issues_by_jql(jql, fields_list, context=auth_context)
+            server.fetch_issues_by_jql(jql, fields_list, context=auth_context)
         ),
-        build_epm_fields_list=build_epm_fields_list,
-        shape_epm_issue_payload=shape_epm_issue_payload,
-        dedupe_issues_by_key=dedupe_issues_by_key,
-        cache=EPM_ISSUES_CACHE,
-        cache_lock=_epm_cache_lock,
-        cache_ttl_seconds=EPM_ISSUES_CACHE_TTL_SECONDS,
+        build_epm_fields_list=server.build_epm_fields_list,
+        shape_epm_issue_payload=server.shape_epm_issue_payload,
+        dedupe_issues_by_key=server.dedupe_issues_by_key,
+        cache=server.EPM_ISSUES_CACHE,
+        cache_lock=server._epm_cache_lock,
+        cache_ttl_seconds=server.EPM_ISSUES_CACHE_TTL_SECONDS,
         context=auth_context,
     )
     return epm_issues.build_epm_project_issues_payload(home_project_id, tab, sprint, deps)
@@ -66,14 +64,14 @@ def build_epm_project_issues_response(home_project_id, tab, sprint, sub_goal_key
 
 @bp.route('/api/epm/config', methods=['GET'])
 def get_epm_config_endpoint():
-    return jsonify(get_epm_config())
+    return jsonify(server.get_epm_config())
 
 
 @bp.route('/api/epm/scope', methods=['GET'])
 def get_epm_scope_endpoint():
-    scope = (get_epm_config().get('scope') or {})
+    scope = (server.get_epm_config().get('scope') or {})
     try:
-        cloud_id = fetch_home_site_cloud_id()
+        cloud_id = server.fetch_home_site_cloud_id()
         error = ''
     except RuntimeError as exc:
         cloud_id = ''
@@ -82,23 +80,23 @@ def get_epm_scope_endpoint():
         'cloudId': cloud_id,
         'error': error,
         'scope': {
-            'rootGoalKey': normalize_epm_upper_text(scope.get('rootGoalKey')),
-            'subGoalKeys': normalize_epm_sub_goal_keys(scope.get('subGoalKeys') or scope.get('subGoalKey')),
+            'rootGoalKey': server.normalize_epm_upper_text(scope.get('rootGoalKey')),
+            'subGoalKeys': server.normalize_epm_sub_goal_keys(scope.get('subGoalKeys') or scope.get('subGoalKey')),
         },
     })
 
 
 @bp.route('/api/epm/goals', methods=['GET'])
 def get_epm_goals_endpoint():
-    root_goal_key = normalize_epm_upper_text(request.args.get('rootGoalKey'))
+    root_goal_key = server.normalize_epm_upper_text(request.args.get('rootGoalKey'))
     try:
-        goals = fetch_epm_sub_goals(root_goal_key) if root_goal_key else fetch_epm_goal_catalog()
+        goals = server.fetch_epm_sub_goals(root_goal_key) if root_goal_key else server.fetch_epm_goal_catalog()
         error = ''
     except (
         RuntimeError,
-        epm_home.HomeAuthenticationError,
-        epm_home.HomeRateLimitError,
-        epm_home.HomeGraphQLError,
+        server.epm_home.HomeAuthenticationError,
+        server.epm_home.HomeRateLimitError,
+        server.epm_home.HomeGraphQLError,
     ) as exc:
         goals = []
         error = str(exc)
@@ -111,7 +109,7 @@ def get_epm_goals_endpoint():
                 'connectUrl': HOME_USER_TOKEN_CONNECT_URL,
             })
         if exc.code == 'auth_required':
-            payload, status = oauth_auth_required_payload()
+            payload, status = server.oauth_auth_required_payload()
             return jsonify(payload), status
         raise
     return jsonify({'goals': goals, 'error': error})
@@ -119,13 +117,13 @@ def get_epm_goals_endpoint():
 
 @bp.route('/api/epm/projects', methods=['GET'])
 def get_epm_projects_endpoint():
-    epm_config = get_epm_config()
+    epm_config = server.get_epm_config()
     force_refresh = str(request.args.get('refresh') or '').strip().lower() in {'1', 'true', 'yes'}
-    tab = normalize_epm_text(request.args.get('tab'))
-    sub_goal_keys = parse_epm_sub_goal_keys_param(request.args.get('subGoalKeys'))
+    tab = server.normalize_epm_text(request.args.get('tab'))
+    sub_goal_keys = server.parse_epm_sub_goal_keys_param(request.args.get('subGoalKeys'))
     started = time.perf_counter()
     try:
-        payload = build_epm_projects_payload(epm_config, force_refresh=force_refresh, tab=tab, sub_goal_keys=sub_goal_keys)
+        payload = server.build_epm_projects_payload(epm_config, force_refresh=force_refresh, tab=tab, sub_goal_keys=sub_goal_keys)
     except AuthError as exc:
         if _is_home_user_token_required(exc):
             return _home_user_token_required_response(exc)
@@ -138,11 +136,11 @@ def get_epm_projects_endpoint():
 
 @bp.route('/api/epm/projects/configuration', methods=['POST'])
 def configure_epm_projects_endpoint():
-    payload = normalize_epm_config(request.get_json(silent=True) or {})
+    payload = server.normalize_epm_config(request.get_json(silent=True) or {})
     force_refresh = str(request.args.get('refresh') or '').strip().lower() in {'1', 'true', 'yes'}
     started = time.perf_counter()
     try:
-        projects_payload = build_epm_projects_payload(payload, force_refresh=force_refresh)
+        projects_payload = server.build_epm_projects_payload(payload, force_refresh=force_refresh)
     except AuthError as exc:
         if _is_home_user_token_required(exc):
             return _home_user_token_required_response(exc)
@@ -162,9 +160,9 @@ def preview_epm_projects_endpoint():
 def get_all_epm_projects_rollup_endpoint():
     tab = str(request.args.get('tab') or 'active').strip().lower()
     sprint = str(request.args.get('sprint') or '').strip()
-    sub_goal_keys = parse_epm_sub_goal_keys_param(request.args.get('subGoalKeys'))
+    sub_goal_keys = server.parse_epm_sub_goal_keys_param(request.args.get('subGoalKeys'))
     try:
-        payload, status, headers = build_all_epm_projects_rollup(tab, sprint, sub_goal_keys=sub_goal_keys)
+        payload, status, headers = server.build_all_epm_projects_rollup(tab, sprint, sub_goal_keys=sub_goal_keys)
     except AuthError as exc:
         if _is_home_user_token_required(exc):
             return _home_user_token_required_response(exc)
@@ -179,7 +177,7 @@ def get_all_epm_projects_rollup_endpoint():
 def get_epm_project_issues_endpoint(home_project_id):
     tab = str(request.args.get('tab') or 'active').strip().lower()
     sprint = str(request.args.get('sprint') or '').strip()
-    sub_goal_keys = parse_epm_sub_goal_keys_param(request.args.get('subGoalKeys'))
+    sub_goal_keys = server.parse_epm_sub_goal_keys_param(request.args.get('subGoalKeys'))
     try:
         payload, status, headers = build_epm_project_issues_response(
             home_project_id,
@@ -202,11 +200,11 @@ def get_epm_project_rollup_endpoint(project_id):
     tab = str(request.args.get('tab') or 'active').strip().lower()
     sprint = str(request.args.get('sprint') or '').strip()
     try:
-        payload, status, headers = build_per_project_rollup(
+        payload, status, headers = server.build_per_project_rollup(
             project_id,
             tab,
             sprint,
-            build_epm_rollup_dependencies(sub_goal_keys=parse_epm_sub_goal_keys_param(request.args.get('subGoalKeys'))),
+            server.build_epm_rollup_dependencies(sub_goal_keys=server.parse_epm_sub_goal_keys_param(request.args.get('subGoalKeys'))),
         )
     except AuthError as exc:
         if _is_home_user_token_required(exc):
@@ -229,8 +227,8 @@ def save_epm_config_endpoint():
             if not isinstance(row, dict):
                 continue
             rewritten_row = dict(row)
-            home_project_id = normalize_epm_text(rewritten_row.get('homeProjectId'))
-            row_id = normalize_epm_text(rewritten_row.get('id'))
+            home_project_id = server.normalize_epm_text(rewritten_row.get('homeProjectId'))
+            row_id = server.normalize_epm_text(rewritten_row.get('id'))
             if home_project_id:
                 rewritten_row['id'] = home_project_id
                 rewritten_projects[home_project_id] = rewritten_row
@@ -242,17 +240,17 @@ def save_epm_config_endpoint():
             rewritten_projects[row_id] = rewritten_row
         raw_payload = dict(raw_payload)
         raw_payload['projects'] = rewritten_projects
-    payload = normalize_epm_config(raw_payload)
+    payload = server.normalize_epm_config(raw_payload)
     try:
-        dashboard_config = load_dashboard_config() or {'version': 1, 'projects': {'selected': []}, 'teamGroups': {}}
-        previous_epm_config = normalize_epm_config(dashboard_config.get('epm') or {})
-        previous_scope_key = build_epm_home_projects_cache_key(previous_epm_config.get('scope') or {})
-        next_scope_key = build_epm_home_projects_cache_key(payload.get('scope') or {})
+        dashboard_config = server.load_dashboard_config() or {'version': 1, 'projects': {'selected': []}, 'teamGroups': {}}
+        previous_epm_config = server.normalize_epm_config(dashboard_config.get('epm') or {})
+        previous_scope_key = server.build_epm_home_projects_cache_key(previous_epm_config.get('scope') or {})
+        next_scope_key = server.build_epm_home_projects_cache_key(payload.get('scope') or {})
         dashboard_config['epm'] = payload
-        save_dashboard_config(dashboard_config)
+        server.save_dashboard_config(dashboard_config)
         if previous_scope_key != next_scope_key:
-            clear_epm_project_cache()
-        clear_epm_rollup_caches()
+            server.clear_epm_project_cache()
+        server.clear_epm_rollup_caches()
     except Exception as e:
         return jsonify({'error': 'Failed to save EPM config', 'message': str(e)}), 500
     return jsonify(payload)
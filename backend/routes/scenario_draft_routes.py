@@ -2,19 +2,21 @@
 
 import json
 import os
+import time
 from copy import deepcopy
 
 from flask import Blueprint, Response, g, jsonify, request, session, stream_with_context
 
 from backend.auth.csrf import validate_csrf_token
 from backend.auth.jira_auth import AUTH_MODE_ATLASSIAN_OAUTH, AuthError
-from backend.db.engine import DatabaseConfigurationError, database_storage_enabled
+from backend.db.engine import DatabaseConfigurationError
 from backend.scenario_drafts import (
     ScenarioDraftConflict,
     ScenarioDraftLockConflict,
     ScenarioDraftNotFound,
     ScenarioDraftReloadTimeout,
     ScenarioDraftReloadUnavailable,
+    ScenarioDraftStreamLimit,
     ScenarioDraftValidationError,
     acquire_lock,
     append_event,
@@ -23,33 +25,34 @@ from backend.scenario_drafts import (
     get_active_presence,
     get_events_page,
     get_version,
+    join_events,
+    list_versions,
     preview_writeback,
+    record_presence,
     release_lock,
     reload_from_jira,
     rollback_to_version,
     save_draft,
-    upsert_presence,
+    subscribe_events,
 )
 
-from . import bind_server_globals, get_jira_server
+from . import bind_server, server
 
 
-bp = Blueprint('scenario_draft_routes', __name__)
+bp = bind_server(Blueprint('scenario_draft_routes', __name__))
 
 UNSAFE_METHODS = {'POST', 'PUT', 'PATCH', 'DELETE'}
 SCENARIO_RELOAD_TIMEOUT_SECONDS = 20
-
-
-@bp.before_request
-def _sync_server_globals():
-    bind_server_globals(globals())
+SSE_RETRY_MILLISECONDS = 3000
+SSE_HEARTBEAT_SECONDS = 15
+SSE_MAX_STREAM_SECONDS = 300
 
 
 @bp.before_request
 def _require_token_bound_csrf():
     if request.method not in UNSAFE_METHODS:
         return None
-    if JIRA_AUTH_MODE != AUTH_MODE_ATLASSIAN_OAUTH:
+    if server.JIRA_AUTH_MODE != AUTH_MODE_ATLASSIAN_OAUTH:
         return None
     if getattr(g, 'security_csrf_validated', False):
         return None
@@ -59,9 +62,9 @@ def _require_token_bound_csrf():
             'message': 'A valid CSRF token is required for this request.',
         }), 403
     try:
-        data = csrf_session_data_for_request()
+        data = server.csrf_session_data_for_request()
     except AuthError as error:
-        return auth_error_response(error, 401)
+        return server.auth_error_response(error, 401)
     except DatabaseConfigurationError:
         return _storage_error_response()
     if validate_csrf_token(session, data, request.headers.get('X-CSRF-Token')):
@@ -74,12 +77,12 @@ def _require_token_bound_csrf():
 
 @bp.before_request
 def _require_db_storage_and_auth_context():
-    if not database_storage_enabled():
+    if not server.database_storage_enabled():
         return _storage_error_response()
     try:
-        g.auth_context = scenario_draft_request_auth_context()
+        g.auth_context = server.scenario_draft_request_auth_context()
     except AuthError as error:
-        return auth_error_response(error, 401)
+        return server.auth_error_response(error, 401)
     except DatabaseConfigurationError:
         return _storage_error_response()
     return None
@@ -131,7 +134,6 @@ def _reload_timeout_response():
 
 
 def scenario_draft_reload_source_loader(context, draft, timeout_seconds):
-    server = globals().get('_jira_server_module') or get_jira_server()
     planner = getattr(server, 'scenario_planner', None)
     app = getattr(server, 'app', None)
     if planner is None or app is None:
@@ -217,7 +219,7 @@ def api_scenario_drafts_get():
     if not scope_key:
         return _error_response('scope_key_required', 'scope_key is required', 400)
     try:
-        return jsonify(get_active_draft(g.auth_context, scope_key, legacy_loader=load_scenario_overrides))
+        return jsonify(get_active_draft(g.auth_context, scope_key, legacy_loader=server.load_scenario_overrides))
     except ScenarioDraftValidationError as error:
         return _validation_error_response(error)
     except DatabaseConfigurationError:
@@ -244,6 +246,23 @@ def api_scenario_drafts_post():
         return _storage_error_response()
 
 
+@bp.route('/api/scenario/drafts/<draft_id>/versions', methods=['GET'])
+def api_scenario_draft_versions_get(draft_id):
+    try:
+        return jsonify(list_versions(
+            g.auth_context,
+            draft_id,
+            before_version_number=request.args.get('before'),
+            limit=request.args.get('limit', type=int),
+        ))
+    except ScenarioDraftValidationError as error:
+        return _validation_error_response(error)
+    except ScenarioDraftNotFound as error:
+        return _not_found_response(error)
+    except DatabaseConfigurationError:
+        return _storage_error_response()
+
+
 @bp.route('/api/scenario/drafts/<draft_id>/versions/<int:version_number>', methods=['GET'])
 def api_scenario_draft_version_get(draft_id, version_number):
     try:
@@ -293,11 +312,13 @@ def api_scenario_draft_rollback(draft_id):
 @bp.route('/api/scenario/drafts/<draft_id>/events', methods=['GET'])
 def api_scenario_draft_events_get(draft_id):
     try:
-        return jsonify(get_events_page(
+        page = get_events_page(
             g.auth_context,
             draft_id,
             since_event_number=request.args.get('since'),
-        ))
+        )
+        # Tells polling clients they can switch to the event stream.
+        return jsonify({**page, 'streamAvailable': _sse_enabled()})
     except ScenarioDraftValidationError as error:
         return _validation_error_response(error)
     except ScenarioDraftNotFound as error:
@@ -306,51 +327,147 @@ def api_scenario_draft_events_get(draft_id):
         return _storage_error_response()
 
 
+@bp.route('/api/scenario/drafts/<draft_id>/events/join', methods=['GET'])
+def api_scenario_draft_events_join(draft_id):
+    try:
+        return jsonify(join_events(g.auth_context, draft_id))
+    except ScenarioDraftNotFound as error:
+        return _not_found_response(error)
+    except DatabaseConfigurationError:
+        return _storage_error_response()
+
+
 @bp.route('/api/scenario/drafts/<draft_id>/events/stream', methods=['GET'])
 def api_scenario_draft_events_stream(draft_id):
-    if str(os.environ.get('SCENARIO_DRAFT_SSE_ENABLED') or '').lower() != 'true':
+    if not _sse_enabled():
         return _error_response('scenario_draft_sse_disabled', 'Scenario draft event streams are disabled.', 404)
+    context = g.auth_context
+    try:
+        # Subscribe before reading the backlog so nothing committed in between is missed.
+        subscription = subscribe_events(context, draft_id)
+    except ScenarioDraftNotFound as error:
+        return _not_found_response(error)
+    except ScenarioDraftStreamLimit as error:
+        return _error_response('scenario_draft_stream_limit', str(error), 429)
+    except DatabaseConfigurationError:
+        return _storage_error_response()
     try:
         page = get_events_page(
-            g.auth_context,
+            context,
             draft_id,
-            since_event_number=request.args.get('since'),
+            since_event_number=request.headers.get('Last-Event-ID') or request.args.get('since'),
         )
     except ScenarioDraftValidationError as error:
+        subscription.close()
         return _validation_error_response(error)
     except ScenarioDraftNotFound as error:
+        subscription.close()
         return _not_found_response(error)
     except DatabaseConfigurationError:
+        subscription.close()
         return _storage_error_response()
 
+    heartbeat_seconds = _env_seconds('SCENARIO_DRAFT_SSE_HEARTBEAT_SECONDS', SSE_HEARTBEAT_SECONDS)
+    deadline = time.monotonic() + _env_seconds('SCENARIO_DRAFT_SSE_MAX_SECONDS', SSE_MAX_STREAM_SECONDS)
+
+    def catch_up(since):
+        # Generator returning the last event number it sent.
+        while True:
+            missed = get_events_page(context, draft_id, since_event_number=since)
+            yield from _sse_page_frames(missed)
+            since = missed['nextSince']
+            if missed['isLast']:
+                return since
+
     @stream_with_context
     def stream():
-        for event in page['events']:
-            yield f"event: {event['eventType']}\n"
-            yield f"data: {json.dumps(event, separators=(',', ':'))}\n\n"
-
-    return Response(stream(), mimetype='text/event-stream')
+        last_event_number = page['nextSince']
+        try:
+            yield f'retry: {SSE_RETRY_MILLISECONDS}\n\n'
+            yield from _sse_page_frames(page)
+            if not page['isLast']:
+                last_event_number = yield from catch_up(last_event_number)
+            while (remaining := deadline - time.monotonic()) > 0:
+                message = subscription.get(min(heartbeat_seconds, remaining))
+                if message is None:
+                    yield ': heartbeat\n\n'
+                    continue
+                if message.get('kind') == 'presence':
+                    yield _sse_frame('presence.heartbeat', message['presence'])
+                    continue
+                event_number = message.get('eventNumber')
+                resync = subscription.lagged or message.get('kind') == 'resync'
+                if not resync and (event_number is None or event_number <= last_event_number):
+                    continue
+                if resync or event_number != last_event_number + 1 or not message.get('event'):
+                    subscription.lagged = False
+                    last_event_number = yield from catch_up(last_event_number)
+                    continue
+                yield _sse_event_frame(message['event'])
+                last_event_number = event_number
+        except ScenarioDraftNotFound:
+            return
+        finally:
+            subscription.close()
+
+    response = Response(stream(), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+
+def _sse_frame(event_type, data, event_id=None):
+    frame = f'id: {event_id}\n' if event_id is not None else ''
+    return f"{frame}event: {event_type}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+
+def _sse_event_frame(event):
+    return _sse_frame(event['eventType'], event, event['eventNumber'])
+
+
+def _sse_page_frames(page):
+    # A page for a caller behind the compacted prefix starts with the draft snapshot.
+    snapshot = page.get('snapshot')
+    if snapshot is not None:
+        yield _sse_frame('draft.snapshot', snapshot, snapshot['eventNumber'])
+    for event in page['events']:
+        yield _sse_event_frame(event)
+
+
+def _sse_enabled():
+    return str(os.environ.get('SCENARIO_DRAFT_SSE_ENABLED') or '').lower() == 'true'
+
+
+def _env_seconds(name, default):
+    try:
+        return max(1.0, float(os.environ.get(name) or default))
+    except ValueError:
+        return float(default)
 
 
 @bp.route('/api/scenario/drafts/<draft_id>/presence', methods=['POST'])
 def api_scenario_draft_presence_post(draft_id):
     body = _request_json()
     try:
-        presence = upsert_presence(
+        presence, changed = record_presence(
             g.auth_context,
             draft_id,
             display_name=_display_name(),
             cursor_payload=body.get('cursorPayload'),
             mode=body.get('mode') or 'viewing',
         )
-        event = append_event(
-            g.auth_context,
-            draft_id,
-            event_type='presence.updated',
-            draft_revision=None,
-            payload={'presence': presence},
-        )
-        return jsonify({'presence': presence, 'event': event})
+        # Plain heartbeats reach peers through this response, GET /presence and stream presence
+        # frames; only a join or a mode or cursor change goes into the event log.
+        result = {'presence': presence, 'activePresence': get_active_presence(g.auth_context, draft_id)}
+        if changed:
+            result['event'] = append_event(
+                g.auth_context,
+                draft_id,
+                event_type='presence.updated',
+                draft_revision=None,
+                payload={'presence': presence},
+            )
+        return jsonify(result)
     except ScenarioDraftValidationError as error:
         return _validation_error_response(error)
     except ScenarioDraftNotFound as error:
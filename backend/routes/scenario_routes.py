@@ -21,3 +21,13 @@ def get_scenario_overrides():
 @bp.route('/api/scenario/overrides', methods=['POST'])
 def post_scenario_overrides():
     return get_jira_server().post_scenario_overrides()
+
+
+@bp.route('/api/scenario/reschedule', methods=['POST'])
+def reschedule_scenario():
+    return get_jira_server().reschedule_scenario()
+
+
+@bp.route('/api/scenario/compare', methods=['POST'])
+def compare_scenarios():
+    return get_jira_server().compare_scenarios()
@@ -1,25 +1,25 @@
 """Settings, config, and catalog route blueprint."""
 
-from flask import Blueprint
+import re
+import time
+from urllib.parse import parse_qs, urlparse
+
+from flask import Blueprint, jsonify, request
 
 from backend.auth.db_context import is_db_auth_context
+from backend.auth.jira_auth import AuthError
 from backend.config.db_repository import ViewConfigNotFound
-from backend.config.repository import config_storage_db_enabled, db_repository
+from backend.config.repository import db_repository
 from backend.services import shared_group_config
 
-from . import bind_server_globals
-
-
-bp = Blueprint("settings_routes", __name__)
+from . import bind_server, server
 
 
-@bp.before_request
-def _sync_server_globals():
-    bind_server_globals(globals())
+bp = bind_server(Blueprint("settings_routes", __name__))
 
 
 def _settings_process_cache_enabled():
-    return jira_home_process_cache_enabled(current_request_auth_context())
+    return server.jira_home_process_cache_enabled(server.current_request_auth_context())
 
 
 def _has_dashboard_config_value(value):
@@ -53,16 +53,16 @@ def _unsupported_group_fields(payload):
 
 
 def _shared_group_db_auth_context():
-    if not config_storage_db_enabled():
+    if not server.config_storage_db_enabled():
         return None
-    auth_context = current_request_auth_context()
+    auth_context = server.current_request_auth_context()
     if not is_db_auth_context(auth_context):
         return None
     return auth_context
 
 
 def _environment_dashboard_config_exists():
-    config = load_dashboard_config() or {}
+    config = server.load_dashboard_config() or {}
     if not isinstance(config, dict):
         return False
 
@@ -90,7 +90,7 @@ def _environment_dashboard_config_exists():
 
 
 def _resolve_bootstrap_view_config(auth_context):
-    if not config_storage_db_enabled():
+    if not server.config_storage_db_enabled():
         return None
     try:
         return db_repository().resolve_effective_view_config(auth_context)
@@ -99,9 +99,9 @@ def _resolve_bootstrap_view_config(auth_context):
 
 
 def _load_team_catalog_dashboard_config():
-    if config_storage_db_enabled() and not local_file_state_enabled():
-        return db_repository().load_dashboard_config(current_request_auth_context()) or {}
-    return load_dashboard_config() or {}
+    if server.config_storage_db_enabled() and not server.local_file_state_enabled():
+        return db_repository().load_dashboard_config(server.current_request_auth_context()) or {}
+    return server.load_dashboard_config() or {}
 
 
 @bp.route('/api/boards', methods=['GET'])
@@ -116,7 +116,7 @@ def get_boards():
             limit = 200
         limit = max(1, min(limit, 500))
 
-        log_info(
+        server.log_info(
             f'Fetching boards mode={"search" if query else "all"} '
             f'limit={limit} queryLen={len(query)}'
         )
@@ -131,8 +131,8 @@ def get_boards():
 
         # Fast path: direct board-id lookup for numeric search terms.
         if query and query.isdigit():
-            direct_resp = current_jira_get(f'/rest/agile/1.0/board/{query}', timeout=30)
-            log_debug(f'Board direct lookup status={direct_resp.status_code} boardId={query}')
+            direct_resp = server.current_jira_get(f'/rest/agile/1.0/board/{query}', timeout=30)
+            server.log_debug(f'Board direct lookup status={direct_resp.status_code} boardId={query}')
             if direct_resp.status_code == 200:
                 board = direct_resp.json() or {}
                 board_id = board.get('id')
@@ -141,7 +141,7 @@ def get_boards():
                     seen_board_ids.add(board_id)
             elif direct_resp.status_code not in (400, 401, 403, 404):
                 error_text = direct_resp.text
-                log_error(f'Board direct lookup failed: status={direct_resp.status_code}')
+                server.log_error(f'Board direct lookup failed: status={direct_resp.status_code}')
                 return jsonify({
                     'error': f'Jira API error: {direct_resp.status_code}',
                     'details': error_text
@@ -151,13 +151,13 @@ def get_boards():
             params = {'maxResults': page_size, 'startAt': start_at}
             if query:
                 params['name'] = query
-            response = current_jira_get('/rest/agile/1.0/board', params=params, timeout=30)
+            response = server.current_jira_get('/rest/agile/1.0/board', params=params, timeout=30)
 
-            log_debug(f'Boards response status={response.status_code} startAt={start_at}')
+            server.log_debug(f'Boards response status={response.status_code} startAt={start_at}')
 
             if response.status_code != 200:
                 error_text = response.text
-                log_error(f'Boards fetch failed: status={response.status_code} startAt={start_at}')
+                server.log_error(f'Boards fetch failed: status={response.status_code} startAt={start_at}')
                 return jsonify({
                     'error': f'Jira API error: {response.status_code}',
                     'details': error_text
@@ -213,7 +213,7 @@ def get_boards():
         if query:
             formatted_boards = formatted_boards[:limit]
 
-        log_info(
+        server.log_info(
             f'Found {len(formatted_boards)} boards pages={pages_fetched} '
             f'mode={"search" if query else "all"}'
         )
@@ -225,10 +225,10 @@ def get_boards():
         return success_response
 
     except AuthError:
-        payload, status = oauth_auth_required_payload()
+        payload, status = server.oauth_auth_required_payload()
         return jsonify(payload), status
     except Exception as e:
-        logger.exception('Boards endpoint error')
+        server.logger.exception('Boards endpoint error')
         error_response = jsonify({
             'error': 'Failed to fetch boards from Jira',
             'message': str(e)
@@ -247,24 +247,24 @@ def get_sprints():
         formatted_sprints = []
 
         # Check if we should use cache
-        if cache_enabled and not force_refresh and is_cache_valid():
-            cache_data = load_sprints_cache()
+        if cache_enabled and not force_refresh and server.is_cache_valid():
+            cache_data = server.load_sprints_cache()
             if cache_data and 'sprints' in cache_data:
                 formatted_sprints = cache_data['sprints']
-                log_info(f'Loaded {len(formatted_sprints)} sprints from cache')
+                server.log_info(f'Loaded {len(formatted_sprints)} sprints from cache')
 
         # If no valid cache or force refresh, fetch from Jira
         if not formatted_sprints or force_refresh:
             if force_refresh:
-                log_info('Force refresh requested')
+                server.log_info('Force refresh requested')
 
-            formatted_sprints = fetch_sprints_from_jira()
+            formatted_sprints = server.fetch_sprints_from_jira()
 
             # Save to cache
             if cache_enabled and formatted_sprints:
-                save_sprints_cache(formatted_sprints)
+                server.save_sprints_cache(formatted_sprints)
 
-        log_info(f'Total quarterly sprints: {len(formatted_sprints)}')
+        server.log_info(f'Total quarterly sprints: {len(formatted_sprints)}')
 
         success_response = jsonify({'sprints': formatted_sprints})
         success_response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
@@ -273,10 +273,10 @@ def get_sprints():
         return success_response
 
     except AuthError:
-        payload, status = oauth_auth_required_payload()
+        payload, status = server.oauth_auth_required_payload()
         return jsonify(payload), status
     except Exception as e:
-        logger.exception('Sprints endpoint error')
+        server.logger.exception('Sprints endpoint error')
         error_response = jsonify({
             'error': 'Failed to fetch sprints from Jira',
             'message': str(e)
@@ -288,27 +288,27 @@ def get_sprints():
 @bp.route('/api/config', methods=['GET'])
 def get_config():
     """Get public configuration"""
-    auth_context = current_request_auth_context()
+    auth_context = server.current_request_auth_context()
     include_view_config = str(request.args.get('includeViewConfig') or '').strip().lower() in {'1', 'true', 'yes'}
     view_config = _resolve_bootstrap_view_config(auth_context) if include_view_config else None
     view_payload = (view_config or {}).get('view') or {}
-    board_cfg = get_board_config()
-    epm_config = normalize_epm_config(view_payload.get('epm') or {}) if view_config else get_epm_config()
-    can_edit_shared_configuration = (not SETTINGS_ADMIN_ONLY) or bool(auth_context.is_admin)
+    board_cfg = server.get_board_config()
+    epm_config = server.normalize_epm_config(view_payload.get('epm') or {}) if view_config else server.get_epm_config()
+    can_edit_shared_configuration = (not server.SETTINGS_ADMIN_ONLY) or bool(auth_context.is_admin)
     payload = {
         'jiraUrl': auth_context.site_url,
         'authMode': auth_context.auth_mode,
-        'capacityProject': get_effective_capacity_project(),
+        'capacityProject': server.get_effective_capacity_project(),
         'boardId': board_cfg.get('boardId', ''),
         'boardName': board_cfg.get('boardName', ''),
         'boardConfigSource': board_cfg.get('source', 'default'),
-        'settingsAdminOnly': bool(SETTINGS_ADMIN_ONLY),
+        'settingsAdminOnly': bool(server.SETTINGS_ADMIN_ONLY),
         'userCanEditSettings': can_edit_shared_configuration,
         'userCanEditViewConfig': True,
         'userCanEditEpmConfig': can_edit_shared_configuration,
-        'groupsConfigPath': resolve_groups_config_path(),
-        'groupQueryTemplateEnabled': bool(JQL_QUERY_TEMPLATE),
-        'projectsConfigured': bool(get_selected_projects()),
+        'groupsConfigPath': server.resolve_groups_config_path(),
+        'groupQueryTemplateEnabled': bool(server.JQL_QUERY_TEMPLATE),
+        'projectsConfigured': bool(server.get_selected_projects()),
         'environmentConfigExists': _environment_dashboard_config_exists(),
         'epm': epm_config
     }
@@ -320,20 +320,20 @@ def get_config():
 @bp.route('/api/version', methods=['GET'])
 def get_version():
     """Return local/remote version info for update checks."""
-    if not UPDATE_CHECK_ENABLED:
+    if not server.UPDATE_CHECK_ENABLED:
         return jsonify({'enabled': False})
 
     now = time.time()
-    with _cache_lock:
-        cached = UPDATE_CHECK_CACHE.get('data')
-        cached_ts = UPDATE_CHECK_CACHE.get('ts', 0)
-    if cached and (now - cached_ts) < UPDATE_CHECK_TTL_SECONDS:
+    with server._cache_lock:
+        cached = server.UPDATE_CHECK_CACHE.get('data')
+        cached_ts = server.UPDATE_CHECK_CACHE.get('ts', 0)
+    if cached and (now - cached_ts) < server.UPDATE_CHECK_TTL_SECONDS:
         return jsonify(cached)
 
-    payload = build_update_check_payload()
-    with _cache_lock:
-        UPDATE_CHECK_CACHE['data'] = payload
-        UPDATE_CHECK_CACHE['ts'] = now
+    payload = server.build_update_check_payload()
+    with server._cache_lock:
+        server.UPDATE_CHECK_CACHE['data'] = payload
+        server.UPDATE_CHECK_CACHE['ts'] = now
     return jsonify(payload)
 
 
@@ -344,8 +344,8 @@ def get_groups_config():
     if auth_context is not None:
         config = shared_group_config.load_shared_groups(
             auth_context,
-            fallback_loader=lambda: load_dashboard_config(source='jsonfile'),
-            validate_groups_config_fn=validate_groups_config,
+            fallback_loader=lambda: server.load_dashboard_config(source='jsonfile'),
+            validate_groups_config_fn=server.validate_groups_config,
         )
         config['preferences'] = shared_group_config.load_group_preferences(auth_context, config)
         return jsonify(config)
@@ -354,31 +354,31 @@ def get_groups_config():
     config_source = 'auto'
 
     # Try unified dashboard config first
-    dashboard_config = load_dashboard_config()
+    dashboard_config = server.load_dashboard_config()
     if dashboard_config and 'teamGroups' in dashboard_config:
         config = dashboard_config['teamGroups']
         config_source = 'file'
     else:
         # Fall back to legacy file / env
-        config_path = resolve_groups_config_path()
-        config = load_groups_config_file(config_path)
+        config_path = server.resolve_groups_config_path()
+        config = server.load_groups_config_file(config_path)
         if config:
             config_source = 'file'
         else:
-            config = parse_groups_config_env()
+            config = server.parse_groups_config_env()
             if config:
                 config_source = 'env'
 
     if not config:
-        config, auto_warnings = build_default_groups_config()
+        config, auto_warnings = server.build_default_groups_config()
         warnings.extend(auto_warnings)
     else:
-        normalized, errors, validate_warnings = validate_groups_config(config, allow_empty=True)
+        normalized, errors, validate_warnings = server.validate_groups_config(config, allow_empty=True)
         warnings.extend(validate_warnings)
         if errors:
             warnings.append('Invalid groups config; falling back to auto Default group.')
             warnings.extend(errors)
-            normalized, auto_warnings = build_default_groups_config()
+            normalized, auto_warnings = server.build_default_groups_config()
             warnings.extend(auto_warnings)
         config = normalized
 
@@ -405,8 +405,8 @@ def save_groups_config():
     if auth_context is not None:
         current = shared_group_config.load_shared_groups(
             auth_context,
-            fallback_loader=lambda: load_dashboard_config(source='jsonfile'),
-            validate_groups_config_fn=validate_groups_config,
+            fallback_loader=lambda: server.load_dashboard_config(source='jsonfile'),
+            validate_groups_config_fn=server.validate_groups_config,
         )
         if not payload.get('clearGroups') and not payload.get('groups') and _has_dashboard_config_value(current.get('groups')):
             return jsonify({'error': 'team_groups_cannot_be_cleared_implicitly'}), 400
@@ -415,7 +415,7 @@ def save_groups_config():
                 auth_context,
                 payload,
                 payload.get('baseRevision'),
-                validate_groups_config_fn=validate_groups_config,
+                validate_groups_config_fn=server.validate_groups_config,
             )
         except shared_group_config.GroupConfigConflict as error:
             return jsonify({
@@ -428,19 +428,19 @@ def save_groups_config():
         saved['preferences'] = shared_group_config.load_group_preferences(auth_context, saved)
         return jsonify(saved)
 
-    normalized, errors, warnings = validate_groups_config(payload, allow_empty=True)
+    normalized, errors, warnings = server.validate_groups_config(payload, allow_empty=True)
     if errors:
         return jsonify({'errors': errors}), 400
 
     # Save into unified dashboard config, preserving other sections
     try:
-        dashboard_config = load_dashboard_config() or {'version': 1, 'projects': {'selected': []}}
+        dashboard_config = server.load_dashboard_config() or {'version': 1, 'projects': {'selected': []}}
         existing_team_groups = dashboard_config.get('teamGroups') or {}
         existing_groups = existing_team_groups.get('groups') if isinstance(existing_team_groups, dict) else []
         if not payload.get('clearGroups') and not normalized.get('groups') and _has_dashboard_config_value(existing_groups):
             return jsonify({'error': 'team groups cannot be cleared implicitly'}), 400
         dashboard_config['teamGroups'] = normalized
-        save_dashboard_config(dashboard_config)
+        server.save_dashboard_config(dashboard_config)
     except Exception as e:
         return jsonify({'error': 'Failed to save groups config', 'message': str(e)}), 500
 
@@ -468,8 +468,8 @@ def save_groups_preferences():
 
     groups_config = shared_group_config.load_shared_groups(
         auth_context,
-        fallback_loader=lambda: load_dashboard_config(source='jsonfile'),
-        validate_groups_config_fn=validate_groups_config,
+        fallback_loader=lambda: server.load_dashboard_config(source='jsonfile'),
+        validate_groups_config_fn=server.validate_groups_config,
     )
     try:
         preferences = shared_group_config.save_group_preferences(
@@ -485,15 +485,15 @@ def save_groups_preferences():
 @bp.route('/api/team-catalog', methods=['GET'])
 def get_team_catalog():
     """Return the team name catalog."""
-    if config_storage_db_enabled():
+    if server.config_storage_db_enabled():
         config = _load_team_catalog_dashboard_config()
         team_catalog = config.get("teamCatalog") or {}
         return jsonify({
-            "catalog": normalize_team_catalog(team_catalog.get("catalog") or {}),
-            "meta": normalize_team_catalog_meta(team_catalog.get("meta") or {}),
+            "catalog": server.normalize_team_catalog(team_catalog.get("catalog") or {}),
+            "meta": server.normalize_team_catalog_meta(team_catalog.get("meta") or {}),
         })
-    migrate_team_catalog_from_config()
-    data = load_team_catalog()
+    server.migrate_team_catalog_from_config()
+    data = server.load_team_catalog()
     return jsonify(data)
 
 
@@ -503,28 +503,28 @@ def post_team_catalog():
     payload = request.get_json(silent=True) or {}
     merge = payload.get('merge', False)
     incoming = {
-        'catalog': normalize_team_catalog(payload.get('catalog') or {}),
-        'meta': normalize_team_catalog_meta(payload.get('meta') or {})
+        'catalog': server.normalize_team_catalog(payload.get('catalog') or {}),
+        'meta': server.normalize_team_catalog_meta(payload.get('meta') or {})
     }
     if merge:
-        if config_storage_db_enabled():
+        if server.config_storage_db_enabled():
             config = _load_team_catalog_dashboard_config()
             team_catalog = config.get("teamCatalog") or {}
             existing = {
-                "catalog": normalize_team_catalog(team_catalog.get("catalog") or {}),
-                "meta": normalize_team_catalog_meta(team_catalog.get("meta") or {}),
+                "catalog": server.normalize_team_catalog(team_catalog.get("catalog") or {}),
+                "meta": server.normalize_team_catalog_meta(team_catalog.get("meta") or {}),
             }
         else:
-            existing = load_team_catalog()
+            existing = server.load_team_catalog()
         merged_catalog = {**existing['catalog'], **incoming['catalog']}
         incoming['catalog'] = merged_catalog
-    if config_storage_db_enabled():
+    if server.config_storage_db_enabled():
         config = _load_team_catalog_dashboard_config() or {"version": 1, "projects": {"selected": []}, "teamGroups": {}}
         config["teamCatalog"] = incoming
-        save_dashboard_config(config)
+        server.save_dashboard_config(config)
         saved = incoming
         return jsonify(saved)
-    saved = save_team_catalog_file(incoming)
+    saved = server.save_team_catalog_file(incoming)
     return jsonify(saved)
 
 
@@ -539,10 +539,10 @@ def get_jira_projects():
 
         # Return cached data only for full-list requests (no query/limit), unless refresh requested.
         if cache_enabled:
-            with _cache_lock:
+            with server._cache_lock:
                 if (not refresh and not query and not limit_raw and
-                        PROJECTS_CACHE['data'] and (time.time() - PROJECTS_CACHE['timestamp']) < PROJECTS_CACHE_TTL):
-                    return jsonify({'projects': PROJECTS_CACHE['data']})
+                        server.PROJECTS_CACHE['data'] and (time.time() - server.PROJECTS_CACHE['timestamp']) < server.PROJECTS_CACHE_TTL):
+                    return jsonify({'projects': server.PROJECTS_CACHE['data']})
 
         limit = None
         if limit_raw:
@@ -563,7 +563,7 @@ def get_jira_projects():
             if query:
                 params['query'] = query
 
-            response = current_jira_get('/rest/api/3/project/search', params=params, timeout=15)
+            response = server.current_jira_get('/rest/api/3/project/search', params=params, timeout=15)
             if response.status_code != 200:
                 return jsonify({'error': 'Failed to fetch projects', 'details': response.text}), response.status_code
             data = response.json()
@@ -612,13 +612,13 @@ def get_jira_projects():
 
         # Cache results (only for unfiltered full list)
         if cache_enabled and not query:
-            with _cache_lock:
-                PROJECTS_CACHE['data'] = all_projects
-                PROJECTS_CACHE['timestamp'] = time.time()
+            with server._cache_lock:
+                server.PROJECTS_CACHE['data'] = all_projects
+                server.PROJECTS_CACHE['timestamp'] = time.time()
 
         return jsonify({'projects': all_projects})
     except AuthError:
-        payload, status = oauth_auth_required_payload()
+        payload, status = server.oauth_auth_required_payload()
         return jsonify(payload), status
     except Exception as e:
         return jsonify({'error': 'Failed to fetch projects', 'details': str(e)}), 500
@@ -641,12 +641,12 @@ def get_jira_components():
 
         # Return cached data when no query is specified and cache is fresh
         if cache_enabled:
-            with _cache_lock:
-                if (not query and COMPONENTS_CACHE['data'] and
-                        (time.time() - COMPONENTS_CACHE['timestamp']) < COMPONENTS_CACHE_TTL):
-                    return jsonify({'components': COMPONENTS_CACHE['data'][:limit]})
+            with server._cache_lock:
+                if (not query and server.COMPONENTS_CACHE['data'] and
+                        (time.time() - server.COMPONENTS_CACHE['timestamp']) < server.COMPONENTS_CACHE_TTL):
+                    return jsonify({'components': server.COMPONENTS_CACHE['data'][:limit]})
 
-        projects = get_selected_projects()
+        projects = server.get_selected_projects()
         if not projects:
             return jsonify({'components': []})
 
@@ -654,7 +654,7 @@ def get_jira_components():
         all_components = []
         for project_key in projects:
             try:
-                resp = current_jira_get(f'/rest/api/3/project/{project_key}/components', timeout=10)
+                resp = server.current_jira_get(f'/rest/api/3/project/{project_key}/components', timeout=10)
                 if resp.status_code != 200:
                     continue
                 for comp in (resp.json() or []):
@@ -679,9 +679,9 @@ def get_jira_components():
 
         # Cache the full unfiltered list
         if cache_enabled and not query:
-            with _cache_lock:
-                COMPONENTS_CACHE['data'] = all_components
-                COMPONENTS_CACHE['timestamp'] = time.time()
+            with server._cache_lock:
+                server.COMPONENTS_CACHE['data'] = all_components
+                server.COMPONENTS_CACHE['timestamp'] = time.time()
 
         # Apply query filter
         if query:
@@ -689,7 +689,7 @@ def get_jira_components():
 
         return jsonify({'components': all_components[:limit]})
     except AuthError:
-        payload, status = oauth_auth_required_payload()
+        payload, status = server.oauth_auth_required_payload()
         return jsonify(payload), status
     except Exception as e:
         return jsonify({'error': 'Failed to fetch components', 'details': str(e)}), 500
@@ -711,7 +711,7 @@ def search_epics():
             except ValueError:
                 return jsonify({'error': 'limit must be an integer'}), 400
 
-        projects = get_selected_projects()
+        projects = server.get_selected_projects()
         if not projects:
             return jsonify({'epics': []})
 
@@ -720,13 +720,13 @@ def search_epics():
         cache_key = f'{"|".join(normalized_projects)}::{query.lower()}::{limit}'
         now_ts = time.time()
         if cache_enabled:
-            with _cache_lock:
-                cached = EPICS_SEARCH_CACHE.get(cache_key)
-                if cached and (now_ts - float(cached.get('timestamp') or 0)) < EPICS_SEARCH_CACHE_TTL:
+            with server._cache_lock:
+                cached = server.EPICS_SEARCH_CACHE.get(cache_key)
+                if cached and (now_ts - float(cached.get('timestamp') or 0)) < server.EPICS_SEARCH_CACHE_TTL:
                     return jsonify({'epics': cached.get('data') or []})
-        escaped_projects = ', '.join(f'"{_escape_jql_literal(project)}"' for project in normalized_projects)
-        escaped_query = _escape_jql_literal(query)
-        escaped_key = _escape_jql_literal(query.upper())
+        escaped_projects = ', '.join(f'"{server._escape_jql_literal(project)}"' for project in normalized_projects)
+        escaped_query = server._escape_jql_literal(query)
+        escaped_key = server._escape_jql_literal(query.upper())
         key_like = re.match(r'^[A-Za-z][A-Za-z0-9_]+-\d+$', query) is not None
 
         if key_like:
@@ -739,7 +739,7 @@ def search_epics():
             f'AND {query_clause} ORDER BY updated DESC'
         )
 
-        response = jira_search_request({
+        response = server.jira_search_request({
             'jql': jql,
             'maxResults': limit,
             'fields': ['summary', 'status', 'project', 'issuetype']
@@ -779,15 +779,15 @@ def search_epics():
             })
 
         if cache_enabled:
-            with _cache_lock:
-                EPICS_SEARCH_CACHE[cache_key] = {
+            with server._cache_lock:
+                server.EPICS_SEARCH_CACHE[cache_key] = {
                     'timestamp': now_ts,
                     'data': epics
                 }
 
         return jsonify({'epics': epics})
     except AuthError:
-        payload, status = oauth_auth_required_payload()
+        payload, status = server.oauth_auth_required_payload()
         return jsonify(payload), status
     except Exception as e:
         return jsonify({'error': 'Failed to search epics', 'details': str(e)}), 500
@@ -810,18 +810,18 @@ def get_jira_labels():
         cached_labels = None
         cached_ts = 0
         if cache_enabled:
-            with _cache_lock:
-                cached_labels = LABELS_CACHE.get('data')
-                cached_ts = LABELS_CACHE.get('timestamp', 0)
+            with server._cache_lock:
+                cached_labels = server.LABELS_CACHE.get('data')
+                cached_ts = server.LABELS_CACHE.get('timestamp', 0)
 
-        if cache_enabled and cached_labels and not refresh and (time.time() - cached_ts) < LABELS_CACHE_TTL:
+        if cache_enabled and cached_labels and not refresh and (time.time() - cached_ts) < server.LABELS_CACHE_TTL:
             labels = cached_labels
         else:
             labels = []
             start_at = 0
             max_results = 1000
             while True:
-                response = current_jira_get(
+                response = server.current_jira_get(
                     '/rest/api/3/label',
                     params={'maxResults': max_results, 'startAt': start_at},
                     timeout=30
@@ -840,20 +840,20 @@ def get_jira_labels():
                     start_at += len(values)
             labels = sorted(dict.fromkeys(labels), key=str.lower)
             if cache_enabled:
-                with _cache_lock:
-                    LABELS_CACHE['data'] = labels
-                    LABELS_CACHE['timestamp'] = time.time()
+                with server._cache_lock:
+                    server.LABELS_CACHE['data'] = labels
+                    server.LABELS_CACHE['timestamp'] = time.time()
 
         if query:
             labels = [label for label in labels if query in label.lower()]
         if prefix:
-            prefix = normalize_epm_label_prefix_mask(prefix)
+            prefix = server.normalize_epm_label_prefix_mask(prefix)
         if prefix:
             labels = [label for label in labels if label.lower().startswith(prefix)]
 
         return jsonify({'labels': labels[:limit]})
     except AuthError:
-        payload, status = oauth_auth_required_payload()
+        payload, status = server.oauth_auth_required_payload()
         return jsonify(payload), status
     except Exception as e:
         return jsonify({'error': 'Failed to fetch labels', 'details': str(e)}), 500
@@ -862,7 +862,7 @@ def get_jira_labels():
 @bp.route('/api/projects/selected', methods=['GET'])
 def get_selected_projects_endpoint():
     """Return the list of selected projects with type from dashboard config."""
-    selected = get_selected_projects_typed()
+    selected = server.get_selected_projects_typed()
     return jsonify({'selected': selected})
 
 
@@ -882,19 +882,19 @@ def save_selected_projects():
             sanitized.append({'key': item.strip(), 'type': 'product'})
 
     try:
-        dashboard_config = load_dashboard_config() or {'version': 1, 'projects': {'selected': []}, 'teamGroups': {}}
+        dashboard_config = server.load_dashboard_config() or {'version': 1, 'projects': {'selected': []}, 'teamGroups': {}}
         existing_projects = dashboard_config.get('projects') or {}
         existing_selected = existing_projects.get('selected') if isinstance(existing_projects, dict) else []
         if not sanitized and _has_dashboard_config_value(existing_selected):
             return jsonify({'error': 'selected projects cannot be cleared implicitly'}), 400
         dashboard_config.setdefault('projects', {})['selected'] = sanitized
-        save_dashboard_config(dashboard_config)
+        server.save_dashboard_config(dashboard_config)
     except Exception as e:
         return jsonify({'error': 'Failed to save project selection', 'message': str(e)}), 500
 
     # Invalidate tasks cache since project scope changed
-    with _cache_lock:
-        TASKS_CACHE.clear()
+    with server._cache_lock:
+        server.TASKS_CACHE.clear()
 
     return jsonify({'selected': sanitized})
 
@@ -902,14 +902,14 @@ def save_selected_projects():
 @bp.route('/api/capacity/config', methods=['GET'])
 def get_capacity_config_endpoint():
     """Return current capacity configuration."""
-    cap = get_capacity_config()
+    cap = server.get_capacity_config()
     return jsonify(cap)
 
 
 @bp.route('/api/board-config', methods=['GET'])
 def get_board_config_endpoint():
     """Return current Jira board configuration."""
-    board_cfg = get_board_config()
+    board_cfg = server.get_board_config()
     return jsonify({
         'boardId': board_cfg.get('boardId', ''),
         'boardName': board_cfg.get('boardName', ''),
@@ -928,15 +928,15 @@ def save_board_config_endpoint():
         return jsonify({'error': 'boardId must be numeric'}), 400
 
     try:
-        dashboard_config = load_dashboard_config() or {'version': 1, 'projects': {'selected': []}, 'teamGroups': {}}
+        dashboard_config = server.load_dashboard_config() or {'version': 1, 'projects': {'selected': []}, 'teamGroups': {}}
         dashboard_config['board'] = {
             'boardId': board_id,
             'boardName': board_name,
         }
-        save_dashboard_config(dashboard_config)
-        with _cache_lock:
-            TASKS_CACHE.clear()
-        invalidate_sprints_cache()
+        server.save_dashboard_config(dashboard_config)
+        with server._cache_lock:
+            server.TASKS_CACHE.clear()
+        server.invalidate_sprints_cache()
     except Exception as e:
         return jsonify({'error': 'Failed to save board config', 'message': str(e)}), 500
 
@@ -952,18 +952,16 @@ def save_capacity_config_endpoint():
     field_name = str(payload.get('fieldName', '')).strip()
 
     try:
-        dashboard_config = load_dashboard_config() or {'version': 1, 'projects': {'selected': []}, 'teamGroups': {}}
+        dashboard_config = server.load_dashboard_config() or {'version': 1, 'projects': {'selected': []}, 'teamGroups': {}}
         dashboard_config['capacity'] = {
             'project': project,
             'fieldId': field_id,
             'fieldName': field_name,
         }
-        save_dashboard_config(dashboard_config)
+        server.save_dashboard_config(dashboard_config)
         # Reset the field cache since config changed
-        global CAPACITY_FIELD_CACHE
-        with _cache_lock:
-            _jira_server_module.CAPACITY_FIELD_CACHE = None
-            CAPACITY_FIELD_CACHE = None
+        with server._cache_lock:
+            server.CAPACITY_FIELD_CACHE = None
     except Exception as e:
         return jsonify({'error': 'Failed to save capacity config', 'message': str(e)}), 500
 
@@ -972,47 +970,47 @@ def save_capacity_config_endpoint():
 
 @bp.route('/api/sprint-field/config', methods=['GET'])
 def get_sprint_field_config_endpoint():
-    return jsonify(get_sprint_field_config())
+    return jsonify(server.get_sprint_field_config())
 
 
 @bp.route('/api/sprint-field/config', methods=['POST'])
 def save_sprint_field_config_endpoint():
-    return _save_field_config('sprintField')
+    return server._save_field_config('sprintField')
 
 
 @bp.route('/api/story-points-field/config', methods=['GET'])
 def get_story_points_field_config_endpoint():
-    return jsonify(get_story_points_field_config())
+    return jsonify(server.get_story_points_field_config())
 
 
 @bp.route('/api/story-points-field/config', methods=['POST'])
 def save_story_points_field_config_endpoint():
-    return _save_field_config('storyPointsField')
+    return server._save_field_config('storyPointsField')
 
 
 @bp.route('/api/parent-name-field/config', methods=['GET'])
 def get_parent_name_field_config_endpoint():
-    return jsonify(get_parent_name_field_config())
+    return jsonify(server.get_parent_name_field_config())
 
 
 @bp.route('/api/parent-name-field/config', methods=['POST'])
 def save_parent_name_field_config_endpoint():
-    return _save_field_config('parentNameField', 'PARENT_NAME_FIELD_CACHE')
+    return server._save_field_config('parentNameField', 'PARENT_NAME_FIELD_CACHE')
 
 
 @bp.route('/api/team-field/config', methods=['GET'])
 def get_team_field_config_endpoint():
-    return jsonify(get_team_field_config())
+    return jsonify(server.get_team_field_config())
 
 
 @bp.route('/api/team-field/config', methods=['POST'])
 def save_team_field_config_endpoint():
-    return _save_field_config('teamField', 'TEAM_FIELD_CACHE')
+    return server._save_field_config('teamField', 'TEAM_FIELD_CACHE')
 
 
 @bp.route('/api/stats/priority-weights-config', methods=['GET'])
 def get_stats_priority_weights_config_endpoint():
-    payload = get_priority_weights_config()
+    payload = server.get_priority_weights_config()
     return jsonify(payload)
 
 
@@ -1021,14 +1019,14 @@ def save_stats_priority_weights_config_endpoint():
     payload = request.get_json(silent=True) or {}
     raw_weights = payload.get('weights', [])
     try:
-        normalized = normalize_priority_weight_rows(raw_weights)
+        normalized = server.normalize_priority_weight_rows(raw_weights)
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
 
     try:
-        dashboard_config = load_dashboard_config() or {'version': 1, 'projects': {'selected': []}, 'teamGroups': {}}
+        dashboard_config = server.load_dashboard_config() or {'version': 1, 'projects': {'selected': []}, 'teamGroups': {}}
         dashboard_config['statsPriorityWeights'] = normalized
-        save_dashboard_config(dashboard_config)
+        server.save_dashboard_config(dashboard_config)
     except Exception as e:
         return jsonify({'error': 'Failed to save stats priority weights', 'message': str(e)}), 500
 
@@ -1041,11 +1039,11 @@ def get_jira_issue_types():
     try:
         cache_enabled = _settings_process_cache_enabled()
         if cache_enabled:
-            with _cache_lock:
-                if ISSUE_TYPES_CACHE['data'] and (time.time() - ISSUE_TYPES_CACHE['timestamp']) < ISSUE_TYPES_CACHE_TTL:
-                    return jsonify({'issueTypes': ISSUE_TYPES_CACHE['data']})
+            with server._cache_lock:
+                if server.ISSUE_TYPES_CACHE['data'] and (time.time() - server.ISSUE_TYPES_CACHE['timestamp']) < server.ISSUE_TYPES_CACHE_TTL:
+                    return jsonify({'issueTypes': server.ISSUE_TYPES_CACHE['data']})
 
-        response = current_jira_get('/rest/api/3/issuetype', timeout=15)
+        response = server.current_jira_get('/rest/api/3/issuetype', timeout=15)
         if response.status_code != 200:
             return jsonify({'error': 'Failed to fetch issue types', 'details': response.text}), response.status_code
         data = response.json()
@@ -1063,13 +1061,13 @@ def get_jira_issue_types():
         result.sort(key=lambda x: x['name'])
 
         if cache_enabled:
-            with _cache_lock:
-                ISSUE_TYPES_CACHE['data'] = result
-                ISSUE_TYPES_CACHE['timestamp'] = time.time()
+            with server._cache_lock:
+                server.ISSUE_TYPES_CACHE['data'] = result
+                server.ISSUE_TYPES_CACHE['timestamp'] = time.time()
 
         return jsonify({'issueTypes': result})
     except AuthError:
-        payload, status = oauth_auth_required_payload()
+        payload, status = server.oauth_auth_required_payload()
         return jsonify(payload), status
     except Exception as e:
         return jsonify({'error': 'Failed to fetch issue types', 'details': str(e)}), 500
@@ -1078,7 +1076,7 @@ def get_jira_issue_types():
 @bp.route('/api/issue-types/config', methods=['GET'])
 def get_issue_types_config_endpoint():
     """Return configured issue types from dashboard config."""
-    types = get_configured_issue_types()
+    types = server.get_configured_issue_types()
     return jsonify({'issueTypes': types})
 
 
@@ -1092,15 +1090,15 @@ def save_issue_types_config_endpoint():
     sanitized = [str(t).strip() for t in raw if str(t).strip()]
 
     try:
-        dashboard_config = load_dashboard_config() or {'version': 1, 'projects': {'selected': []}, 'teamGroups': {}}
+        dashboard_config = server.load_dashboard_config() or {'version': 1, 'projects': {'selected': []}, 'teamGroups': {}}
         dashboard_config['issueTypes'] = sanitized
-        save_dashboard_config(dashboard_config)
+        server.save_dashboard_config(dashboard_config)
     except Exception as e:
         return jsonify({'error': 'Failed to save issue types config', 'message': str(e)}), 500
 
     # Invalidate tasks cache since query scope changed
-    with _cache_lock:
-        TASKS_CACHE.clear()
+    with server._cache_lock:
+        server.TASKS_CACHE.clear()
 
     return jsonify({'issueTypes': sanitized})
 
@@ -1113,7 +1111,7 @@ def get_jira_fields():
         if project_key:
             # Fetch fields scoped to a specific project via createmeta
             seen = {}
-            resp = current_jira_get(f'/rest/api/3/issue/createmeta/{project_key}/issuetypes', timeout=15)
+            resp = server.current_jira_get(f'/rest/api/3/issue/createmeta/{project_key}/issuetypes', timeout=15)
             if resp.status_code == 200:
                 issue_types = (resp.json() or {}).get('issueTypes', resp.json() if isinstance(resp.json(), list) else [])
                 if isinstance(issue_types, list):
@@ -1121,7 +1119,7 @@ def get_jira_fields():
                         it_id = it.get('id', '')
                         if not it_id:
                             continue
-                        fields_resp = current_jira_get(
+                        fields_resp = server.current_jira_get(
                             f'/rest/api/3/issue/createmeta/{project_key}/issuetypes/{it_id}',
                             timeout=15
                         )
@@ -1143,7 +1141,7 @@ def get_jira_fields():
                 return jsonify({'fields': result, 'scoped': True})
             # Fallback to global fields if createmeta didn't work
 
-        response = current_jira_get('/rest/api/3/field', timeout=15)
+        response = server.current_jira_get('/rest/api/3/field', timeout=15)
         if response.status_code != 200:
             return jsonify({'error': 'Failed to fetch fields', 'details': response.text}), response.status_code
         fields = response.json() or []
@@ -1157,7 +1155,7 @@ def get_jira_fields():
         result.sort(key=lambda f: f['name'].lower())
         return jsonify({'fields': result, 'scoped': False})
     except AuthError:
-        payload, status = oauth_auth_required_payload()
+        payload, status = server.oauth_auth_required_payload()
         return jsonify(payload), status
     except Exception as e:
         return jsonify({'error': 'Failed to fetch fields', 'details': str(e)}), 500
@@ -8,26 +8,21 @@ from backend.auth.key_provider import KeyProviderConfigurationError, key_provide
 from backend.auth import user_api_tokens
 from backend.db.engine import DatabaseConfigurationError, session_scope
 
-from . import bind_server_globals
+from . import bind_server, server
 
 
-bp = Blueprint("user_connection_routes", __name__)
-
-
-@bp.before_request
-def _sync_server_globals():
-    bind_server_globals(globals())
+bp = bind_server(Blueprint("user_connection_routes", __name__))
 
 
 @bp.before_request
 def _require_token_bound_csrf():
     if request.method not in {'POST', 'PUT', 'PATCH', 'DELETE'}:
         return None
-    if JIRA_AUTH_MODE != AUTH_MODE_ATLASSIAN_OAUTH:
+    if server.JIRA_AUTH_MODE != AUTH_MODE_ATLASSIAN_OAUTH:
         return None
     if getattr(g, 'security_csrf_validated', False):
         return None
-    data = oauth_session_data()
+    data = server.oauth_session_data()
     if validate_csrf_token(session, data, request.headers.get('X-CSRF-Token')):
         return None
     return jsonify({
@@ -39,9 +34,9 @@ def _require_token_bound_csrf():
 @bp.before_request
 def _require_authenticated_user():
     try:
-        g.auth_context = current_request_auth_context()
+        g.auth_context = server.current_request_auth_context()
     except AuthError as error:
-        return auth_error_response(error, 401)
+        return server.auth_error_response(error, 401)
     except DatabaseConfigurationError as error:
         return _storage_error_response(error)
     return None
@@ -82,7 +77,7 @@ def api_me_home_token_connection():
 def api_me_connect_home_token():
     context = g.auth_context
     payload = request.get_json(silent=True) or {}
-    session_data = oauth_session_data()
+    session_data = server.oauth_session_data()
     email = str(payload.get('email') or session_data.get('email') or '').strip()
     api_token = payload.get('apiToken') or ''
     try:
@@ -93,9 +88,9 @@ def api_me_connect_home_token():
                 email=email,
                 api_token=api_token,
                 key_provider=key_provider_from_env(),
-                http_get=HTTP_SESSION.get,
+                http_get=server.HTTP_SESSION.get,
             )
-            clear_auth_sensitive_caches('user_api_token_connected')
+            server.clear_auth_sensitive_caches('user_api_token_connected')
             return jsonify(user_api_tokens.home_token_summary(connection))
     except user_api_tokens.UserApiTokenError as error:
         return _error_response(error)
@@ -109,7 +104,7 @@ def api_me_revoke_home_token():
     try:
         with session_scope() as db_session:
             user_api_tokens.revoke_home_user_api_token(db_session, context=context)
-            clear_auth_sensitive_caches('user_api_token_revoked')
+            server.clear_auth_sensitive_caches('user_api_token_revoked')
         return jsonify({'connected': False})
     except DatabaseConfigurationError as error:
         return _storage_error_response(error)
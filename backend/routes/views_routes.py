@@ -12,29 +12,24 @@ from backend.config.view_validation import ViewPayloadValidationError, validate_
 from backend.db import models
 from backend.db.engine import DatabaseConfigurationError, session_scope
 
-from . import bind_server_globals
+from . import bind_server, server
 
 
-bp = Blueprint("views_routes", __name__)
+bp = bind_server(Blueprint("views_routes", __name__))
 
 VALID_VIEW_TYPES = {'eng', 'epm', 'mixed'}
 UNSAFE_METHODS = {'POST', 'PUT', 'PATCH', 'DELETE'}
 
 
-@bp.before_request
-def _sync_server_globals():
-    bind_server_globals(globals())
-
-
 @bp.before_request
 def _require_token_bound_csrf():
     if request.method not in UNSAFE_METHODS:
         return None
-    if JIRA_AUTH_MODE != AUTH_MODE_ATLASSIAN_OAUTH:
+    if server.JIRA_AUTH_MODE != AUTH_MODE_ATLASSIAN_OAUTH:
         return None
     if getattr(g, 'security_csrf_validated', False):
         return None
-    data = oauth_session_data()
+    data = server.oauth_session_data()
     if validate_csrf_token(session, data, request.headers.get('X-CSRF-Token')):
         return None
     return jsonify({
@@ -46,9 +41,9 @@ def _require_token_bound_csrf():
 @bp.before_request
 def _require_authenticated_user():
     try:
-        g.auth_context = current_request_auth_context()
+        g.auth_context = server.current_request_auth_context()
     except AuthError as error:
-        return auth_error_response(error, 401)
+        return server.auth_error_response(error, 401)
     except DatabaseConfigurationError as error:
         return _storage_error_response(error)
     return None
@@ -219,7 +214,7 @@ def _validate_home_project_references(context, payload):
         return None
     epm = payload.get('epm') if isinstance(payload, dict) else {}
     scope = epm.get('scope') if isinstance(epm, dict) else {}
-    projects = fetch_epm_home_projects(scope, context=context)
+    projects = server.fetch_epm_home_projects(scope, context=context)
     missing = sorted(referenced - _home_project_catalog_ids(projects))
     if missing:
         return jsonify({
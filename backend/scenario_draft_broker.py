@@ -0,0 +1,244 @@
+"""Scenario draft event fan-out for long-lived SSE streams.
+
+Writers publish a message per draft after their transaction commits. Each
+open stream holds a bounded queue subscribed to one draft:
+
+* with PostgreSQL the message is sent with ``pg_notify`` inside the writing
+  transaction, so it is delivered on commit to every worker process; one
+  ``LISTEN`` connection per process fans it out to the local queues;
+* with any other database the message is handed to the local queues after
+  commit, so only streams served by the writing process see it.
+
+Messages are wake-ups rather than the source of truth. A stream that sees a
+gap in event numbers, overflows its queue, or reconnects after a listener
+error reads the missed events from ``scenario_draft_events``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import queue
+import threading
+import time
+
+from sqlalchemy import func, select
+from sqlalchemy.engine import make_url
+
+
+NOTIFY_CHANNEL = 'scenario_draft_events'
+NOTIFY_PAYLOAD_LIMIT = 7000
+SUBSCRIPTION_QUEUE_SIZE = 256
+DEFAULT_MAX_STREAMS_PER_DRAFT = 10
+DEFAULT_GUNICORN_THREADS = 8
+LISTENER_POLL_SECONDS = 5
+LISTENER_RETRY_SECONDS = 2
+
+logger = logging.getLogger(__name__)
+
+_BROKERS: dict[str, 'DraftEventBroker'] = {}
+_BROKERS_LOCK = threading.Lock()
+
+
+class ScenarioDraftStreamLimit(RuntimeError):
+    """Raised when a draft, or this process, already has the maximum number of open streams."""
+
+
+class DraftSubscription:
+    """Bounded message queue for one open stream on one draft."""
+
+    def __init__(self, broker, draft_id):
+        self._broker = broker
+        self.draft_id = draft_id
+        self._queue = queue.Queue(maxsize=SUBSCRIPTION_QUEUE_SIZE)
+        self.lagged = False
+
+    def offer(self, message):
+        try:
+            self._queue.put_nowait(message)
+        except queue.Full:
+            self.lagged = True
+
+    def get(self, timeout):
+        """Next message, or None when ``timeout`` seconds pass without one."""
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self):
+        self._broker.unsubscribe(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+
+class DraftEventBroker:
+    """In-process fan-out to the streams served by this process."""
+
+    def __init__(self):
+        self._stream_count = 0
+        self._lock = threading.Lock()
+        self._subscriptions: dict[str, set[DraftSubscription]] = {}
+
+    def subscribe(self, draft_id, *, max_streams, max_streams_per_draft):
+        draft_id = str(draft_id)
+        with self._lock:
+            if self._stream_count >= max_streams:
+                raise ScenarioDraftStreamLimit('too many open scenario draft streams on this server')
+            subscriptions = self._subscriptions.setdefault(draft_id, set())
+            if len(subscriptions) >= max_streams_per_draft:
+                raise ScenarioDraftStreamLimit('too many open streams for this scenario draft')
+            subscription = DraftSubscription(self, draft_id)
+            subscriptions.add(subscription)
+            self._stream_count += 1
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.draft_id)
+            if subscriptions is None or subscription not in subscriptions:
+                return
+            subscriptions.discard(subscription)
+            self._stream_count -= 1
+            if not subscriptions:
+                del self._subscriptions[subscription.draft_id]
+
+    def stream_count(self, draft_id):
+        with self._lock:
+            return len(self._subscriptions.get(str(draft_id), ()))
+
+    def deliver(self, draft_id, message):
+        """Hand ``message`` to the local streams of ``draft_id``."""
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(str(draft_id), ()))
+        for subscription in subscriptions:
+            subscription.offer(message)
+
+    def deliver_to_all(self, message):
+        with self._lock:
+            subscriptions = [item for group in self._subscriptions.values() for item in group]
+        for subscription in subscriptions:
+            subscription.offer(message)
+
+    def notify_in_transaction(self, session, messages):
+        """Publish from inside the writing transaction; returns False when delivery waits for commit."""
+        return False
+
+    def publish_committed(self, messages):
+        for draft_id, message in messages:
+            self.deliver(draft_id, message)
+
+
+class PostgresDraftEventBroker(DraftEventBroker):
+    """Fan-out across worker processes through PostgreSQL ``LISTEN/NOTIFY``."""
+
+    def __init__(self, database_url):
+        super().__init__()
+        self._dsn = make_url(database_url).set(drivername='postgresql').render_as_string(hide_password=False)
+        self._listener = None
+        self._listener_lock = threading.Lock()
+
+    def subscribe(self, draft_id, **limits):
+        self._ensure_listener()
+        return super().subscribe(draft_id, **limits)
+
+    def notify_in_transaction(self, session, messages):
+        for draft_id, message in messages:
+            payload = json.dumps({'draftId': str(draft_id), **message}, separators=(',', ':'), default=str)
+            if len(payload) > NOTIFY_PAYLOAD_LIMIT:
+                # Too large for NOTIFY; streams read the event from the table instead.
+                payload = json.dumps({
+                    'draftId': str(draft_id),
+                    'kind': message.get('kind'),
+                    'eventNumber': message.get('eventNumber'),
+                }, separators=(',', ':'))
+            session.execute(select(func.pg_notify(NOTIFY_CHANNEL, payload)))
+        return True
+
+    def publish_committed(self, messages):
+        # Delivered by the listener, including to this process.
+        return None
+
+    def _ensure_listener(self):
+        with self._listener_lock:
+            if self._listener is None or not self._listener.is_alive():
+                self._listener = threading.Thread(
+                    target=self._listen_forever,
+                    name='scenario-draft-listener',
+                    daemon=True,
+                )
+                self._listener.start()
+
+    def _listen_forever(self):
+        import psycopg
+
+        while True:
+            try:
+                with psycopg.connect(self._dsn, autocommit=True) as connection:
+                    connection.execute(f'LISTEN {NOTIFY_CHANNEL}')
+                    # Anything sent while the listener was down is read back from the table.
+                    self.deliver_to_all({'kind': 'resync'})
+                    while True:
+                        for notify in connection.notifies(timeout=LISTENER_POLL_SECONDS):
+                            self._dispatch(notify.payload)
+            except Exception:
+                logger.warning('Scenario draft LISTEN connection failed; retrying', exc_info=True)
+                time.sleep(LISTENER_RETRY_SECONDS)
+
+    def _dispatch(self, payload):
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            return
+        draft_id = message.pop('draftId', None)
+        if draft_id:
+            self.deliver(draft_id, message)
+
+
+def draft_event_broker(database_url):
+    """Shared broker for ``database_url``: ``LISTEN/NOTIFY`` on PostgreSQL, in-process otherwise."""
+    url = str(database_url or '')
+    with _BROKERS_LOCK:
+        broker = _BROKERS.get(url)
+        if broker is None:
+            if url and make_url(url).get_backend_name() == 'postgresql':
+                broker = PostgresDraftEventBroker(url)
+            else:
+                broker = DraftEventBroker()
+            _BROKERS[url] = broker
+        return broker
+
+
+def stream_limits(environ=None):
+    """``subscribe`` limits from the environment.
+
+    Every open stream holds a server thread, so by default at most half of
+    ``GUNICORN_THREADS`` serve streams and the rest stay free for ordinary
+    requests.
+    """
+    env = os.environ if environ is None else environ
+    return {
+        'max_streams': max(1, _env_int(
+            env,
+            'SCENARIO_DRAFT_SSE_MAX_STREAMS',
+            _env_int(env, 'GUNICORN_THREADS', DEFAULT_GUNICORN_THREADS) // 2,
+        )),
+        'max_streams_per_draft': max(1, _env_int(env, 'SCENARIO_DRAFT_SSE_MAX_STREAMS_PER_DRAFT', DEFAULT_MAX_STREAMS_PER_DRAFT)),
+    }
+
+
+def _env_int(env, name, default):
+    try:
+        return int(env.get(name) or default)
+    except ValueError:
+        return default
+
+
+def reset_draft_event_brokers():
+    with _BROKERS_LOCK:
+        _BROKERS.clear()
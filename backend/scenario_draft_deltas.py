@@ -0,0 +1,53 @@
+"""JSON Patch (RFC 6902) deltas between scenario draft override maps.
+
+Overrides map issue keys to small ``{'start', 'end'}`` objects, so deltas are
+computed per top-level key: ``add`` for new keys, ``replace`` for changed
+values and ``remove`` for dropped keys. ``apply_overrides_patch`` accepts
+that subset and rejects anything else.
+"""
+
+from __future__ import annotations
+
+from copy import deepcopy
+
+
+def overrides_patch(old, new):
+    """Operations turning ``old`` into ``new``, sorted by key."""
+    old = old or {}
+    new = new or {}
+    operations = []
+    for key in sorted(set(old) | set(new)):
+        path = '/' + _escape(key)
+        if key not in new:
+            operations.append({'op': 'remove', 'path': path})
+        elif key not in old:
+            operations.append({'op': 'add', 'path': path, 'value': deepcopy(new[key])})
+        elif old[key] != new[key]:
+            operations.append({'op': 'replace', 'path': path, 'value': deepcopy(new[key])})
+    return operations
+
+
+def apply_overrides_patch(base, operations):
+    """Return a copy of ``base`` with ``operations`` applied."""
+    result = deepcopy(base or {})
+    for operation in operations or []:
+        op = operation.get('op')
+        path = str(operation.get('path') or '')
+        if not path.startswith('/') or '/' in path[1:]:
+            raise ValueError(f'unsupported scenario override patch path: {path!r}')
+        key = _unescape(path[1:])
+        if op in ('add', 'replace'):
+            result[key] = deepcopy(operation.get('value'))
+        elif op == 'remove':
+            result.pop(key, None)
+        else:
+            raise ValueError(f'unsupported scenario override patch op: {op!r}')
+    return result
+
+
+def _escape(key):
+    return str(key).replace('~', '~0').replace('/', '~1')
+
+
+def _unescape(token):
+    return token.replace('~1', '/').replace('~0', '~')
@@ -0,0 +1,212 @@
+"""In-memory scenario draft presence with batched ``last_seen_at`` writes.
+
+Presence heartbeats mostly move ``last_seen_at``. The registry keeps the
+presence of each visible draft in memory:
+
+* the first heartbeat of a user on a draft, and the first one after
+  ``verify_seconds``, is written through by the caller. That write checks
+  the draft is still visible and creates the row;
+* other heartbeats only update memory and mark the row dirty. A background
+  flush writes all dirty rows every ``flush_interval`` seconds in one
+  statement;
+* presence reads answer from memory. Rows written by other worker processes
+  are reloaded at most every ``refresh_seconds`` per draft, and the newer
+  ``last_seen_at`` wins when memory and database disagree.
+
+A process that exits loses at most one flush interval of heartbeats, which
+only makes presence look a few seconds older to other processes.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import threading
+import time
+from copy import deepcopy
+from datetime import datetime, timedelta, timezone
+
+
+DEFAULT_FLUSH_INTERVAL_SECONDS = 5
+DEFAULT_VERIFY_SECONDS = 30
+DEFAULT_REFRESH_SECONDS = 5
+
+logger = logging.getLogger(__name__)
+
+
+class _DraftPresence:
+    __slots__ = ('entries', 'verified_at', 'dirty', 'loaded_at')
+
+    def __init__(self):
+        self.entries = {}  # user_id -> (serialized presence, last_seen_at)
+        self.verified_at = {}  # user_id -> monotonic time of the last write-through
+        self.dirty = set()
+        self.loaded_at = None
+
+
+class PresenceRegistry:
+    """Presence per ``(scope, draft_id)``; ``scope`` is the resolved database URL and workspace."""
+
+    def __init__(
+        self,
+        writer,
+        *,
+        ttl_seconds,
+        flush_interval=None,
+        verify_seconds=DEFAULT_VERIFY_SECONDS,
+        refresh_seconds=DEFAULT_REFRESH_SECONDS,
+        clock=time.monotonic,
+    ):
+        self._writer = writer
+        self.ttl_seconds = ttl_seconds
+        self._flush_interval = flush_interval
+        self.verify_seconds = verify_seconds
+        self.refresh_seconds = refresh_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._drafts: dict[tuple, _DraftPresence] = {}
+        self._flusher_pid = None
+
+    def heartbeat(self, scope, draft_id, user_id, *, display_name, cursor_payload, mode, last_seen_at):
+        """Absorb a heartbeat; returns the updated presence, or None when the caller must write through."""
+        with self._lock:
+            state = self._drafts.get((scope, draft_id))
+            entry = state.entries.get(user_id) if state is not None else None
+            verified_at = state.verified_at.get(user_id) if state is not None else None
+            if entry is None or verified_at is None or self._clock() - verified_at >= self.verify_seconds:
+                return None
+            presence = dict(
+                entry[0],
+                displayName=display_name,
+                cursorPayload=deepcopy(cursor_payload),
+                mode=mode,
+                lastSeenAt=last_seen_at.isoformat(),
+            )
+            state.entries[user_id] = (presence, last_seen_at)
+            state.dirty.add(user_id)
+        self._ensure_flusher()
+        return deepcopy(presence)
+
+    def current(self, scope, draft_id, user_id, cutoff):
+        """The user's presence on the draft if seen after ``cutoff``, else None."""
+        with self._lock:
+            state = self._drafts.get((scope, draft_id))
+            entry = state.entries.get(user_id) if state is not None else None
+            if entry is None or entry[1] <= cutoff:
+                return None
+            return deepcopy(entry[0])
+
+    def remember(self, scope, draft_id, presence, last_seen_at):
+        """Record a presence row the caller just wrote to the database."""
+        with self._lock:
+            state = self._drafts.setdefault((scope, draft_id), _DraftPresence())
+            user_id = presence['userId']
+            current = state.entries.get(user_id)
+            if current is None or current[1] <= last_seen_at:
+                state.entries[user_id] = (deepcopy(presence), last_seen_at)
+                state.dirty.discard(user_id)
+            state.verified_at[user_id] = self._clock()
+
+    def active(self, scope, draft_id, cutoff):
+        """Presence seen after ``cutoff``, or None when the draft must be reloaded from the database."""
+        with self._lock:
+            state = self._drafts.get((scope, draft_id))
+            if state is None or state.loaded_at is None or self._clock() - state.loaded_at >= self.refresh_seconds:
+                return None
+            return _sorted_presence(state, cutoff)
+
+    def load(self, scope, draft_id, rows, cutoff):
+        """Merge ``(presence, last_seen_at)`` rows read from the database; returns presence seen after ``cutoff``."""
+        with self._lock:
+            state = self._drafts.setdefault((scope, draft_id), _DraftPresence())
+            for presence, last_seen_at in rows:
+                current = state.entries.get(presence['userId'])
+                if current is None or current[1] < last_seen_at:
+                    state.entries[presence['userId']] = (deepcopy(presence), last_seen_at)
+            state.loaded_at = self._clock()
+            return _sorted_presence(state, cutoff)
+
+    def flush(self):
+        """Write every dirty row through ``writer``; rows that fail stay dirty for the next flush."""
+        with self._flush_lock:
+            batches = {}
+            with self._lock:
+                for (scope, _draft_id), state in self._drafts.items():
+                    for user_id in state.dirty:
+                        presence, last_seen_at = state.entries[user_id]
+                        batches.setdefault(scope[0], []).append((deepcopy(presence), last_seen_at))
+                    state.dirty.clear()
+            written = 0
+            for database_url, rows in batches.items():
+                try:
+                    self._writer(database_url, rows)
+                    written += len(rows)
+                except Exception:
+                    logger.warning('Scenario draft presence flush failed; retrying next interval', exc_info=True)
+                    self._mark_dirty(rows)
+            return written
+
+    def forget_expired(self, cutoff):
+        """Drop clean entries last seen before ``cutoff`` and drafts left empty."""
+        with self._lock:
+            for key in list(self._drafts):
+                state = self._drafts[key]
+                for user_id, (_, last_seen_at) in list(state.entries.items()):
+                    if user_id not in state.dirty and last_seen_at <= cutoff:
+                        del state.entries[user_id]
+                        state.verified_at.pop(user_id, None)
+                if not state.entries:
+                    del self._drafts[key]
+
+    def clear(self):
+        with self._lock:
+            self._drafts.clear()
+
+    def _mark_dirty(self, rows):
+        with self._lock:
+            for state in self._drafts.values():
+                for presence, last_seen_at in rows:
+                    entry = state.entries.get(presence['userId'])
+                    if entry is not None and entry[0].get('presenceId') == presence.get('presenceId') and entry[1] == last_seen_at:
+                        state.dirty.add(presence['userId'])
+
+    def _flush_forever(self, interval):
+        while True:
+            time.sleep(interval)
+            try:
+                self.flush()
+                self.forget_expired(datetime.now(timezone.utc) - timedelta(seconds=self.ttl_seconds))
+            except Exception:  # pragma: no cover - the flusher must never die
+                logger.warning('Scenario draft presence flush failed', exc_info=True)
+
+    def _ensure_flusher(self):
+        """Start the periodic flush lazily, once per process (one per pre-forked worker)."""
+        pid = os.getpid()
+        if self._flusher_pid == pid:
+            return
+        with self._lock:
+            if self._flusher_pid == pid:
+                return
+            self._flusher_pid = pid
+        interval = self._flush_interval
+        if interval is None:
+            try:
+                interval = float(os.environ.get('SCENARIO_DRAFT_PRESENCE_FLUSH_SECONDS') or DEFAULT_FLUSH_INTERVAL_SECONDS)
+            except ValueError:
+                interval = DEFAULT_FLUSH_INTERVAL_SECONDS
+        atexit.register(self.flush)
+        if interval <= 0:
+            return
+        threading.Thread(
+            target=self._flush_forever,
+            args=(interval,),
+            name='scenario-draft-presence-flush',
+            daemon=True,
+        ).start()
+
+
+def _sorted_presence(state, cutoff):
+    active = [deepcopy(presence) for presence, last_seen_at in state.entries.values() if last_seen_at > cutoff]
+    return sorted(active, key=lambda item: (item.get('displayName') or '', item.get('userId') or ''))
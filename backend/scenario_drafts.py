@@ -11,12 +11,18 @@ import warnings
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import func, select, update
+from sqlalchemy import event as sa_event
+from sqlalchemy import delete, func, select, update
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, defer
+from sqlalchemy.orm.attributes import set_committed_value
 
 from backend.db import engine as db_engine
 from backend.db import models
 from backend import runtime_state
+from backend.scenario_draft_broker import ScenarioDraftStreamLimit, draft_event_broker, stream_limits
+from backend.scenario_draft_deltas import apply_overrides_patch, overrides_patch
+from backend.scenario_draft_presence import PresenceRegistry
 
 
 MEMBERSHIP_SCOPE_KEYS = {
@@ -32,6 +38,14 @@ KEEP_SCENARIO_SOURCE_HASH = object()
 PRESENCE_TTL_SECONDS = 30
 ISSUE_LOCK_TTL_SECONDS = 30
 COLLABORATION_WRITE_ATTEMPTS = 2
+VERSION_CHECKPOINT_INTERVAL = 20
+VERSION_PAGE_SIZE = 50
+VERSION_PAGE_LIMIT = 100
+EVENT_PAGE_LIMIT = 100
+EVENT_COMPACTION_INTERVAL = 200
+DEFAULT_EVENT_RETENTION_HOURS = 24
+PENDING_BROADCASTS_KEY = 'scenario_draft_broadcasts'
+COMMITTED_BROADCASTS_KEY = 'scenario_draft_committed_broadcasts'
 
 
 class ScenarioDraftNotFound(LookupError):
@@ -95,7 +109,7 @@ def get_active_draft(context, scope_key, legacy_loader=None):
         draft = _active_draft_for_scope(session, context, scope_key)
         if draft is None and legacy_loader is not None and _legacy_import_allowed(session, context):
             draft = _import_legacy_scope(session, context, scope_key, legacy_loader)
-        return _response(draft, _versions_for_draft(session, draft.id) if draft is not None else [])
+        return _response(session, draft)
 
 
 def save_draft(context, scope_key, name, overrides, base_draft_revision=None, scope_payload=None):
@@ -139,7 +153,7 @@ def save_draft(context, scope_key, name, overrides, base_draft_revision=None, sc
                 payload={'versionNumber': version.version_number},
             )
             session.flush()
-            return _response(draft, _versions_for_draft(session, draft.id, pending=version))
+            return _response(session, draft)
     except IntegrityError as exc:
         _raise_conflict_for_scope(context, scope_key, base_draft_revision, exc)
 
@@ -152,7 +166,23 @@ def get_version(context, draft_id, version_number):
         version = _version_for_number(session, draft.id, version_number)
         if version is None:
             raise ScenarioDraftNotFound('scenario draft version not found')
-        return _serialize_version(version)
+        return _serialize_version(version, overrides=_version_overrides(session, version))
+
+
+def list_versions(context, draft_id, *, before_version_number=None, limit=VERSION_PAGE_SIZE):
+    """Version metadata, newest page first; page back with ``nextBefore`` until ``isLast``."""
+    before = _coerce_non_negative_int(before_version_number, 'before')
+    page_limit = min(max(int(limit or VERSION_PAGE_SIZE), 1), VERSION_PAGE_LIMIT)
+    with db_engine.session_scope(_database_url(context), testing=_testing(context)) as session:
+        draft = _draft_for_id(session, context, draft_id)
+        if draft is None:
+            raise ScenarioDraftNotFound('scenario draft not found')
+        versions, is_last = _version_page(session, draft.id, before=before, limit=page_limit)
+        return {
+            'versions': [_serialize_version_summary(version) for version in versions],
+            'nextBefore': int(versions[0].version_number) if versions and not is_last else None,
+            'isLast': is_last,
+        }
 
 
 def rollback_to_version(context, draft_id, target_version_number, base_draft_revision):
@@ -169,7 +199,7 @@ def rollback_to_version(context, draft_id, target_version_number, base_draft_rev
                 context,
                 draft,
                 name=target.name,
-                overrides=deepcopy(target.overrides or {}),
+                overrides=_version_overrides(session, target),
                 scope_payload=deepcopy(target.scope_payload or {}),
                 scenario_source_hash=target.scenario_source_hash,
                 base_draft_revision=base_draft_revision,
@@ -192,7 +222,7 @@ def rollback_to_version(context, draft_id, target_version_number, base_draft_rev
                 },
             )
             session.flush()
-            return _response(draft, _versions_for_draft(session, draft.id, pending=version))
+            return _response(session, draft)
     except IntegrityError as exc:
         _raise_conflict_for_draft_id(context, draft_id, base_draft_revision, exc)
 
@@ -209,7 +239,7 @@ def append_event(context, draft_id, *, event_type, draft_revision, payload):
                     raise ScenarioDraftNotFound('scenario draft not found')
                 event = models.ScenarioDraftEvent(
                     scenario_draft_id=draft.id,
-                    event_number=_next_event_number(session, draft.id),
+                    event_number=_next_event_number(session, draft),
                     event_type=event_type,
                     draft_revision=int(draft.draft_revision or 0),
                     payload=payload,
@@ -217,6 +247,8 @@ def append_event(context, draft_id, *, event_type, draft_revision, payload):
                 )
                 session.add(event)
                 session.flush()
+                _queue_broadcast(session, draft.id, 'event', event)
+                _compact_events_periodically(session, context, draft, event)
                 return _serialize_event(event)
         except IntegrityError as exc:
             last_error = exc
@@ -242,45 +274,140 @@ def get_events_after(context, draft_id, *, after_event_number):
         return [_serialize_event(event) for event in session.execute(statement).scalars().all()]
 
 
-def get_events_page(context, draft_id, *, since_event_number, limit=100):
+def get_events_page(context, draft_id, *, since_event_number, limit=EVENT_PAGE_LIMIT):
+    """Events after ``since``; a caller behind the compacted prefix gets ``join_events`` instead."""
     since = _coerce_non_negative_int(since_event_number, 'since')
-    page_limit = min(max(int(limit or 100), 1), 100)
+    page_limit = min(max(int(limit or EVENT_PAGE_LIMIT), 1), EVENT_PAGE_LIMIT)
     with db_engine.session_scope(_database_url(context), testing=_testing(context)) as session:
         draft = _draft_for_id(session, context, draft_id)
         if draft is None:
             raise ScenarioDraftNotFound('scenario draft not found')
-        statement = (
-            select(models.ScenarioDraftEvent)
-            .where(
-                models.ScenarioDraftEvent.scenario_draft_id == draft.id,
-                models.ScenarioDraftEvent.event_number > since,
-            )
-            .order_by(models.ScenarioDraftEvent.event_number.asc())
-            .limit(page_limit + 1)
-        )
-        loaded = list(session.execute(statement).scalars().all())
-        events = [_serialize_event(event) for event in loaded[:page_limit]]
-        next_since = events[-1]['eventNumber'] if events else since
-        return {
-            'events': events,
-            'nextSince': next_since,
-            'isLast': len(loaded) <= page_limit,
-        }
+        if since < int(draft.compacted_event_number or 0):
+            return _snapshot_page(session, context, draft, limit=page_limit)
+        return _events_page(session, draft.id, since=since, limit=page_limit)
+
+
+def join_events(context, draft_id, *, limit=EVENT_PAGE_LIMIT, now=None):
+    """Snapshot of the draft at event N plus the events after N, however old the draft is.
+
+    The draft row, its locks and presence already hold the state that older
+    events describe, so the snapshot is read from them. Events after N repeat
+    changes the snapshot may already include; applying them again is a no-op
+    for clients, which compare draft revisions and merge locks and presence
+    by key.
+    """
+    page_limit = min(max(int(limit or EVENT_PAGE_LIMIT), 1), EVENT_PAGE_LIMIT)
+    with db_engine.session_scope(_database_url(context), testing=_testing(context)) as session:
+        draft = _draft_for_id(session, context, draft_id)
+        if draft is None:
+            raise ScenarioDraftNotFound('scenario draft not found')
+        return _snapshot_page(session, context, draft, limit=page_limit, now=now)
+
+
+def compact_events(context, draft_id, *, now=None):
+    """Prune events older than the retention window; returns the number of events removed.
+
+    Writers also compact every ``EVENT_COMPACTION_INTERVAL`` events, so this
+    is only needed to shrink a draft that has gone quiet; ``compact_stale_events``
+    does that for every such draft.
+    """
+    with db_engine.session_scope(_database_url(context), testing=_testing(context)) as session:
+        draft = _draft_for_id(session, context, draft_id, for_update=True)
+        if draft is None:
+            raise ScenarioDraftNotFound('scenario draft not found')
+        return _compact_events(session, draft, retention=_event_retention(context), now=now or _utcnow())
+
+
+def compact_stale_events(context, *, now=None):
+    """Compact every open draft that still holds events past retention; returns ``{draft_id: removed}``.
+
+    A ``context.workspace_id`` of None sweeps every workspace. Run by
+    ``python -m backend.admin.compact_scenario_draft_events``.
+    """
+    now = now or _utcnow()
+    retention = _event_retention(context)
+    cutoff = _normalize_datetime(now) - retention
+    workspace_id = getattr(context, 'workspace_id', None)
+    statement = (
+        select(models.ScenarioDraft.id)
+        .join(models.ScenarioDraftEvent, models.ScenarioDraftEvent.scenario_draft_id == models.ScenarioDraft.id)
+        .where(models.ScenarioDraft.archived_at.is_(None), models.ScenarioDraftEvent.created_at < cutoff)
+        .distinct()
+    )
+    if workspace_id is not None:
+        statement = statement.where(models.ScenarioDraft.workspace_id == workspace_id)
+    with db_engine.session_scope(_database_url(context), testing=_testing(context)) as session:
+        stale_draft_ids = session.execute(statement).scalars().all()
+    removed = {}
+    for draft_id in stale_draft_ids:
+        # One transaction per draft, so the sweep holds a single draft row lock at a time.
+        with db_engine.session_scope(_database_url(context), testing=_testing(context)) as session:
+            draft = session.execute(
+                select(models.ScenarioDraft)
+                .where(models.ScenarioDraft.id == draft_id, models.ScenarioDraft.archived_at.is_(None))
+                .with_for_update()
+            ).scalars().first()
+            count = _compact_events(session, draft, retention=retention, now=now) if draft is not None else 0
+        if count:
+            removed[draft_id] = count
+    return removed
+
+
+def subscribe_events(context, draft_id):
+    """Open a broker subscription for a visible draft; close it when the stream ends."""
+    with db_engine.session_scope(_database_url(context), testing=_testing(context)) as session:
+        draft = _draft_for_id(session, context, draft_id)
+        if draft is None:
+            raise ScenarioDraftNotFound('scenario draft not found')
+        return _session_broker(session).subscribe(draft.id, **stream_limits(getattr(context, 'environ', None)))
 
 
 def upsert_presence(context, draft_id, *, display_name, cursor_payload, mode, now=None):
+    return record_presence(
+        context,
+        draft_id,
+        display_name=display_name,
+        cursor_payload=cursor_payload,
+        mode=mode,
+        now=now,
+    )[0]
+
+
+def record_presence(context, draft_id, *, display_name, cursor_payload, mode, now=None):
+    """Record a heartbeat; returns ``(presence, changed)``.
+
+    ``changed`` is true when the user joins the draft or their mode or cursor
+    moved, the only heartbeats worth a ``presence.updated`` event.
+    """
     now = _normalize_datetime(now or _utcnow())
     user_id = _require_user_id(context)
     cursor_payload = _validate_json_object(cursor_payload, 'cursor_payload')
     mode = _require_text(mode, 'mode')
+    scope = _presence_scope(context)
+    cutoff = now - timedelta(seconds=PRESENCE_TTL_SECONDS)
+    previous = PRESENCE_REGISTRY.current(scope, draft_id, user_id, cutoff)
+    absorbed = PRESENCE_REGISTRY.heartbeat(
+        scope,
+        draft_id,
+        user_id,
+        display_name=display_name,
+        cursor_payload=cursor_payload,
+        mode=mode,
+        last_seen_at=now,
+    )
+    if absorbed is not None:
+        draft_event_broker(scope[0]).deliver(draft_id, {'kind': 'presence', 'presence': absorbed})
+        return absorbed, _presence_moved(previous, mode, cursor_payload)
     last_error = None
     for _ in range(COLLABORATION_WRITE_ATTEMPTS):
         try:
-            with db_engine.session_scope(_database_url(context), testing=_testing(context)) as session:
+            with db_engine.session_scope(scope[0], testing=_testing(context)) as session:
                 draft = _draft_for_id(session, context, draft_id)
                 if draft is None:
                     raise ScenarioDraftNotFound('scenario draft not found')
                 presence = _presence_for_user(session, draft.id, user_id)
+                if previous is None and presence is not None and _normalize_datetime(presence.last_seen_at) > cutoff:
+                    previous = {'mode': presence.mode, 'cursorPayload': presence.cursor_payload}
                 if presence is None:
                     presence = models.ScenarioDraftPresence(
                         scenario_draft_id=draft.id,
@@ -297,7 +424,10 @@ def upsert_presence(context, draft_id, *, display_name, cursor_payload, mode, no
                     presence.mode = mode
                     presence.last_seen_at = now
                 session.flush()
-                return _serialize_presence(presence)
+                _queue_broadcast(session, draft.id, 'presence', presence)
+                serialized = _serialize_presence(presence)
+            PRESENCE_REGISTRY.remember(scope, draft_id, serialized, now)
+            return serialized, _presence_moved(previous, mode, cursor_payload)
         except IntegrityError as exc:
             last_error = exc
     raise ScenarioDraftValidationError(
@@ -306,22 +436,27 @@ def upsert_presence(context, draft_id, *, display_name, cursor_payload, mode, no
     ) from last_error
 
 
+def _presence_moved(previous, mode, cursor_payload):
+    return previous is None or previous.get('mode') != mode or (previous.get('cursorPayload') or {}) != cursor_payload
+
+
 def get_active_presence(context, draft_id, *, now=None):
     now = _normalize_datetime(now or _utcnow())
     cutoff = now - timedelta(seconds=PRESENCE_TTL_SECONDS)
-    with db_engine.session_scope(_database_url(context), testing=_testing(context)) as session:
+    scope = _presence_scope(context)
+    active = PRESENCE_REGISTRY.active(scope, draft_id, cutoff)
+    if active is not None:
+        return active
+    with db_engine.session_scope(scope[0], testing=_testing(context)) as session:
         draft = _draft_for_id(session, context, draft_id)
         if draft is None:
             raise ScenarioDraftNotFound('scenario draft not found')
-        statement = (
-            select(models.ScenarioDraftPresence)
-            .where(
-                models.ScenarioDraftPresence.scenario_draft_id == draft.id,
-                models.ScenarioDraftPresence.last_seen_at > cutoff,
-            )
-            .order_by(models.ScenarioDraftPresence.display_name.asc(), models.ScenarioDraftPresence.user_id.asc())
-        )
-        return [_serialize_presence(presence) for presence in session.execute(statement).scalars().all()]
+        return _load_presence(session, scope, draft.id, cutoff)
+
+
+def flush_presence():
+    """Write heartbeats absorbed in memory to ``scenario_draft_presence`` now."""
+    return PRESENCE_REGISTRY.flush()
 
 
 def acquire_lock(context, draft_id, *, resource_type, resource_id, holder_display_name, now=None):
@@ -406,7 +541,7 @@ def reload_from_jira(context, draft_id, *, base_draft_revision, source_loader=No
         _raise_if_stale(session, draft, base_draft_revision)
         draft_snapshot = _serialize_draft(
             draft,
-            current_version_number=_current_version_number(_versions_for_draft(session, draft.id)),
+            current_version_number=_latest_version_number(session, draft.id),
         )
 
     source = _run_reload_source_loader(
@@ -447,7 +582,7 @@ def reload_from_jira(context, draft_id, *, base_draft_revision, source_loader=No
                 payload={'versionNumber': version.version_number},
             )
             session.flush()
-            return _response(draft, _versions_for_draft(session, draft.id, pending=version))
+            return _response(session, draft)
     except IntegrityError as exc:
         _raise_conflict_for_draft_id(context, draft_id, base_draft_revision, exc)
 
@@ -724,48 +859,238 @@ def _version_for_number(session, draft_id, version_number):
     return session.execute(statement).scalars().first()
 
 
-def _versions_for_draft(session, draft_id, pending=None):
+def _version_page(session, draft_id, *, before=None, limit=VERSION_PAGE_SIZE):
+    """Up to ``limit`` versions below ``before`` (newest when None) in ascending order, and whether older ones remain.
+
+    Override and scope payloads are deferred so listings never load them.
+    """
     statement = (
         select(models.ScenarioDraftVersion)
         .where(models.ScenarioDraftVersion.scenario_draft_id == draft_id)
-        .order_by(models.ScenarioDraftVersion.version_number.asc())
+        .options(
+            defer(models.ScenarioDraftVersion.overrides),
+            defer(models.ScenarioDraftVersion.overrides_delta),
+            defer(models.ScenarioDraftVersion.scope_payload),
+        )
+        .order_by(models.ScenarioDraftVersion.version_number.desc())
+        .limit(limit + 1)
     )
+    if before:
+        statement = statement.where(models.ScenarioDraftVersion.version_number < before)
     versions = list(session.execute(statement).scalars().all())
-    if pending is not None and pending not in versions:
-        versions.append(pending)
-        versions.sort(key=lambda version: int(version.version_number or 0))
-    return versions
+    return list(reversed(versions[:limit])), len(versions) <= limit
 
 
-def _next_version_number(session, draft_id):
+def _version_chain(session, draft_id, version_number):
+    """``(is_checkpoint, overrides, overrides_delta)`` rows from the nearest checkpoint up to ``version_number``."""
+    checkpoint_number = (
+        select(func.coalesce(func.max(models.ScenarioDraftVersion.version_number), 0))
+        .where(
+            models.ScenarioDraftVersion.scenario_draft_id == draft_id,
+            models.ScenarioDraftVersion.is_checkpoint.is_(True),
+            models.ScenarioDraftVersion.version_number <= version_number,
+        )
+        .scalar_subquery()
+    )
+    statement = (
+        select(
+            models.ScenarioDraftVersion.is_checkpoint,
+            models.ScenarioDraftVersion.overrides,
+            models.ScenarioDraftVersion.overrides_delta,
+        )
+        .where(
+            models.ScenarioDraftVersion.scenario_draft_id == draft_id,
+            models.ScenarioDraftVersion.version_number >= checkpoint_number,
+            models.ScenarioDraftVersion.version_number <= version_number,
+        )
+        .order_by(models.ScenarioDraftVersion.version_number.asc())
+    )
+    return list(session.execute(statement).all())
+
+
+def _replay_version_chain(chain):
+    overrides = {}
+    for is_checkpoint, checkpoint_overrides, delta in chain:
+        if is_checkpoint:
+            overrides = deepcopy(checkpoint_overrides or {})
+        else:
+            overrides = apply_overrides_patch(overrides, delta)
+    return overrides
+
+
+def _version_overrides(session, version):
+    """Full overrides of ``version``, replayed from its checkpoint when it only stores a delta."""
+    if version.is_checkpoint:
+        return deepcopy(version.overrides or {})
+    return _replay_version_chain(_version_chain(session, version.scenario_draft_id, int(version.version_number)))
+
+
+def _latest_version_number(session, draft_id):
     statement = select(func.max(models.ScenarioDraftVersion.version_number)).where(
         models.ScenarioDraftVersion.scenario_draft_id == draft_id,
     )
-    current = session.execute(statement).scalar_one()
-    return int(current or 0) + 1
+    return int(session.execute(statement).scalar_one() or 0)
+
+
+def _next_version_number(session, draft_id):
+    return _latest_version_number(session, draft_id) + 1
 
 
-def _next_event_number(session, draft_id):
+def _latest_event_number(session, draft):
     statement = select(func.max(models.ScenarioDraftEvent.event_number)).where(
-        models.ScenarioDraftEvent.scenario_draft_id == draft_id,
+        models.ScenarioDraftEvent.scenario_draft_id == draft.id,
     )
     current = session.execute(statement).scalar_one()
-    return int(current or 0) + 1
+    # Compaction may have pruned every event; numbers must still never be reused.
+    return max(int(current or 0), int(draft.compacted_event_number or 0))
+
+
+def _next_event_number(session, draft):
+    return _latest_event_number(session, draft) + 1
+
+
+def _events_page(session, draft_id, *, since, limit):
+    statement = (
+        select(models.ScenarioDraftEvent)
+        .where(
+            models.ScenarioDraftEvent.scenario_draft_id == draft_id,
+            models.ScenarioDraftEvent.event_number > since,
+        )
+        .order_by(models.ScenarioDraftEvent.event_number.asc())
+        .limit(limit + 1)
+    )
+    loaded = list(session.execute(statement).scalars().all())
+    events = [_serialize_event(event) for event in loaded[:limit]]
+    next_since = events[-1]['eventNumber'] if events else since
+    return {
+        'events': events,
+        'nextSince': next_since,
+        'isLast': len(loaded) <= limit,
+    }
+
+
+def _snapshot_page(session, context, draft, *, limit, now=None):
+    now = _normalize_datetime(now or _utcnow())
+    event_number = _latest_event_number(session, draft)
+    # Read the state after N so it includes at least every event up to N.
+    session.refresh(draft)
+    locks = session.execute(
+        select(models.ScenarioDraftLock)
+        .where(
+            models.ScenarioDraftLock.scenario_draft_id == draft.id,
+            models.ScenarioDraftLock.expires_at > now,
+        )
+        .order_by(models.ScenarioDraftLock.resource_type, models.ScenarioDraftLock.resource_id)
+    ).scalars().all()
+    scope = _presence_scope(context)
+    cutoff = now - timedelta(seconds=PRESENCE_TTL_SECONDS)
+    presence = PRESENCE_REGISTRY.active(scope, draft.id, cutoff)
+    if presence is None:
+        presence = _load_presence(session, scope, draft.id, cutoff)
+    snapshot = {
+        'eventNumber': event_number,
+        'activeDraft': _serialize_draft(draft, current_version_number=_latest_version_number(session, draft.id)),
+        'locks': [_serialize_lock(lock) for lock in locks],
+        'presence': presence,
+    }
+    return {'snapshot': snapshot, **_events_page(session, draft.id, since=event_number, limit=limit)}
+
+
+def _compact_events(session, draft, *, retention, now):
+    cutoff = _normalize_datetime(now) - retention
+    through = session.execute(
+        select(func.max(models.ScenarioDraftEvent.event_number)).where(
+            models.ScenarioDraftEvent.scenario_draft_id == draft.id,
+            models.ScenarioDraftEvent.created_at < cutoff,
+        )
+    ).scalar_one()
+    if not through or int(through) <= int(draft.compacted_event_number or 0):
+        return 0
+    removed = session.execute(
+        delete(models.ScenarioDraftEvent).where(
+            models.ScenarioDraftEvent.scenario_draft_id == draft.id,
+            models.ScenarioDraftEvent.event_number <= through,
+        )
+    ).rowcount
+    # Keep updated_at: compaction is not a draft change.
+    session.execute(
+        update(models.ScenarioDraft)
+        .where(models.ScenarioDraft.id == draft.id)
+        .values(compacted_event_number=int(through), updated_at=models.ScenarioDraft.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+    set_committed_value(draft, 'compacted_event_number', int(through))
+    return int(removed or 0)
+
+
+def _compact_events_periodically(session, context, draft, event):
+    if int(event.event_number) % EVENT_COMPACTION_INTERVAL == 0:
+        _compact_events(session, draft, retention=_event_retention(context), now=_utcnow())
+
+
+def _event_retention(context):
+    env = getattr(context, 'environ', None) or os.environ
+    try:
+        hours = float(env.get('SCENARIO_DRAFT_EVENT_RETENTION_HOURS') or DEFAULT_EVENT_RETENTION_HOURS)
+    except ValueError:
+        hours = DEFAULT_EVENT_RETENTION_HOURS
+    return timedelta(hours=max(hours, 0))
 
 
 def _append_event_in_session(session, context, draft, *, event_type, payload):
     event = models.ScenarioDraftEvent(
         scenario_draft_id=draft.id,
-        event_number=_next_event_number(session, draft.id),
+        event_number=_next_event_number(session, draft),
         event_type=event_type,
         draft_revision=int(draft.draft_revision or 0),
         payload=_validate_json_object(payload, 'payload'),
         created_by=_context_user_id(context),
     )
     session.add(event)
+    _queue_broadcast(session, draft.id, 'event', event)
+    _compact_events_periodically(session, context, draft, event)
     return event
 
 
+def _queue_broadcast(session, draft_id, kind, record):
+    session.info.setdefault(PENDING_BROADCASTS_KEY, []).append((draft_id, kind, record))
+
+
+def _broadcast_message(kind, record):
+    if kind == 'presence':
+        return {'kind': 'presence', 'presence': _serialize_presence(record)}
+    event = _serialize_event(record)
+    return {'kind': 'event', 'eventNumber': event['eventNumber'], 'event': event}
+
+
+def _session_broker(session):
+    return draft_event_broker(session.get_bind().url.render_as_string(hide_password=False))
+
+
+@sa_event.listens_for(Session, 'before_commit')
+def _notify_draft_streams(session):
+    pending = session.info.pop(PENDING_BROADCASTS_KEY, None)
+    if not pending:
+        return
+    session.flush()
+    messages = [(draft_id, _broadcast_message(kind, record)) for draft_id, kind, record in pending]
+    if not _session_broker(session).notify_in_transaction(session, messages):
+        session.info[COMMITTED_BROADCASTS_KEY] = messages
+
+
+@sa_event.listens_for(Session, 'after_commit')
+def _publish_draft_streams(session):
+    messages = session.info.pop(COMMITTED_BROADCASTS_KEY, None)
+    if messages:
+        _session_broker(session).publish_committed(messages)
+
+
+@sa_event.listens_for(Session, 'after_rollback')
+def _drop_draft_broadcasts(session):
+    session.info.pop(PENDING_BROADCASTS_KEY, None)
+    session.info.pop(COMMITTED_BROADCASTS_KEY, None)
+
+
 def _coerce_non_negative_int(value, field_name):
     if value is None or value == '':
         return 0
@@ -782,6 +1107,42 @@ def _coerce_non_negative_int(value, field_name):
     return parsed
 
 
+def _presence_scope(context):
+    # Resolved URL, so drafts read through an explicit and an env-derived URL share entries.
+    engine = db_engine.get_engine(_database_url(context), testing=_testing(context))
+    return engine.url.render_as_string(hide_password=False), context.workspace_id
+
+
+def _write_presence_batch(database_url, rows):
+    # One executemany UPDATE by primary key; write-through heartbeats created the rows.
+    with db_engine.session_scope(database_url) as session:
+        session.execute(update(models.ScenarioDraftPresence), [
+            {
+                'id': presence['presenceId'],
+                'display_name': presence['displayName'],
+                'cursor_payload': presence['cursorPayload'],
+                'mode': presence['mode'],
+                'last_seen_at': last_seen_at,
+            }
+            for presence, last_seen_at in rows
+        ])
+
+
+PRESENCE_REGISTRY = PresenceRegistry(_write_presence_batch, ttl_seconds=PRESENCE_TTL_SECONDS)
+
+
+def _load_presence(session, scope, draft_id, cutoff):
+    statement = select(models.ScenarioDraftPresence).where(
+        models.ScenarioDraftPresence.scenario_draft_id == draft_id,
+        models.ScenarioDraftPresence.last_seen_at > cutoff,
+    )
+    rows = [
+        (_serialize_presence(presence), _normalize_datetime(presence.last_seen_at))
+        for presence in session.execute(statement).scalars().all()
+    ]
+    return PRESENCE_REGISTRY.load(scope, draft_id, rows, cutoff)
+
+
 def _presence_for_user(session, draft_id, user_id):
     statement = (
         select(models.ScenarioDraftPresence)
@@ -810,17 +1171,33 @@ def _lock_is_active(lock, now):
 
 
 def _append_version(session, draft, *, source, change_note=None):
+    """Append the draft's current state as a version.
+
+    Every ``VERSION_CHECKPOINT_INTERVAL`` versions, and whenever a patch
+    would not be smaller than the overrides, the version stores the full
+    overrides as a checkpoint. Otherwise it stores a JSON patch from the
+    previous version.
+    """
+    version_number = _next_version_number(session, draft.id)
+    overrides = deepcopy(draft.overrides or {})
+    storage = {'overrides': overrides, 'is_checkpoint': True, 'overrides_delta': None}
+    chain = _version_chain(session, draft.id, version_number - 1) if version_number > 1 else []
+    if chain and len(chain) < VERSION_CHECKPOINT_INTERVAL:
+        delta = overrides_patch(_replay_version_chain(chain), overrides)
+        if len(delta) < len(overrides):
+            storage = {'overrides': {}, 'is_checkpoint': False, 'overrides_delta': delta}
     version = models.ScenarioDraftVersion(
         scenario_draft_id=draft.id,
-        version_number=_next_version_number(session, draft.id),
+        version_number=version_number,
         draft_revision=int(draft.draft_revision or 1),
         name=draft.name,
         scope_payload=deepcopy(draft.scope_payload or {}),
         scenario_source_hash=draft.scenario_source_hash,
-        overrides=deepcopy(draft.overrides or {}),
+        override_count=len(overrides),
         created_by=draft.updated_by,
         change_note=change_note,
         source=source,
+        **storage,
     )
     session.add(version)
     return version
@@ -829,15 +1206,15 @@ def _append_version(session, draft, *, source, change_note=None):
 def _raise_if_stale(session, draft, base_draft_revision):
     if base_draft_revision == draft.draft_revision:
         return
-    versions = _versions_for_draft(session, draft.id)
-    current_version_number = max([int(version.version_number or 0) for version in versions] or [0])
+    versions, _ = _version_page(session, draft.id)
+    current_version_number = _current_version_number(versions)
     raise ScenarioDraftConflict(
         reason='stale_base_draft_revision',
         received_base_draft_revision=base_draft_revision,
         current_draft_revision=int(draft.draft_revision or 0),
         current_version_number=current_version_number,
         active_draft=_serialize_draft(draft, current_version_number=current_version_number),
-        versions=[_serialize_version(version) for version in versions],
+        versions=[_serialize_version_summary(version) for version in versions],
     )
 
 
@@ -857,14 +1234,14 @@ def _raise_conflict_for_scope(context, scope_key, base_draft_revision, original_
             _raise_if_stale(session, draft, base_draft_revision)
         except ScenarioDraftConflict as conflict:
             raise conflict from original_error
-        versions = _versions_for_draft(session, draft.id)
+        versions, _ = _version_page(session, draft.id)
         raise ScenarioDraftConflict(
             reason='stale_base_draft_revision',
             received_base_draft_revision=base_draft_revision,
             current_draft_revision=int(draft.draft_revision or 0),
             current_version_number=_current_version_number(versions),
             active_draft=_serialize_draft(draft, current_version_number=_current_version_number(versions)),
-            versions=[_serialize_version(version) for version in versions],
+            versions=[_serialize_version_summary(version) for version in versions],
         ) from original_error
 
 
@@ -877,24 +1254,26 @@ def _raise_conflict_for_draft_id(context, draft_id, base_draft_revision, origina
             _raise_if_stale(session, draft, base_draft_revision)
         except ScenarioDraftConflict as conflict:
             raise conflict from original_error
-        versions = _versions_for_draft(session, draft.id)
+        versions, _ = _version_page(session, draft.id)
         raise ScenarioDraftConflict(
             reason='stale_base_draft_revision',
             received_base_draft_revision=base_draft_revision,
             current_draft_revision=int(draft.draft_revision or 0),
             current_version_number=_current_version_number(versions),
             active_draft=_serialize_draft(draft, current_version_number=_current_version_number(versions)),
-            versions=[_serialize_version(version) for version in versions],
+            versions=[_serialize_version_summary(version) for version in versions],
         ) from original_error
 
 
-def _response(draft, versions):
+def _response(session, draft):
+    versions, is_last = _version_page(session, draft.id) if draft is not None else ([], True)
     return {
         'storage': 'db',
         'activeDraft': _serialize_draft(draft, current_version_number=_current_version_number(versions))
         if draft is not None
         else None,
-        'versions': [_serialize_version(version) for version in versions],
+        'versions': [_serialize_version_summary(version) for version in versions],
+        'versionsNextBefore': int(versions[0].version_number) if versions and not is_last else None,
     }
 
 
@@ -919,17 +1298,24 @@ def _serialize_draft(draft, *, current_version_number):
     }
 
 
-def _serialize_version(version):
+def _serialize_version(version, *, overrides):
+    return {
+        **_serialize_version_summary(version),
+        'scopePayload': deepcopy(version.scope_payload or {}),
+        'overrides': overrides,
+        'overrideCount': len(overrides),
+    }
+
+
+def _serialize_version_summary(version):
     return {
         'versionId': version.id,
         'draftId': version.scenario_draft_id,
         'versionNumber': int(version.version_number or 0),
         'draftRevision': int(version.draft_revision or 0),
         'name': version.name,
-        'scopePayload': deepcopy(version.scope_payload or {}),
         'scenarioSourceHash': version.scenario_source_hash,
-        'overrides': deepcopy(version.overrides or {}),
-        'overrideCount': len(version.overrides or {}),
+        'overrideCount': int(version.override_count or 0),
         'source': version.source,
         'changeNote': version.change_note,
         'createdAt': _serialize_datetime(version.created_at),
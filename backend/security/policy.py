@@ -79,6 +79,7 @@ ENDPOINT_POLICIES = (
     EndpointPolicy("eng-api-backlog", "/api/backlog-epics", PUBLIC_METHODS, "authenticated_read"),
     EndpointPolicy("eng-api-missing-info", "/api/missing-info", PUBLIC_METHODS, "authenticated_read"),
     EndpointPolicy("eng-api-dependencies", "/api/dependencies", frozenset({"POST"}), "authenticated_read"),
+    EndpointPolicy("eng-api-dependencies-graph", "/api/dependencies/graph", frozenset({"POST"}), "authenticated_read"),
     EndpointPolicy("eng-api-issue-lookup", "/api/issues/lookup", PUBLIC_METHODS, "authenticated_read"),
     EndpointPolicy("eng-api-story-subtasks", "/api/issues/subtasks", PUBLIC_METHODS, "authenticated_read"),
     EndpointPolicy("jira-issue-transition-options", "/api/issues/transitions/options", frozenset({"POST"}), "authenticated_read"),
@@ -132,10 +133,14 @@ ENDPOINT_POLICIES = (
     EndpointPolicy("epm-projects-preview", "/api/epm/projects/preview", frozenset({"POST"}), "authenticated_read"),
     EndpointPolicy("epm-projects-rollup-all", "/api/epm/projects/rollup/all", PUBLIC_METHODS, "authenticated_read"),
     EndpointPolicy("scenario-main", "/api/scenario", frozenset({"GET", "POST"}), "authenticated_read"),
+    EndpointPolicy("scenario-reschedule", "/api/scenario/reschedule", frozenset({"POST"}), "authenticated_read"),
+    EndpointPolicy("scenario-compare", "/api/scenario/compare", frozenset({"POST"}), "authenticated_read"),
     EndpointPolicy("scenario-drafts-root-read", "/api/scenario/drafts", PUBLIC_METHODS, "authenticated_read"),
     EndpointPolicy("scenario-drafts-root-write", "/api/scenario/drafts", frozenset({"POST"}), "workspace_write"),
+    EndpointPolicy("scenario-draft-versions", "/api/scenario/drafts/<draft_id>/versions", PUBLIC_METHODS, "authenticated_read", "dynamic"),
     EndpointPolicy("scenario-draft-version", "/api/scenario/drafts/<draft_id>/versions/<int:version_number>", PUBLIC_METHODS, "authenticated_read", "dynamic"),
     EndpointPolicy("scenario-draft-events", "/api/scenario/drafts/<draft_id>/events", PUBLIC_METHODS, "authenticated_read", "dynamic"),
+    EndpointPolicy("scenario-draft-events-join", "/api/scenario/drafts/<draft_id>/events/join", PUBLIC_METHODS, "authenticated_read", "dynamic"),
     EndpointPolicy("scenario-draft-events-stream", "/api/scenario/drafts/<draft_id>/events/stream", PUBLIC_METHODS, "authenticated_read", "dynamic"),
     EndpointPolicy("scenario-draft-presence-read", "/api/scenario/drafts/<draft_id>/presence", PUBLIC_METHODS, "authenticated_read", "dynamic"),
     EndpointPolicy("scenario-draft-presence-write", "/api/scenario/drafts/<draft_id>/presence", frozenset({"POST"}), "workspace_write", "dynamic"),
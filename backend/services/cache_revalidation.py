@@ -0,0 +1,70 @@
+"""Stale-while-revalidate policy for ``{'timestamp', 'data'}`` process-cache entries.
+
+An entry younger than the soft TTL is fresh. Between the soft and hard TTL it
+is stale: callers serve it immediately (marked ``Server-Timing: cache-stale``)
+and schedule one background refresh per key. Past the hard TTL the caller
+fetches synchronously as before.
+"""
+
+import logging
+import os
+import threading
+import time
+
+
+CACHE_FRESH = 'fresh'
+CACHE_STALE = 'stale'
+CACHE_EXPIRED = 'expired'
+STALE_SERVER_TIMING = 'cache-stale;dur=1'
+DEFAULT_HARD_TTL_MULTIPLIER = 3
+
+logger = logging.getLogger(__name__)
+
+
+def resolve_hard_ttl_seconds(env_name, soft_ttl_seconds, environ=None):
+    """Read the hard TTL from ``env_name``; defaults to a multiple of the soft TTL.
+
+    The result is never below the soft TTL, so setting it equal to the soft TTL
+    (or ``0``) disables the stale window.
+    """
+    env = os.environ if environ is None else environ
+    raw = str(env.get(env_name, '') or '').strip()
+    try:
+        hard_ttl = int(raw) if raw else int(soft_ttl_seconds) * DEFAULT_HARD_TTL_MULTIPLIER
+    except ValueError:
+        hard_ttl = int(soft_ttl_seconds) * DEFAULT_HARD_TTL_MULTIPLIER
+    return max(int(soft_ttl_seconds), hard_ttl)
+
+
+def classify_cache_entry(entry, soft_ttl_seconds, hard_ttl_seconds, now=None):
+    if not entry:
+        return CACHE_EXPIRED
+    age = (time.time() if now is None else now) - entry.get('timestamp', 0)
+    if age < soft_ttl_seconds:
+        return CACHE_FRESH
+    if age < max(soft_ttl_seconds, hard_ttl_seconds or 0):
+        return CACHE_STALE
+    return CACHE_EXPIRED
+
+
+def revalidate_in_background(single_flight, key, refresh):
+    """Run ``refresh`` on a daemon thread unless a fetch for ``key`` is already in flight.
+
+    The refresh holds the single-flight slot for ``key`` while it runs, so
+    concurrent synchronous misses on the same key wait for it instead of
+    starting their own fetch. Returns True when a refresh was started.
+    """
+    flight = single_flight.join(key)
+    if not flight.leader:
+        return False
+
+    def run():
+        try:
+            refresh()
+        except Exception:
+            logger.exception('Background cache revalidation failed for %s', key[0] if isinstance(key, tuple) else key)
+        finally:
+            flight.done()
+
+    threading.Thread(target=run, name='cache-revalidate', daemon=True).start()
+    return True
@@ -0,0 +1,153 @@
+"""Append-only cache of Jira issue changelogs, keyed by ``(site, issue key)``.
+
+Burnout, epic cohort terminal dates and Project Track phase durations all
+parse full issue histories. Changelogs only ever grow, so an entry keeps the
+histories seen so far (ascending, de-duplicated by history ``id``) and the
+issue's ``updated`` at the time:
+
+* a caller that already holds the issue's current ``updated`` (from its own
+  search or issue fetch) gets the cached histories without a Jira call;
+* a known issue whose ``updated`` moved is extended from
+  ``/rest/api/3/issue/{key}/changelog?startAt=<cached count>``, which returns
+  only the newer entries;
+* an unknown issue is seeded from the caller's ``expand=changelog`` response,
+  paging the rest when ``changelog.total`` exceeds the embedded window.
+
+Entries are only served for an issue the caller just read from Jira, so Jira
+still decides who may see which issue.
+"""
+
+from collections import OrderedDict
+import threading
+
+
+DEFAULT_MAX_PAGES = 20
+MAX_REMEMBERED_QUERIES = 512
+PAGE_SIZE = 100
+
+
+def _history_sort_key(history):
+    raw_id = str(history.get('id') or '')
+    return (history.get('created') or '', int(raw_id) if raw_id.isdigit() else 0, raw_id)
+
+
+def _merge_histories(existing, new_histories, seen_ids):
+    # First occurrence wins: some Jira deployments re-send the boundary record
+    # on the first paged result with different content.
+    merged = list(existing)
+    for history in new_histories or []:
+        history_id = history.get('id')
+        if history_id is not None and history_id in seen_ids:
+            continue
+        merged.append(history)
+        if history_id is not None:
+            seen_ids.add(history_id)
+    return merged
+
+
+class ChangelogCache:
+    """``entries`` is a mapping (a registered process cache) shared by the changelog consumers."""
+
+    def __init__(self, entries, *, max_pages=DEFAULT_MAX_PAGES):
+        self._entries = entries
+        self.max_pages = max(1, int(max_pages))
+        self._lock = threading.Lock()
+        self._counters = {'hits': 0, 'seeded': 0, 'extended': 0, 'pages': 0}
+        self._queries = OrderedDict()
+
+    def _count(self, name, amount=1):
+        with self._lock:
+            self._counters[name] += amount
+
+    def known(self, site, issue_key):
+        return (site, issue_key) in self._entries
+
+    def is_fresh(self, site, issue_key, updated):
+        entry = self._entries.get((site, issue_key))
+        return bool(updated) and bool(entry) and entry.get('updated') == updated
+
+    def note_query(self, site, query):
+        """Remember ``query`` and return whether it ran before, so repeat searches can skip ``expand=changelog``."""
+        with self._lock:
+            seen = (site, query) in self._queries
+            self._queries[(site, query)] = True
+            self._queries.move_to_end((site, query))
+            while len(self._queries) > MAX_REMEMBERED_QUERIES:
+                self._queries.popitem(last=False)
+        return seen
+
+    def clear(self):
+        self._entries.clear()
+        with self._lock:
+            self._queries.clear()
+
+    def lookup(self, site, issue_key, updated):
+        """Cached histories when ``updated`` matches the stored one, else None."""
+        entry = self._entries.get((site, issue_key))
+        if not updated or not entry or entry.get('updated') != updated:
+            return None
+        self._count('hits')
+        return list(entry['histories'])
+
+    def _page(self, histories, seen_ids, fetch_page):
+        """Page ``fetch_page(start_at)`` from ``len(histories)`` to ``isLast``; None on failure."""
+        start_at = len(histories)
+        for _ in range(self.max_pages):
+            response = fetch_page(start_at)
+            self._count('pages')
+            if response.status_code != 200:
+                return None
+            data = response.json() or {}
+            total = data.get('total')
+            if isinstance(total, int) and total < start_at:
+                # History shrank (an issue move can rewrite it): start over.
+                histories, seen_ids, start_at = [], set(), 0
+                continue
+            values = data.get('values') or []
+            histories = _merge_histories(histories, values, seen_ids)
+            start_at += len(values)
+            if bool(data.get('isLast', True)) or not values:
+                return histories
+        return None
+
+    def _store(self, site, issue_key, updated, histories):
+        histories = sorted(histories, key=_history_sort_key)
+        self._entries[(site, issue_key)] = {'updated': updated or '', 'histories': histories}
+        return list(histories)
+
+    def resolve(self, site, issue_key, *, updated=None, embedded=None, fetch_page=None):
+        """Full histories for ``issue_key``, or None when Jira could not be read.
+
+        ``embedded`` is the ``changelog`` object of an ``expand=changelog``
+        response for an issue the cache does not know yet; without it a known
+        issue is extended through ``fetch_page`` (an unknown one is paged from
+        the start).
+        """
+        cached = self.lookup(site, issue_key, updated)
+        if cached is not None:
+            return cached
+        entry = self._entries.get((site, issue_key)) or {}
+        histories = list(entry.get('histories') or [])
+        seen_ids = {history.get('id') for history in histories if history.get('id') is not None}
+        if embedded is not None:
+            histories = _merge_histories(histories, embedded.get('histories') or [], seen_ids)
+            total = embedded.get('total')
+            if fetch_page is not None and isinstance(total, int) and total > len(histories):
+                paged = self._page(histories, seen_ids, fetch_page)
+                if paged is None:
+                    # Keep the partial window for this response but do not cache it as complete.
+                    return histories
+                histories = paged
+            self._count('seeded')
+            return self._store(site, issue_key, updated, histories)
+        if fetch_page is None:
+            return None
+        histories = self._page(histories, seen_ids, fetch_page)
+        if histories is None:
+            return None
+        self._count('extended')
+        return self._store(site, issue_key, updated, histories)
+
+    def stats(self):
+        with self._lock:
+            return {'entries': len(self._entries), **self._counters}
@@ -0,0 +1,292 @@
+"""Dependency graph index per cache partition (Jira site, or site and user).
+
+``collect_dependencies`` reads issue links for the issues a caller asks
+about. Each read is recorded here as the issue's ``updated`` and the
+``(prereq, dependent, category)`` edges its links resolve to:
+
+* an issue whose ``updated`` did not move keeps its edges, so the cached
+  closures and cycle components stay valid;
+* an issue whose ``updated`` moved replaces the edges it reported before.
+  Jira shows a link on both issues, so an edge is kept while any endpoint
+  last read still reports it.
+
+Direct prerequisites and dependents are dict lookups. Transitive closures
+and strongly connected components (dependency cycles) are computed on demand
+and cached until the edge set changes. Issue snapshots from the same reads
+let scenario context expansion add multi-hop neighbours without Jira calls.
+
+The index only knows what callers have read, so it answers "what is known to
+depend on this" rather than proving absence.
+"""
+
+from collections import OrderedDict, deque
+import threading
+
+
+DEFAULT_MAX_GRAPHS = 64
+DEFAULT_MAX_NODES = 50000
+UPSTREAM = 'upstream'
+DOWNSTREAM = 'downstream'
+
+
+def dependency_entry_edges(entries):
+    """``(prereq, dependent, category)`` edges from ``collect_dependencies`` entries of one issue."""
+    edges = set()
+    for entry in entries or []:
+        prereq_key = entry.get('prereqKey')
+        dependent_key = entry.get('dependentKey')
+        category = entry.get('category')
+        if prereq_key and dependent_key and prereq_key != dependent_key and category in ('block', 'dependency'):
+            edges.add((prereq_key, dependent_key, category))
+    return edges
+
+
+class DependencyGraph:
+    """Edges and issue snapshots of one partition; bounded to ``max_nodes`` recorded issues and snapshots."""
+
+    def __init__(self, *, max_nodes=DEFAULT_MAX_NODES):
+        self.max_nodes = max(1, int(max_nodes))
+        self._lock = threading.Lock()
+        self._nodes = OrderedDict()  # key -> (updated, edges reported by that issue), least recently read first
+        self._snapshots = OrderedDict()  # key -> issue snapshot, least recently stored first
+        self._edge_owners = {}  # (prereq, dependent, category) -> issue keys reporting it
+        self._prerequisites = {}  # key -> {prereq: categories}
+        self._dependents = {}  # key -> {dependent: categories}
+        self._closures = {}
+        self._components = None
+        self.version = 0
+
+    def _link(self, edge):
+        prereq_key, dependent_key, category = edge
+        self._prerequisites.setdefault(dependent_key, {}).setdefault(prereq_key, set()).add(category)
+        self._dependents.setdefault(prereq_key, {}).setdefault(dependent_key, set()).add(category)
+
+    def _unlink(self, edge):
+        prereq_key, dependent_key, category = edge
+        for index, a, b in ((self._prerequisites, dependent_key, prereq_key), (self._dependents, prereq_key, dependent_key)):
+            categories = index[a][b]
+            categories.discard(category)
+            if not categories:
+                del index[a][b]
+                if not index[a]:
+                    del index[a]
+
+    def _set_edges(self, key, old_edges, new_edges):
+        changed = False
+        for edge in old_edges - new_edges:
+            owners = self._edge_owners[edge]
+            owners.discard(key)
+            if not owners:
+                del self._edge_owners[edge]
+                self._unlink(edge)
+                changed = True
+        for edge in new_edges - old_edges:
+            owners = self._edge_owners.setdefault(edge, set())
+            if not owners:
+                self._link(edge)
+                changed = True
+            owners.add(key)
+        if changed:
+            self.version += 1
+            self._closures.clear()
+            self._components = None
+        return changed
+
+    def is_fresh(self, key, updated):
+        node = self._nodes.get(key)
+        return bool(updated) and node is not None and node[0] == updated
+
+    def record(self, key, updated, edges, snapshot=None):
+        """Store the edges ``key`` reports as of ``updated``; returns whether the edge set changed."""
+        edges = frozenset(edges)
+        with self._lock:
+            if snapshot:
+                self._keep_snapshot(key, snapshot)
+            node = self._nodes.get(key)
+            if node is not None:
+                self._nodes.move_to_end(key)
+                if updated and node[0] == updated and node[1] == edges:
+                    return False
+            self._nodes[key] = (updated or '', edges)
+            changed = self._set_edges(key, node[1] if node else frozenset(), edges)
+            while len(self._nodes) > self.max_nodes:
+                old_key, (_, old_edges) = self._nodes.popitem(last=False)
+                self._snapshots.pop(old_key, None)
+                changed = self._set_edges(old_key, old_edges, frozenset()) or changed
+            return changed
+
+    def remember(self, snapshots):
+        """Keep issue snapshots (for example of linked issues) without touching edges."""
+        with self._lock:
+            for snapshot in snapshots:
+                if snapshot and snapshot.get('key'):
+                    self._keep_snapshot(snapshot['key'], snapshot)
+
+    def _keep_snapshot(self, key, snapshot):
+        # Linked issues are remembered without being recorded, so snapshots get their own LRU bound.
+        self._snapshots[key] = snapshot
+        self._snapshots.move_to_end(key)
+        while len(self._snapshots) > self.max_nodes:
+            self._snapshots.popitem(last=False)
+
+    def snapshot(self, key):
+        return self._snapshots.get(key)
+
+    def known(self, key):
+        return key in self._nodes or key in self._prerequisites or key in self._dependents
+
+    def prerequisites(self, key):
+        with self._lock:
+            return frozenset(self._prerequisites.get(key, ()))
+
+    def dependents(self, key):
+        with self._lock:
+            return frozenset(self._dependents.get(key, ()))
+
+    def closure(self, key, direction=UPSTREAM):
+        """Every issue reachable from ``key`` upstream (prerequisites) or downstream (dependents)."""
+        with self._lock:
+            cached = self._closures.get((key, direction))
+            if cached is not None:
+                return cached
+            index = self._prerequisites if direction == UPSTREAM else self._dependents
+            seen = set()
+            queue = deque([key])
+            while queue:
+                for neighbour in index.get(queue.popleft(), ()):
+                    if neighbour not in seen:
+                        seen.add(neighbour)
+                        queue.append(neighbour)
+            seen.discard(key)
+            result = self._closures[(key, direction)] = frozenset(seen)
+            return result
+
+    def neighbourhood(self, keys, depth):
+        """Issues within ``depth`` links of ``keys`` in either direction, including ``keys``."""
+        with self._lock:
+            seen = set(keys)
+            frontier = list(seen)
+            for _ in range(max(0, int(depth))):
+                next_frontier = []
+                for key in frontier:
+                    for index in (self._prerequisites, self._dependents):
+                        for neighbour in index.get(key, ()):
+                            if neighbour not in seen:
+                                seen.add(neighbour)
+                                next_frontier.append(neighbour)
+                if not next_frontier:
+                    break
+                frontier = next_frontier
+            return seen
+
+    def edges_among(self, keys):
+        """``(prereq, dependent, category)`` edges with both ends in ``keys``, sorted."""
+        keys = set(keys)
+        with self._lock:
+            return sorted(
+                (prereq_key, dependent_key, category)
+                for dependent_key in keys
+                for prereq_key, categories in self._prerequisites.get(dependent_key, {}).items()
+                if prereq_key in keys
+                for category in categories
+            )
+
+    def _strong_components(self):
+        # Iterative Tarjan over the dependents index.
+        index_of, low, on_stack, stack, components = {}, {}, set(), [], []
+        counter = 0
+        nodes = set(self._prerequisites) | set(self._dependents)
+        for root in sorted(nodes):
+            if root in index_of:
+                continue
+            work = [(root, iter(sorted(self._dependents.get(root, ()))))]
+            index_of[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                node, children = work[-1]
+                child = next(children, None)
+                if child is not None:
+                    if child not in index_of:
+                        index_of[child] = low[child] = counter
+                        counter += 1
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(sorted(self._dependents.get(child, ())))))
+                    elif child in on_stack:
+                        low[node] = min(low[node], index_of[child])
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index_of[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    if len(component) > 1:
+                        components.append(tuple(sorted(component)))
+        return components
+
+    def _component_index(self):
+        if self._components is None:
+            self._components = {member: component for component in self._strong_components() for member in component}
+        return self._components
+
+    def cycles(self):
+        """Dependency cycles as sorted tuples of issue keys (strongly connected components of two or more)."""
+        with self._lock:
+            return sorted(set(self._component_index().values()))
+
+    def cycle_of(self, key):
+        with self._lock:
+            return self._component_index().get(key, ())
+
+    def stats(self):
+        with self._lock:
+            return {
+                'nodes': len(self._nodes),
+                'edges': len(self._edge_owners),
+                'snapshots': len(self._snapshots),
+                'cachedClosures': len(self._closures),
+                'version': self.version,
+            }
+
+
+class DependencyGraphIndex:
+    """``DependencyGraph`` per partition key, least recently used partitions dropped beyond ``max_graphs``."""
+
+    def __init__(self, *, max_graphs=DEFAULT_MAX_GRAPHS, max_nodes=DEFAULT_MAX_NODES):
+        self.max_graphs = max(1, int(max_graphs))
+        self.max_nodes = max_nodes
+        self._lock = threading.Lock()
+        self._graphs = OrderedDict()
+
+    def graph(self, partition):
+        with self._lock:
+            graph = self._graphs.get(partition)
+            if graph is None:
+                graph = self._graphs[partition] = DependencyGraph(max_nodes=self.max_nodes)
+                while len(self._graphs) > self.max_graphs:
+                    self._graphs.popitem(last=False)
+            else:
+                self._graphs.move_to_end(partition)
+            return graph
+
+    def clear(self):
+        with self._lock:
+            self._graphs.clear()
+
+    def stats(self):
+        with self._lock:
+            graphs = list(self._graphs.values())
+        return {
+            'graphs': len(graphs),
+            'nodes': sum(graph.stats()['nodes'] for graph in graphs),
+            'edges': sum(graph.stats()['edges'] for graph in graphs),
+        }
@@ -0,0 +1,198 @@
+"""Keep-alive ``requests.Session`` pool, one session per Jira site.
+
+Jira fan-outs (epic enrichment, EPM rollups, transitions, priorities, sharded
+searches) run on thread pools wider than urllib3's default ``pool_maxsize`` of
+10 per host, which shows up as "connection pool is full, discarding
+connection" and a fresh TLS handshake per overflow request. Each site here
+gets its own session with an explicitly sized ``HTTPAdapter``.
+
+Sessions are keyed by ``scheme://host`` rather than by user: credentials
+travel in per-request headers and the cookie jar is disabled, so sharing a
+site's TCP connections never shares auth state between contexts. Sessions
+idle longer than ``idle_seconds`` are closed on the next pool access, which
+drops their sockets before Jira's load balancer resets them.
+
+Concurrent requests per site are capped at ``pool_maxsize``: callers past the
+cap wait for a connection instead of opening one urllib3 would discard.
+"""
+
+from http.cookiejar import DefaultCookiePolicy
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+
+DEFAULT_POOL_CONNECTIONS = 4
+DEFAULT_POOL_MAXSIZE = 16
+DEFAULT_IDLE_SECONDS = 300.0
+
+
+def _env_number(name, default, cast=int, environ=None):
+    env = os.environ if environ is None else environ
+    raw = str(env.get(name, '') or '').strip()
+    if not raw:
+        return default
+    try:
+        return cast(raw)
+    except ValueError:
+        return default
+
+
+def _site_key(url):
+    parts = urlsplit(str(url or ''))
+    if not parts.scheme or not parts.netloc:
+        return ''
+    return f'{parts.scheme.lower()}://{parts.netloc.lower()}'
+
+
+class _SiteSession:
+    __slots__ = ('session', 'adapter', 'slots', 'created_at', 'last_used_at', 'requests', 'in_flight')
+
+    def __init__(self, session, adapter, max_in_flight, now):
+        self.session = session
+        self.adapter = adapter
+        self.slots = threading.BoundedSemaphore(max_in_flight)
+        self.created_at = now
+        self.last_used_at = now
+        self.requests = 0
+        self.in_flight = 0
+
+
+class JiraSessionPool:
+    """Drop-in for the module-level ``Session``: ``get``/``post``/``request``.
+
+    ``pool_maxsize`` should cover the widest concurrent fan-out to one site
+    (gunicorn threads x per-request workers is the upper bound; the default
+    matches the 8-worker EPM and transition pools with headroom).
+    """
+
+    def __init__(self, *, pool_connections=DEFAULT_POOL_CONNECTIONS, pool_maxsize=DEFAULT_POOL_MAXSIZE,
+                 idle_seconds=DEFAULT_IDLE_SECONDS, clock=time.monotonic, session_factory=Session):
+        self.pool_connections = max(1, int(pool_connections))
+        self.pool_maxsize = max(1, int(pool_maxsize))
+        self.idle_seconds = float(idle_seconds)
+        self._clock = clock
+        self._session_factory = session_factory
+        self._lock = threading.Lock()
+        self._sites = {}
+        self._counters = {'sessionsOpened': 0, 'sessionsReaped': 0}
+
+    @classmethod
+    def from_env(cls, environ=None):
+        """Build a pool from ``JIRA_HTTP_POOL_CONNECTIONS`` / ``_MAXSIZE`` / ``_IDLE_SECONDS``."""
+        return cls(
+            pool_connections=_env_number('JIRA_HTTP_POOL_CONNECTIONS', DEFAULT_POOL_CONNECTIONS, environ=environ),
+            pool_maxsize=_env_number('JIRA_HTTP_POOL_MAXSIZE', DEFAULT_POOL_MAXSIZE, environ=environ),
+            idle_seconds=_env_number('JIRA_HTTP_POOL_IDLE_SECONDS', DEFAULT_IDLE_SECONDS, float, environ=environ),
+        )
+
+    def _open_session(self, now):
+        session = self._session_factory()
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        adapter = HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        self._counters['sessionsOpened'] += 1
+        return _SiteSession(session, adapter, self.pool_maxsize, now)
+
+    def _site_entry(self, url):
+        now = self._clock()
+        key = _site_key(url)
+        with self._lock:
+            stale = self._reap_idle_locked(now, keep=key)
+            entry = self._sites.get(key)
+            if entry is None:
+                entry = self._sites[key] = self._open_session(now)
+            entry.last_used_at = now
+            entry.requests += 1
+        for session in stale:
+            session.close()
+        return entry
+
+    def session_for(self, url):
+        return self._site_entry(url).session
+
+    def _reap_idle_locked(self, now, keep=None):
+        if self.idle_seconds <= 0:
+            return []
+        idle = [key for key, entry in self._sites.items()
+                if key != keep and not entry.in_flight and now - entry.last_used_at >= self.idle_seconds]
+        self._counters['sessionsReaped'] += len(idle)
+        return [self._sites.pop(key).session for key in idle]
+
+    def reap_idle(self, now=None):
+        """Close sessions idle past ``idle_seconds``; returns how many were closed."""
+        with self._lock:
+            stale = self._reap_idle_locked(self._clock() if now is None else now)
+        for session in stale:
+            session.close()
+        return len(stale)
+
+    def request(self, method, url, **kwargs):
+        entry = self._site_entry(url)
+        with entry.slots:
+            with self._lock:
+                entry.in_flight += 1
+            try:
+                return entry.session.request(method, url, **kwargs)
+            finally:
+                with self._lock:
+                    entry.in_flight -= 1
+                    entry.last_used_at = self._clock()
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def close(self):
+        with self._lock:
+            sessions = [entry.session for entry in self._sites.values()]
+            self._sites.clear()
+        for session in sessions:
+            session.close()
+
+    def stats(self):
+        now = self._clock()
+        with self._lock:
+            sites = {
+                key or '(relative)': {
+                    'requests': entry.requests,
+                    'inFlight': entry.in_flight,
+                    'idleSeconds': round(now - entry.last_used_at, 3),
+                    'ageSeconds': round(now - entry.created_at, 3),
+                    'hostPools': _adapter_pool_stats(entry.adapter),
+                }
+                for key, entry in sorted(self._sites.items())
+            }
+            return {
+                'poolConnections': self.pool_connections,
+                'poolMaxsize': self.pool_maxsize,
+                'idleSeconds': self.idle_seconds,
+                'sites': sites,
+                **self._counters,
+            }
+
+
+def _adapter_pool_stats(adapter):
+    pools = getattr(adapter.poolmanager, 'pools', None)
+    if pools is None:
+        return []
+    result = []
+    for pool_key in list(pools.keys()):
+        pool = pools.get(pool_key)
+        if pool is None:
+            continue
+        idle_queue = getattr(pool, 'pool', None)
+        result.append({
+            'host': f'{pool.scheme}://{pool.host}:{pool.port}',
+            'connectionsOpened': getattr(pool, 'num_connections', 0),
+            'requests': getattr(pool, 'num_requests', 0),
+            'idleConnections': idle_queue.qsize() if idle_queue is not None else 0,
+        })
+    return result
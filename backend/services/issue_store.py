@@ -0,0 +1,218 @@
+"""Persistent write-through store of Jira issues, keyed by ``(site, key)``.
+
+The dependency, scenario, EPM and epic-summary fetchers each ask Jira for
+the same issues with different field lists. With ``JIRA_ISSUE_STORE_ENABLED``
+they read through this store instead:
+
+* the caller's JQL runs once with only ``updated``, which keeps Jira as the
+  authority on membership, order and permissions;
+* issues whose stored ``updated`` matches and whose stored field set covers
+  the request are served from the store;
+* the rest are fetched by key with the requested fields and written back,
+  widening the stored field set while ``updated`` stays the same.
+
+Rows live in ``jira_issue_records`` in the configured database, or in a local
+SQLite file in jsonfile mode. Store failures are logged and never fail a
+fetch: the read path then behaves like a plain Jira search.
+"""
+
+import logging
+import os
+import threading
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import sessionmaker
+
+from backend.db.engine import database_storage_enabled, resolve_database_url, session_factory
+from backend.db.models import JiraIssueRecord
+from backend.jira_client import JqlSearchPages, chunk_values, fetch_search_pages
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SQLITE_PATH = '.jira-issue-store.sqlite3'
+PROBE_FIELDS = ['updated']
+KEY_BATCH_SIZE = 100
+# Field lists the store cannot prove coverage for; these go straight to Jira.
+UNCOVERABLE_FIELDS = {'*all', '*navigable'}
+
+
+def issue_store_enabled(environ=None):
+    env = os.environ if environ is None else environ
+    return str(env.get('JIRA_ISSUE_STORE_ENABLED', '') or '').strip().lower() in {'1', 'true', 'yes'}
+
+
+def _issue_updated(issue):
+    return str(((issue or {}).get('fields') or {}).get('updated') or '')
+
+
+def _project_issue(issue_id, key, fields, fields_list):
+    return {'id': issue_id, 'key': key, 'fields': {name: fields[name] for name in fields_list if name in fields}}
+
+
+class IssueStore:
+    """``sessions`` is a SQLAlchemy ``sessionmaker``; with ``schema_engine`` the table is created on first use."""
+
+    def __init__(self, sessions, *, schema_engine=None):
+        self._sessions = sessions
+        self._schema_engine = schema_engine
+        self._lock = threading.Lock()
+        self._counters = {'served': 0, 'fetched': 0, 'written': 0, 'errors': 0}
+
+    @classmethod
+    def from_env(cls, environ=None, *, local_file_state=False):
+        """Return a store when ``JIRA_ISSUE_STORE_ENABLED`` is set and a backend is available, else None."""
+        env = os.environ if environ is None else environ
+        if not issue_store_enabled(env):
+            return None
+        if database_storage_enabled(env):
+            database_url = resolve_database_url(environ=env, required=False)
+            return cls(session_factory(database_url)) if database_url else None
+        if not local_file_state:
+            return None
+        path = str(env.get('JIRA_ISSUE_STORE_PATH', '') or '').strip() or DEFAULT_SQLITE_PATH
+        engine = create_engine(f'sqlite+pysqlite:///{path}', future=True)
+        return cls(sessionmaker(bind=engine, future=True, expire_on_commit=False), schema_engine=engine)
+
+    def _session(self):
+        if self._schema_engine is not None:
+            with self._lock:
+                if self._schema_engine is not None:
+                    JiraIssueRecord.metadata.create_all(self._schema_engine, tables=[JiraIssueRecord.__table__])
+                    self._schema_engine = None
+        return self._sessions()
+
+    def _count(self, name, amount=1):
+        with self._lock:
+            self._counters[name] += amount
+
+    def load(self, site, keys):
+        """Stored rows for ``keys`` as ``{key: {'id', 'updated', 'fields', 'fieldNames'}}``."""
+        keys = [key for key in dict.fromkeys(keys or []) if key]
+        records = {}
+        if not keys:
+            return records
+        try:
+            with self._session() as db:
+                for chunk in chunk_values(keys, KEY_BATCH_SIZE * 5):
+                    rows = db.scalars(select(JiraIssueRecord).where(
+                        JiraIssueRecord.site == site, JiraIssueRecord.issue_key.in_(chunk),
+                    ))
+                    for row in rows:
+                        records[row.issue_key] = {
+                            'id': row.issue_id,
+                            'updated': row.jira_updated,
+                            'fields': dict(row.fields or {}),
+                            'fieldNames': set(row.field_names or []),
+                        }
+        except SQLAlchemyError as error:
+            self._count('errors')
+            logger.warning('Issue store read failed: %s', error)
+            return {}
+        return records
+
+    def save(self, site, issues, fields_list):
+        """Upsert ``issues`` fetched with ``fields_list``; same ``updated`` merges, newer replaces."""
+        by_key = {issue.get('key'): issue for issue in issues or [] if issue.get('key')}
+        if not by_key:
+            return
+        try:
+            with self._session() as db:
+                existing = {
+                    row.issue_key: row for row in db.scalars(select(JiraIssueRecord).where(
+                        JiraIssueRecord.site == site, JiraIssueRecord.issue_key.in_(list(by_key)),
+                    ))
+                }
+                for key, issue in by_key.items():
+                    fields = dict(issue.get('fields') or {})
+                    field_names = set(fields_list)
+                    row = existing.get(key)
+                    if row is None:
+                        row = JiraIssueRecord(site=site, issue_key=key)
+                        db.add(row)
+                    elif row.jira_updated == _issue_updated(issue):
+                        fields = {**(row.fields or {}), **fields}
+                        field_names.update(row.field_names or [])
+                    row.issue_id = str(issue.get('id') or row.issue_id or '') or None
+                    row.jira_updated = _issue_updated(issue)
+                    row.fields = fields
+                    row.field_names = sorted(field_names)
+                db.commit()
+        except SQLAlchemyError as error:
+            # A concurrent writer inserting the same key loses nothing: the next read refetches.
+            self._count('errors')
+            logger.warning('Issue store write failed: %s', error)
+            return
+        self._count('written', len(by_key))
+
+    def search(self, site, jql, fields_list, *, search_request, max_results=None, page_size=100):
+        """Run ``jql`` through the store; returns a ``JqlSearchPages`` like ``fetch_search_pages``."""
+        fields_list = list(fields_list or [])
+        if not fields_list or UNCOVERABLE_FIELDS.intersection(fields_list):
+            return fetch_search_pages(jql, fields_list, search_request=search_request,
+                                      max_results=max_results, page_size=page_size)
+        probe = fetch_search_pages(jql, PROBE_FIELDS, search_request=search_request,
+                                   max_results=max_results, page_size=page_size)
+        if probe.error is not None:
+            return probe
+        keys = [issue.get('key') for issue in probe.issues if issue.get('key')]
+        probe_updated = {issue.get('key'): _issue_updated(issue) for issue in probe.issues}
+        records = self.load(site, keys)
+        needed = set(fields_list)
+        stale = [
+            key for key in keys
+            if key not in records or records[key]['updated'] != probe_updated[key]
+            or not needed <= records[key]['fieldNames']
+        ]
+        fetch_fields = fields_list if 'updated' in needed else [*fields_list, 'updated']
+        fetched = {}
+        result = JqlSearchPages(probe.label, jql)
+        result.names, result.total, result.truncated = probe.names, probe.total, probe.truncated
+        result.pages, result.duration_ms = probe.pages, probe.duration_ms
+        for chunk in chunk_values(stale, KEY_BATCH_SIZE):
+            quoted = ','.join(f'"{key}"' for key in chunk)
+            page = fetch_search_pages(f'key in ({quoted})', fetch_fields, search_request=search_request,
+                                      max_results=len(chunk), page_size=KEY_BATCH_SIZE)
+            result.pages += page.pages
+            result.duration_ms = round(result.duration_ms + page.duration_ms, 1)
+            if page.error is not None:
+                result.error = page.error
+                break
+            fetched.update((issue.get('key'), issue) for issue in page.issues if issue.get('key'))
+        self.save(site, list(fetched.values()), fetch_fields)
+        self._count('fetched', len(fetched))
+        self._count('served', len(keys) - len(stale))
+        for key in keys:
+            if key in fetched:
+                issue = fetched[key]
+                result.issues.append(_project_issue(issue.get('id'), key, issue.get('fields') or {}, fields_list))
+            elif key in records and key not in stale:
+                record = records[key]
+                result.issues.append(_project_issue(record['id'], key, record['fields'], fields_list))
+            # Stale keys Jira did not return by key were deleted after the probe; drop them.
+        return result
+
+    def fetch_by_keys(self, site, keys, fields_list, *, search_request, log_warning_fn):
+        """Store-backed ``jira_client.fetch_issues_by_keys``: failed batches are logged and skipped."""
+        results = []
+        for chunk in chunk_values(keys or [], KEY_BATCH_SIZE):
+            quoted = ','.join(f'"{key}"' for key in chunk)
+            page = self.search(site, f'key in ({quoted})', fields_list, search_request=search_request,
+                               max_results=len(chunk))
+            if page.error is not None:
+                log_warning_fn(f'Dependencies fetch error: status={page.error.status_code}')
+                continue
+            results.extend(page.issues)
+        return results
+
+    def fetch_by_jql(self, site, jql, fields_list, *, max_results, search_request, log_warning_fn):
+        """Store-backed ``jira_client.fetch_issues_by_jql``."""
+        page = self.search(site, jql, fields_list, search_request=search_request, max_results=max_results)
+        if page.error is not None:
+            log_warning_fn(f'Scenario fetch error: status={page.error.status_code}')
+        return page.issues
+
+    def stats(self):
+        with self._lock:
+            return dict(self._counters)
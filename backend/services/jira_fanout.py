@@ -0,0 +1,162 @@
+"""Process-wide bounded fan-out for independent Jira calls.
+
+Endpoints that issue N independent Jira requests and join (EPM per-project
+rollups, transition/priority batches, cohort changelog lookups, Project Track
+phase fetches, ``fetch_tasks`` epic enrichment, sharded JQL searches) used to build a ThreadPoolExecutor per request. They now share
+one lazily created executor per process: a request keeps its own
+``max_parallel`` window, and a ``timeout`` budget returns at the deadline
+instead of waiting for stragglers while the executor shuts down.
+
+Calls made from inside a fan-out worker run inline so nested fan-outs can
+never exhaust the shared executor and deadlock on themselves.
+
+The executor is sized like the per-site in-flight cap of the HTTP session pool
+(``JIRA_HTTP_POOL_MAXSIZE``, 16 by default) unless ``JIRA_FANOUT_WORKERS`` is
+set: threads past that cap would only wait on the pool's semaphore. One
+request therefore drives at most that many concurrent Jira calls, and all
+requests in a process share them. Driving 50+ calls at once means raising
+``JIRA_HTTP_POOL_MAXSIZE`` (which Jira rate limits usually argue against),
+not adding threads.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import os
+import threading
+import time
+
+from backend.services.http_session_pool import DEFAULT_POOL_MAXSIZE
+
+
+DEFAULT_FANOUT_WORKERS = DEFAULT_POOL_MAXSIZE
+
+
+class FanoutResult:
+    """``results`` maps finished keys to values in submission order;
+    ``timed_out`` lists keys that did not finish within the budget."""
+
+    __slots__ = ('results', 'timed_out')
+
+    def __init__(self):
+        self.results = {}
+        self.timed_out = []
+
+
+class JiraFanout:
+    def __init__(self, max_workers=DEFAULT_FANOUT_WORKERS):
+        self.max_workers = max(1, int(max_workers))
+        self._lock = threading.Lock()
+        self._executor = None
+        self._pid = None
+        self._local = threading.local()
+        self._counters = {'runs': 0, 'inlineRuns': 0, 'tasks': 0, 'timedOut': 0}
+
+    @classmethod
+    def from_env(cls, environ=None):
+        env = os.environ if environ is None else environ
+        for name in ('JIRA_FANOUT_WORKERS', 'JIRA_HTTP_POOL_MAXSIZE'):
+            raw = str(env.get(name, '') or '').strip()
+            if raw.isdigit() and int(raw) > 0:
+                return cls(max_workers=int(raw))
+        return cls(max_workers=DEFAULT_FANOUT_WORKERS)
+
+    def _shared_executor(self):
+        # Created on first use and re-created after fork, so pre-fork servers
+        # (gunicorn) get one executor per worker process.
+        pid = os.getpid()
+        if self._pid != pid:
+            with self._lock:
+                if self._pid != pid:
+                    self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='jira-fanout')
+                    self._pid = pid
+        return self._executor
+
+    def _run_task(self, fn, args):
+        self._local.active = True
+        try:
+            return fn(*args)
+        finally:
+            self._local.active = False
+
+    def run(self, calls, *, max_parallel, timeout=None):
+        """Run ``fn(*args)`` for each ``(key, fn, args)`` with at most ``max_parallel`` in flight.
+
+        Keys must be unique. An exception from any call propagates once the
+        unfinished calls are cancelled, matching ``future.result()`` in the
+        per-request executors this replaces.
+        """
+        calls = list(calls)
+        outcome = FanoutResult()
+        if not calls:
+            return outcome
+        deadline = None if timeout is None else time.monotonic() + float(timeout)
+        parallel = max(1, min(int(max_parallel), len(calls)))
+        with self._lock:
+            self._counters['runs'] += 1
+            self._counters['tasks'] += len(calls)
+        if parallel == 1 or getattr(self._local, 'active', False):
+            return self._run_inline(calls, deadline, outcome)
+
+        executor = self._shared_executor()
+        queued = iter(calls)
+        running = {}
+        finished = {}
+
+        def submit_next():
+            for key, fn, args in queued:
+                running[executor.submit(self._run_task, fn, args)] = key
+                return
+
+        for _ in range(parallel):
+            submit_next()
+        try:
+            while running:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    break
+                done, _pending = wait(running, timeout=remaining, return_when=FIRST_COMPLETED)
+                if not done:
+                    break
+                for future in done:
+                    key = running.pop(future)
+                    finished[key] = future.result()
+                    submit_next()
+        finally:
+            for future in running:
+                future.cancel()
+        outcome.timed_out = list(running.values()) + [key for key, _fn, _args in queued]
+        outcome.results = {key: finished[key] for key, _fn, _args in calls if key in finished}
+        self._count_timeouts(outcome)
+        return outcome
+
+    def _run_inline(self, calls, deadline, outcome):
+        with self._lock:
+            self._counters['inlineRuns'] += 1
+        for index, (key, fn, args) in enumerate(calls):
+            if deadline is not None and time.monotonic() >= deadline:
+                outcome.timed_out = [pending_key for pending_key, _fn, _args in calls[index:]]
+                break
+            outcome.results[key] = fn(*args)
+        self._count_timeouts(outcome)
+        return outcome
+
+    def _count_timeouts(self, outcome):
+        if outcome.timed_out:
+            with self._lock:
+                self._counters['timedOut'] += len(outcome.timed_out)
+
+    def stats(self):
+        with self._lock:
+            return {'maxWorkers': self.max_workers, **self._counters}
+
+
+_shared = {'fanout': None}
+_shared_lock = threading.Lock()
+
+
+def shared_jira_fanout():
+    """The process-wide fan-out, sized by ``JIRA_FANOUT_WORKERS`` or ``JIRA_HTTP_POOL_MAXSIZE``."""
+    if _shared['fanout'] is None:
+        with _shared_lock:
+            if _shared['fanout'] is None:
+                _shared['fanout'] = JiraFanout.from_env()
+    return _shared['fanout']
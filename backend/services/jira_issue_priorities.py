@@ -11,9 +11,7 @@ still authenticate as the signed-in user. Issue-key validation is reused from
 circular import.
 """
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from concurrent.futures import TimeoutError as FuturesTimeoutError
-
+from backend.services.jira_fanout import shared_jira_fanout
 from backend.services.jira_issue_transitions import IssueTransitionInputError, normalize_issue_keys
 
 
@@ -266,32 +264,19 @@ def _resolve_target_priority_name(snapshots, target_priority_id, *, jira_request
 
 
 def _run_bounded_pool(keys, worker, context):
-    """Run ``worker(key, context)`` across a capped ThreadPoolExecutor.
+    """Run ``worker(key, context)`` on the shared Jira fan-out, capped per request.
 
     ``context`` is passed explicitly into every worker so contextless threads
     still authenticate as the signed-in user. Returns a ``{key: value}`` map;
-    keys whose future did not finish within the time budget are simply absent so
+    keys whose call did not finish within the time budget are simply absent so
     callers can shape their own timeout result.
     """
-    results = {}
-    if not keys:
-        return results
-    workers = max(1, min(PRIORITY_UPDATE_WORKERS, len(keys)))
-    future_map = {}
-    with ThreadPoolExecutor(max_workers=workers) as pool:
-        for key in keys:
-            future_map[pool.submit(worker, key, context)] = key
-        try:
-            for future in as_completed(future_map, timeout=PRIORITY_UPDATE_TIMEOUT_BUDGET_SECONDS):
-                key, value = future.result()
-                results[key] = value
-        except FuturesTimeoutError:
-            pass
-        finally:
-            for future in future_map:
-                if not future.done():
-                    future.cancel()
-    return results
+    outcome = shared_jira_fanout().run(
+        ((key, worker, (key, context)) for key in keys),
+        max_parallel=PRIORITY_UPDATE_WORKERS,
+        timeout=PRIORITY_UPDATE_TIMEOUT_BUDGET_SECONDS,
+    )
+    return dict(outcome.results.values())
 
 
 def _make_priority_worker(jira_request, snapshots, target_priority_id, target_priority_name):
@@ -0,0 +1,263 @@
+"""Bounded LRU + TTL process caches for Jira-derived response payloads.
+
+Every cache keeps the plain mapping protocol (``get``, ``[]``, ``clear``, ``in``,
+``len``) the legacy module-level dicts exposed, so existing call sites, the
+``{'timestamp', 'data'}`` entry shape, and ``patch.object(jira_server, ...)``
+test overrides keep working. Keys are whatever the caller builds, which keeps
+the per-auth-context partitioning from ``build_jira_home_process_cache_key``.
+"""
+
+from collections import OrderedDict
+from collections.abc import MutableMapping
+import os
+import re
+import sys
+import threading
+import time
+
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_SWEEP_INTERVAL_SECONDS = 60.0
+
+_registry = {}
+_registry_lock = threading.Lock()
+_sweeper_state = {'thread': None, 'pid': None}
+
+
+def _env_int(name, default):
+    raw = str(os.getenv(name, '') or '').strip()
+    if not raw:
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        return default
+
+
+def _namespace_env_prefix(namespace):
+    return 'PROCESS_CACHE_' + re.sub(r'[^A-Z0-9]+', '_', str(namespace).upper()).strip('_')
+
+
+def estimate_payload_bytes(value):
+    """Approximate the retained size of a JSON-like payload.
+
+    Walks dicts/lists/tuples/sets iteratively and counts each object once, so
+    shared sub-objects (for example epic records referenced from several
+    issues) are not double counted.
+    """
+    seen = set()
+    total = 0
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        item_id = id(item)
+        if item_id in seen:
+            continue
+        seen.add(item_id)
+        total += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+    return total
+
+
+class ProcessCache(MutableMapping):
+    """Thread-safe mapping with LRU eviction, an entry/byte budget and TTL expiry.
+
+    ``ttl_seconds`` is the horizon after which the expiry sweep drops an entry;
+    it is measured from when the entry was stored, independent of any
+    ``timestamp`` field inside the cached value. Reads through ``get`` count
+    hits (present and younger than the TTL) and misses (absent or older).
+    """
+
+    def __init__(self, namespace, *, ttl_seconds, max_entries=None, max_bytes=None,
+                 clock=time.monotonic, size_fn=estimate_payload_bytes):
+        self.namespace = str(namespace)
+        self.ttl_seconds = float(ttl_seconds)
+        self.max_entries = max(1, int(max_entries if max_entries is not None else DEFAULT_MAX_ENTRIES))
+        self.max_bytes = max(1, int(max_bytes if max_bytes is not None else DEFAULT_MAX_BYTES))
+        self._clock = clock
+        self._size_fn = size_fn
+        self._lock = threading.RLock()
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._counters = {'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0, 'rejected': 0}
+
+    def __getitem__(self, key):
+        with self._lock:
+            value, _stored_at, _size = self._entries[key]
+            self._entries.move_to_end(key)
+            return value
+
+    def get(self, key, default=None):
+        with self._lock:
+            record = self._entries.get(key)
+            if record is None:
+                self._counters['misses'] += 1
+                return default
+            value, stored_at, _size = record
+            self._entries.move_to_end(key)
+            if self._clock() - stored_at < self.ttl_seconds:
+                self._counters['hits'] += 1
+            else:
+                self._counters['misses'] += 1
+            return value
+
+    def __setitem__(self, key, value):
+        size = int(self._size_fn(value)) if self._size_fn else 0
+        with self._lock:
+            self._discard(key)
+            if size > self.max_bytes:
+                self._counters['rejected'] += 1
+                return
+            self._entries[key] = (value, self._clock(), size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _key, (_value, _stored_at, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._counters['evictions'] += 1
+        _ensure_expiry_sweeper()
+
+    def __delitem__(self, key):
+        with self._lock:
+            if key not in self._entries:
+                raise KeyError(key)
+            self._discard(key)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def __iter__(self):
+        with self._lock:
+            return iter(list(self._entries.keys()))
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def __repr__(self):
+        return f'ProcessCache({self.namespace!r}, entries={len(self)})'
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _discard(self, key):
+        record = self._entries.pop(key, None)
+        if record is not None:
+            self._bytes -= record[2]
+
+    def sweep_expired(self, now=None):
+        """Drop entries older than the TTL; returns how many were removed."""
+        now_value = self._clock() if now is None else now
+        with self._lock:
+            expired = [key for key, (_value, stored_at, _size) in self._entries.items()
+                       if now_value - stored_at >= self.ttl_seconds]
+            for key in expired:
+                self._discard(key)
+            self._counters['expirations'] += len(expired)
+            return len(expired)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'namespace': self.namespace,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'maxEntries': self.max_entries,
+                'maxBytes': self.max_bytes,
+                'ttlSeconds': self.ttl_seconds,
+                **self._counters,
+            }
+
+
+def register_process_cache(namespace, *, ttl_seconds, max_entries=None, max_bytes=None, environ=None):
+    """Create (or replace) the named cache, applying ``PROCESS_CACHE_*`` env limits.
+
+    Limits resolve as ``PROCESS_CACHE_<NAMESPACE>_MAX_ENTRIES`` /
+    ``..._MAX_BYTES``, then the caller defaults, then the global
+    ``PROCESS_CACHE_MAX_ENTRIES`` / ``PROCESS_CACHE_MAX_BYTES``.
+    """
+    env = os.environ if environ is None else environ
+    prefix = _namespace_env_prefix(namespace)
+
+    def resolve(suffix, explicit, fallback):
+        raw = str(env.get(f'{prefix}_{suffix}', '') or '').strip()
+        if raw.isdigit():
+            return int(raw)
+        if explicit is not None:
+            return explicit
+        global_raw = str(env.get(f'PROCESS_CACHE_{suffix}', '') or '').strip()
+        return int(global_raw) if global_raw.isdigit() else fallback
+
+    cache = ProcessCache(
+        namespace,
+        ttl_seconds=ttl_seconds,
+        max_entries=resolve('MAX_ENTRIES', max_entries, DEFAULT_MAX_ENTRIES),
+        max_bytes=resolve('MAX_BYTES', max_bytes, DEFAULT_MAX_BYTES),
+    )
+    with _registry_lock:
+        _registry[cache.namespace] = cache
+    return cache
+
+
+def registered_process_caches():
+    with _registry_lock:
+        return dict(_registry)
+
+
+def process_cache_stats():
+    return {namespace: cache.stats() for namespace, cache in sorted(registered_process_caches().items())}
+
+
+def sweep_process_caches(now=None):
+    return {namespace: cache.sweep_expired(now) for namespace, cache in registered_process_caches().items()}
+
+
+def _sweep_interval_seconds():
+    raw = str(os.getenv('PROCESS_CACHE_SWEEP_INTERVAL_SECONDS', '') or '').strip()
+    try:
+        return float(raw) if raw else DEFAULT_SWEEP_INTERVAL_SECONDS
+    except ValueError:
+        return DEFAULT_SWEEP_INTERVAL_SECONDS
+
+
+def _sweep_forever(interval):
+    while True:
+        time.sleep(interval)
+        try:
+            sweep_process_caches()
+        except Exception:  # pragma: no cover - the sweeper must never die
+            pass
+
+
+def _ensure_expiry_sweeper():
+    """Start the background expiry sweep lazily, once per process.
+
+    Started on first write rather than at import so pre-fork servers (gunicorn)
+    get one sweeper per worker. ``PROCESS_CACHE_SWEEP_INTERVAL_SECONDS=0``
+    disables it.
+    """
+    pid = os.getpid()
+    if _sweeper_state['pid'] == pid:
+        return
+    interval = _sweep_interval_seconds()
+    with _registry_lock:
+        if _sweeper_state['pid'] == pid:
+            return
+        _sweeper_state['pid'] = pid
+        if interval <= 0:
+            return
+        thread = threading.Thread(
+            target=_sweep_forever,
+            args=(interval,),
+            name='process-cache-sweeper',
+            daemon=True,
+        )
+        _sweeper_state['thread'] = thread
+        thread.start()
@@ -0,0 +1,99 @@
+"""Scenario planner results cached per auth partition by a hash of their inputs.
+
+Results live in a registered ``ProcessCache`` (global entry/byte budget and
+TTL sweep) under ``(partition, digest)``. Each partition also keeps only its
+``max_per_partition`` most recently used digests, so one user toggling between
+configurations cannot evict everybody else's scenarios.
+
+The digest covers the request payload (filters, config, any overrides), a
+``jira_snapshot_version`` of the issues in scope, and the cache's
+``snapshot_version``. The Jira version hashes each issue's ``updated``
+timestamp, so an edit, a new link, or an issue entering or leaving the scope
+changes the digest. ``clear`` bumps ``snapshot_version`` whenever the
+Jira-derived caches are dropped, so a computation that started on the old
+Jira snapshot stores its result under a digest nobody asks for any more.
+"""
+
+from collections import OrderedDict
+import hashlib
+import json
+import threading
+import time
+
+
+def scenario_cache_digest(payload, snapshot_version, jira_version=None):
+    """Stable hash of a scenario request payload; key order does not matter."""
+    canonical = json.dumps(
+        {'payload': payload, 'snapshotVersion': snapshot_version, 'jiraVersion': jira_version},
+        sort_keys=True, separators=(',', ':'), default=str,
+    )
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def jira_snapshot_version(issues):
+    """Hash of ``(key, updated)`` over Jira issues; order does not matter."""
+    pairs = sorted((issue.get('key') or '', (issue.get('fields') or {}).get('updated') or '') for issue in issues or ())
+    return hashlib.sha256(json.dumps(pairs, separators=(',', ':')).encode('utf-8')).hexdigest()
+
+
+class ScenarioResultCache:
+    """Per-partition LRU view over a shared ``ProcessCache`` of scenario results."""
+
+    def __init__(self, store, *, max_per_partition, ttl_seconds, clock=time.time):
+        self.store = store
+        self.max_per_partition = max(1, int(max_per_partition))
+        self.ttl_seconds = float(ttl_seconds)
+        self.snapshot_version = 0
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._recent = {}  # partition -> OrderedDict(digest -> None), least recently used first
+
+    def digest(self, payload, jira_version=None):
+        return scenario_cache_digest(payload, self.snapshot_version, jira_version)
+
+    def get(self, partition, digest):
+        entry = self.store.get((partition, digest))
+        with self._lock:
+            recent = self._recent.get(partition)
+            if entry is None or self._clock() - entry['timestamp'] >= self.ttl_seconds:
+                if recent is not None:
+                    recent.pop(digest, None)
+                    if not recent:
+                        del self._recent[partition]
+                return None
+            if recent is not None and digest in recent:
+                recent.move_to_end(digest)
+        return entry['data']
+
+    def put(self, partition, digest, result):
+        self.store[(partition, digest)] = {'timestamp': self._clock(), 'data': result}
+        with self._lock:
+            recent = self._recent.setdefault(partition, OrderedDict())
+            recent[digest] = None
+            recent.move_to_end(digest)
+            evicted = []
+            while len(recent) > self.max_per_partition:
+                evicted.append(recent.popitem(last=False)[0])
+        for old_digest in evicted:
+            self.store.pop((partition, old_digest), None)
+
+    def latest(self, partition):
+        """The partition's most recently computed or served scenario, if still cached."""
+        with self._lock:
+            digests = list(reversed(self._recent.get(partition) or ()))
+        for digest in digests:
+            result = self.get(partition, digest)
+            if result is not None:
+                return result
+        return None
+
+    def clear(self):
+        with self._lock:
+            self.snapshot_version += 1
+            self._recent.clear()
+        self.store.clear()
+
+    def stats(self):
+        with self._lock:
+            partitions = len(self._recent)
+        return {**self.store.stats(), 'partitions': partitions, 'maxPerPartition': self.max_per_partition}
@@ -0,0 +1,125 @@
+"""Evaluate several scenario configurations against one Jira snapshot.
+
+A scenario build (``jira_server.build_scenario_result``) is a generator: it
+fetches and normalizes Jira data, yields the ``schedule_issues`` inputs once,
+and returns the response dict when sent the schedule. ``run_scenario_builds``
+advances every build to that point, schedules them together — on a process
+pool when one is given — and resumes them. Builds that share a snapshot dict
+fetch Jira once for all variants.
+
+``compare_payload`` reduces the results to a compact per-variant summary with
+end-date deltas against the first (base) variant; full results are included
+only on request.
+"""
+
+from datetime import date
+
+from planning.scheduler import schedule_issues
+
+MAX_VARIANTS = 12
+
+
+def run_scenario_builds(builds, pool=None):
+    """Drive scenario build generators to completion and return their results in order."""
+    builds = list(builds)
+    results = [None] * len(builds)
+    pending = []
+    for index, build in enumerate(builds):
+        try:
+            pending.append((index, next(build)))
+        except StopIteration as stop:
+            # Incremental runs schedule inside their session and never yield.
+            results[index] = stop.value
+    arguments = [request for _, request in pending]
+    schedules = pool.map(schedule_issues, arguments) if pool is not None else [schedule_issues(*args) for args in arguments]
+    for (index, _), schedule in zip(pending, schedules):
+        try:
+            builds[index].send(schedule)
+        except StopIteration as stop:
+            results[index] = stop.value
+        else:
+            raise RuntimeError('scenario build yielded more than once')
+    return results
+
+
+def variant_configs(payload):
+    """``[(name, config_payload)]`` from a compare request; each variant overrides the base ``config``.
+
+    Raises ``ValueError`` for a malformed or oversized variant list.
+    """
+    base = payload.get('config') or {}
+    variants = payload.get('variants')
+    if not isinstance(base, dict):
+        raise ValueError('config must be an object')
+    if not isinstance(variants, list) or not variants:
+        raise ValueError('variants must be a non-empty list')
+    if len(variants) > MAX_VARIANTS:
+        raise ValueError(f'at most {MAX_VARIANTS} variants can be compared at once')
+    configs = []
+    names = set()
+    for index, variant in enumerate(variants):
+        if not isinstance(variant, dict) or not isinstance(variant.get('config') or {}, dict):
+            raise ValueError(f'variant {index} must be an object with an optional config object')
+        name = str(variant.get('name') or f'variant-{index + 1}')
+        if name in names:
+            raise ValueError(f'duplicate variant name: {name}')
+        names.add(name)
+        config = {**base, **(variant.get('config') or {})}
+        config.pop('incremental', None)
+        configs.append((name, config))
+    return configs
+
+
+def _end_dates(result):
+    return {
+        issue['key']: date.fromisoformat(issue['end'])
+        for issue in result.get('issues') or []
+        if issue.get('end') and not issue.get('isContext')
+    }
+
+
+def _days_between(before, after):
+    if before is None or after is None:
+        return None
+    return (after - before).days
+
+
+def variant_summary(name, result, base_ends):
+    """Compact view of one variant: outcome flags, bottlenecks and end-date deltas vs the base."""
+    summary = result.get('summary') or {}
+    ends = _end_dates(result)
+    end_date = max(ends.values(), default=None)
+    base_end = max(base_ends.values(), default=None)
+    changed = {}
+    for key in sorted(set(ends) | set(base_ends)):
+        before, after = base_ends.get(key), ends.get(key)
+        if before != after:
+            changed[key] = _days_between(before, after)
+    return {
+        'name': name,
+        'deadlineMet': summary.get('deadline_met'),
+        'lateItems': summary.get('late_items') or [],
+        'unschedulable': summary.get('unschedulable') or [],
+        'bottleneckLanes': summary.get('bottleneck_lanes') or [],
+        'criticalPath': summary.get('critical_path') or [],
+        'endDate': end_date.isoformat() if end_date else None,
+        'endDateDeltaDays': _days_between(base_end, end_date),
+        'issueEndDeltaDays': changed,
+    }
+
+
+def compare_payload(variants, results, full=False):
+    """Response for ``POST /api/scenario/compare``.
+
+    ``full`` is ``True`` for every variant's complete result or a list of
+    variant names to include it for.
+    """
+    base_ends = _end_dates(results[0]) if results else {}
+    wanted = set(full) if isinstance(full, list) else None
+    compared = []
+    for (name, _), result in zip(variants, results):
+        entry = variant_summary(name, result, base_ends)
+        if (wanted is None and full is True) or (wanted is not None and name in wanted):
+            entry['result'] = result
+        compared.append(entry)
+    return {'baseVariant': compared[0]['name'] if compared else None, 'variants': compared}
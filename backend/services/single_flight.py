@@ -0,0 +1,133 @@
+"""Single-flight coalescing for identical concurrent Jira fetches.
+
+When several requests miss the same process-cache key at once, only the first
+(the leader) talks to Jira; the rest wait for it and share its result. Keys
+must already be auth-partitioned (``build_jira_home_process_cache_key``) so a
+result is never shared across users who could not share the cache entry.
+"""
+
+import threading
+
+from backend.auth.cache_policy import (
+    build_jira_home_process_cache_key,
+    jira_home_partitioned_process_cache_enabled,
+)
+
+
+DEFAULT_WAIT_SECONDS = 60.0
+
+
+class _Flight:
+    def __init__(self, owner, key, leader_flight=None):
+        self._owner = owner
+        self.key = key
+        self.leader = leader_flight is None
+        self._leader_flight = leader_flight or self
+        self._event = threading.Event() if self.leader else None
+        self.result = None
+        self.error = None
+
+    def wait(self, timeout=None):
+        """Follower side: block until the leader finishes; False on timeout."""
+        if self.leader:
+            return True
+        return self._leader_flight._event.wait(timeout)
+
+    def done(self, result=None, error=None):
+        """Leader side: publish the outcome and wake waiting followers.
+
+        Safe to call from every exit path (and from followers, where it is a
+        no-op), which keeps ``try/finally`` call sites simple.
+        """
+        if not self.leader or self._event.is_set():
+            return
+        self.result = result
+        self.error = error
+        self._owner._finish(self)
+        self._event.set()
+
+
+class SingleFlight:
+    """Per-key leader election with shared results.
+
+    ``do(key, fn)`` is for fetchers that return plain data. ``join(key)`` is for
+    route bodies that build a response and store the payload in a process
+    cache: followers ``wait()`` and then re-read the cache instead of sharing a
+    Flask response object across requests.
+    """
+
+    def __init__(self, wait_seconds=DEFAULT_WAIT_SECONDS):
+        self.wait_seconds = float(wait_seconds)
+        self._lock = threading.Lock()
+        self._inflight = {}
+        self._counters = {'leaders': 0, 'followers': 0, 'timeouts': 0}
+
+    def _finish(self, flight):
+        with self._lock:
+            if self._inflight.get(flight.key) is flight:
+                del self._inflight[flight.key]
+
+    def join(self, key):
+        with self._lock:
+            leader_flight = self._inflight.get(key)
+            if leader_flight is not None:
+                self._counters['followers'] += 1
+                return _Flight(self, key, leader_flight)
+            flight = _Flight(self, key)
+            self._inflight[key] = flight
+            self._counters['leaders'] += 1
+            return flight
+
+    def join_and_wait(self, key):
+        """Join ``key``; a follower blocks (bounded) until the leader finishes.
+
+        The caller re-reads its process cache afterwards and must call
+        ``done()`` on the returned flight from a ``finally`` block.
+        """
+        flight = self.join(key)
+        if not flight.leader and not flight.wait(self.wait_seconds):
+            with self._lock:
+                self._counters['timeouts'] += 1
+        return flight
+
+    def do(self, key, fn):
+        """Run ``fn`` once for concurrent callers of ``key`` and share its result.
+
+        Exceptions raised by the leader are re-raised in every follower. A
+        follower that outwaits ``wait_seconds`` runs ``fn`` itself rather than
+        hanging on a stuck leader.
+        """
+        flight = self.join(key)
+        if not flight.leader:
+            if not flight.wait(self.wait_seconds):
+                with self._lock:
+                    self._counters['timeouts'] += 1
+                return fn()
+            leader_flight = flight._leader_flight
+            if leader_flight.error is not None:
+                raise leader_flight.error
+            return leader_flight.result
+
+        try:
+            result = fn()
+        except BaseException as error:
+            flight.done(error=error)
+            raise
+        flight.done(result=result)
+        return result
+
+    def stats(self):
+        with self._lock:
+            return {'inflight': len(self._inflight), **self._counters}
+
+
+def coalesce_for_context(single_flight, context, key_parts, fn):
+    """Coalesce ``fn`` when ``context`` may share a partitioned process-cache key.
+
+    Contexts that cannot use the shared process cache (for example OAuth
+    sessions without a resolved workspace/token version) always run ``fn``
+    directly, so results never cross user boundaries.
+    """
+    if single_flight is None or not jira_home_partitioned_process_cache_enabled(context):
+        return fn()
+    return single_flight.do(build_jira_home_process_cache_key(context, *key_parts), fn)
@@ -0,0 +1,154 @@
+"""Incremental ``updated >=`` refresh for the sprint task list.
+
+A full ``fetch_tasks`` search stores a raw snapshot (issues, names map, epic
+details) next to its response in ``TASKS_CACHE``. A later refresh of the same
+cache key, inside ``TASKS_FULL_SYNC_SECONDS`` of the last full search, then
+issues two cheap queries instead of re-downloading every issue with every
+field:
+
+* ``<jql> AND updated >= -Nm`` with the full field list, for changed issues;
+* ``<jql>`` with only ``key``, for the current membership and order, which
+  also drops issues that were deleted or moved out of scope.
+
+The window is relative (minutes) so it does not depend on the Jira user's
+time zone, and it reaches back ``skew`` seconds past the last sync to cover
+clock drift and issues updated while that sync was running.
+
+Each delta moves ``syncedAt`` (the delta anchor) but carries ``fullSyncedAt``
+over unchanged, so a full search still runs once the window has passed since
+the last one, also under steady traffic. That refreshes epic details that
+deltas reuse.
+"""
+
+import math
+
+from backend.jira_client import chunk_values, fetch_search_pages
+
+
+DEFAULT_FULL_SYNC_SECONDS = 900
+DEFAULT_SYNC_SKEW_SECONDS = 120
+SCOPE_FIELDS = ['key']
+
+
+def build_task_sync_snapshot(jql, fields_list, issues, names, epic_details, synced_at, full_synced_at=None):
+    """Snapshot of a search at ``synced_at``; ``full_synced_at`` is the last full search (``synced_at`` for a full one)."""
+    return {
+        'jql': jql,
+        'fields': tuple(fields_list),
+        'syncedAt': float(synced_at),
+        'fullSyncedAt': float(synced_at if full_synced_at is None else full_synced_at),
+        'issues': [_copy_issue(issue) for issue in issues],
+        'names': dict(names or {}),
+        'epicDetails': dict(epic_details or {}),
+    }
+
+
+def usable_task_sync_snapshot(entry, jql, fields_list, now, max_age_seconds):
+    """Return the snapshot in ``entry`` when it was built for this exact query and its last full search is young enough."""
+    snapshot = (entry or {}).get('sync') if isinstance(entry, dict) else None
+    if not snapshot or max_age_seconds <= 0:
+        return None
+    if snapshot.get('jql') != jql or tuple(snapshot.get('fields') or ()) != tuple(fields_list):
+        return None
+    if now - float(snapshot.get('fullSyncedAt') or 0) >= max_age_seconds:
+        return None
+    return snapshot
+
+
+def build_delta_jql(jql, synced_at, now, skew_seconds, add_clause_to_jql):
+    minutes = max(1, math.ceil((max(0.0, now - synced_at) + max(0, skew_seconds)) / 60))
+    return add_clause_to_jql(jql, f'updated >= -{minutes}m')
+
+
+def _copy_issue(issue):
+    # fetch_tasks decorates ``fields`` in place; keep the snapshot's dicts private.
+    return {**issue, 'fields': dict(issue.get('fields') or {})}
+
+
+def merge_task_delta(snapshot_issues, changed_issues, scope_keys):
+    """Overlay changed issues on the snapshot, keeping only ``scope_keys`` in their order.
+
+    Returns ``(issues, changed_keys, missing_keys)``; ``missing_keys`` are in
+    scope but neither changed nor known (for example moved into scope by an
+    edit to another issue) and must be fetched by key.
+    """
+    by_key = {issue.get('key'): issue for issue in snapshot_issues}
+    changed_keys = set()
+    for issue in changed_issues:
+        by_key[issue.get('key')] = issue
+        changed_keys.add(issue.get('key'))
+    merged = []
+    missing_keys = []
+    for key in scope_keys:
+        issue = by_key.get(key)
+        if issue is None:
+            missing_keys.append(key)
+            continue
+        merged.append(_copy_issue(issue))
+    return merged, changed_keys, missing_keys
+
+
+def split_epic_details(previous_details, epic_keys, stale_epic_keys):
+    """Reuse cached epic details except for epics that are new or had children change."""
+    reused = {
+        key: value for key, value in (previous_details or {}).items()
+        if key in epic_keys and key not in stale_epic_keys
+    }
+    return reused, {key for key in epic_keys if key not in reused}
+
+
+class TaskDeltaResult:
+    """Quacks like ``ShardedSearchResult`` for ``fetch_tasks``; ``error`` is always None."""
+
+    __slots__ = ('issues', 'names', 'total', 'error', 'changed_keys', 'timings')
+
+    def __init__(self, issues, names, changed_keys, timings):
+        self.issues = issues
+        self.names = names
+        self.total = len(issues)
+        self.error = None
+        self.changed_keys = changed_keys
+        self.timings = timings
+
+    def server_timing(self):
+        parts = [f'jira-delta-{name};dur={duration}' for name, duration in self.timings]
+        return parts + [f'jira-delta;desc="{len(self.changed_keys)} changed"']
+
+
+def run_task_delta_sync(snapshot, jql, fields_list, *, search_request, add_clause_to_jql, max_results,
+                        now, skew_seconds=DEFAULT_SYNC_SKEW_SECONDS, page_size=100):
+    """Refresh ``snapshot`` with a delta search plus a key-only scope search.
+
+    Returns a ``TaskDeltaResult``, or None when any query fails so the caller
+    falls back to a full search.
+    """
+    delta = fetch_search_pages(
+        build_delta_jql(jql, snapshot['syncedAt'], now, skew_seconds, add_clause_to_jql),
+        fields_list,
+        search_request=search_request,
+        max_results=max_results,
+        page_size=page_size,
+    )
+    if delta.error is not None or delta.truncated:
+        return None
+    scope = fetch_search_pages(jql, SCOPE_FIELDS, search_request=search_request, max_results=max_results, page_size=page_size)
+    if scope.error is not None:
+        return None
+    scope_keys = [issue.get('key') for issue in scope.issues if issue.get('key')]
+    issues, changed_keys, missing_keys = merge_task_delta(snapshot['issues'], delta.issues, scope_keys)
+    timings = [('changed', delta.duration_ms), ('scope', scope.duration_ms)]
+    if missing_keys:
+        fetched = []
+        missing_ms = 0.0
+        for chunk in chunk_values(missing_keys, page_size):
+            quoted = ', '.join(f'"{key}"' for key in chunk)
+            page = fetch_search_pages(f'key in ({quoted})', fields_list, search_request=search_request,
+                                      max_results=len(chunk), page_size=page_size)
+            if page.error is not None:
+                return None
+            fetched.extend(page.issues)
+            missing_ms += page.duration_ms
+        # Keys Jira no longer returns by key were deleted between the two searches; drop them.
+        issues, changed_keys, _gone = merge_task_delta(snapshot['issues'], [*delta.issues, *fetched], scope_keys)
+        timings.append(('missing', round(missing_ms, 1)))
+    return TaskDeltaResult(issues, delta.names or snapshot.get('names') or {}, changed_keys, timings)
@@ -40,7 +40,9 @@ export const pollScenarioDraftEvents = (backendUrl, draftId, sinceEventNumber, {
         signal
     }).then(response => scenarioJson(response, 'Scenario draft events')).then(data => ({
         events: Array.isArray(data.events) ? data.events : [],
-        nextSince: Number(data.nextSince || 0)
+        nextSince: Number(data.nextSince || 0),
+        snapshot: data.snapshot || null,
+        streamAvailable: data.streamAvailable === true
     }));
 
 export const saveScenarioDraftVersion = (backendUrl, payload, { csrfToken = '' } = {}) =>
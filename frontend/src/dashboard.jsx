@@ -4,6 +4,7 @@ import './styles/dashboard.css';
 import { parseScenarioDate, normalizeScenarioSummary, buildScenarioTooltipPayload, applyIssueOverride, pxToDate, dateToPx, dateToISODate, createUndoStack, validateDependencies, splitAtSprintBoundaries, SCENARIO_BAR_HEIGHT, SCENARIO_BAR_GAP, SCENARIO_COLLAPSED_ROWS, SCENARIO_TEAM_LEAD_ROWS } from './scenario/scenarioUtils.js';
 import ScenarioBar from './scenario/ScenarioBar.jsx';
 import { buildLaneIssues } from './scenario/scenarioLaneUtils.js';
+import { useScenarioDraftEventStream } from './scenario/useScenarioDraftEventStream.js';
 import CohortGrid from './cohort/CohortGrid.jsx';
 import LeadTimesEpicCharts from './cohort/LeadTimesEpicCharts.jsx';
 import LeadTimesWorkflowStatusCard from './cohort/LeadTimesWorkflowStatusCard.jsx';
@@ -154,7 +155,6 @@ import {
     saveEpmConfig as requestSaveEpmConfig,
 } from './api/epmApi.js';
 import {
-    buildScenarioDraftEventsStreamUrl,
     fetchScenarioDraft as requestScenarioDraft,
     fetchScenarioDraftVersion as requestScenarioDraftVersion,
     fetchScenarioRun as requestScenarioRun,
@@ -801,6 +801,7 @@ import {
             const [scenarioOverrides, setScenarioOverrides] = useState({});
             const scenarioActiveDraftIdRef = useRef('');
             const scenarioScopeKeyRef = useRef('');
+            const scenarioDraftLastEventNumberRef = useRef(0);
             const [scenarioDraftMeta, setScenarioDraftMeta] = useState({
                 activeDraft: null,
                 versions: [],
@@ -839,6 +840,7 @@ import {
                 message: ''
             });
             const [scenarioDraftLastEventNumber, setScenarioDraftLastEventNumber] = useState(0);
+            const [scenarioDraftStreamAvailable, setScenarioDraftStreamAvailable] = useState(false);
             const [scenarioEditMode, setScenarioEditMode] = useState(false);
 
             const scenarioUndoStackRef = useRef(createUndoStack());
@@ -5896,6 +5898,19 @@ import {
                 });
             };
 
+            // A page for a client behind the compacted event prefix starts from the draft snapshot.
+            const applyScenarioDraftSnapshot = (snapshot) => {
+                if (!snapshot) return;
+                setScenarioDraftLocks((snapshot.locks || []).filter(lock => !isScenarioLockExpired(lock)));
+                setScenarioDraftPresence((snapshot.presence || []).filter(item => !isScenarioPresenceExpired(item)));
+                applyScenarioDraftEvent({
+                    eventNumber: snapshot.eventNumber,
+                    eventType: 'draft.snapshot',
+                    draftRevision: snapshot.activeDraft?.draftRevision,
+                    payload: { activeDraft: snapshot.activeDraft || null }
+                });
+            };
+
             const pollScenarioDraftEvents = (draftId, sinceEventNumber, signal) =>
                 requestScenarioDraftEvents(BACKEND_URL, draftId, sinceEventNumber, { signal });
 
@@ -7591,6 +7606,7 @@ import {
             const scenarioActiveDraftId = scenarioDraftMeta.activeDraft?.draftId || '';
             scenarioActiveDraftIdRef.current = scenarioActiveDraftId;
             scenarioScopeKeyRef.current = scenarioScopeKey;
+            scenarioDraftLastEventNumberRef.current = scenarioDraftLastEventNumber;
             const isScenarioScopeDraftCurrent = React.useCallback((expectedScopeKey, expectedDraftId = '') => {
                 if (scenarioScopeKeyRef.current !== expectedScopeKey) return false;
                 if (expectedDraftId && scenarioActiveDraftIdRef.current !== expectedDraftId) return false;
@@ -7649,8 +7665,25 @@ import {
                 }
             }, [scenarioActiveDraftId, scenarioScopeKey]);
 
+            const { streamOpen: scenarioDraftStreamOpen } = useScenarioDraftEventStream({
+                backendUrl: BACKEND_URL,
+                ready: scenarioActiveDraftReady,
+                draftId: scenarioActiveDraftId,
+                streamAvailable: scenarioDraftStreamAvailable,
+                activeDraftIdRef: scenarioActiveDraftIdRef,
+                lastEventNumberRef: scenarioDraftLastEventNumberRef,
+                onEvent: applyScenarioDraftEvent,
+                onSnapshot: applyScenarioDraftSnapshot,
+                onPresence: presence => {
+                    if (!isScenarioPresenceExpired(presence)) mergeScenarioDraftPresence(presence);
+                },
+                setRealtimeStatus: setScenarioDraftRealtimeStatus
+            });
+
             React.useEffect(() => {
                 if (!scenarioActiveDraftReady) return undefined;
+                // An open event stream delivers everything polling would; poll only while it is down.
+                if (scenarioDraftStreamOpen) return undefined;
                 let cancelled = false;
                 const controllers = new Set();
                 const expectedDraftId = scenarioActiveDraftId;
@@ -7666,10 +7699,12 @@ import {
                         if (!stillCurrent) {
                             return;
                         }
+                        applyScenarioDraftSnapshot(data.snapshot);
                         data.events.forEach(applyScenarioDraftEvent);
                         if (data.nextSince > 0) {
                             setScenarioDraftLastEventNumber(prev => Math.max(prev, data.nextSince));
                         }
+                        setScenarioDraftStreamAvailable(data.streamAvailable);
                         setScenarioDraftRealtimeStatus(prev => (
                             prev.paused ? prev : { mode: 'polling', paused: false, message: '' }
                         ));
@@ -7697,7 +7732,7 @@ import {
                     });
                     controllers.clear();
                 };
-            }, [scenarioActiveDraftReady, scenarioActiveDraftId, scenarioScopeKey, scenarioDraftLastEventNumber]);
+            }, [scenarioActiveDraftReady, scenarioActiveDraftId, scenarioScopeKey, scenarioDraftLastEventNumber, scenarioDraftStreamOpen]);
 
             React.useEffect(() => {
                 if (!scenarioActiveDraftReady) return undefined;
@@ -7708,7 +7743,12 @@ import {
                         await postScenarioRealtimeJson(scenarioActiveDraftId, '/presence', {
                             mode: scenarioEditMode ? 'editing' : 'viewing',
                             cursorPayload: {}
-                        }).then(data => learnScenarioCurrentUserFromPresence(data.presence));
+                        }).then(data => {
+                            learnScenarioCurrentUserFromPresence(data.presence);
+                            if (!cancelled && Array.isArray(data.activePresence)) {
+                                setScenarioDraftPresence(data.activePresence.filter(item => !isScenarioPresenceExpired(item)));
+                            }
+                        });
                     } catch (err) {
                         if (!cancelled && !(err.status === 403 && err.payload?.error === 'csrf_required')) {
                             pauseScenarioRealtime('Realtime paused; keep editing local-only until the connection recovers.');
@@ -7723,49 +7763,6 @@ import {
                 };
             }, [scenarioActiveDraftReady, scenarioActiveDraftId, scenarioDraftRealtimeStatus.paused, scenarioEditMode]);
 
-            React.useEffect(() => {
-                if (!scenarioActiveDraftReady) return undefined;
-                const sseEnabled = window.SCENARIO_DRAFT_SSE_ENABLED === true;
-                if (!sseEnabled || typeof window.EventSource !== 'function') return undefined;
-                const source = new window.EventSource(buildScenarioDraftEventsStreamUrl(BACKEND_URL, scenarioActiveDraftId, scenarioDraftLastEventNumber));
-                const expectedDraftId = scenarioActiveDraftId;
-                const handleStreamMessage = (message) => {
-                    if (scenarioActiveDraftIdRef.current !== expectedDraftId) return;
-                    try {
-                        applyScenarioDraftEvent(JSON.parse(message.data));
-                    } catch (err) {
-                        // Malformed stream events are ignored; polling remains the fallback.
-                    }
-                };
-                source.onmessage = handleStreamMessage;
-                [
-                    'draft.saved',
-                    'draft.rolled_back',
-                    'presence.updated',
-                    'lock.acquired',
-                    'lock.refreshed',
-                    'lock.released'
-                ].forEach(eventType => {
-                    source.addEventListener(eventType, handleStreamMessage);
-                });
-                source.onerror = () => {
-                    setScenarioDraftRealtimeStatus(prev => (
-                        prev.paused ? prev : { mode: 'polling', paused: false, message: 'Realtime stream disconnected; polling will continue.' }
-                    ));
-                    try {
-                        source.close();
-                    } catch (err) {
-                        // ignore close errors
-                    }
-                };
-                return () => {
-                    try {
-                        source.close();
-                    } catch (err) {
-                        // ignore close errors
-                    }
-                };
-            }, [scenarioActiveDraftReady, scenarioActiveDraftId, scenarioDraftLastEventNumber]);
             const scenarioSprintBounds = React.useMemo(() => {
                 const b = scenarioData?.sprintBoundaries;
                 if (!b) return [];
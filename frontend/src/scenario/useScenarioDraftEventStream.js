@@ -0,0 +1,92 @@
+import * as React from 'react';
+import { buildScenarioDraftEventsStreamUrl } from '../api/scenarioApi.js';
+
+// Extracted from dashboard.jsx: the per-draft server-sent event stream.
+
+export const SCENARIO_DRAFT_STREAM_RETRY_MS = 60000;
+
+const SCENARIO_DRAFT_STREAM_EVENT_TYPES = [
+    'draft.saved',
+    'draft.rolled_back',
+    'draft.reloaded_from_jira',
+    'presence.updated',
+    'lock.acquired',
+    'lock.refreshed',
+    'lock.released'
+];
+
+export function useScenarioDraftEventStream({
+    backendUrl,
+    ready,
+    draftId,
+    streamAvailable,
+    activeDraftIdRef,
+    lastEventNumberRef,
+    onEvent,
+    onSnapshot,
+    onPresence,
+    setRealtimeStatus,
+}) {
+    const [streamOpen, setStreamOpen] = React.useState(false);
+    const [streamRetry, setStreamRetry] = React.useState(0);
+    const handlersRef = React.useRef({ onEvent, onSnapshot, onPresence });
+    handlersRef.current = { onEvent, onSnapshot, onPresence };
+
+    React.useEffect(() => {
+        if (!ready || !streamAvailable) return undefined;
+        if (typeof window.EventSource !== 'function') return undefined;
+        // One stream per draft. When the server ends it (SCENARIO_DRAFT_SSE_MAX_SECONDS) the browser
+        // reconnects on its own with Last-Event-ID, so new events must not reopen it.
+        const expectedDraftId = draftId;
+        const source = new window.EventSource(buildScenarioDraftEventsStreamUrl(
+            backendUrl,
+            expectedDraftId,
+            lastEventNumberRef.current
+        ));
+        let retryTimer = null;
+        const streamHandler = (handlerName) => (message) => {
+            if (activeDraftIdRef.current !== expectedDraftId) return;
+            try {
+                handlersRef.current[handlerName](JSON.parse(message.data));
+            } catch (err) {
+                // Malformed stream events are ignored; polling remains the fallback.
+            }
+        };
+        const handleStreamEvent = streamHandler('onEvent');
+        source.onopen = () => {
+            setStreamOpen(true);
+            setRealtimeStatus(prev => (
+                prev.paused ? prev : { mode: 'stream', paused: false, message: '' }
+            ));
+        };
+        source.onmessage = handleStreamEvent;
+        SCENARIO_DRAFT_STREAM_EVENT_TYPES.forEach(eventType => {
+            source.addEventListener(eventType, handleStreamEvent);
+        });
+        source.addEventListener('draft.snapshot', streamHandler('onSnapshot'));
+        source.addEventListener('presence.heartbeat', streamHandler('onPresence'));
+        source.onerror = () => {
+            setStreamOpen(false);
+            setRealtimeStatus(prev => (
+                prev.paused ? prev : { mode: 'polling', paused: false, message: 'Realtime stream reconnecting; polling meanwhile.' }
+            ));
+            if (source.readyState === window.EventSource.CLOSED && retryTimer === null) {
+                // The server refused the stream (for example over its stream limit); poll, then try again.
+                retryTimer = window.setTimeout(() => {
+                    setStreamRetry(prev => prev + 1);
+                }, SCENARIO_DRAFT_STREAM_RETRY_MS);
+            }
+        };
+        return () => {
+            window.clearTimeout(retryTimer);
+            setStreamOpen(false);
+            try {
+                source.close();
+            } catch (err) {
+                // ignore close errors
+            }
+        };
+    }, [backendUrl, ready, draftId, streamAvailable, streamRetry]);
+
+    return { streamOpen };
+}
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 
-from flask import abort, has_request_context, jsonify, redirect, request, send_file, send_from_directory, session
+from flask import abort, copy_current_request_context, has_request_context, jsonify, redirect, request, send_file, send_from_directory, session
 import requests
 import argparse
 import base64
@@ -11,6 +11,7 @@ import os
 import re
 import json
 import hashlib
+import sys
 import threading
 import time
 import uuid
@@ -25,8 +26,6 @@ from dotenv import load_dotenv
 from openpyxl import Workbook
 from openpyxl.styles import Font, PatternFill, Alignment
 import io
-from requests import Session
-from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
 from backend.epm import config as epm_config
 from backend.epm import home as epm_home
 from backend.epm import aggregate as epm_aggregate
@@ -34,7 +33,10 @@ from backend.epm import payload as epm_payload
 from backend.epm.home import fetch_epm_home_projects, merge_epm_linkage
 from backend.epm.rollup import EpmRollupDependencies, build_per_project_rollup
 from backend.epm.scope import build_epm_scope_clause, normalize_epm_sprint_field, should_apply_epm_sprint
-from planning import Issue, ScheduledIssue, ScenarioConfig, compute_slack, schedule_issues
+from planning import Issue, ScheduledIssue, ScenarioConfig, compute_slack, critical_chains
+from planning.capacity import scenario_capacity_settings
+from planning import forecast as scenario_forecast
+from planning.incremental import ScheduleSession
 from backend.auth.cache_policy import (
     build_jira_home_process_cache_key,
     jira_home_partitioned_process_cache_enabled,
@@ -88,6 +90,17 @@ from backend import runtime_state as _runtime_state
 from backend.services import capacity as _capacity_service
 from backend.services import sprints as _sprints_service
 from backend.services import stats_cache as _stats_cache_service
+from backend.services.process_cache import register_process_cache
+from backend.services.scenario_cache import ScenarioResultCache, jira_snapshot_version
+from backend.services import scenario_compare as _scenario_compare_service
+from backend.services.single_flight import SingleFlight, coalesce_for_context
+from backend.services.http_session_pool import JiraSessionPool
+from backend.services.jira_fanout import shared_jira_fanout
+from backend.services import task_sync as _task_sync
+from backend.services.issue_store import IssueStore
+from backend.services.changelog_cache import ChangelogCache
+from backend.services.dependency_graph import DependencyGraphIndex, dependency_entry_edges
+from backend.services.cache_revalidation import CACHE_EXPIRED, CACHE_STALE, STALE_SERVER_TIMING, classify_cache_entry, resolve_hard_ttl_seconds, revalidate_in_background
 from backend.services.alert_epics import (
     build_alert_epic_payloads as build_alert_epic_payloads_service,
     fetch_epics_by_keys_for_alert as fetch_epics_by_keys_for_alert_service,
@@ -104,8 +117,8 @@ from backend.security.policy import (
     shared_config_write_paths,
 )
 
-# Reuse a single HTTP session to avoid reconnect overhead on repeated calls
-HTTP_SESSION = Session()
+# Keep-alive session per Jira site, sized for the thread-pool fan-outs
+HTTP_SESSION = JiraSessionPool.from_env()
 logger = logging.getLogger(__name__)
 
 # CONFIGURATION - Load from environment variables
@@ -185,27 +198,47 @@ EXCLUDED_CAPACITY_STATS_SOURCE_CACHE_TTL_SECONDS = int(os.getenv('EXCLUDED_CAPAC
 EXCLUDED_CAPACITY_EPIC_SUMMARY_CACHE_TTL_SECONDS = int(os.getenv('EXCLUDED_CAPACITY_EPIC_SUMMARY_CACHE_TTL_SECONDS', '3600'))
 EXCLUDED_CAPACITY_EPIC_SUMMARY_BATCH_SIZE = int(os.getenv('EXCLUDED_CAPACITY_EPIC_SUMMARY_BATCH_SIZE', '100'))
 
-SCENARIO_CACHE = {'generatedAt': None, 'data': None}
-TASKS_CACHE = {}
-TASKS_CACHE_TTL_SECONDS = 60 * 5
+SCENARIO_CACHE = ScenarioResultCache(
+    register_process_cache('scenario-results', ttl_seconds=int(os.getenv('SCENARIO_CACHE_TTL_SECONDS', '300')), max_entries=256),
+    max_per_partition=int(os.getenv('SCENARIO_CACHE_MAX_PER_USER', '8')),
+    ttl_seconds=int(os.getenv('SCENARIO_CACHE_TTL_SECONDS', '300')),
+)
+SCENARIO_FORECAST_CACHE = register_process_cache('scenario-forecasts', ttl_seconds=int(os.getenv('SCENARIO_FORECAST_CACHE_TTL_SECONDS', '3600')), max_entries=32)
+SCENARIO_FORECAST_POOL = scenario_forecast.ForecastPool.from_env()
+SCENARIO_SESSIONS = register_process_cache('scenario-sessions', ttl_seconds=int(os.getenv('SCENARIO_SESSION_TTL_SECONDS', '1800')), max_entries=64)
+TASKS_CACHE_TTL_SECONDS = int(os.getenv('TASKS_CACHE_TTL_SECONDS', str(60 * 5)))
+TASKS_CACHE_HARD_TTL_SECONDS = resolve_hard_ttl_seconds('TASKS_CACHE_HARD_TTL_SECONDS', TASKS_CACHE_TTL_SECONDS)
+TASKS_CACHE = register_process_cache('tasks', ttl_seconds=TASKS_CACHE_HARD_TTL_SECONDS)
 TASKS_CACHE_SCHEMA_VERSION = 'v2-empty-epic-actionable'
-MISSING_INFO_CACHE = {}
-MISSING_INFO_CACHE_TTL_SECONDS = 60 * 5
-DEPENDENCIES_CACHE = {}
+TASKS_FULL_SYNC_SECONDS = int(os.getenv('TASKS_FULL_SYNC_SECONDS', str(_task_sync.DEFAULT_FULL_SYNC_SECONDS)))
+TASKS_SYNC_SKEW_SECONDS = int(os.getenv('TASKS_SYNC_SKEW_SECONDS', str(_task_sync.DEFAULT_SYNC_SKEW_SECONDS)))
+# Opt-in (JIRA_ISSUE_STORE_ENABLED) write-through issue store behind fetch_issues_by_keys/_by_jql
+JIRA_ISSUE_STORE = IssueStore.from_env(local_file_state=local_file_state_enabled())
+MISSING_INFO_CACHE_TTL_SECONDS = int(os.getenv('MISSING_INFO_CACHE_TTL_SECONDS', str(60 * 5)))
+MISSING_INFO_CACHE_HARD_TTL_SECONDS = resolve_hard_ttl_seconds('MISSING_INFO_CACHE_HARD_TTL_SECONDS', MISSING_INFO_CACHE_TTL_SECONDS)
+MISSING_INFO_CACHE = register_process_cache('missing-info', ttl_seconds=MISSING_INFO_CACHE_HARD_TTL_SECONDS)
 DEPENDENCIES_CACHE_TTL_SECONDS = 60 * 5
+DEPENDENCIES_CACHE = register_process_cache('dependencies', ttl_seconds=DEPENDENCIES_CACHE_TTL_SECONDS)
+# Issue-link graph per site (and user outside basic mode), fed by collect_dependencies
+DEPENDENCY_GRAPHS = DependencyGraphIndex(max_nodes=int(os.getenv('DEPENDENCY_GRAPH_MAX_NODES', '50000')))
 UPDATE_CHECK_CACHE = {'ts': 0, 'data': None}
-EPIC_COHORT_CACHE = {}
-EXCLUDED_CAPACITY_STATS_SOURCE_CACHE = {}
-EXCLUDED_CAPACITY_EPIC_SUMMARY_CACHE = {}
-EPM_PROJECTS_CACHE = {}
-EPM_ISSUES_CACHE = {}
-EPM_ROLLUP_CACHE = {}
+EPIC_COHORT_CACHE = register_process_cache('epic-cohort', ttl_seconds=EPIC_COHORT_CACHE_TTL_SECONDS, max_entries=64)
+EXCLUDED_CAPACITY_STATS_SOURCE_CACHE = register_process_cache('excluded-capacity-source', ttl_seconds=EXCLUDED_CAPACITY_STATS_SOURCE_CACHE_TTL_SECONDS, max_entries=64)
+EXCLUDED_CAPACITY_EPIC_SUMMARY_CACHE = register_process_cache('excluded-capacity-epic-summary', ttl_seconds=EXCLUDED_CAPACITY_EPIC_SUMMARY_CACHE_TTL_SECONDS, max_entries=20000, max_bytes=16 * 1024 * 1024)
+EPM_PROJECTS_CACHE_TTL_SECONDS = 300
+EPM_ISSUES_CACHE_TTL_SECONDS = 300
+EPM_ROLLUP_CACHE_TTL_SECONDS = int(os.getenv('EPM_ROLLUP_CACHE_TTL_SECONDS', '300'))
+EPM_ROLLUP_CACHE_HARD_TTL_SECONDS = resolve_hard_ttl_seconds('EPM_ROLLUP_CACHE_HARD_TTL_SECONDS', EPM_ROLLUP_CACHE_TTL_SECONDS)
 OAUTH_TOKEN_STORE = {}
 OAUTH_TOKEN_STORE_LOCK = threading.RLock()
 OAUTH_REFRESH_LOCKS = {}
-EPM_PROJECTS_CACHE_TTL_SECONDS = 300
-EPM_ISSUES_CACHE_TTL_SECONDS = 300
-EPM_ROLLUP_CACHE_TTL_SECONDS = 300
+EPM_PROJECTS_CACHE = register_process_cache('epm-projects', ttl_seconds=EPM_PROJECTS_CACHE_TTL_SECONDS, max_entries=64)
+EPM_ISSUES_CACHE = register_process_cache('epm-issues', ttl_seconds=EPM_ISSUES_CACHE_TTL_SECONDS)
+EPM_ROLLUP_CACHE = register_process_cache('epm-rollup', ttl_seconds=EPM_ROLLUP_CACHE_HARD_TTL_SECONDS)
+CHANGELOG_CACHE_TTL_SECONDS = int(os.getenv('CHANGELOG_CACHE_TTL_SECONDS', str(6 * 60 * 60)))
+CHANGELOG_CACHE = register_process_cache('changelogs', ttl_seconds=CHANGELOG_CACHE_TTL_SECONDS, max_entries=20000, max_bytes=64 * 1024 * 1024)
+JIRA_CHANGELOGS = ChangelogCache(CHANGELOG_CACHE)
+JIRA_FETCH_SINGLE_FLIGHT = SingleFlight(wait_seconds=float(os.getenv('JIRA_SINGLE_FLIGHT_WAIT_SECONDS', '60')))
 EPM_ROLLUP_QUERY_MAX_RESULTS = 2000
 _epm_cache_lock = threading.Lock()
 
@@ -629,6 +662,12 @@ def current_jira_auth_context(context=None):
     return current_request_auth_context()
 
 
+def jira_site_partition(context=None):
+    """Cache partition for the active Jira site (issue store, changelog cache)."""
+    auth_context = current_jira_auth_context(context)
+    return str(getattr(auth_context, 'cloud_id', '') or getattr(auth_context, 'site_url', '') or JIRA_URL or '').rstrip('/')
+
+
 def current_oauth_session_callbacks(context=None):
     if JIRA_AUTH_MODE != AUTH_MODE_ATLASSIAN_OAUTH:
         return {}
@@ -697,7 +736,14 @@ def current_jira_request(method, path, *, json_body=None, params=None, timeout=3
     session_callbacks = current_oauth_session_callbacks(session_context)
 
     def request_fn(method_name, url, **kwargs):
-        return HTTP_SESSION.request(method_name, url, **kwargs)
+        # Wait for the limiter no longer than the request itself may take, so a long Retry-After
+        # pause or a collapsed rate cannot hold a request thread indefinitely.
+        if JIRA_RATE_LIMITER.acquire(max_wait=float(timeout)) is None:
+            log_warning(f'Jira {method_name} rate limit wait exceeds request timeout timeout_s={timeout}')
+            return _build_jira_unavailable_response('Jira is rate limiting requests. Please retry shortly.')
+        response = HTTP_SESSION.request(method_name, url, **kwargs)
+        JIRA_RATE_LIMITER.observe(response)
+        return response
 
     kwargs = {'timeout': timeout}
     if json_body is not None:
@@ -870,12 +916,22 @@ def utc_now_iso(timespec=None):
 RETRYABLE_JIRA_STATUS_CODES = _jira_client.RETRYABLE_JIRA_STATUS_CODES
 SyntheticJiraResponse = _jira_client.SyntheticJiraResponse
 JiraCircuitBreaker = _jira_client.JiraCircuitBreaker
+JIRA_SEARCH_SHARD_WORKERS = int(os.getenv('JIRA_SEARCH_SHARD_WORKERS', str(_jira_client.DEFAULT_SEARCH_SHARD_WORKERS)))
+
+
+def jira_search_shard_workers():
+    # Shards run on pool threads without the request context, so OAuth searches stay inline (as epic enrichment does).
+    return 1 if JIRA_AUTH_MODE == AUTH_MODE_ATLASSIAN_OAUTH else max(1, JIRA_SEARCH_SHARD_WORKERS)
 
 
 JIRA_SEARCH_CIRCUIT_BREAKER = JiraCircuitBreaker(
     failure_threshold=JIRA_CIRCUIT_FAILURE_THRESHOLD,
     open_seconds=JIRA_CIRCUIT_OPEN_SECONDS
 )
+JIRA_RATE_LIMITER = _jira_client.JiraRateLimiter(
+    float(os.getenv('JIRA_RATE_LIMIT_PER_SECOND', str(_jira_client.DEFAULT_RATE_LIMIT_PER_SECOND))),
+    min_rate=float(os.getenv('JIRA_RATE_LIMIT_MIN_PER_SECOND', str(_jira_client.DEFAULT_RATE_LIMIT_MIN_PER_SECOND))),
+)
 
 
 def _build_jira_unavailable_response(message, attempts=0, elapsed_seconds=0.0, upstream_status=None, circuit=None):
@@ -890,7 +946,7 @@ def _build_jira_unavailable_response(message, attempts=0, elapsed_seconds=0.0, u
 
 
 def resilient_jira_get(url, *, params=None, headers=None, timeout=30, connect_timeout=None,
-                       session=None, breaker=None,
+                       session=None, breaker=None, limiter=None,
                        now_fn=None, sleep_fn=None, rand_fn=None,
                        max_attempts=None, max_elapsed_seconds=None,
                        base_delay_seconds=None, max_delay_seconds=None):
@@ -903,6 +959,7 @@ def resilient_jira_get(url, *, params=None, headers=None, timeout=30, connect_ti
         connect_timeout=JIRA_HTTP_CONNECT_TIMEOUT_SECONDS if connect_timeout is None else connect_timeout,
         session=session or HTTP_SESSION,
         breaker=breaker or JIRA_SEARCH_CIRCUIT_BREAKER,
+        limiter=limiter or JIRA_RATE_LIMITER,
         now_fn=now_fn,
         sleep_fn=sleep_fn,
         rand_fn=rand_fn,
@@ -1364,6 +1421,11 @@ def normalize_capacity_team_name(team_name):
     return _capacity_service.normalize_capacity_team_name(team_name)
 
 
+def intern_label(value):
+    """Return one shared copy of a repeated label string (team, status, assignee, ...)."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 def build_team_value(raw_team):
     """Build a consistent team payload with id/name when possible."""
     if isinstance(raw_team, dict):
@@ -1880,11 +1942,14 @@ def clear_auth_sensitive_caches(reason='auth_context_change'):
         TASKS_CACHE.clear()
         MISSING_INFO_CACHE.clear()
         DEPENDENCIES_CACHE.clear()
+        DEPENDENCY_GRAPHS.clear()
         EPIC_COHORT_CACHE.clear()
+        JIRA_CHANGELOGS.clear()
         EXCLUDED_CAPACITY_STATS_SOURCE_CACHE.clear()
         EXCLUDED_CAPACITY_EPIC_SUMMARY_CACHE.clear()
-        SCENARIO_CACHE['generatedAt'] = None
-        SCENARIO_CACHE['data'] = None
+        SCENARIO_CACHE.clear()
+        SCENARIO_FORECAST_CACHE.clear()
+        SCENARIO_SESSIONS.clear()
         if 'PROJECTS_CACHE' in globals():
             PROJECTS_CACHE['data'] = None
             PROJECTS_CACHE['timestamp'] = 0
@@ -2126,7 +2191,9 @@ def build_epm_rollup_dependencies(sub_goal_keys=None):
         cache=EPM_ROLLUP_CACHE,
         cache_lock=_epm_cache_lock,
         cache_ttl_seconds=EPM_ROLLUP_CACHE_TTL_SECONDS,
+        cache_hard_ttl_seconds=EPM_ROLLUP_CACHE_HARD_TTL_SECONDS,
         context=auth_context,
+        single_flight=JIRA_FETCH_SINGLE_FLIGHT,
     )
 
 
@@ -3007,8 +3074,13 @@ def fetch_story_distribution_for_epics(epic_keys, headers, epic_link_field, sele
     return distribution
 
 
-def fetch_tasks(include_team_name=False):
-    """Fetch tasks from Jira API."""
+def fetch_tasks(include_team_name=False, revalidate=False):
+    """Fetch tasks from Jira API.
+
+    ``revalidate`` is the background stale-while-revalidate refresh: it skips
+    the cache read and single-flight join and just repopulates TASKS_CACHE.
+    """
+    flight = None
     try:
         request_started = time.perf_counter()
         timings_ms = {}
@@ -3046,15 +3118,27 @@ def fetch_tasks(include_team_name=False):
         cache_enabled = jira_home_partitioned_process_cache_enabled(auth_context)
         cache_key = build_jira_home_process_cache_key(auth_context, raw_cache_key)
         cached_entry = None
-        if cache_enabled:
+        cache_state = CACHE_EXPIRED
+        if cache_enabled and not revalidate:
             with _cache_lock:
                 cached_entry = TASKS_CACHE.get(cache_key)
-        if cache_enabled and not force_refresh and cached_entry and (time.time() - cached_entry.get('timestamp', 0)) < TASKS_CACHE_TTL_SECONDS:
+            cache_state = classify_cache_entry(cached_entry, TASKS_CACHE_TTL_SECONDS, TASKS_CACHE_HARD_TTL_SECONDS)
+            if not force_refresh and cache_state == CACHE_EXPIRED:
+                # Coalesce identical concurrent misses: followers wait for the leader, then re-read its cache entry.
+                flight = JIRA_FETCH_SINGLE_FLIGHT.join_and_wait(('tasks', cache_key))
+                with _cache_lock:
+                    cached_entry = TASKS_CACHE.get(cache_key)
+                cache_state = classify_cache_entry(cached_entry, TASKS_CACHE_TTL_SECONDS, TASKS_CACHE_HARD_TTL_SECONDS)
+        if cache_enabled and not force_refresh and cache_state != CACHE_EXPIRED:
             cached_response = jsonify(cached_entry.get('data') or {})
             cached_response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
             cached_response.headers['Pragma'] = 'no-cache'
             cached_response.headers['Expires'] = '0'
             cached_response.headers['Server-Timing'] = 'cache;dur=1'
+            if cache_state == CACHE_STALE:
+                revalidate_in_background(JIRA_FETCH_SINGLE_FLIGHT, ('tasks', cache_key), copy_current_request_context(
+                    lambda: fetch_tasks(include_team_name=include_team_name, revalidate=True)))
+                cached_response.headers['Server-Timing'] = STALE_SERVER_TIMING
             return cached_response
 
         auth_started = time.perf_counter()
@@ -3150,10 +3234,6 @@ def fetch_tasks(include_team_name=False):
 
         max_results = 250
         page_size = 100
-        next_page_token = None
-        collected_issues = []
-        names_map = {}
-        total_issues = None
 
         log_info(
             f'Jira task fetch start purpose={request_purpose} sprint={sprint or "all"} '
@@ -3161,53 +3241,52 @@ def fetch_tasks(include_team_name=False):
         )
 
         jira_fetch_started = time.perf_counter()
-        while len(collected_issues) < max_results:
-            remaining = max_results - len(collected_issues)
-            page_limit = min(page_size, remaining)
-            payload = {
-                'jql': tasks_jql,
-                'maxResults': page_limit,
-                'fields': fields_list
-            }
-            if next_page_token:
-                payload['nextPageToken'] = next_page_token
-
-            response = jira_search_request(payload)
-            log_debug(f'Jira search page response status={response.status_code}')
-
-            if response.status_code != 200:
-                error_text = response.text
-                log_error(f'Jira search failed: status={response.status_code}')
-
-                try:
-                    error_json = response.json()
-                    log_debug(f'Jira error payload keys={sorted((error_json or {}).keys()) if isinstance(error_json, dict) else "non-dict"}')
-                except Exception:
-                    pass
-
-                error_response = jsonify({
-                    'error': f'Jira API error: {response.status_code}',
-                    'details': error_text,
-                    'jql_used': tasks_jql
-                })
-                error_response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
-                error_response.headers['Pragma'] = 'no-cache'
-                error_response.headers['Expires'] = '0'
-                return error_response, response.status_code
-
-            data = response.json()
-            if not names_map:
-                names_map = data.get('names', {}) or {}
-            total_issues = data.get('total', total_issues)
+        sync_started_at = time.time()
+        sync_snapshot = None
+        if cache_enabled and not force_refresh:
+            # Refreshes of a recent full fetch only pull issues updated since it (plus a key-only scope check).
+            with _cache_lock:
+                sync_entry = TASKS_CACHE.get(cache_key) if revalidate else cached_entry
+            sync_snapshot = _task_sync.usable_task_sync_snapshot(sync_entry, tasks_jql, fields_list, sync_started_at, TASKS_FULL_SYNC_SECONDS)
+        search_result = sync_snapshot and _task_sync.run_task_delta_sync(
+            sync_snapshot, tasks_jql, fields_list, search_request=jira_search_request, add_clause_to_jql=add_clause_to_jql,
+            max_results=max_results, now=sync_started_at, skew_seconds=TASKS_SYNC_SKEW_SECONDS, page_size=page_size,
+        )
+        if not search_result:
+            sync_snapshot = None
+            search_result = _jira_client.run_sharded_jql_search(
+                _jira_client.build_team_jql_shards(
+                    tasks_jql, [] if use_template else team_ids, shard_count=jira_search_shard_workers(), max_results=max_results
+                ),
+                fields_list,
+                search_request=jira_search_request,
+                max_workers=jira_search_shard_workers(),
+                page_size=page_size,
+            )
+        if search_result.error is not None:
+            response = search_result.error
+            error_text = response.text
+            log_error(f'Jira search failed: status={response.status_code}')
 
-            issues = data.get('issues', [])
-            if not issues:
-                break
+            try:
+                error_json = response.json()
+                log_debug(f'Jira error payload keys={sorted((error_json or {}).keys()) if isinstance(error_json, dict) else "non-dict"}')
+            except Exception:
+                pass
 
-            collected_issues.extend(issues)
-            next_page_token = data.get('nextPageToken')
-            if data.get('isLast', not next_page_token) or not next_page_token:
-                break
+            error_response = jsonify({
+                'error': f'Jira API error: {response.status_code}',
+                'details': error_text,
+                'jql_used': tasks_jql
+            })
+            error_response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
+            error_response.headers['Pragma'] = 'no-cache'
+            error_response.headers['Expires'] = '0'
+            return error_response, response.status_code
+
+        collected_issues = search_result.issues[:max_results]
+        names_map = search_result.names
+        total_issues = search_result.total
         record_timing('jira_search', jira_fetch_started)
 
         data = {
@@ -3257,6 +3336,10 @@ def fetch_tasks(include_team_name=False):
                 fields['epicKey'] = epic_key
                 epic_keys.add(epic_key)
         record_timing('normalize_tasks', normalize_started)
+        reused_epic_details, epic_fetch_keys = _task_sync.split_epic_details(
+            sync_snapshot['epicDetails'] if sync_snapshot else {}, epic_keys,
+            {issue['fields'].get('epicKey') for issue in collected_issues if issue.get('key') in getattr(search_result, 'changed_keys', ())},
+        )
 
         enrich_epics_started = time.perf_counter()
         if lightweight_ready_to_close:
@@ -3293,14 +3376,16 @@ def fetch_tasks(include_team_name=False):
                 epics_in_scope = fetch_epics_for_empty_alert(jql, headers, team_field_id, epic_name_field, sprint_field_id, team_ids, group_team_label_values, sprint_name)
         else:
             if JIRA_AUTH_MODE == AUTH_MODE_ATLASSIAN_OAUTH:
-                epic_details = fetch_epic_details_bulk(epic_keys, headers, epic_name_field)
+                epic_details = fetch_epic_details_bulk(epic_fetch_keys, headers, epic_name_field)
                 epics_in_scope = fetch_epics_for_empty_alert(jql, headers, team_field_id, epic_name_field, sprint_field_id, team_ids, group_team_label_values, sprint_name)
             else:
-                with ThreadPoolExecutor(max_workers=2) as pool:
-                    future_epic_details = pool.submit(fetch_epic_details_bulk, epic_keys, headers, epic_name_field)
-                    future_epics_in_scope = pool.submit(fetch_epics_for_empty_alert, jql, headers, team_field_id, epic_name_field, sprint_field_id, team_ids, group_team_label_values, sprint_name)
-                    epic_details = future_epic_details.result()
-                    epics_in_scope = future_epics_in_scope.result()
+                enrichment = shared_jira_fanout().run([
+                    ('details', fetch_epic_details_bulk, (epic_fetch_keys, headers, epic_name_field)),
+                    ('in_scope', fetch_epics_for_empty_alert, (jql, headers, team_field_id, epic_name_field, sprint_field_id, team_ids, group_team_label_values, sprint_name)),
+                ], max_parallel=2).results
+                epic_details = enrichment['details']
+                epics_in_scope = enrichment['in_scope']
+            epic_details = {**reused_epic_details, **epic_details}
         record_timing('epic_enrichment', enrich_epics_started)
 
         if epic_keys_filter:
@@ -3316,16 +3401,12 @@ def fetch_tasks(include_team_name=False):
                 )
                 epic_story_distribution = fetch_story_distribution_for_epics(epic_scope_keys, headers, epic_link_field, sprint, team_field_id=team_field_id)
             else:
-                with ThreadPoolExecutor(max_workers=2) as pool:
-                    future_epic_story_counts = (
-                        pool.submit(fetch_story_counts_for_epics, epic_scope_keys, headers, epic_link_field)
-                        if epic_link_field else None
-                    )
-                    future_epic_story_distribution = pool.submit(
-                        fetch_story_distribution_for_epics, epic_scope_keys, headers, epic_link_field, sprint, team_field_id=team_field_id
-                    )
-                    epic_story_counts = future_epic_story_counts.result() if future_epic_story_counts else None
-                    epic_story_distribution = future_epic_story_distribution.result()
+                count_calls = [('distribution', lambda: fetch_story_distribution_for_epics(epic_scope_keys, headers, epic_link_field, sprint, team_field_id=team_field_id), ())]
+                if epic_link_field:
+                    count_calls.append(('counts', fetch_story_counts_for_epics, (epic_scope_keys, headers, epic_link_field)))
+                counted = shared_jira_fanout().run(count_calls, max_parallel=2).results
+                epic_story_counts = counted.get('counts')
+                epic_story_distribution = counted['distribution']
             record_timing('epic_counts_distribution', enrich_counts_started)
             for epic in epics_in_scope:
                 key = epic.get('key')
@@ -3413,7 +3494,11 @@ def fetch_tasks(include_team_name=False):
             with _cache_lock:
                 TASKS_CACHE[cache_key] = {
                     'timestamp': time.time(),
-                    'data': data
+                    'data': data,
+                    'sync': _task_sync.build_task_sync_snapshot(
+                        tasks_jql, fields_list, collected_issues, names_map, epic_details, sync_started_at,
+                        full_synced_at=sync_snapshot['fullSyncedAt'] if sync_snapshot else None,
+                    ),
                 }
             record_timing('cache_store', cache_store_started)
 
@@ -3427,6 +3512,8 @@ def fetch_tasks(include_team_name=False):
             if value is not None:
                 token = key.replace('_', '-')
                 server_timing_parts.append(f'{token};dur={value}')
+            if key == 'jira_search':
+                server_timing_parts.extend(search_result.server_timing())
         if server_timing_parts:
             success_response.headers['Server-Timing'] = ', '.join(server_timing_parts)
         return success_response
@@ -3444,10 +3531,16 @@ def fetch_tasks(include_team_name=False):
         })
         error_response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
         return error_response, 500
+    finally:
+        if flight is not None:
+            flight.done()
 
 
 def fetch_issues_by_keys(keys, fields_list, context=None):
     """Fetch issues by keys in batches."""
+    if JIRA_ISSUE_STORE is not None:
+        return JIRA_ISSUE_STORE.fetch_by_keys(jira_site_partition(context), keys, fields_list, log_warning_fn=log_warning,
+                                              search_request=lambda payload: jira_search_request(payload, context=context))
     return _jira_client.fetch_issues_by_keys(
         keys,
         fields_list,
@@ -3459,6 +3552,9 @@ def fetch_issues_by_keys(keys, fields_list, context=None):
 
 def fetch_issues_by_jql(jql, fields_list, max_results=500, context=None):
     """Fetch issues by JQL with pagination."""
+    if JIRA_ISSUE_STORE is not None:
+        return JIRA_ISSUE_STORE.fetch_by_jql(jira_site_partition(context), jql, fields_list, max_results=max_results, log_warning_fn=log_warning,
+                                             search_request=lambda payload: jira_search_request(payload, context=context))
     return _jira_client.fetch_issues_by_jql(
         jql,
         fields_list,
@@ -3596,7 +3692,8 @@ def collect_dependencies(keys, context=None):
         'issuetype',
         get_story_points_field_id(),
         'parent',
-        'issuelinks'
+        'issuelinks',
+        'updated',
     ]
     if epic_link_field_id and epic_link_field_id not in fields_list:
         fields_list.append(epic_link_field_id)
@@ -3685,467 +3782,583 @@ def collect_dependencies(keys, context=None):
         if entries:
             dependencies[base_key] = entries
 
+    graph = dependency_graph_for(auth_context) if auth_context is not None else None
+    if graph is not None:
+        graph.remember(issue_map.values())
+        for issue in issues:
+            if issue.get('key'):
+                graph.record(issue['key'], (issue.get('fields') or {}).get('updated'),
+                             dependency_entry_edges(dependencies.get(issue['key'])))
     return dependencies
 
 
+def dependency_graph_for(auth_context):
+    """The caller's dependency graph index, or None when partitioned caches are off for this context."""
+    if not jira_home_partitioned_process_cache_enabled(auth_context):
+        return None
+    return DEPENDENCY_GRAPHS.graph(
+        build_jira_home_process_cache_key(auth_context, 'dependency-graph', jira_site_partition(auth_context))
+    )
+
+
 def scenario_planner():
     """Scenario planner endpoint."""
     auth_context = current_request_auth_context()
     cache_enabled = jira_home_process_cache_enabled(auth_context)
+    results_cache_enabled = jira_home_partitioned_process_cache_enabled(auth_context)
+    cache_partition = build_jira_home_process_cache_key(auth_context, 'scenario')
     if request.method == 'GET':
-        if cache_enabled:
-            with _cache_lock:
-                if not SCENARIO_CACHE.get('data'):
-                    return jsonify({'error': 'No scenario cached'}), 404
-                return jsonify(SCENARIO_CACHE)
-        return jsonify({'error': 'No scenario cached'}), 404
+        cached = SCENARIO_CACHE.latest(cache_partition) if results_cache_enabled else None
+        if not cached:
+            return jsonify({'error': 'No scenario cached'}), 404
+        return jsonify({'generatedAt': cached['generatedAt'], 'data': cached})
 
     try:
         payload = request.get_json(silent=True) or {}
         config_payload = payload.get('config') or {}
         filters = payload.get('filters') or {}
+        # Incremental runs hand out a fresh schedule session, so they are never served from cache.
+        results_cache_enabled = results_cache_enabled and not config_payload.get('incremental')
+        cache_digest = None
+        if results_cache_enabled:
+            # A light search of the same scope ('updated' only) versions the cached result by Jira's data.
+            jira_version = jira_snapshot_version(fetch_issues_by_jql(build_scenario_jql(filters), ['updated']))
+            cache_digest = SCENARIO_CACHE.digest({k: v for k, v in payload.items() if k != 'refresh'}, jira_version)
+        if results_cache_enabled and not payload.get('refresh'):
+            cached = SCENARIO_CACHE.get(cache_partition, cache_digest)
+            if cached is not None:
+                return jsonify(cached)
+
+        build = build_scenario_result(config_payload, filters, auth_context, cache_enabled)
+        result = _scenario_compare_service.run_scenario_builds([build])[0]
+
+        if results_cache_enabled:
+            SCENARIO_CACHE.put(cache_partition, cache_digest, result)
 
-        sprint_label = resolve_sprint_label(filters.get('sprint'), cache_enabled=cache_enabled)
-        quarter_start, quarter_end = quarter_dates_from_label(sprint_label)
-
-        # Build sprint boundaries (selected + previous/next neighbors)
-        sprint_boundaries = None
-        if cache_enabled and sprint_label:
-            cache_data = load_sprints_cache() or {}
-            cached_sprints = cache_data.get('sprints') or []
-            # Sort chronologically by name (e.g. 2025Q4, 2026Q1, 2026Q2)
-            sorted_sprints = sorted(cached_sprints, key=lambda s: s.get('name', ''))
-            selected_idx = None
-            for i, s in enumerate(sorted_sprints):
-                if s.get('name') == sprint_label:
-                    selected_idx = i
-                    break
-            if selected_idx is not None:
-                def _sprint_boundary(s):
-                    return {'id': s.get('id'), 'name': s.get('name'),
-                            'startDate': s.get('startDate'), 'endDate': s.get('endDate')}
-                sprint_boundaries = {
-                    'selected': _sprint_boundary(sorted_sprints[selected_idx]),
-                    'previous': _sprint_boundary(sorted_sprints[selected_idx - 1]) if selected_idx > 0 else None,
-                    'next': _sprint_boundary(sorted_sprints[selected_idx + 1]) if selected_idx < len(sorted_sprints) - 1 else None,
-                }
-        start_date = parse_iso_date(config_payload.get('start_date')) or quarter_start or date.today()
-        quarter_end_date = parse_iso_date(config_payload.get('quarter_end_date')) or quarter_end or (start_date + timedelta(days=90))
-        anchor_date = parse_iso_date(config_payload.get('anchor_date')) if config_payload.get('anchor_date') else None
-
-        scenario_config = ScenarioConfig(
-            start_date=start_date,
-            quarter_end_date=quarter_end_date,
-            anchor_date=anchor_date,
-            sp_to_weeks=2.0,
-            team_sizes={},
-            vacation_weeks={},
-            sickleave_buffer=0.0,
-            wip_limit=1,
-            lane_mode=config_payload.get('lane_mode', 'team'),
-        )
+        return jsonify(result)
+    except AuthError:
+        payload, status = oauth_auth_required_payload()
+        return jsonify(payload), status
+    except Exception as e:
+        logger.exception('Scenario error')
+        return jsonify({'error': 'Failed to compute scenario', 'message': str(e)}), 500
 
-        headers = None
-        team_field_id = resolve_team_field_id(None, context=auth_context)
-        epic_link_field_id = resolve_epic_link_field_id(None, context=auth_context)
-
-        fields_list = [
-            'summary',
-            'status',
-            'priority',
-            'issuetype',
-            'assignee',
-            'updated',
-            get_story_points_field_id(),
-            'parent',
-            'startDate',
-            'duedate',
-            'timetracking',
-        ]
-        if epic_link_field_id and epic_link_field_id not in fields_list:
-            fields_list.append(epic_link_field_id)
-        if team_field_id and team_field_id not in fields_list:
-            fields_list.append(team_field_id)
 
-        search_query = (filters.get('search') or '').strip().lower()
-        team_filter_ids = {t for t in (filters.get('teams') or []) if t}
-        scenario_jql = build_scenario_jql(filters)
-        issues_raw = fetch_issues_by_jql(scenario_jql, fields_list)
+def _snapshot_fetch(snapshot, name, fetch, *args, **kwargs):
+    """Call a Jira fetcher once per distinct arguments within a shared ``snapshot`` dict."""
+    if snapshot is None:
+        return fetch(*args, **kwargs)
+    key = (name, repr(args), repr(sorted(kwargs.items())))
+    if key not in snapshot:
+        snapshot[key] = fetch(*args, **kwargs)
+    return snapshot[key]
 
-        issues = []
-        issue_keys = []
-        issue_by_key = {}
-        team_names = set()
-        epic_keys = set()
-        for issue in issues_raw:
-            fields = issue.get('fields', {}) or {}
-            raw_team = None
-            if team_field_id and fields.get(team_field_id) is not None:
-                raw_team = fields.get(team_field_id)
-            team_name = extract_team_name(raw_team) if raw_team is not None else None
-            team_id = None
-            if raw_team is not None:
-                team_value = build_team_value(raw_team)
-                if isinstance(team_value, dict):
-                    team_id = team_value.get('id')
 
-            epic_key = None
-            if epic_link_field_id and fields.get(epic_link_field_id):
-                epic_key = fields.get(epic_link_field_id)
-            elif fields.get('parent') and fields['parent'].get('key') and \
-                    fields['parent'].get('fields', {}).get('issuetype', {}).get('name', '').lower() == 'epic':
-                epic_key = fields['parent'].get('key')
+def _snapshot_fetch_parallel(snapshot, calls):
+    """``_snapshot_fetch`` for independent ``(name, fetch, args, kwargs)`` calls on the shared Jira fan-out."""
+    def bind(name, fetch, args, kwargs):
+        def call():
+            return _snapshot_fetch(snapshot, name, fetch, *args, **kwargs)
+        return copy_current_request_context(call) if has_request_context() else call
 
-            assignee = fields.get('assignee') or {}
-            issue_type = (fields.get('issuetype') or {}).get('name') or ''
-            story_points = fields.get(get_story_points_field_id())
-            priority = (fields.get('priority') or {}).get('name')
-            status = (fields.get('status') or {}).get('name')
-            jira_start_date = fields.get('startDate')   # ISO string or None
-            jira_due_date = fields.get('duedate')       # ISO string or None
-            time_tracking = fields.get('timetracking') or {}
-            time_spent_seconds = time_tracking.get('timeSpentSeconds')
-            issue_obj = Issue(
-                key=issue.get('key'),
-                summary=fields.get('summary') or '',
-                issue_type=issue_type,
-                team=team_name,
-                assignee=assignee.get('displayName'),
-                story_points=story_points,
-                priority=priority,
-                status=status,
-                epic_key=epic_key,
-                team_id=team_id,
-            )
-            if issue_obj.key:
-                issues.append(issue_obj)
-                issue_keys.append(issue_obj.key)
-                if team_name:
-                    team_names.add(team_name)
-                if epic_key:
-                    epic_keys.add(epic_key)
-                issue_by_key[issue_obj.key] = {
-                    'key': issue_obj.key,
-                    'summary': issue_obj.summary,
-                    'type': issue_type,
-                    'team': team_name,
-                    'team_id': team_id,
-                    'assignee': issue_obj.assignee,
-                    'sp': story_points,
-                    'priority': priority,
-                    'status': status,
-                    'epicKey': epic_key,
-                    'jiraStartDate': jira_start_date,
-                    'jiraDueDate': jira_due_date,
-                    'timeSpentSeconds': time_spent_seconds,
-                }
+    outcome = shared_jira_fanout().run(
+        ((name, bind(name, fetch, args, kwargs), ()) for name, fetch, args, kwargs in calls),
+        max_parallel=len(calls),
+    )
+    return outcome.results
 
-        dependencies = collect_dependencies(issue_keys)
-        dependency_edges = {}
-        edge_list = []
-        edge_set = set()
-        dependency_snapshots = {}
-        for deps in dependencies.values():
-            for dep in deps:
-                if dep.get('key'):
-                    dependency_snapshots[dep['key']] = dep
-
-        for issue_key, deps in dependencies.items():
-            for dep in deps:
-                prereq_key = dep.get('prereqKey')
-                dependent_key = dep.get('dependentKey')
-                if not prereq_key or not dependent_key:
-                    continue
-                category = dep.get('category')
-                edge_type = 'dependency' if category == 'dependency' else 'block' if category == 'block' else None
-                if edge_type is None:
-                    continue
-                if prereq_key == dependent_key:
-                    continue
-                edge_id = (prereq_key, dependent_key, edge_type)
-                if edge_id in edge_set:
-                    continue
-                edge_set.add(edge_id)
-                edge_list.append({'from': prereq_key, 'to': dependent_key, 'type': edge_type})
-                if edge_type in ('dependency', 'block'):
-                    dependency_edges.setdefault(dependent_key, []).append(prereq_key)
-
-        def matches_search(entry):
-            if not search_query:
-                return True
-            key = (entry.get('key') or '').lower()
-            summary = (entry.get('summary') or '').lower()
-            return search_query in key or search_query in summary
-
-        focus_keys = [
-            key for key, entry in issue_by_key.items()
-            if matches_search(entry) and (not team_filter_ids or entry.get('team_id') in team_filter_ids)
-        ]
 
-        adjacency = {}
-        for edge in edge_list:
-            adjacency.setdefault(edge['from'], set()).add(edge['to'])
-            adjacency.setdefault(edge['to'], set()).add(edge['from'])
+def build_scenario_result(config_payload, filters, auth_context, cache_enabled, snapshot=None):
+    """Build one /api/scenario response; a generator driven by ``run_scenario_builds``.
 
-        focus_set = set(focus_keys)
-        context_keys = set()
-        for key in focus_set:
-            context_keys.update(adjacency.get(key, set()))
-        context_keys -= focus_set
+    It yields ``(issues, dependencies, config)`` once for ``schedule_issues`` and
+    receives ``(scheduled_list, scheduled_map)``, so several builds can be scheduled
+    together. Builds sharing a ``snapshot`` dict fetch Jira once per distinct call.
+    """
+    sprint_label = resolve_sprint_label(filters.get('sprint'), cache_enabled=cache_enabled)
+    quarter_start, quarter_end = quarter_dates_from_label(sprint_label)
+
+    # Build sprint boundaries (selected + previous/next neighbors)
+    sprint_boundaries = None
+    if cache_enabled and sprint_label:
+        cache_data = load_sprints_cache() or {}
+        cached_sprints = cache_data.get('sprints') or []
+        # Sort chronologically by name (e.g. 2025Q4, 2026Q1, 2026Q2)
+        sorted_sprints = sorted(cached_sprints, key=lambda s: s.get('name', ''))
+        selected_idx = None
+        for i, s in enumerate(sorted_sprints):
+            if s.get('name') == sprint_label:
+                selected_idx = i
+                break
+        if selected_idx is not None:
+            def _sprint_boundary(s):
+                return {'id': s.get('id'), 'name': s.get('name'),
+                        'startDate': s.get('startDate'), 'endDate': s.get('endDate')}
+            sprint_boundaries = {
+                'selected': _sprint_boundary(sorted_sprints[selected_idx]),
+                'previous': _sprint_boundary(sorted_sprints[selected_idx - 1]) if selected_idx > 0 else None,
+                'next': _sprint_boundary(sorted_sprints[selected_idx + 1]) if selected_idx < len(sorted_sprints) - 1 else None,
+            }
+    start_date = parse_iso_date(config_payload.get('start_date')) or quarter_start or date.today()
+    quarter_end_date = parse_iso_date(config_payload.get('quarter_end_date')) or quarter_end or (start_date + timedelta(days=90))
+    anchor_date = parse_iso_date(config_payload.get('anchor_date')) if config_payload.get('anchor_date') else None
+
+    scenario_config = ScenarioConfig(
+        start_date=start_date,
+        quarter_end_date=quarter_end_date,
+        anchor_date=anchor_date,
+        sp_to_weeks=2.0,
+        team_sizes={},
+        lane_mode=config_payload.get('lane_mode', 'team'),
+        engine=config_payload.get('engine', 'python'),
+        **scenario_capacity_settings(config_payload),
+    )
 
-        included_keys = focus_set | context_keys
-        if not focus_set and not search_query:
-            included_keys = set(issue_by_key.keys())
-            focus_set = set(included_keys)
+    headers = None
+    team_field_id = resolve_team_field_id(None, context=auth_context)
+    epic_link_field_id = resolve_epic_link_field_id(None, context=auth_context)
 
-        for key in context_keys:
-            if key in issue_by_key:
-                continue
-            snapshot = dependency_snapshots.get(key)
-            if not snapshot:
-                continue
-            issue_by_key[key] = {
-                'key': snapshot.get('key'),
-                'summary': snapshot.get('summary') or '',
-                'type': snapshot.get('issuetype'),
-                'team': snapshot.get('teamName'),
-                'team_id': snapshot.get('teamId'),
-                'assignee': None,
-                'sp': snapshot.get('storyPoints'),
-                'priority': snapshot.get('priority'),
-                'status': snapshot.get('status'),
-                'epicKey': snapshot.get('epicKey'),
-            }
-            if snapshot.get('teamName'):
-                team_names.add(snapshot.get('teamName'))
-            if snapshot.get('epicKey'):
-                epic_keys.add(snapshot.get('epicKey'))
-
-        capacity_details = {}
-        if sprint_label:
-            capacity_keys = {}
-            for name in team_names:
-                normalized = normalize_capacity_team_name(name)
-                if normalized:
-                    capacity_keys[name] = normalized
-            capacity_sizes, capacity_details = fetch_capacity_team_sizes(
-                sprint_label,
-                None,
-                team_names=sorted(set(capacity_keys.values()))
-            )
-            scenario_config.team_sizes = {
-                name: capacity_sizes.get(norm)
-                for name, norm in capacity_keys.items()
-                if capacity_sizes.get(norm) is not None
-            }
+    fields_list = [
+        'summary',
+        'status',
+        'priority',
+        'issuetype',
+        'assignee',
+        'updated',
+        get_story_points_field_id(),
+        'parent',
+        'startDate',
+        'duedate',
+        'timetracking',
+    ]
+    if epic_link_field_id and epic_link_field_id not in fields_list:
+        fields_list.append(epic_link_field_id)
+    if team_field_id and team_field_id not in fields_list:
+        fields_list.append(team_field_id)
 
-        epic_summary_by_key = {}
-        if epic_keys:
-            epic_issues = fetch_issues_by_keys(sorted(epic_keys), ['summary'])
-            for epic in epic_issues:
-                fields = epic.get('fields') or {}
-                epic_summary_by_key[epic.get('key')] = fields.get('summary')
-
-        jira_base_url = auth_context.site_url or (JIRA_URL or '').rstrip('/')
-
-        capacity_by_team = {}
-        if sprint_label:
-            for team_name in sorted(team_names):
-                normalized = normalize_capacity_team_name(team_name)
-                detail = capacity_details.get(normalized) if normalized else None
-                size = detail.get('watchers') if detail else None
-                capacity_by_team[team_name] = {
-                    'size': size,
-                    'capacityIssueKey': detail.get('issue_key') if detail else None,
-                    'watchersCount': detail.get('watchers') if detail else None,
-                    'devLead': detail.get('reporter') if detail else None
-                }
+    search_query = (filters.get('search') or '').strip().lower()
+    team_filter_ids = {t for t in (filters.get('teams') or []) if t}
+    scenario_jql = build_scenario_jql(filters)
+    # Team capacity does not depend on the issues, so it is fetched alongside them for all teams of the sprint.
+    fetch_calls = [('issues', fetch_issues_by_jql, (scenario_jql, fields_list), {})]
+    if sprint_label:
+        fetch_calls.append(('capacity', fetch_capacity_team_sizes, (sprint_label, None), {'team_names': None}))
+        if config_payload.get('planned_capacity', True):
+            fetch_calls.append(('planned-capacity', fetch_capacity_for_sprint, (sprint_label, None), {'team_names': None}))
+    fetched = _snapshot_fetch_parallel(snapshot, fetch_calls)
+    issues_raw = fetched['issues']
 
-        # Separate excluded-capacity issues (Ad Hoc, Interrupt, DevLead, etc.)
-        # from the scheduling pipeline.  They get fixed sprint-window dates
-        # instead of consuming assignee time slots.
-        excluded_capacity_epics_raw = config_payload.get('excluded_capacity_epics') or []
-        excluded_epic_set = {str(k).strip().upper() for k in excluded_capacity_epics_raw if k}
-        log_info(f'[Scenario] excluded_capacity_epics from config: {excluded_capacity_epics_raw}')
-        log_info(f'[Scenario] excluded_epic_set (normalized): {excluded_epic_set}')
-
-        issue_objs = []
-        excluded_issue_entries = []
-        for key in included_keys:
-            entry = issue_by_key.get(key)
-            if not entry:
-                continue
-            epic = (entry.get('epicKey') or '').strip().upper()
-            if excluded_epic_set and epic in excluded_epic_set:
-                excluded_issue_entries.append(entry)
-                continue
-            issue_objs.append(Issue(
-                key=entry.get('key'),
-                summary=entry.get('summary') or '',
-                issue_type=entry.get('type') or '',
-                team=entry.get('team'),
-                assignee=entry.get('assignee'),
-                story_points=entry.get('sp'),
-                priority=entry.get('priority'),
-                status=entry.get('status'),
-                epic_key=entry.get('epicKey'),
-                team_id=entry.get('team_id'),
-            ))
+    issue_keys = []
+    issue_by_key = {}
+    team_names = set()
+    epic_keys = set()
+    story_points_field_id = get_story_points_field_id()
+    for issue in issues_raw:
+        fields = issue.get('fields', {}) or {}
+        raw_team = None
+        if team_field_id and fields.get(team_field_id) is not None:
+            raw_team = fields.get(team_field_id)
+        team_name = extract_team_name(raw_team) if raw_team is not None else None
+        team_id = None
+        if raw_team is not None:
+            team_value = build_team_value(raw_team)
+            if isinstance(team_value, dict):
+                team_id = team_value.get('id')
 
-        log_info(f'[Scenario] excluded {len(excluded_issue_entries)} issues, scheduling {len(issue_objs)} regular issues')
-        if excluded_issue_entries:
-            log_info(f'[Scenario] excluded issue keys: {[e.get("key") for e in excluded_issue_entries]}')
-
-        scheduled_list, scheduled_map = schedule_issues(issue_objs, dependency_edges, scenario_config)
-
-        # Give excluded-capacity issues SP-proportional durations within the sprint.
-        # Each starts at sprint start with width reflecting its SP — they run in
-        # parallel (background capacity), not sequentially.
-        total_weeks = max(1.0, (quarter_end_date - start_date).days / 7.0)
-        for entry in excluded_issue_entries:
-            sp = entry.get('sp')
-            sp_val = float(sp) if sp is not None else 0.0
-            duration_weeks = max(0.5, sp_val * scenario_config.sp_to_weeks) if sp_val > 0 else total_weeks
-            exc_start = start_date
-            exc_end = start_date + timedelta(weeks=duration_weeks)
-            if exc_end > quarter_end_date:
-                exc_end = quarter_end_date
-            item = ScheduledIssue(
-                key=entry.get('key'),
-                summary=entry.get('summary') or '',
-                lane=entry.get('team') or 'Unassigned',
-                start_date=exc_start,
-                end_date=exc_end,
-                blocked_by=[],
-                scheduled_reason='excluded_capacity',
-                duration_weeks=duration_weeks,
-                assignee=entry.get('assignee'),
-            )
-            scheduled_list.append(item)
-            scheduled_map[entry.get('key')] = item
-        scheduled_by_key = {item.key: item for item in scheduled_list}
-        slack, critical = compute_slack(scheduled_map, dependency_edges, scenario_config.quarter_end_date)
-        if app.debug:
-            blocked_edges = [edge for edge in edge_list if edge.get('type') == 'block']
-            for edge in blocked_edges[:20]:
-                prereq_key = edge.get('from')
-                dependent_key = edge.get('to')
-                assert prereq_key != dependent_key
-                prereq_item = scheduled_by_key.get(prereq_key)
-                dependent_item = scheduled_by_key.get(dependent_key)
-                prereq_start = prereq_item.start_date.isoformat() if prereq_item and prereq_item.start_date else None
-                prereq_end = prereq_item.end_date.isoformat() if prereq_item and prereq_item.end_date else None
-                dependent_start = dependent_item.start_date.isoformat() if dependent_item and dependent_item.start_date else None
-                dependent_end = dependent_item.end_date.isoformat() if dependent_item and dependent_item.end_date else None
-                log_debug(
-                    "scenario blocked_by edge timing",
-                    {
-                        "prereqScheduled": bool(prereq_item),
-                        "dependentScheduled": bool(dependent_item),
-                        "prereqStart": prereq_start,
-                        "prereqEnd": prereq_end,
-                        "dependentStart": dependent_start,
-                        "dependentEnd": dependent_end,
-                    },
-                )
+        epic_key = None
+        if epic_link_field_id and fields.get(epic_link_field_id):
+            epic_key = fields.get(epic_link_field_id)
+        elif fields.get('parent') and fields['parent'].get('key') and \
+                fields['parent'].get('fields', {}).get('issuetype', {}).get('name', '').lower() == 'epic':
+            epic_key = fields['parent'].get('key')
+
+        issue_key = issue.get('key')
+        if issue_key:
+            time_tracking = fields.get('timetracking') or {}
+            issue_keys.append(issue_key)
+            if team_name:
+                team_names.add(team_name)
+            if epic_key:
+                epic_keys.add(epic_key)
+            # Labels repeat across issues; interning keeps one copy each, also in the cached response.
+            issue_by_key[issue_key] = {
+                'key': issue_key,
+                'summary': fields.get('summary') or '',
+                'type': intern_label((fields.get('issuetype') or {}).get('name') or ''),
+                'team': intern_label(team_name),
+                'team_id': intern_label(team_id),
+                'assignee': intern_label((fields.get('assignee') or {}).get('displayName')),
+                'sp': fields.get(story_points_field_id),
+                'priority': intern_label((fields.get('priority') or {}).get('name')),
+                'status': intern_label((fields.get('status') or {}).get('name')),
+                'epicKey': intern_label(epic_key),
+                'jiraStartDate': fields.get('startDate'),   # ISO string or None
+                'jiraDueDate': fields.get('duedate'),       # ISO string or None
+                'timeSpentSeconds': time_tracking.get('timeSpentSeconds'),
+            }
 
-        total_weeks = max(1.0, (scenario_config.quarter_end_date - scenario_config.start_date).days / 7.0)
-        lane_usage = {}
-        for item in scheduled_list:
-            if item.duration_weeks is None:
+    dependencies = _snapshot_fetch(snapshot, 'dependencies', collect_dependencies, issue_keys)
+    dependency_edges = {}
+    edge_list = []
+    edge_set = set()
+    dependency_snapshots = {}
+    for deps in dependencies.values():
+        for dep in deps:
+            if dep.get('key'):
+                dependency_snapshots[dep['key']] = dep
+
+    for issue_key, deps in dependencies.items():
+        for dep in deps:
+            prereq_key = dep.get('prereqKey')
+            dependent_key = dep.get('dependentKey')
+            if not prereq_key or not dependent_key:
                 continue
-            lane_usage[item.lane] = lane_usage.get(item.lane, 0.0) + item.duration_weeks
-
-        bottleneck_lanes = sorted(lane_usage.keys(), key=lambda lane: lane_usage[lane], reverse=True)[:3]
-        late_items = []
-        unschedulable = []
-
-        for item in scheduled_list:
-            if item.key in slack:
-                item.slack_weeks = slack[item.key]
-                item.is_critical = item.key in critical
-            if item.end_date and item.end_date > scenario_config.quarter_end_date:
-                item.is_late = True
-                late_items.append(item.key)
-            if item.scheduled_reason != 'scheduled' and item.scheduled_reason != 'already_done':
-                unschedulable.append(item.key)
-
-        response_issues = []
-        for key in sorted(included_keys):
-            entry = issue_by_key.get(key)
-            item = scheduled_by_key.get(key)
-            if not entry:
+            category = dep.get('category')
+            edge_type = 'dependency' if category == 'dependency' else 'block' if category == 'block' else None
+            if edge_type is None:
                 continue
-            epic_key = entry.get('epicKey')
-            response_issues.append({
-                'key': key,
-                'summary': entry.get('summary'),
-                'type': entry.get('type'),
-                'team': entry.get('team'),
-                'team_id': entry.get('team_id'),
-                'assignee': entry.get('assignee'),
-                'sp': entry.get('sp'),
-                'priority': entry.get('priority'),
-                'status': entry.get('status'),
-                'epicKey': epic_key,
-                'epicSummary': epic_summary_by_key.get(epic_key),
-                'start': item.start_date.isoformat() if item and item.start_date else None,
-                'end': item.end_date.isoformat() if item and item.end_date else None,
-                'blockedBy': item.blocked_by if item else [],
-                'scheduledReason': item.scheduled_reason if item else 'context_only',
-                'durationWeeks': item.duration_weeks if item else None,
-                'slackWeeks': item.slack_weeks if item else None,
-                'progressPct': item.progress_pct if item and item.progress_pct is not None else None,
-                'isCritical': item.is_critical if item else False,
-                'isLate': item.is_late if item else False,
-                'isContext': key in context_keys,
-                'url': f'{jira_base_url}/browse/{key}' if jira_base_url else None,
-                'jiraStartDate': entry.get('jiraStartDate'),
-                'jiraDueDate': entry.get('jiraDueDate'),
-                'timeSpentSeconds': entry.get('timeSpentSeconds'),
-            })
+            if prereq_key == dependent_key:
+                continue
+            edge_id = (prereq_key, dependent_key, edge_type)
+            if edge_id in edge_set:
+                continue
+            edge_set.add(edge_id)
+            edge_list.append({'from': prereq_key, 'to': dependent_key, 'type': edge_type})
+            if edge_type in ('dependency', 'block'):
+                dependency_edges.setdefault(dependent_key, []).append(prereq_key)
+
+    def matches_search(entry):
+        if not search_query:
+            return True
+        key = (entry.get('key') or '').lower()
+        summary = (entry.get('summary') or '').lower()
+        return search_query in key or search_query in summary
+
+    focus_keys = [
+        key for key, entry in issue_by_key.items()
+        if matches_search(entry) and (not team_filter_ids or entry.get('team_id') in team_filter_ids)
+    ]
 
-        result = {
-            'generatedAt': datetime.now().isoformat(),
-            'jira_base_url': jira_base_url,
-            'config': {
-                'start_date': scenario_config.start_date.isoformat(),
-                'quarter_end_date': scenario_config.quarter_end_date.isoformat(),
-                'sp_to_weeks': scenario_config.sp_to_weeks,
-                'wip_limit': scenario_config.wip_limit,
-                'sickleave_buffer': scenario_config.sickleave_buffer,
-                'lane_mode': scenario_config.lane_mode,
-                'sprint': sprint_label
-            },
-            'summary': {
-                'critical_path': critical,
-                'bottleneck_lanes': bottleneck_lanes,
-                'late_items': late_items,
-                'unschedulable': unschedulable,
-                'deadline_met': len(late_items) == 0 and len(unschedulable) == 0,
-            },
-            'issues': response_issues,
-            'dependencies': [edge for edge in edge_list if edge['from'] in included_keys and edge['to'] in included_keys],
-            'capacity_by_team': capacity_by_team,
-            'focus_set': {
-                'focused_issue_keys': sorted(focus_set),
-                'context_issue_keys': sorted(context_keys),
-            },
-            'sprintBoundaries': sprint_boundaries,
+    adjacency = {}
+    for edge in edge_list:
+        adjacency.setdefault(edge['from'], set()).add(edge['to'])
+        adjacency.setdefault(edge['to'], set()).add(edge['from'])
+
+    focus_set = set(focus_keys)
+    context_keys = set()
+    for key in focus_set:
+        context_keys.update(adjacency.get(key, set()))
+    context_keys -= focus_set
+
+    # config.context_depth > 1 widens the context from the dependency graph index, without more Jira calls.
+    context_depth = str(config_payload.get('context_depth') or '1')
+    dependency_graph = dependency_graph_for(auth_context) if context_depth.isdigit() and int(context_depth) > 1 else None
+    if dependency_graph is not None and focus_set:
+        extra_keys = {
+            key for key in dependency_graph.neighbourhood(focus_set, min(int(context_depth), 5)) - focus_set - context_keys
+            if dependency_graph.snapshot(key)
+        }
+        for prereq_key, dependent_key, edge_type in dependency_graph.edges_among(focus_set | context_keys | extra_keys):
+            if (prereq_key in extra_keys or dependent_key in extra_keys) and (prereq_key, dependent_key, edge_type) not in edge_set:
+                edge_set.add((prereq_key, dependent_key, edge_type))
+                edge_list.append({'from': prereq_key, 'to': dependent_key, 'type': edge_type})
+                dependency_edges.setdefault(dependent_key, []).append(prereq_key)
+        for key in extra_keys:
+            dependency_snapshots.setdefault(key, dependency_graph.snapshot(key))
+        context_keys |= extra_keys
+
+    included_keys = focus_set | context_keys
+    if not focus_set and not search_query:
+        included_keys = set(issue_by_key.keys())
+        focus_set = set(included_keys)
+
+    for key in context_keys:
+        if key in issue_by_key:
+            continue
+        dependency_snapshot = dependency_snapshots.get(key)
+        if not dependency_snapshot:
+            continue
+        issue_by_key[key] = {
+            'key': dependency_snapshot.get('key'),
+            'summary': dependency_snapshot.get('summary') or '',
+            'type': dependency_snapshot.get('issuetype'),
+            'team': dependency_snapshot.get('teamName'),
+            'team_id': dependency_snapshot.get('teamId'),
+            'assignee': None,
+            'sp': dependency_snapshot.get('storyPoints'),
+            'priority': dependency_snapshot.get('priority'),
+            'status': dependency_snapshot.get('status'),
+            'epicKey': dependency_snapshot.get('epicKey'),
+        }
+        if dependency_snapshot.get('teamName'):
+            team_names.add(dependency_snapshot.get('teamName'))
+        if dependency_snapshot.get('epicKey'):
+            epic_keys.add(dependency_snapshot.get('epicKey'))
+
+    capacity_details = {}
+    if sprint_label:
+        capacity_keys = {}
+        for name in team_names:
+            normalized = normalize_capacity_team_name(name)
+            if normalized:
+                capacity_keys[name] = normalized
+        capacity_sizes, capacity_details = fetched['capacity']
+        planned_payload, _ = fetched.get('planned-capacity') or (None, None)
+        planned_capacity = (planned_payload or {}).get('capacities') or {}
+        scenario_config.team_sizes = {
+            name: capacity_sizes.get(norm)
+            for name, norm in capacity_keys.items()
+            if capacity_sizes.get(norm) is not None
+        }
+        scenario_config.planned_capacity = {
+            name: planned_capacity[norm] for name, norm in capacity_keys.items() if norm in planned_capacity
         }
 
-        if cache_enabled:
-            with _cache_lock:
-                SCENARIO_CACHE['generatedAt'] = result['generatedAt']
-                SCENARIO_CACHE['data'] = result
+    epic_summary_by_key = {}
+    if epic_keys:
+        epic_issues = _snapshot_fetch(snapshot, 'epics', fetch_issues_by_keys, sorted(epic_keys), ['summary'])
+        for epic in epic_issues:
+            fields = epic.get('fields') or {}
+            epic_summary_by_key[epic.get('key')] = fields.get('summary')
+
+    jira_base_url = auth_context.site_url or (JIRA_URL or '').rstrip('/')
+
+    capacity_by_team = {}
+    if sprint_label:
+        for team_name in sorted(team_names):
+            normalized = normalize_capacity_team_name(team_name)
+            detail = capacity_details.get(normalized) if normalized else None
+            size = detail.get('watchers') if detail else None
+            capacity_by_team[team_name] = {
+                'size': size,
+                'capacityIssueKey': detail.get('issue_key') if detail else None,
+                'watchersCount': detail.get('watchers') if detail else None,
+                'devLead': detail.get('reporter') if detail else None,
+                'plannedCapacity': scenario_config.planned_capacity.get(team_name),
+            }
 
-        return jsonify(result)
+    # Separate excluded-capacity issues (Ad Hoc, Interrupt, DevLead, etc.)
+    # from the scheduling pipeline.  They get fixed sprint-window dates
+    # instead of consuming assignee time slots.
+    excluded_capacity_epics_raw = config_payload.get('excluded_capacity_epics') or []
+    excluded_epic_set = {str(k).strip().upper() for k in excluded_capacity_epics_raw if k}
+    log_info(f'[Scenario] excluded_capacity_epics from config: {excluded_capacity_epics_raw}')
+    log_info(f'[Scenario] excluded_epic_set (normalized): {excluded_epic_set}')
+
+    issue_objs = []
+    excluded_issue_entries = []
+    for key in included_keys:
+        entry = issue_by_key.get(key)
+        if not entry:
+            continue
+        epic = (entry.get('epicKey') or '').strip().upper()
+        if excluded_epic_set and epic in excluded_epic_set:
+            excluded_issue_entries.append(entry)
+            continue
+        issue_objs.append(Issue(
+            key=entry.get('key'),
+            summary=entry.get('summary') or '',
+            issue_type=entry.get('type') or '',
+            team=entry.get('team'),
+            assignee=entry.get('assignee'),
+            story_points=entry.get('sp'),
+            priority=entry.get('priority'),
+            status=entry.get('status'),
+            epic_key=entry.get('epicKey'),
+            team_id=entry.get('team_id'),
+        ))
+
+    log_info(f'[Scenario] excluded {len(excluded_issue_entries)} issues, scheduling {len(issue_objs)} regular issues')
+    if excluded_issue_entries:
+        log_info(f'[Scenario] excluded issue keys: {[e.get("key") for e in excluded_issue_entries]}')
+
+    schedule_session = ScheduleSession(issue_objs, dependency_edges, scenario_config) if config_payload.get('incremental') else None
+    if schedule_session:
+        scheduled_list, scheduled_map = list(schedule_session.results[0]), dict(schedule_session.results[1])
+    else:
+        scheduled_list, scheduled_map = yield issue_objs, dependency_edges, scenario_config
+
+    # Give excluded-capacity issues SP-proportional durations within the sprint.
+    # Each starts at sprint start with width reflecting its SP — they run in
+    # parallel (background capacity), not sequentially.
+    total_weeks = max(1.0, (quarter_end_date - start_date).days / 7.0)
+    for entry in excluded_issue_entries:
+        sp = entry.get('sp')
+        sp_val = float(sp) if sp is not None else 0.0
+        duration_weeks = max(0.5, sp_val * scenario_config.sp_to_weeks) if sp_val > 0 else total_weeks
+        exc_start = start_date
+        exc_end = start_date + timedelta(weeks=duration_weeks)
+        if exc_end > quarter_end_date:
+            exc_end = quarter_end_date
+        item = ScheduledIssue(
+            key=entry.get('key'),
+            summary=entry.get('summary') or '',
+            lane=entry.get('team') or 'Unassigned',
+            start_date=exc_start,
+            end_date=exc_end,
+            blocked_by=[],
+            scheduled_reason='excluded_capacity',
+            duration_weeks=duration_weeks,
+            assignee=entry.get('assignee'),
+        )
+        scheduled_list.append(item)
+        scheduled_map[entry.get('key')] = item
+    scheduled_by_key = {item.key: item for item in scheduled_list}
+    slack, critical = compute_slack(
+        scheduled_map, dependency_edges, scenario_config.quarter_end_date, engine=scenario_config.engine,
+    )
+    critical_paths = critical_chains(scheduled_map, dependency_edges)
+    if app.debug:
+        blocked_edges = [edge for edge in edge_list if edge.get('type') == 'block']
+        for edge in blocked_edges[:20]:
+            prereq_key = edge.get('from')
+            dependent_key = edge.get('to')
+            assert prereq_key != dependent_key
+            prereq_item = scheduled_by_key.get(prereq_key)
+            dependent_item = scheduled_by_key.get(dependent_key)
+            prereq_start = prereq_item.start_date.isoformat() if prereq_item and prereq_item.start_date else None
+            prereq_end = prereq_item.end_date.isoformat() if prereq_item and prereq_item.end_date else None
+            dependent_start = dependent_item.start_date.isoformat() if dependent_item and dependent_item.start_date else None
+            dependent_end = dependent_item.end_date.isoformat() if dependent_item and dependent_item.end_date else None
+            log_debug(
+                "scenario blocked_by edge timing",
+                {
+                    "prereqScheduled": bool(prereq_item),
+                    "dependentScheduled": bool(dependent_item),
+                    "prereqStart": prereq_start,
+                    "prereqEnd": prereq_end,
+                    "dependentStart": dependent_start,
+                    "dependentEnd": dependent_end,
+                },
+            )
+
+    total_weeks = max(1.0, (scenario_config.quarter_end_date - scenario_config.start_date).days / 7.0)
+    lane_usage = {}
+    for item in scheduled_list:
+        if item.duration_weeks is None:
+            continue
+        lane_usage[item.lane] = lane_usage.get(item.lane, 0.0) + item.duration_weeks
+
+    bottleneck_lanes = sorted(lane_usage.keys(), key=lambda lane: lane_usage[lane], reverse=True)[:3]
+    late_items = []
+    unschedulable = []
+
+    for item in scheduled_list:
+        if item.key in slack:
+            item.slack_weeks = slack[item.key]
+            item.is_critical = item.key in critical
+        if item.end_date and item.end_date > scenario_config.quarter_end_date:
+            item.is_late = True
+            late_items.append(item.key)
+        if item.scheduled_reason != 'scheduled' and item.scheduled_reason != 'already_done':
+            unschedulable.append(item.key)
+
+    response_issues = []
+    for key in sorted(included_keys):
+        entry = issue_by_key.get(key)
+        item = scheduled_by_key.get(key)
+        if not entry:
+            continue
+        # The snapshot entry already carries the issue fields; extend it instead of copying them.
+        entry.update({
+            'epicSummary': epic_summary_by_key.get(entry.get('epicKey')),
+            'start': item.start_date.isoformat() if item and item.start_date else None,
+            'end': item.end_date.isoformat() if item and item.end_date else None,
+            'blockedBy': item.blocked_by if item else [],
+            'scheduledReason': item.scheduled_reason if item else 'context_only',
+            'durationWeeks': item.duration_weeks if item else None,
+            'slackWeeks': item.slack_weeks if item else None,
+            'progressPct': item.progress_pct if item and item.progress_pct is not None else None,
+            'isCritical': item.is_critical if item else False,
+            'isLate': item.is_late if item else False,
+            'isContext': key in context_keys,
+            'url': f'{jira_base_url}/browse/{key}' if jira_base_url else None,
+            'jiraStartDate': entry.get('jiraStartDate'),
+            'jiraDueDate': entry.get('jiraDueDate'),
+            'timeSpentSeconds': entry.get('timeSpentSeconds'),
+        })
+        response_issues.append(entry)
+
+    result = {
+        'generatedAt': datetime.now().isoformat(),
+        'jira_base_url': jira_base_url,
+        'config': {
+            'start_date': scenario_config.start_date.isoformat(),
+            'quarter_end_date': scenario_config.quarter_end_date.isoformat(),
+            'sp_to_weeks': scenario_config.sp_to_weeks,
+            'wip_limit': scenario_config.wip_limit,
+            'sickleave_buffer': scenario_config.sickleave_buffer,
+            'lane_mode': scenario_config.lane_mode,
+            'sprint': sprint_label
+        },
+        'summary': {
+            'critical_path': critical_paths[0] if critical_paths else [],
+            'critical_paths': critical_paths,
+            'bottleneck_lanes': bottleneck_lanes,
+            'late_items': late_items,
+            'unschedulable': unschedulable,
+            'deadline_met': len(late_items) == 0 and len(unschedulable) == 0,
+        },
+        'issues': response_issues,
+        'dependencies': [edge for edge in edge_list if edge['from'] in included_keys and edge['to'] in included_keys],
+        'capacity_by_team': capacity_by_team,
+        'focus_set': {
+            'focused_issue_keys': sorted(focus_set),
+            'context_issue_keys': sorted(context_keys),
+        },
+        'sprintBoundaries': sprint_boundaries,
+    }
+    if config_payload.get('forecast'):
+        result['forecast'] = scenario_forecast.forecast_payload(
+            issue_objs, dependency_edges, scenario_config, issue_by_key.values(), config_payload['forecast'],
+            cache=SCENARIO_FORECAST_CACHE, pool=SCENARIO_FORECAST_POOL,
+        )
+    if schedule_session:
+        result['scheduleSessionId'] = uuid.uuid4().hex
+        with _cache_lock:
+            SCENARIO_SESSIONS[build_jira_home_process_cache_key(auth_context, result['scheduleSessionId'])] = schedule_session
+    return result
+
+
+def compare_scenarios():
+    """Run several scenario configurations against one Jira snapshot and summarize them side by side."""
+    auth_context = current_request_auth_context()
+    payload = request.get_json(silent=True) or {}
+    try:
+        variants = _scenario_compare_service.variant_configs(payload)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    try:
+        filters = payload.get('filters') or {}
+        cache_enabled = jira_home_process_cache_enabled(auth_context)
+        snapshot = {}
+        builds = [
+            build_scenario_result(config_payload, filters, auth_context, cache_enabled, snapshot=snapshot)
+            for _, config_payload in variants
+        ]
+        results = _scenario_compare_service.run_scenario_builds(builds, pool=SCENARIO_FORECAST_POOL)
+        return jsonify(_scenario_compare_service.compare_payload(variants, results, full=payload.get('full', False)))
     except AuthError:
         payload, status = oauth_auth_required_payload()
         return jsonify(payload), status
     except Exception as e:
-        logger.exception('Scenario error')
-        return jsonify({'error': 'Failed to compute scenario', 'message': str(e)}), 500
+        logger.exception('Scenario compare error')
+        return jsonify({'error': 'Failed to compare scenarios', 'message': str(e)}), 500
+
+
+def reschedule_scenario():
+    """Apply issue edits to a scenario session and return only the changed placements."""
+    payload = request.get_json(silent=True) or {}
+    session_key = build_jira_home_process_cache_key(current_request_auth_context(), str(payload.get('scheduleSessionId') or ''))
+    with _cache_lock:
+        schedule_session = SCENARIO_SESSIONS.get(session_key)
+    if schedule_session is None:
+        return jsonify({'error': 'Unknown or expired schedule session'}), 404
+    try:
+        diff = schedule_session.apply(payload.get('changes') or {})
+    except ValueError as e:
+        return jsonify({'error': 'Invalid changes', 'message': str(e)}), 400
+    return jsonify({**diff.as_payload(), 'summary': schedule_session.summary()})
 
 
 def get_scenario_overrides():
@@ -4270,34 +4483,16 @@ def fetch_stats_for_sprint(sprint_name, headers, team_field_id, team_ids=None):
     if team_field_id and team_field_id not in fields_list:
         fields_list.append(team_field_id)
 
-    page_size = 250
-    next_page_token = None
-    collected_issues = []
-    total_issues = None
-
-    while True:
-        payload = {
-            'jql': jql,
-            'maxResults': page_size,
-            'fields': fields_list
-        }
-        if next_page_token:
-            payload['nextPageToken'] = next_page_token
-
-        response = jira_search_request(payload)
-        if response.status_code != 200:
-            return None, response
-
-        data = response.json()
-        total_issues = data.get('total', total_issues)
-        issues = data.get('issues', [])
-        if not issues:
-            break
-
-        collected_issues.extend(issues)
-        next_page_token = data.get('nextPageToken')
-        if data.get('isLast', not next_page_token) or not next_page_token:
-            break
+    search_result = _jira_client.run_sharded_jql_search(
+        _jira_client.build_team_jql_shards(jql, stats_team_ids, shard_count=jira_search_shard_workers()),
+        fields_list,
+        search_request=jira_search_request,
+        max_workers=jira_search_shard_workers(),
+        page_size=250,
+    )
+    if search_result.error is not None:
+        return None, search_result.error
+    collected_issues = search_result.issues
 
     def normalize_status(value):
         return (value or '').strip().lower()
@@ -4703,7 +4898,7 @@ def fetch_burnout_events_for_sprint(
     if not re.search(r'order\s+by', jql, flags=re.IGNORECASE):
         jql = f'{jql} ORDER BY updated DESC'
 
-    fields_list = ['status', 'assignee', 'created']
+    fields_list = ['status', 'assignee', 'created', 'updated']
     if team_field_id and team_field_id not in fields_list:
         fields_list.append(team_field_id)
 
@@ -4725,6 +4920,26 @@ def fetch_burnout_events_for_sprint(
         'scopedTeamIds': scoped_team_ids
     }
 
+    # Changelogs come from JIRA_CHANGELOGS: only issues whose ``updated`` moved are re-expanded.
+    site = jira_site_partition()
+
+    def key_chunk_shards(keys, clause=''):
+        key_chunks = _jira_client.chunk_values(keys, 100)
+        return [
+            _jira_client.JqlShard(f'keys {index}/{len(key_chunks)}', add_clause_to_jql(f'issueKey in ({",".join(chunk)})', clause), len(chunk))
+            for index, chunk in enumerate(key_chunks, start=1)
+        ]
+
+    def with_changelog(issue, embedded=None):
+        key = issue.get('key')
+        histories = JIRA_CHANGELOGS.resolve(site, key, updated=(issue.get('fields') or {}).get('updated'),
+                                            embedded=embedded, fetch_page=_issue_changelog_page_fn(key, 30))
+        issue['changelog'] = {'histories': histories or []}
+        return issue
+
+    def is_fresh(issue):
+        return JIRA_CHANGELOGS.is_fresh(site, issue.get('key'), (issue.get('fields') or {}).get('updated'))
+
     if normalized_issue_keys:
         # UI already scopes keys to the selected sprint/team filter.
         # Phase 1: fetch base fields only for all keys (fast, no changelog expansion).
@@ -4734,25 +4949,15 @@ def fetch_burnout_events_for_sprint(
         debug_payload['mode'] = 'keys-two-phase'
         issue_map = {}
 
-        for start in range(0, len(normalized_issue_keys), chunk_size):
-            chunk = normalized_issue_keys[start:start + chunk_size]
-            quoted_keys = ','.join(chunk)
-            chunk_jql = f'issueKey in ({quoted_keys})'
-            payload = {
-                'jql': chunk_jql,
-                'maxResults': len(chunk),
-                'fields': fields_list
-            }
-            response = jira_search_request(payload)
-            if response.status_code != 200:
-                return None, response, payload
-            data = response.json() or {}
-            issues = data.get('issues') or []
-            if issues:
-                for issue in issues:
-                    key = str(issue.get('key') or '').strip().upper()
-                    if key:
-                        issue_map[key] = issue
+        search_result = _jira_client.run_sharded_jql_search(
+            key_chunk_shards(normalized_issue_keys), fields_list, search_request=jira_search_request, max_workers=jira_search_shard_workers(), page_size=chunk_size,
+        )
+        if search_result.error is not None:
+            return None, search_result.error, {'jql': search_result.error_shard.jql, 'fields': fields_list}
+        for issue in search_result.issues:
+            key = str(issue.get('key') or '').strip().upper()
+            if key:
+                issue_map[key] = issue
 
         closure_clause = 'status CHANGED TO ("Done","Killed","Incomplete")'
         if sprint_start:
@@ -4760,58 +4965,55 @@ def fetch_burnout_events_for_sprint(
         if sprint_end and not include_post_sprint_closures:
             closure_clause += f' BEFORE "{(sprint_end + timedelta(days=1)).isoformat()}"'
 
+        fresh_keys = [key for key in normalized_issue_keys if key in issue_map and is_fresh(issue_map[key])]
+        fresh_key_set = set(fresh_keys)
+        stale_keys = [key for key in normalized_issue_keys if key not in fresh_key_set]
         changelog_hits = 0
-        for start in range(0, len(normalized_issue_keys), chunk_size):
-            chunk = normalized_issue_keys[start:start + chunk_size]
-            quoted_keys = ','.join(chunk)
-            chunk_scope_jql = f'issueKey in ({quoted_keys})'
-            chunk_jql = add_clause_to_jql(chunk_scope_jql, closure_clause)
-            payload = {
-                'jql': chunk_jql,
-                'maxResults': len(chunk),
-                'fields': fields_list,
-                'expand': ['changelog']
-            }
-            response = jira_search_request(payload)
-            if response.status_code != 200:
-                return None, response, payload
-            data = response.json() or {}
-            issues = data.get('issues') or []
-            if issues:
-                changelog_hits += len(issues)
-                for issue in issues:
-                    key = str(issue.get('key') or '').strip().upper()
-                    if key:
-                        issue_map[key] = issue
+        for keys, shard_fields, expand in ((stale_keys, fields_list, ['changelog']), (fresh_keys, ['updated'], None)):
+            if not keys:
+                continue
+            search_result = _jira_client.run_sharded_jql_search(
+                key_chunk_shards(keys, closure_clause), shard_fields, search_request=jira_search_request,
+                max_workers=jira_search_shard_workers(), page_size=chunk_size, expand=expand,
+            )
+            if search_result.error is not None:
+                return None, search_result.error, {'jql': search_result.error_shard.jql, 'fields': shard_fields, 'expand': expand}
+            for issue in search_result.issues:
+                key = str(issue.get('key') or '').strip().upper()
+                if key and (expand or key in issue_map):
+                    changelog_hits += 1
+                    issue_map[key] = with_changelog(issue, issue.get('changelog') or {}) if expand else with_changelog(issue_map[key])
 
         debug_payload['changelogCandidates'] = changelog_hits
+        debug_payload['changelogCacheHits'] = len(fresh_keys)
         collected_issues = list(issue_map.values())
     else:
-        page_size = 100
-        next_page_token = None
-        total_issues = None
         debug_payload['mode'] = 'jql'
-        while True:
-            payload = {
-                'jql': jql,
-                'maxResults': page_size,
-                'fields': fields_list,
-                'expand': ['changelog']
-            }
-            if next_page_token:
-                payload['nextPageToken'] = next_page_token
-            response = jira_search_request(payload)
-            if response.status_code != 200:
-                return None, response, payload
-            data = response.json() or {}
-            total_issues = data.get('total', total_issues)
-            issues = data.get('issues') or []
-            if not issues:
-                break
-            collected_issues.extend(issues)
-            next_page_token = data.get('nextPageToken')
-            if data.get('isLast', not next_page_token) or not next_page_token:
-                break
+        # Cold queries expand changelogs inline; repeats fetch fields only and expand just the stale issues.
+        warm = JIRA_CHANGELOGS.note_query(site, jql)
+        search_result = _jira_client.run_sharded_jql_search(
+            _jira_client.build_team_jql_shards(jql, scoped_team_ids, shard_count=jira_search_shard_workers()),
+            fields_list,
+            search_request=jira_search_request,
+            max_workers=jira_search_shard_workers(),
+            expand=None if warm else ['changelog'],
+        )
+        if search_result.error is not None:
+            return None, search_result.error, {'jql': search_result.error_shard.jql, 'fields': fields_list, 'expand': ['changelog']}
+        collected_issues = search_result.issues
+        embedded = {issue.get('key'): issue.get('changelog') or {} for issue in collected_issues}
+        stale_keys = {issue.get('key') for issue in collected_issues if warm and issue.get('key') and not is_fresh(issue)}
+        if stale_keys:
+            search_result = _jira_client.run_sharded_jql_search(
+                key_chunk_shards(sorted(stale_keys)), ['updated'], search_request=jira_search_request,
+                max_workers=jira_search_shard_workers(), expand=['changelog'],
+            )
+            if search_result.error is not None:
+                return None, search_result.error, {'jql': search_result.error_shard.jql, 'fields': ['updated'], 'expand': ['changelog']}
+            embedded.update((issue.get('key'), issue.get('changelog') or {}) for issue in search_result.issues)
+        for issue in collected_issues:
+            with_changelog(issue, None if warm and issue.get('key') not in stale_keys else embedded.get(issue.get('key')))
+        debug_payload['changelogCacheHits'] = len(collected_issues) - len(stale_keys) if warm else 0
 
     events = []
     issues_meta = []
@@ -4899,17 +5101,25 @@ def _escape_jql_literal(value):
     return str(value or '').replace('\\', '\\\\').replace('"', '\\"')
 
 
-def _cohort_fetch_terminal_date_from_changelog(issue_key, target_status, headers, context=None):
-    response = current_jira_get(
-        f'/rest/api/3/issue/{issue_key}',
-        params={'fields': 'status', 'expand': 'changelog'},
-        timeout=20,
-        context=context,
-    )
-    if response.status_code != 200:
-        return issue_key, None, f'changelog fetch failed ({response.status_code})'
-    data = response.json() or {}
-    changelog = (data.get('changelog') or {}).get('histories') or []
+def _cohort_fetch_terminal_date_from_changelog(issue_key, target_status, headers, context=None, updated=None):
+    site = jira_site_partition(context)
+    fetch_page = _issue_changelog_page_fn(issue_key, 20, context)
+    changelog = None
+    if JIRA_CHANGELOGS.known(site, issue_key):
+        changelog = JIRA_CHANGELOGS.resolve(site, issue_key, updated=updated, fetch_page=fetch_page)
+    if changelog is None:
+        response = current_jira_get(
+            f'/rest/api/3/issue/{issue_key}',
+            params={'fields': 'status', 'expand': 'changelog'},
+            timeout=20,
+            context=context,
+        )
+        if response.status_code != 200:
+            return issue_key, None, f'changelog fetch failed ({response.status_code})'
+        data = response.json() or {}
+        changelog = JIRA_CHANGELOGS.resolve(
+            site, issue_key, updated=updated, embedded=data.get('changelog') or {}, fetch_page=fetch_page,
+        )
     resolved = resolve_terminal_date_from_history(changelog, target_status)
     if not resolved:
         return issue_key, None, 'terminal transition not found in changelog'
@@ -4929,64 +5139,55 @@ def fetch_epic_cohort_data(start_date, end_date, headers, team_field_id, team_id
             }
         }, None
 
-    escaped_projects = ', '.join(f'"{_escape_jql_literal(project)}"' for project in scoped_projects)
+    def project_clause(projects):
+        escaped_projects = ', '.join(f'"{_escape_jql_literal(project)}"' for project in projects)
+        return f'project in ({escaped_projects})'
+
     ad_hoc_keys = normalize_epic_keys(ad_hoc_capacity_epics or [])[:EPIC_COHORT_ADHOC_MAX_EPICS]
     ad_hoc_key_set = set(ad_hoc_keys)
-    if ad_hoc_keys:
-        escaped_ad_hoc = ', '.join(f'"{_escape_jql_literal(key)}"' for key in ad_hoc_keys)
-        match_clause = f'(project in ({escaped_projects}) OR key in ({escaped_ad_hoc}))'
-    else:
-        match_clause = f'project in ({escaped_projects})'
+    escaped_ad_hoc = ', '.join(f'"{_escape_jql_literal(key)}"' for key in ad_hoc_keys)
+    ad_hoc_clause = f'key in ({escaped_ad_hoc})' if ad_hoc_keys else ''
     end_exclusive = end_date + timedelta(days=1)
-    jql = (
-        f'issuetype = Epic AND {match_clause} '
-        f'AND created >= "{start_date.isoformat()}" '
-        f'AND created < "{end_exclusive.isoformat()}"'
-    )
-
     scoped_team_ids = normalize_team_ids(team_ids or [])
     scoped_components = [str(name or '').strip() for name in (component_names or []) if str(name or '').strip()]
     scope_clause = build_missing_info_scope_clause(scoped_team_ids, scoped_components, team_field_name='Team[Team]')
-    if scope_clause:
-        jql = add_clause_to_jql(jql, scope_clause)
 
-    fields = ['summary', 'created', 'status', 'resolutiondate', 'assignee', 'project']
-    if team_field_id and team_field_id not in fields:
-        fields.append(team_field_id)
+    def cohort_jql(shard_match_clause):
+        shard_jql = (
+            f'issuetype = Epic AND {shard_match_clause} '
+            f'AND created >= "{start_date.isoformat()}" '
+            f'AND created < "{end_exclusive.isoformat()}"'
+        )
+        return add_clause_to_jql(shard_jql, scope_clause) if scope_clause else shard_jql
 
-    warnings = []
-    all_issues = []
-    next_page_token = None
-    page_count = 0
-    max_pages = 80
-    truncated = False
+    def match_clause(projects, include_ad_hoc):
+        # Project and Ad Hoc key matches stay grouped so the scope clause applies to both branches.
+        return f'({project_clause(projects)} OR {ad_hoc_clause})' if include_ad_hoc and ad_hoc_keys else project_clause(projects)
 
-    while True:
-        payload = {
-            'jql': jql,
-            'fields': fields,
-            'maxResults': 100
-        }
-        if next_page_token:
-            payload['nextPageToken'] = next_page_token
+    # One shard per project chunk; the first also carries the Ad Hoc keys, so the
+    # union equals the single grouped query and overlaps merge by issue key.
+    max_pages = 80
+    shard_workers = jira_search_shard_workers()
+    project_chunks = _jira_client.chunk_values(scoped_projects, -(-len(scoped_projects) // shard_workers))
+    shards = [
+        _jira_client.JqlShard(f'projects {index}/{len(project_chunks)}', cohort_jql(match_clause(chunk, index == 1)), max_pages * 100)
+        for index, chunk in enumerate(project_chunks, start=1)
+    ]
 
-        response = jira_search_request(payload)
-        if response.status_code != 200:
-            return None, response
-        data = response.json() or {}
-        issues = data.get('issues') or []
-        if issues:
-            all_issues.extend(issues)
+    fields = ['summary', 'created', 'status', 'resolutiondate', 'assignee', 'project', 'updated']
+    if team_field_id and team_field_id not in fields:
+        fields.append(team_field_id)
 
-        page_count += 1
-        is_last = bool(data.get('isLast', True))
-        next_page_token = data.get('nextPageToken')
-        if is_last or not next_page_token:
-            break
-        if page_count >= max_pages:
-            truncated = True
-            warnings.append(f'result truncated at {max_pages} pages')
-            break
+    warnings = []
+    search_result = _jira_client.run_sharded_jql_search(
+        shards, fields, search_request=jira_search_request, max_workers=shard_workers, page_size=100,
+    )
+    if search_result.error is not None:
+        return None, search_result.error
+    all_issues = search_result.issues
+    truncated = search_result.truncated
+    if truncated:
+        warnings.append(f'result truncated at {max_pages} pages')
 
     terminal_candidates = []
     for issue in all_issues:
@@ -4996,7 +5197,7 @@ def fetch_epic_cohort_data(start_date, end_date, headers, team_field_id, team_id
             continue
         if fields_data.get('resolutiondate'):
             continue
-        terminal_candidates.append((str(issue.get('key') or '').strip(), status_name))
+        terminal_candidates.append((str(issue.get('key') or '').strip(), (status_name, fields_data.get('updated'))))
 
     resolved_terminal_dates = {}
     if terminal_candidates:
@@ -5008,31 +5209,23 @@ def fetch_epic_cohort_data(start_date, end_date, headers, team_field_id, team_id
             terminal_candidates = terminal_candidates[:max_targets]
             truncated = True
 
-        future_map = {}
-        timed_out = []
-        with ThreadPoolExecutor(max_workers=workers) as pool:
-            for issue_key, status_name in terminal_candidates:
-                if not issue_key:
-                    continue
-                future = pool.submit(_cohort_fetch_terminal_date_from_changelog, issue_key, status_name, headers, context)
-                future_map[future] = issue_key
-            try:
-                for future in as_completed(future_map, timeout=timeout_budget):
-                    issue_key, resolved_date, warning = future.result()
-                    if resolved_date:
-                        resolved_terminal_dates[issue_key] = resolved_date
-                    if warning:
-                        warnings.append(f'{issue_key}: {warning}')
-            except FuturesTimeoutError:
-                warnings.append('changelog enrichment timeout budget exceeded')
-                truncated = True
-            for future, issue_key in future_map.items():
-                if future.done():
-                    continue
-                future.cancel()
-                timed_out.append(issue_key)
-        if timed_out:
-            warnings.append(f'changelog enrichment timed out for {len(timed_out)} issues')
+        outcome = shared_jira_fanout().run(
+            (
+                (issue_key, _cohort_fetch_terminal_date_from_changelog, (issue_key, status_name, headers, context, updated))
+                for issue_key, (status_name, updated) in dict(terminal_candidates).items() if issue_key
+            ),
+            max_parallel=workers,
+            timeout=timeout_budget,
+        )
+        for issue_key, resolved_date, warning in outcome.results.values():
+            if resolved_date:
+                resolved_terminal_dates[issue_key] = resolved_date
+            if warning:
+                warnings.append(f'{issue_key}: {warning}')
+        if outcome.timed_out:
+            warnings.append('changelog enrichment timeout budget exceeded')
+            truncated = True
+            warnings.append(f'changelog enrichment timed out for {len(outcome.timed_out)} issues')
 
     today = date.today()
 
@@ -5485,13 +5678,15 @@ def get_excluded_capacity_stats_source():
     try:
         auth_context = current_request_auth_context()
         timings_ms = {}
-        stats_payload, error_response = fetch_excluded_capacity_stats_source(
-            sprint_ids,
-            context=auth_context,
-            team_ids=team_ids,
-            refresh=refresh,
-            timings_ms=timings_ms,
-        )
+        stats_payload, error_response = coalesce_for_context(
+            JIRA_FETCH_SINGLE_FLIGHT, auth_context, ('excluded-capacity-source', ','.join(sprint_ids), ','.join(team_ids), refresh),
+            lambda: fetch_excluded_capacity_stats_source(
+                sprint_ids,
+                context=auth_context,
+                team_ids=team_ids,
+                refresh=refresh,
+                timings_ms=timings_ms,
+            ))
         if error_response is not None:
             return jsonify({
                 'error': 'Failed to fetch excluded-capacity stats source',
@@ -5556,7 +5751,9 @@ def get_completed_sprint_stats():
 
     try:
         team_field_id = resolve_team_field_id(None, context=auth_context)
-        stats_payload, error_response = fetch_stats_for_sprint(sprint_name, None, team_field_id, team_ids=team_ids or None)
+        stats_payload, error_response = coalesce_for_context(
+            JIRA_FETCH_SINGLE_FLIGHT, auth_context, ('stats', cache_key),
+            lambda: fetch_stats_for_sprint(sprint_name, None, team_field_id, team_ids=team_ids or None))
         if error_response is not None:
             return jsonify({
                 'error': 'Failed to fetch stats',
@@ -5617,7 +5814,8 @@ def get_burnout_stats():
         auth_context = current_request_auth_context()
         cache_enabled = jira_home_process_cache_enabled(auth_context)
         team_field_id = resolve_team_field_id(None, context=auth_context)
-        burnout_payload, error_response, debug_payload = fetch_burnout_events_for_sprint(
+        burnout_flight_key = ('burnout', sprint_name, ','.join(scoped_team_ids), ','.join(sorted(issue_keys)), include_post_sprint_closures)
+        burnout_payload, error_response, debug_payload = coalesce_for_context(JIRA_FETCH_SINGLE_FLIGHT, auth_context, burnout_flight_key, lambda: fetch_burnout_events_for_sprint(
             sprint_name,
             None,
             team_field_id,
@@ -5625,7 +5823,7 @@ def get_burnout_stats():
             issue_keys=issue_keys,
             include_post_sprint_closures=include_post_sprint_closures,
             cache_enabled=cache_enabled
-        )
+        ))
         if error_response is not None:
             return jsonify({
                 'error': 'Failed to fetch burnout stats',
@@ -5679,7 +5877,7 @@ def get_epic_cohort_stats():
 
     try:
         team_field_id = resolve_team_field_id(None, context=auth_context)
-        cohort_payload, error_response = fetch_epic_cohort_data(
+        cohort_payload, error_response = coalesce_for_context(JIRA_FETCH_SINGLE_FLIGHT, auth_context, ('epic-cohort', cache_key), lambda: fetch_epic_cohort_data(
             start_date,
             end_date,
             None,
@@ -5688,7 +5886,7 @@ def get_epic_cohort_stats():
             component_names=component_names,
             context=auth_context,
             ad_hoc_capacity_epics=ad_hoc_epics,
-        )
+        ))
         if error_response is not None:
             return jsonify({
                 'error': 'Failed to fetch epic cohort stats',
@@ -5714,61 +5912,35 @@ def get_epic_cohort_stats():
     })
 
 
-def _fetch_full_issue_changelog(issue_key, partial_histories, context=None):
-    """Collect the complete changelog for an issue when the embedded one is partial.
-
-    The expanded ``/issue/{key}`` response only carries a window of histories. When
-    ``changelog.total`` exceeds what was returned, page the dedicated
-    ``/rest/api/3/issue/{key}/changelog`` endpoint (``values``/``isLast``) to gather
-    the rest before parsing.
-
-    Some Jira deployments re-include the boundary history record in the first paged
-    result. De-duplicate by ``id`` (keep the first occurrence, i.e. the embedded copy)
-    to prevent double-counting transitions.
-    """
-    histories = list(partial_histories or [])
-    seen_ids = {h['id'] for h in histories if h.get('id') is not None}
-    start_at = len(histories)
-    max_pages = 20
-    for _ in range(max_pages):
-        response = current_jira_get(
-            f'/rest/api/3/issue/{issue_key}/changelog',
-            params={'startAt': start_at, 'maxResults': 100},
-            timeout=max(1.0, float(PROJECT_TRACK_PHASE_TIMEOUT_SECONDS)),
-            context=context,
-        )
-        if response.status_code != 200:
-            break
-        data = response.json() or {}
-        values = data.get('values') or []
-        for v in values:
-            vid = v.get('id')
-            if vid is None or vid not in seen_ids:
-                histories.append(v)
-                if vid is not None:
-                    seen_ids.add(vid)
-        start_at += len(values)
-        if bool(data.get('isLast', True)) or not values:
-            break
-    return histories
+def _issue_changelog_page_fn(issue_key, timeout, context=None):
+    """``fetch_page(start_at)`` over ``/rest/api/3/issue/{key}/changelog`` for ``JIRA_CHANGELOGS``."""
+    return lambda start_at: current_jira_get(
+        f'/rest/api/3/issue/{issue_key}/changelog',
+        params={'startAt': start_at, 'maxResults': 100},
+        timeout=timeout,
+        context=context,
+    )
 
 
 def _fetch_epic_track_phase(issue_key, track_field, context=None):
-    response = current_jira_get(
-        f'/rest/api/3/issue/{issue_key}',
-        params={'expand': 'changelog', 'fields': f'created,summary,{track_field}'},
-        timeout=max(1.0, float(PROJECT_TRACK_PHASE_TIMEOUT_SECONDS)),
-        context=context,
-    )
+    # Known changelogs are extended from the cached count instead of re-expanded.
+    site = jira_site_partition(context)
+    known = JIRA_CHANGELOGS.known(site, issue_key)
+    timeout = max(1.0, float(PROJECT_TRACK_PHASE_TIMEOUT_SECONDS))
+    params = {'fields': f'created,summary,updated,{track_field}'}
+    if not known:
+        params['expand'] = 'changelog'
+    response = current_jira_get(f'/rest/api/3/issue/{issue_key}', params=params, timeout=timeout, context=context)
     if response.status_code != 200:
         return issue_key, None, f'issue fetch failed ({response.status_code})'
     data = response.json() or {}
     fields = data.get('fields') or {}
-    changelog = data.get('changelog') or {}
-    histories = changelog.get('histories') or []
-    total = changelog.get('total')
-    if isinstance(total, int) and total > len(histories):
-        histories = _fetch_full_issue_changelog(issue_key, histories, context=context)
+    histories = JIRA_CHANGELOGS.resolve(
+        site, issue_key, updated=fields.get('updated'), embedded=None if known else (data.get('changelog') or {}),
+        fetch_page=_issue_changelog_page_fn(issue_key, timeout, context),
+    )
+    if histories is None:
+        return issue_key, None, 'changelog fetch failed'
 
     track_value_raw = fields.get(track_field)
     current_value = (track_value_raw or {}).get('value') if isinstance(track_value_raw, dict) else None
@@ -5813,24 +5985,19 @@ def get_project_track_phase_durations():
 
     epics = []
     warnings = []
-    future_map = {}
-    with ThreadPoolExecutor(max_workers=workers) as pool:
-        for epic_key in epic_keys:
-            future = pool.submit(_fetch_epic_track_phase, epic_key, track_field, auth_context)
-            future_map[future] = epic_key
-        try:
-            for future in as_completed(future_map, timeout=timeout_budget):
-                epic_key, record, warning = future.result()
-                if record:
-                    epics.append(record)
-                if warning:
-                    warnings.append(warning)
-        except FuturesTimeoutError:
-            warnings.append('phase duration fetch timeout budget exceeded')
-            truncated = True
-        for future, epic_key in future_map.items():
-            if not future.done():
-                future.cancel()
+    outcome = shared_jira_fanout().run(
+        ((epic_key, _fetch_epic_track_phase, (epic_key, track_field, auth_context)) for epic_key in dict.fromkeys(epic_keys)),
+        max_parallel=workers,
+        timeout=timeout_budget,
+    )
+    for _epic_key, record, warning in outcome.results.values():
+        if record:
+            epics.append(record)
+        if warning:
+            warnings.append(warning)
+    if outcome.timed_out:
+        warnings.append('phase duration fetch timeout budget exceeded')
+        truncated = True
 
     return jsonify({
         'epics': epics,
@@ -5943,8 +6110,8 @@ def _save_field_config(config_key, cache_name=None):
         dashboard_config[config_key] = {'fieldId': field_id, 'fieldName': field_name}
         save_dashboard_config(dashboard_config)
         # Invalidate tasks cache so next fetch uses the new field
-        global TASKS_CACHE
-        TASKS_CACHE = {}
+        with _cache_lock:
+            TASKS_CACHE.clear()
         # Invalidate the specific resolve cache if applicable
         if cache_name:
             g = globals()
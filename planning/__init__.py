@@ -1,4 +1,4 @@
-from .analysis import compute_slack
+from .analysis import compute_slack, critical_chains
 from .models import Dependency, Issue, ScheduleResult, ScenarioConfig, ScheduledIssue
 from .scheduler import schedule_issues
 
@@ -9,5 +9,6 @@ __all__ = [
     "ScenarioConfig",
     "ScheduledIssue",
     "compute_slack",
+    "critical_chains",
     "schedule_issues",
 ]
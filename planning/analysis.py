@@ -1,10 +1,15 @@
 from collections import defaultdict, deque
-from datetime import date
+from datetime import date, timedelta
+from itertools import chain
 from typing import Dict, List, Tuple
 
 from .models import ScheduledIssue
 
 
+# Done and excluded-capacity issues do not hold anything back.
+CHAIN_EXCLUDED_REASONS = {"already_done", "excluded_capacity"}
+
+
 def build_successors(dependencies: Dict[str, List[str]]) -> Dict[str, List[str]]:
     successors = defaultdict(list)
     for issue, deps in dependencies.items():
@@ -13,20 +18,12 @@ def build_successors(dependencies: Dict[str, List[str]]) -> Dict[str, List[str]]
     return successors
 
 
-def compute_slack(
+def topological_order(
     scheduled: Dict[str, ScheduledIssue],
     dependencies: Dict[str, List[str]],
-    quarter_end_date: date,
-) -> Tuple[Dict[str, float], List[str]]:
-    if not scheduled:
-        return {}, []
-
-    quarter_weeks = max(
-        1.0,
-        (quarter_end_date - min(issue.start_date for issue in scheduled.values() if issue.start_date)).days / 7.0
-    )
-    successors = build_successors(dependencies)
-
+    successors: Dict[str, List[str]],
+) -> List[str]:
+    """Scheduled keys in dependency order; keys on cycles are left out."""
     indegree = {key: 0 for key in scheduled}
     for issue, deps in dependencies.items():
         for dep in deps:
@@ -43,24 +40,117 @@ def compute_slack(
                 indegree[nxt] -= 1
                 if indegree[nxt] == 0:
                     queue.append(nxt)
+    return topo
+
+
+def compute_slack(
+    scheduled: Dict[str, ScheduledIssue],
+    dependencies: Dict[str, List[str]],
+    quarter_end_date: date,
+    engine: str = "python",
+) -> Tuple[Dict[str, float], List[str]]:
+    if engine == "numpy":
+        from .vectorized import compute_slack_vectorized, numpy_available
 
+        if numpy_available():
+            return compute_slack_vectorized(scheduled, dependencies, quarter_end_date)
+    if not scheduled:
+        return {}, []
+    start_dates = [issue.start_date for issue in scheduled.values() if issue.start_date]
+    if not start_dates:
+        return {}, []
+
+    project_start = min(start_dates)
+    quarter_weeks = max(1.0, (quarter_end_date - project_start).days / 7.0)
+    successors = build_successors(dependencies)
+    topo = topological_order(scheduled, dependencies, successors)
+
+    # Forward pass: scheduled start of every dated issue, in weeks from the project start.
+    start_week = {
+        key: (issue.start_date - project_start).days / 7.0
+        for key, issue in scheduled.items()
+        if issue.start_date is not None
+    }
+
+    # Backward pass: latest start that still lets every successor start in time.
     latest_start = {key: quarter_weeks for key in scheduled}
     for key in reversed(topo):
-        issue = scheduled[key]
-        duration = issue.duration_weeks or 0.0
+        duration = scheduled[key].duration_weeks or 0.0
         successor_starts = [latest_start[s] for s in successors.get(key, []) if s in scheduled]
         latest_finish = min(successor_starts) if successor_starts else quarter_weeks
         latest_start[key] = latest_finish - duration
 
     slack = {}
     critical = []
-    for key, issue in scheduled.items():
-        if issue.start_date is None:
-            continue
-        start_week = (issue.start_date - min(i.start_date for i in scheduled.values() if i.start_date)).days / 7.0
-        slack_weeks = latest_start[key] - start_week
+    for key, week in start_week.items():
+        slack_weeks = latest_start[key] - week
         slack[key] = slack_weeks
         if slack_weeks <= 0.01:
             critical.append(key)
 
     return slack, critical
+
+
+def _dependency_end(issue: ScheduledIssue):
+    # Mirrors the scheduler's dependency_end: whole days from the start date plus the
+    # fractional duration, truncated to a date again when the dependent is placed.
+    if issue.duration_weeks is None:
+        return issue.end_date
+    return issue.start_date + timedelta(weeks=issue.duration_weeks)
+
+
+def critical_chains(
+    scheduled: Dict[str, ScheduledIssue],
+    dependencies: Dict[str, List[str]],
+) -> List[List[str]]:
+    """Ordered chains of issues that set the scenario end date.
+
+    An issue is driven by a prerequisite, or by an earlier issue in its lane,
+    that ends on the day it starts: the dependency or the lane slot it waited
+    for. A prerequisite's end is taken the way the scheduler releases its
+    dependents (its start date plus its duration), which can fall a day before
+    its ``end_date`` when capacity factors are fractional. Each chain walks back from an issue that finishes last through its
+    longest driver chain, so it follows both dependency and lane-resource
+    edges. Chains are ordered first to last issue, longest first.
+    """
+    dated = {
+        key: issue for key, issue in scheduled.items()
+        if issue.start_date and issue.end_date and issue.scheduled_reason not in CHAIN_EXCLUDED_REASONS
+    }
+    if not dated:
+        return []
+
+    lane_ends = defaultdict(list)
+    for key, issue in dated.items():
+        lane_ends[(issue.lane, issue.end_date)].append(key)
+
+    length = {}
+    driver = {}
+    for key in sorted(dated, key=lambda k: (dated[k].start_date, k)):
+        issue = dated[key]
+        best = None
+        for kind, candidate in chain(
+            (("dependency", dep) for dep in dependencies.get(key, [])),
+            (("lane", other) for other in lane_ends.get((issue.lane, issue.start_date), [])),
+        ):
+            prior = dated.get(candidate)
+            # Drivers start strictly earlier, which keeps the driver graph acyclic.
+            if prior is None or prior.start_date >= issue.start_date:
+                continue
+            if (_dependency_end(prior) if kind == "dependency" else prior.end_date) != issue.start_date:
+                continue
+            rank = (length[candidate], kind == "dependency", candidate)
+            if best is None or rank > best[0]:
+                best = (rank, candidate)
+        driver[key] = best[1] if best else None
+        length[key] = (issue.duration_weeks or 0.0) + (best[0][0] if best else 0.0)
+
+    finish = max(issue.end_date for issue in dated.values())
+    chains = []
+    for key in sorted((k for k, issue in dated.items() if issue.end_date == finish), key=lambda k: (-length[k], k)):
+        path = []
+        while key is not None:
+            path.append(key)
+            key = driver[key]
+        chains.append(path[::-1])
+    return chains
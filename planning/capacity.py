@@ -1,8 +1,10 @@
 from dataclasses import dataclass, field
-from typing import Dict, List
+import heapq
+import math
+from typing import Dict, List, Optional, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class LaneCapacity:
     lane: str
     slot_count: int
@@ -10,6 +12,45 @@ class LaneCapacity:
     available_at: List[float] = field(default_factory=list)
     assignee_slots: Dict[str, int] = field(default_factory=dict)  # assignee -> slot_index
     assignee_available_at: Dict[str, float] = field(default_factory=dict)  # assignee -> end_week
+    slot_heap: List[Tuple[float, int]] = field(default_factory=list, repr=False)  # (available_at, slot_index)
+    weekly_capacity: List[float] = field(default_factory=list)  # per-week multiplier of capacity_factor from week 0
+
+    def __post_init__(self):
+        self.slot_heap = [(ready, index) for index, ready in enumerate(self.available_at)]
+        heapq.heapify(self.slot_heap)
+
+    def claim_slot(self) -> Tuple[float, int]:
+        """Pop the earliest free slot (lowest index on ties); hand it back with ``occupy_slot``."""
+        return heapq.heappop(self.slot_heap)
+
+    def occupy_slot(self, slot_index: int, until_week: float) -> None:
+        self.available_at[slot_index] = until_week
+        heapq.heappush(self.slot_heap, (until_week, slot_index))
+
+    def span_weeks(self, start_week: float, duration_weeks: float) -> float:
+        """Calendar weeks needed from ``start_week`` for work that takes ``duration_weeks`` at ``capacity_factor``.
+
+        Weeks outside ``weekly_capacity`` run at the plain ``capacity_factor``.
+        """
+        weekly = self.weekly_capacity
+        if not weekly or duration_weeks <= 0:
+            return duration_weeks
+        week = start_week
+        remaining = duration_weeks
+        while True:
+            index = math.floor(week)
+            if index >= len(weekly):
+                return week + remaining - start_week
+            if index < 0:
+                # Before week 0 (in-progress work started in the past) the lane runs at full rate.
+                rate, boundary = 1.0, 0.0
+            else:
+                rate, boundary = weekly[index], index + 1.0
+            progress = (boundary - week) * rate
+            if rate > 0 and progress >= remaining:
+                return week + remaining / rate - start_week
+            remaining -= progress
+            week = boundary
 
 
 def build_lane_capacities(
@@ -20,22 +61,76 @@ def build_lane_capacities(
     total_weeks: float,
     vacation_weeks: Dict[str, float],
     sickleave_buffer: float,
+    planned_capacity: Optional[Dict[str, float]] = None,
+    sp_to_weeks: float = 2.0,
+    weekly_capacity: Optional[Dict[str, List[float]]] = None,
 ):
+    """One ``LaneCapacity`` per lane.
+
+    ``planned_capacity`` is a team's story-point capacity for the whole
+    horizon (the Jira capacity field). It sets the lane's speed so its slots
+    together deliver that many points over ``total_weeks``, replacing the
+    vacation and sick-leave estimate, which planned capacity already nets out.
+    ``weekly_capacity`` lists per-week multipliers for a lane (holidays,
+    ramp-ups), applied on top of the lane's ``capacity_factor``.
+    """
     capacities = {}
+    planned_capacity = planned_capacity or {}
+    weekly_capacity = weekly_capacity or {}
     effective_wip_limit = 1 if lane_mode == "assignee" else wip_limit
     for lane in lanes:
         size = team_sizes.get(lane, 1)
         if lane_mode == "assignee":
             size = 1
         slot_count = max(1, int(size * max(1, effective_wip_limit)))
-        vacation = max(0.0, vacation_weeks.get(lane, 0.0))
-        effective_weeks = max(0.1, total_weeks - vacation)
-        capacity_factor = max(0.1, effective_weeks / max(0.1, total_weeks))
-        capacity_factor *= max(0.1, 1.0 - sickleave_buffer)
+        planned = planned_capacity.get(lane) if lane_mode != "assignee" else None
+        if planned is not None and planned > 0:
+            # Each slot finishes one story point per sp_to_weeks weeks at factor 1.0.
+            nominal_points = slot_count * max(0.1, total_weeks) / max(0.01, sp_to_weeks)
+            capacity_factor = max(0.1, planned / nominal_points)
+        else:
+            vacation = max(0.0, vacation_weeks.get(lane, 0.0))
+            effective_weeks = max(0.1, total_weeks - vacation)
+            capacity_factor = max(0.1, effective_weeks / max(0.1, total_weeks))
+            capacity_factor *= max(0.1, 1.0 - sickleave_buffer)
         capacities[lane] = LaneCapacity(
             lane=lane,
             slot_count=slot_count,
             capacity_factor=capacity_factor,
             available_at=[0.0 for _ in range(slot_count)],
+            weekly_capacity=[max(0.0, float(value)) for value in weekly_capacity.get(lane) or ()],
         )
     return capacities
+
+
+def _number(value, default, low, high):
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return default
+    if math.isnan(number):
+        return default
+    return min(high, max(low, number))
+
+
+def scenario_capacity_settings(payload: dict) -> dict:
+    """``ScenarioConfig`` capacity fields from a scenario ``config`` payload.
+
+    Invalid values fall back to the defaults (one slot per person, no buffer);
+    ``vacation_weeks`` and ``weekly_capacity`` are keyed by lane.
+    """
+    vacation_weeks = payload.get("vacation_weeks")
+    weekly_capacity = payload.get("weekly_capacity")
+    return {
+        "wip_limit": int(_number(payload.get("wip_limit"), 1, 1, 10)),
+        "sickleave_buffer": _number(payload.get("sickleave_buffer"), 0.0, 0.0, 0.9),
+        "vacation_weeks": {
+            str(lane): _number(weeks, 0.0, 0.0, 52.0)
+            for lane, weeks in (vacation_weeks.items() if isinstance(vacation_weeks, dict) else ())
+        },
+        "weekly_capacity": {
+            str(lane): [_number(value, 1.0, 0.0, 10.0) for value in values]
+            for lane, values in (weekly_capacity.items() if isinstance(weekly_capacity, dict) else ())
+            if isinstance(values, list) and values
+        },
+    }
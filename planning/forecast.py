@@ -0,0 +1,320 @@
+"""Monte Carlo delivery forecast for scenario schedules.
+
+``schedule_issues`` maps story points to one point estimate. A forecast
+re-runs the schedule ``runs`` times with every open issue's duration scaled
+by a multiplier drawn from its team's history -- actual time spent over the
+``sp_to_weeks`` estimate on completed issues -- and reports P50/P85/P95 end
+dates per issue, per epic and for the whole scenario, plus the probability
+of finishing by ``quarter_end_date``.
+
+Runs are split into fixed-size chunks with their own seeds, so results only
+depend on ``seed`` and not on how chunks are spread over ``ForecastPool``
+worker processes. A chunk uses the NumPy batch engine when NumPy is
+installed and ``schedule_issues`` per run otherwise; both see the same
+samples.
+"""
+
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass, field, replace
+from datetime import date, timedelta
+import hashlib
+import json
+import math
+import multiprocessing
+import os
+import random
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .models import Issue, ScenarioConfig
+from .scheduler import DONE_STATUSES, normalize_status, schedule_issues
+from .vectorized import numpy_available
+
+
+DEFAULT_RUNS = 2000
+MAX_RUNS = 20000
+CHUNK_RUNS = 250
+PERCENTILES = (50, 85, 95)
+MIN_TEAM_SAMPLES = 5
+# Jira time tracking counts a week as 5 days of 8 hours.
+WORK_WEEK_SECONDS = 5 * 8 * 3600
+# Ratios outside this band are logging mistakes, not estimates.
+MULTIPLIER_BOUNDS = (0.1, 10.0)
+# Used when neither the team nor the scenario has enough completed, tracked work.
+DEFAULT_MULTIPLIERS = (0.75, 0.9, 1.0, 1.0, 1.1, 1.25, 1.5, 2.0)
+
+
+def duration_multiplier_pools(history: Iterable[dict], sp_to_weeks: float) -> Tuple[Dict[Optional[str], tuple], dict]:
+    """Per-team multiplier samples from completed issues, plus a summary of where they came from.
+
+    ``history`` entries are scenario issue entries (``team``, ``sp``,
+    ``status``, ``timeSpentSeconds``). Teams with fewer than
+    ``MIN_TEAM_SAMPLES`` fall back to the pooled samples (key ``None``),
+    which fall back to ``DEFAULT_MULTIPLIERS``.
+    """
+    by_team = {}
+    for entry in history or []:
+        if normalize_status(entry.get("status")) not in DONE_STATUSES:
+            continue
+        try:
+            story_points = float(entry.get("sp") or 0)
+            spent_seconds = float(entry.get("timeSpentSeconds") or 0)
+        except (TypeError, ValueError):
+            continue
+        if story_points <= 0 or spent_seconds <= 0 or sp_to_weeks <= 0:
+            continue
+        multiplier = (spent_seconds / WORK_WEEK_SECONDS) / (story_points * sp_to_weeks)
+        if MULTIPLIER_BOUNDS[0] <= multiplier <= MULTIPLIER_BOUNDS[1]:
+            by_team.setdefault(entry.get("team"), []).append(round(multiplier, 6))
+    pooled = sorted(value for values in by_team.values() for value in values)
+    pools = {None: tuple(pooled) if len(pooled) >= MIN_TEAM_SAMPLES else DEFAULT_MULTIPLIERS}
+    for team, values in sorted(by_team.items(), key=lambda item: str(item[0])):
+        if team is not None and len(values) >= MIN_TEAM_SAMPLES:
+            pools[team] = tuple(sorted(values))
+    summary = {
+        "pooledSamples": len(pooled),
+        "teams": {team: len(values) for team, values in pools.items() if team is not None},
+        "source": "history" if len(pooled) >= MIN_TEAM_SAMPLES else "default",
+    }
+    return pools, summary
+
+
+def forecast_cache_key(
+    issues: List[Issue],
+    dependencies: Dict[str, List[str]],
+    config: ScenarioConfig,
+    pools: Dict[Optional[str], tuple],
+    runs: int,
+    seed: int,
+) -> str:
+    """Content hash of everything a forecast depends on."""
+    payload = {
+        "issues": [asdict(issue) for issue in issues],
+        "dependencies": sorted((key, list(deps)) for key, deps in dependencies.items()),
+        "config": {name: value for name, value in asdict(config).items() if name != "engine"},
+        "pools": sorted((str(team), list(values)) for team, values in pools.items()),
+        "runs": runs,
+        "seed": seed,
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _chunk_end_days(issues, dependencies, config, scales):
+    """End-day offsets ``{key: day}`` per run for every placed issue."""
+    if numpy_available() and not config.weekly_capacity:
+        from .vectorized import base_durations, schedule_batch, timedelta_days
+
+        issue_map = {issue.key: issue for issue in issues}
+        keys = list(issue_map)
+        base = base_durations(issue_map.values(), config)
+        matrix = base * [[scale.get(key, 1.0) for key in keys] for scale in scales]
+        batch = schedule_batch(issues, dependencies, config, durations=matrix)
+        placed = list(batch.scheduled)
+        days = timedelta_days(batch.end_weeks[:, batch.scheduled_columns()]).astype(int).tolist()
+        return [dict(zip(placed, row)) for row in days]
+    python_config = replace(config, engine="python")
+    runs = []
+    for scale in scales:
+        _, scheduled = schedule_issues(issues, dependencies, python_config, duration_scale=scale)
+        runs.append({key: (item.end_date - config.start_date).days for key, item in scheduled.items()})
+    return runs
+
+
+def forecast_chunk(issues, dependencies, config, pools, runs, seed):
+    """Run ``runs`` sampled schedules; returns end-day counters for issues, epics and the scenario."""
+    rng = random.Random(seed)
+    issue_map = {issue.key: issue for issue in issues}
+    sampled = [
+        (key, pools.get(issue.team) or pools[None])
+        for key, issue in issue_map.items()
+        if issue.story_points and normalize_status(issue.status) not in DONE_STATUSES
+    ]
+    scales = [{key: rng.choice(pool) for key, pool in sampled} for _ in range(runs)]
+    issue_days = {}
+    epic_days = {}
+    scenario_days = Counter()
+    for ends in _chunk_end_days(issues, dependencies, config, scales):
+        epic_end = {}
+        for key, day in ends.items():
+            issue_days.setdefault(key, Counter())[day] += 1
+            epic_key = issue_map[key].epic_key
+            if epic_key:
+                epic_end[epic_key] = max(day, epic_end.get(epic_key, day))
+        for epic_key, day in epic_end.items():
+            epic_days.setdefault(epic_key, Counter())[day] += 1
+        if ends:
+            scenario_days[max(ends.values())] += 1
+    return {"issues": issue_days, "epics": epic_days, "scenario": scenario_days}
+
+
+def _percentile_day(counts: Counter, total: int, percentile: int) -> int:
+    rank = max(1, math.ceil(percentile / 100.0 * total))
+    seen = 0
+    for day in sorted(counts):
+        seen += counts[day]
+        if seen >= rank:
+            return day
+    return max(counts)
+
+
+@dataclass
+class ForecastResult:
+    runs: int
+    seed: int
+    start_date: date
+    quarter_end_date: date
+    scenario: Counter = field(default_factory=Counter)
+    issues: Dict[str, Counter] = field(default_factory=dict)
+    epics: Dict[str, Counter] = field(default_factory=dict)
+    history: dict = field(default_factory=dict)
+
+    def _distribution(self, counts: Counter) -> dict:
+        total = sum(counts.values())
+        if not total:
+            return {}
+        deadline = (self.quarter_end_date - self.start_date).days
+        summary = {
+            f"p{percentile}": (self.start_date + timedelta(days=_percentile_day(counts, total, percentile))).isoformat()
+            for percentile in PERCENTILES
+        }
+        summary["onTimeProbability"] = round(
+            sum(count for day, count in counts.items() if day <= deadline) / total, 4,
+        )
+        return summary
+
+    def as_payload(self) -> dict:
+        scenario = self._distribution(self.scenario)
+        return {
+            "runs": self.runs,
+            "seed": self.seed,
+            "quarterEndProbability": scenario.get("onTimeProbability"),
+            "scenario": scenario,
+            "issues": {key: self._distribution(counts) for key, counts in self.issues.items()},
+            "epics": {key: self._distribution(counts) for key, counts in self.epics.items()},
+            "history": self.history,
+        }
+
+
+class ForecastPool:
+    """Process-wide, lazily started ``ProcessPoolExecutor`` for forecast chunks
+    and compared scenario variants.
+
+    ``max_workers`` of 0 or 1 runs chunks inline. The executor uses the
+    ``spawn`` start method (the server process is multi-threaded) and is
+    re-created after fork and after a worker crash.
+    """
+
+    def __init__(self, max_workers=None):
+        self.max_workers = max(0, int(max_workers if max_workers is not None else (os.cpu_count() or 1)))
+        self._lock = threading.Lock()
+        self._executor = None
+        self._pid = None
+
+    @classmethod
+    def from_env(cls, environ=None):
+        env = os.environ if environ is None else environ
+        raw = str(env.get("SCENARIO_FORECAST_WORKERS", "") or "").strip()
+        return cls(max_workers=int(raw) if raw.isdigit() else None)
+
+    def _shared_executor(self):
+        pid = os.getpid()
+        if self._pid != pid:
+            with self._lock:
+                if self._pid != pid:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn"),
+                    )
+                    self._pid = pid
+        return self._executor
+
+    def _reset(self, executor):
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+                self._pid = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def map(self, fn, argument_tuples):
+        argument_tuples = list(argument_tuples)
+        if self.max_workers <= 1 or len(argument_tuples) <= 1:
+            return [fn(*arguments) for arguments in argument_tuples]
+        executor = self._shared_executor()
+        try:
+            futures = [executor.submit(fn, *arguments) for arguments in argument_tuples]
+            return [future.result() for future in futures]
+        except BrokenProcessPool:
+            self._reset(executor)
+            return [fn(*arguments) for arguments in argument_tuples]
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor, self._pid = self._executor, None, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def stats(self):
+        return {"maxWorkers": self.max_workers, "started": self._executor is not None}
+
+
+def run_forecast(
+    issues: List[Issue],
+    dependencies: Dict[str, List[str]],
+    config: ScenarioConfig,
+    pools: Dict[Optional[str], tuple],
+    *,
+    runs: int = DEFAULT_RUNS,
+    seed: int = 0,
+    pool: Optional[ForecastPool] = None,
+    history_summary: Optional[dict] = None,
+) -> ForecastResult:
+    runs = max(1, min(int(runs), MAX_RUNS))
+    chunks = []
+    for index, offset in enumerate(range(0, runs, CHUNK_RUNS)):
+        chunk_runs = min(CHUNK_RUNS, runs - offset)
+        chunks.append((issues, dependencies, config, pools, chunk_runs, seed * 1_000_003 + index))
+    partials = (pool or ForecastPool(max_workers=0)).map(forecast_chunk, chunks)
+
+    result = ForecastResult(
+        runs=runs,
+        seed=seed,
+        start_date=config.start_date,
+        quarter_end_date=config.quarter_end_date,
+        history=dict(history_summary or {}),
+    )
+    for partial in partials:
+        result.scenario.update(partial["scenario"])
+        for target, counters in ((result.issues, partial["issues"]), (result.epics, partial["epics"])):
+            for key, counts in counters.items():
+                target.setdefault(key, Counter()).update(counts)
+    return result
+
+
+def _int_option(value, default):
+    try:
+        return int(value or default)
+    except (TypeError, ValueError, OverflowError):
+        return default
+
+
+def forecast_payload(issues, dependencies, config, history, options, *, cache=None, pool=None) -> dict:
+    """Forecast for the scenario API's ``config.forecast`` (``true`` or ``{runs, seed}``).
+
+    Invalid ``runs`` or ``seed`` fall back to the defaults, as the capacity
+    settings do. ``cache`` maps ``forecast_cache_key`` hashes to finished payloads.
+    """
+    options = options if isinstance(options, dict) else {}
+    runs = max(1, min(_int_option(options.get("runs"), DEFAULT_RUNS), MAX_RUNS))
+    seed = _int_option(options.get("seed"), 0)
+    pools, history_summary = duration_multiplier_pools(history, config.sp_to_weeks)
+    cache_key = forecast_cache_key(issues, dependencies, config, pools, runs, seed)
+    payload = cache.get(cache_key) if cache is not None else None
+    if payload is None:
+        payload = run_forecast(
+            issues, dependencies, config, pools, runs=runs, seed=seed, pool=pool, history_summary=history_summary,
+        ).as_payload()
+        if cache is not None:
+            cache[cache_key] = payload
+    return payload
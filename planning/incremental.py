@@ -0,0 +1,229 @@
+"""Incremental rescheduling of a scenario after issue edits.
+
+A ``ScheduleSession`` keeps the last ``ScheduleRun`` -- lane capacity state
+per placement, processing order and per-issue results -- so an edit to a few
+issues (story points, team, exclusion) does not re-place everything:
+
+* the new run walks the new processing order as usual;
+* a placement whose issue is unchanged, whose lane has not diverged yet and
+  whose prerequisites were not re-placed replays its recorded slot claim and
+  keeps its previous result;
+* the first re-placed issue in a lane marks that lane diverged, so later work
+  in the lane is re-placed too, and re-placed issues pull their dependents in.
+
+Only the changed issues, their lane successors and their downstream
+dependency cone are re-placed, and the results equal a full
+``schedule_issues`` run on the edited issues.
+"""
+
+import threading
+from dataclasses import dataclass, field, replace
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .analysis import critical_chains
+from .models import Issue, ScheduledIssue, ScenarioConfig
+from .scheduler import PlacementStep, ScheduleRun
+
+
+EDITABLE_FIELDS = {"story_points", "team", "excluded"}
+COMPARED_FIELDS = ("lane", "start_date", "end_date", "duration_weeks", "scheduled_reason", "progress_pct")
+
+
+class IncrementalScheduleRun(ScheduleRun):
+    """A ``ScheduleRun`` that reuses ``previous`` placements outside the affected cone."""
+
+    def __init__(self, previous: ScheduleRun, issues, dependencies, config, changed_keys: Set[str]):
+        super().__init__(issues, dependencies, config)
+        self.previous = previous
+        self.changed_keys = changed_keys
+        self.replaced_keys = set()
+        self.diverged_lanes = set()
+        self.previous_position = {key: index for index, key in enumerate(previous.sequence)}
+        self.previous_lane_sequence = {}
+        for key in previous.sequence:
+            lane = previous.steps[key].lane
+            if lane is not None and previous.steps[key].placed:
+                self.previous_lane_sequence.setdefault(lane, []).append(key)
+        self.lane_cursor = {}
+
+    def _was_placed_before(self, dep: str, key: str) -> bool:
+        if dep in self.previous.steps:
+            position = self.previous_position.get(dep)
+            return position is not None and position < self.previous_position[key] and self.previous.steps[dep].placed
+        # Done issues are placed before the in-progress, main and incomplete passes.
+        return dep in self.previous.scheduled
+
+    def _reusable(self, phase: str, issue: Issue) -> Optional[PlacementStep]:
+        key = issue.key
+        step = self.previous.steps.get(key)
+        if step is None or step.phase != phase or key in self.changed_keys:
+            return None
+        lane = step.lane if step.placed else None
+        if lane is not None:
+            if lane in self.diverged_lanes or lane not in self.capacities:
+                return None
+            cursor = self.lane_cursor.get(lane, 0)
+            lane_sequence = self.previous_lane_sequence.get(lane, [])
+            if cursor >= len(lane_sequence) or lane_sequence[cursor] != key:
+                return None
+        for dep in self.dependency_keys.get(key, []):
+            if dep in self.replaced_keys or (dep in self.scheduled) != self._was_placed_before(dep, key):
+                return None
+        return step
+
+    def _replay(self, issue: Issue, step: PlacementStep) -> None:
+        if step.placed and step.lane is not None:
+            lane_capacity = self.capacities[step.lane]
+            if step.slot_index is not None:
+                _, slot_index = lane_capacity.claim_slot()
+                if issue.assignee:
+                    lane_capacity.assignee_slots[issue.assignee] = slot_index
+                lane_capacity.occupy_slot(slot_index, step.slot_until)
+            if step.assignee_until is not None:
+                lane_capacity.assignee_available_at[issue.assignee] = step.assignee_until
+            self.lane_cursor[step.lane] = self.lane_cursor.get(step.lane, 0) + 1
+        self.record(issue.key, step)
+
+    def place(self, phase: str, issue: Issue) -> None:
+        step = self._reusable(phase, issue)
+        if step is not None:
+            self._replay(issue, step)
+            return
+        self.replaced_keys.add(issue.key)
+        self.diverged_lanes.add(self.lane_for(issue))
+        previous = self.previous.steps.get(issue.key)
+        if previous is not None and previous.lane is not None:
+            self.diverged_lanes.add(previous.lane)
+        super().place(phase, issue)
+
+
+@dataclass
+class ScheduleDiff:
+    """Placements that differ from the previous run, keyed by issue."""
+
+    changed: Dict[str, Tuple[Optional[ScheduledIssue], Optional[ScheduledIssue]]] = field(default_factory=dict)
+    replaced: int = 0
+    reused: int = 0
+
+    def as_payload(self) -> dict:
+        def placement(item):
+            if item is None:
+                return None
+            return {
+                "lane": item.lane,
+                "start": item.start_date.isoformat() if item.start_date else None,
+                "end": item.end_date.isoformat() if item.end_date else None,
+                "durationWeeks": item.duration_weeks,
+                "scheduledReason": item.scheduled_reason,
+            }
+
+        return {
+            "changed": [
+                {"key": key, "before": placement(before), "after": placement(after)}
+                for key, (before, after) in self.changed.items()
+            ],
+            "replaced": self.replaced,
+            "reused": self.reused,
+        }
+
+
+def _result_map(run: ScheduleRun) -> Dict[str, ScheduledIssue]:
+    return {**run.scheduled, **run.unschedulable}
+
+
+def _same_placement(before: ScheduledIssue, after: ScheduledIssue) -> bool:
+    return all(getattr(before, name) == getattr(after, name) for name in COMPARED_FIELDS)
+
+
+class ScheduleSession:
+    """Scenario inputs plus the last run, for incremental edits.
+
+    ``edits`` accumulate per issue: ``{"story_points": 5}``, ``{"team": "Beta"}``
+    or ``{"excluded": True}``; ``{"excluded": False}`` restores an excluded
+    issue at its original position. ``apply`` serializes concurrent edits, so
+    a session can be shared between requests.
+    """
+
+    def __init__(self, issues: List[Issue], dependencies: Dict[str, List[str]], config: ScenarioConfig):
+        self.base_issues = list(issues)
+        self.dependencies = dependencies
+        self.config = replace(config, engine="python")
+        self.edits = {}
+        self._lock = threading.Lock()
+        self.issues = self.current_issues()
+        self.run = ScheduleRun(self.issues, dependencies, self.config)
+        self.results = self.run.run()
+
+    def current_issues(self) -> List[Issue]:
+        issues = []
+        for issue in self.base_issues:
+            edit = self.edits.get(issue.key) or {}
+            if edit.get("excluded"):
+                continue
+            values = {name: edit[name] for name in ("story_points", "team") if name in edit}
+            issues.append(replace(issue, **values) if values else issue)
+        return issues
+
+    def _changed_keys(self, previous_issues: Iterable[Issue], issues: Iterable[Issue]) -> Set[str]:
+        before = {issue.key: issue for issue in previous_issues}
+        after = {issue.key: issue for issue in issues}
+        changed = {key for key in before.keys() | after.keys() if before.get(key) != after.get(key)}
+        membership = before.keys() ^ after.keys()
+        if membership:
+            # Dependents of added or removed issues gain or lose a (missing) prerequisite.
+            changed.update(
+                key for key, deps in self.dependencies.items()
+                if membership.intersection(deps)
+            )
+        return changed
+
+    def apply(self, edits: Dict[str, dict]) -> ScheduleDiff:
+        with self._lock:
+            return self._apply(edits)
+
+    def summary(self) -> dict:
+        """The ``summary`` block of a scenario response for the current run."""
+        scheduled_list, scheduled_map = self.results
+        quarter_end_date = self.config.quarter_end_date
+        critical_paths = critical_chains(scheduled_map, self.dependencies)
+        late_items = [item.key for item in scheduled_list if item.end_date and item.end_date > quarter_end_date]
+        unschedulable = [
+            item.key for item in scheduled_list if item.scheduled_reason not in ("scheduled", "already_done")
+        ]
+        return {
+            "critical_path": critical_paths[0] if critical_paths else [],
+            "critical_paths": critical_paths,
+            "late_items": late_items,
+            "unschedulable": unschedulable,
+            "deadline_met": not late_items and not unschedulable,
+        }
+
+    def _apply(self, edits: Dict[str, dict]) -> ScheduleDiff:
+        for key, edit in (edits or {}).items():
+            if not isinstance(edit, dict):
+                raise ValueError(f"edit for {key} must be an object")
+            unknown = set(edit) - EDITABLE_FIELDS
+            if unknown:
+                raise ValueError(f"unsupported edit fields for {key}: {', '.join(sorted(unknown))}")
+        previous_issues = self.issues
+        for key, edit in (edits or {}).items():
+            self.edits.setdefault(key, {}).update(edit)
+        issues = self.current_issues()
+        self.issues = issues
+        previous_run = self.run
+        run = IncrementalScheduleRun(
+            previous_run, issues, self.dependencies, self.config, self._changed_keys(previous_issues, issues),
+        )
+        self.results = run.run()
+        self.run = run
+
+        diff = ScheduleDiff(replaced=len(run.replaced_keys), reused=len(run.sequence) - len(run.replaced_keys))
+        before_map = _result_map(previous_run)
+        after_map = _result_map(run)
+        for key in list(dict.fromkeys([*before_map, *after_map])):
+            before, after = before_map.get(key), after_map.get(key)
+            if before is after:
+                continue
+            if before is None or after is None or not _same_placement(before, after):
+                diff.changed[key] = (before, after)
+        return diff
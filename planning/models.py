@@ -3,7 +3,7 @@ from datetime import date
 from typing import Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Issue:
     key: str
     summary: str
@@ -17,7 +17,7 @@ class Issue:
     team_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Dependency:
     issue_key: str
     depends_on_key: str
@@ -34,9 +34,12 @@ class ScenarioConfig:
     sickleave_buffer: float = 0.1
     wip_limit: int = 1
     lane_mode: str = "team"  # "team" or "assignee"
+    engine: str = "python"  # "python" or "numpy" (see planning.vectorized)
+    planned_capacity: Dict[str, float] = field(default_factory=dict)  # lane -> story points over the horizon
+    weekly_capacity: Dict[str, List[float]] = field(default_factory=dict)  # lane -> per-week capacity multipliers
 
 
-@dataclass
+@dataclass(slots=True)
 class ScheduledIssue:
     key: str
     summary: str
@@ -53,7 +56,7 @@ class ScheduledIssue:
     progress_pct: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ScheduleResult:
     issues: List[ScheduledIssue]
     critical_path: List[str]
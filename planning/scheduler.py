@@ -1,7 +1,7 @@
 from collections import defaultdict, deque
 import heapq
 from datetime import timedelta
-from typing import Dict, List, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 from .capacity import build_lane_capacities
 from .models import Issue, ScheduledIssue, ScenarioConfig
@@ -49,6 +49,9 @@ def topo_sort(issues: Dict[str, Issue], dependencies: Dict[str, List[str]]) -> L
     indegree = {key: 0 for key in issues}
     forward = defaultdict(list)
     for issue_key, deps in dependencies.items():
+        if issue_key not in issues:
+            # Edges of issues left out of the scenario (excluded capacity) do not order anything.
+            continue
         for dep in deps:
             if dep not in issues:
                 continue
@@ -78,248 +81,264 @@ def topo_sort(issues: Dict[str, Issue], dependencies: Dict[str, List[str]]) -> L
     return order
 
 
-def schedule_issues(
-    issues: List[Issue],
-    dependencies: Dict[str, List[str]],
-    config: ScenarioConfig,
-) -> Tuple[List[ScheduledIssue], Dict[str, ScheduledIssue]]:
-    issue_map = {issue.key: issue for issue in issues}
-    total_weeks = max(1.0, (config.quarter_end_date - config.start_date).days / 7.0)
-    anchor_date = config.anchor_date or config.start_date
-    anchor_week = max(0.0, (anchor_date - config.start_date).days / 7.0)
-
-    lanes = []
-    for issue in issues:
-        if config.lane_mode == "assignee":
-            lane = issue.assignee or issue.team or "Unassigned"
-        else:
-            lane = issue.team or "Unassigned"
-        lanes.append(lane)
-    lane_list = sorted(set(lanes))
-
-    capacities = build_lane_capacities(
-        lane_list,
-        config.team_sizes,
-        config.lane_mode,
-        config.wip_limit,
-        total_weeks,
-        config.vacation_weeks,
-        config.sickleave_buffer,
-    )
-
-    scheduled = {}
-    unschedulable = {}
-    dependency_keys = {
-        key: [dep for dep in deps if dep in issue_map]
-        for key, deps in dependencies.items()
-    }
-    missing_dependency = {
-        key: [dep for dep in deps if dep not in issue_map]
-        for key, deps in dependencies.items()
-    }
-
-    for issue in issues:
-        if not issue.story_points:
-            unschedulable[issue.key] = ScheduledIssue(
-                key=issue.key,
-                summary=issue.summary,
-                lane=issue.team or "Unassigned",
-                start_date=None,
-                end_date=None,
-                blocked_by=dependencies.get(issue.key, []),
-                scheduled_reason="missing_story_points",
-                assignee=issue.assignee,
-            )
-
-    # Handle completed tasks
-    for issue in issues:
-        status = normalize_status(issue.status)
-        if status in DONE_STATUSES:
-            scheduled[issue.key] = ScheduledIssue(
-                key=issue.key,
-                summary=issue.summary,
-                lane=issue.team or "Unassigned",
-                start_date=config.start_date,
-                end_date=config.start_date,
-                blocked_by=dependencies.get(issue.key, []),
-                scheduled_reason="already_done",
-                duration_weeks=0.0,
-                assignee=issue.assignee,
-            )
+def order_cyclic_remainder(
+    remaining_keys: List[str],
+    issue_map: Dict[str, Issue],
+    dependency_keys: Dict[str, List[str]],
+    ready: set,
+) -> List[str]:
+    """Order issues left out of ``topo_sort`` because they sit on or behind a cycle.
+
+    Works in rounds: every issue whose dependencies are all ready is released
+    together, sorted by priority and story points. When no issue is ready, the
+    one with the fewest dependencies still remaining (non-"Blocked" first) is
+    released to break the cycle. Readiness counters and a lazily invalidated
+    heap for the cycle breaker keep this O((n + e) log n). Ties fall back to
+    input order.
+    """
+    position = {key: index for index, key in enumerate(remaining_keys)}
+    remaining = set(remaining_keys)
+    unready = {}
+    remaining_deps = {}
+    dependents = defaultdict(list)
+    for key in remaining_keys:
+        deps = dependency_keys.get(key, [])
+        # Duplicate dependency entries count twice for the cycle breaker, once for readiness.
+        remaining_deps[key] = sum(1 for dep in deps if dep in remaining)
+        blockers = {dep for dep in deps if dep in issue_map and dep not in ready}
+        unready[key] = len(blockers)
+        for dep in deps:
+            if dep in remaining:
+                dependents[dep].append(key)
 
-    # Handle in-progress tasks (schedule before "to do")
-    for issue in issues:
-        if issue.key in scheduled or issue.key in unschedulable:
+    def release_rank(key):
+        issue = issue_map[key]
+        return (priority_rank(issue.priority), -(issue.story_points or 0.0), position[key])
+
+    def breaker_entry(key):
+        blocked = 1 if normalize_status(issue_map[key].status) == 'blocked' else 0
+        return (remaining_deps[key], blocked, *release_rank(key), key)
+
+    breaker_heap = [breaker_entry(key) for key in remaining_keys]
+    heapq.heapify(breaker_heap)
+    released = []
+    ready_now = [key for key in remaining_keys if unready[key] == 0]
+
+    def release(keys):
+        next_ready = []
+        for key in keys:
+            remaining.discard(key)
+            released.append(key)
+        for key in keys:
+            seen = set()
+            for dependent in dependents.get(key, []):
+                if dependent not in remaining:
+                    continue
+                remaining_deps[dependent] -= 1
+                heapq.heappush(breaker_heap, breaker_entry(dependent))
+                if dependent not in seen:
+                    seen.add(dependent)
+                    unready[dependent] -= 1
+                    if unready[dependent] == 0:
+                        next_ready.append(dependent)
+        return next_ready
+
+    while remaining:
+        if ready_now:
+            ready_now = release(sorted(ready_now, key=release_rank))
             continue
-        status = normalize_status(issue.status)
-        if status in IN_PROGRESS_STATUSES:
-            if missing_dependency.get(issue.key):
-                unschedulable[issue.key] = ScheduledIssue(
-                    key=issue.key,
-                    summary=issue.summary,
-                    lane=issue.team or "Unassigned",
-                    start_date=None,
-                    end_date=None,
-                    blocked_by=dependencies.get(issue.key, []),
-                    scheduled_reason="missing_dependency",
-                    assignee=issue.assignee,
-                )
-                continue
-            lane = issue.team or "Unassigned"
-            if config.lane_mode == "assignee":
-                lane = issue.assignee or issue.team or "Unassigned"
-
-            lane_capacity = capacities[lane]
-            dep_end = 0.0
-            for dep in dependency_keys.get(issue.key, []):
-                dep_issue = scheduled.get(dep)
-                if dep_issue and dep_issue.duration_weeks is not None:
-                    dep_end = max(dep_end, dep_issue.duration_weeks + (dep_issue.start_date - config.start_date).days / 7.0)
-
-            # Compute duration assuming 50% done
-            duration_weeks = compute_duration_weeks(
-                issue.story_points,
-                config.sp_to_weeks,
-                lane_capacity.capacity_factor,
-            )
-            if duration_weeks is None:
-                continue
+        # Deadlock: release the issue with the fewest dependencies still remaining.
+        while True:
+            entry = heapq.heappop(breaker_heap)
+            key = entry[-1]
+            if key in remaining and entry[0] == remaining_deps[key]:
+                break
+        ready_now = release([key])
+    return released
+
+
+class PlacementStep(NamedTuple):
+    """How one placement used its lane, so ``planning.incremental`` can replay it."""
+
+    phase: str
+    lane: Optional[str]
+    result: ScheduledIssue
+    placed: bool
+    slot_index: Optional[int] = None
+    slot_until: Optional[float] = None
+    assignee_until: Optional[float] = None
+
+
+class ScheduleRun:
+    """One pass of the Python engine.
+
+    ``steps`` maps each key placed by the in-progress, main and incomplete
+    passes to its ``PlacementStep``, and ``sequence`` lists those keys in
+    placement order.
+    """
+
+    def __init__(
+        self,
+        issues: List[Issue],
+        dependencies: Dict[str, List[str]],
+        config: ScenarioConfig,
+        duration_scale: Optional[Dict[str, float]] = None,
+    ):
+        self.issues = issues
+        self.dependencies = dependencies
+        self.config = config
+        self.duration_scale = duration_scale
+        self.issue_map = {issue.key: issue for issue in issues}
+        total_weeks = max(1.0, (config.quarter_end_date - config.start_date).days / 7.0)
+        anchor_date = config.anchor_date or config.start_date
+        self.anchor_week = max(0.0, (anchor_date - config.start_date).days / 7.0)
+
+        lane_list = sorted({self.lane_for(issue) for issue in issues})
+        self.capacities = build_lane_capacities(
+            lane_list,
+            config.team_sizes,
+            config.lane_mode,
+            config.wip_limit,
+            total_weeks,
+            config.vacation_weeks,
+            config.sickleave_buffer,
+            planned_capacity=config.planned_capacity,
+            sp_to_weeks=config.sp_to_weeks,
+            weekly_capacity=config.weekly_capacity,
+        )
 
-            # Assume task started 50% duration ago
-            elapsed_weeks = duration_weeks * 0.5
-            start_week = max(dep_end, anchor_week - elapsed_weeks)
-            end_week = start_week + duration_weeks
+        self.scheduled = {}
+        self.unschedulable = {}
+        self.steps = {}
+        self.sequence = []
+        self.dependency_keys = {
+            key: [dep for dep in deps if dep in self.issue_map]
+            for key, deps in dependencies.items()
+        }
+        self.missing_dependency = {
+            key: [dep for dep in deps if dep not in self.issue_map]
+            for key, deps in dependencies.items()
+        }
+
+    def lane_for(self, issue: Issue) -> str:
+        if self.config.lane_mode == "assignee":
+            return issue.assignee or issue.team or "Unassigned"
+        return issue.team or "Unassigned"
+
+    def issue_duration(self, issue: Issue, lane_capacity) -> Optional[float]:
+        duration_weeks = compute_duration_weeks(
+            issue.story_points,
+            self.config.sp_to_weeks,
+            lane_capacity.capacity_factor,
+        )
+        if duration_weeks is not None and self.duration_scale:
+            duration_weeks *= self.duration_scale.get(issue.key, 1.0)
+        return duration_weeks
 
-            start_date = config.start_date + timedelta(weeks=start_week)
-            end_date = config.start_date + timedelta(weeks=end_week)
-
-            scheduled[issue.key] = ScheduledIssue(
-                key=issue.key,
-                summary=issue.summary,
-                lane=lane,
-                start_date=start_date,
-                end_date=end_date,
-                blocked_by=dependencies.get(issue.key, []),
-                scheduled_reason="in_progress",
-                duration_weeks=duration_weeks,
-                assignee=issue.assignee,
-                progress_pct=0.5,
+    def unplaced(self, issue: Issue, lane: str, reason: str) -> ScheduledIssue:
+        return ScheduledIssue(
+            key=issue.key,
+            summary=issue.summary,
+            lane=lane,
+            start_date=None,
+            end_date=None,
+            blocked_by=self.dependencies.get(issue.key, []),
+            scheduled_reason=reason,
+            assignee=issue.assignee,
+        )
+
+    def placed(self, issue: Issue, lane: str, start_week: float, end_week: float,
+               duration_weeks: float, reason: str, progress_pct: Optional[float] = None) -> ScheduledIssue:
+        return ScheduledIssue(
+            key=issue.key,
+            summary=issue.summary,
+            lane=lane,
+            start_date=self.config.start_date + timedelta(weeks=start_week),
+            end_date=self.config.start_date + timedelta(weeks=end_week),
+            blocked_by=self.dependencies.get(issue.key, []),
+            scheduled_reason=reason,
+            duration_weeks=duration_weeks,
+            assignee=issue.assignee,
+            progress_pct=progress_pct,
+        )
+
+    def dependency_end(self, key: str) -> float:
+        dep_end = 0.0
+        for dep in self.dependency_keys.get(key, []):
+            dep_issue = self.scheduled.get(dep)
+            if dep_issue and dep_issue.duration_weeks is not None:
+                dep_end = max(dep_end, dep_issue.duration_weeks + (dep_issue.start_date - self.config.start_date).days / 7.0)
+        return dep_end
+
+    def record(self, key: str, step: Optional[PlacementStep]) -> None:
+        if step is None:
+            return
+        self.steps[key] = step
+        self.sequence.append(key)
+        if step.placed:
+            self.scheduled[key] = step.result
+        else:
+            self.unschedulable[key] = step.result
+
+    def place(self, phase: str, issue: Issue) -> None:
+        if phase == "in_progress":
+            self.record(issue.key, self.place_in_progress(issue))
+        elif phase == "scheduled":
+            self.record(issue.key, self.place_scheduled(issue))
+        else:
+            self.record(issue.key, self.place_incomplete(issue))
+
+    def place_in_progress(self, issue: Issue) -> Optional[PlacementStep]:
+        if self.missing_dependency.get(issue.key):
+            return PlacementStep(
+                "in_progress", None, self.unplaced(issue, issue.team or "Unassigned", "missing_dependency"), False,
             )
+        lane = self.lane_for(issue)
+        lane_capacity = self.capacities[lane]
+        dep_end = self.dependency_end(issue.key)
 
-            # Mark assignee/slot as occupied until end_date
-            if issue.assignee:
-                lane_capacity.assignee_available_at[issue.assignee] = end_week
-
-    order = topo_sort(issue_map, dependency_keys)
-
-    # Handle tasks in circular dependencies (not in topo order)
-    # Use iterative scheduling: process tasks whose deps are ready first
-    remaining_keys = set(issue_map.keys()) - set(order) - set(scheduled.keys()) - set(unschedulable.keys())
-    if remaining_keys:
-        already_in_order = set(order) | set(scheduled.keys())
-        remaining_order = []
-        remaining_set = set(remaining_keys)
-
-        # Iteratively add tasks whose all dependencies are either:
-        # 1) Already in order/scheduled (non-cyclic deps), OR
-        # 2) Already added to remaining_order (within-cycle deps processed earlier)
-        max_iterations = len(remaining_keys) + 1
-        for _ in range(max_iterations):
-            if not remaining_set:
-                break
+        # Compute duration assuming 50% done
+        duration_weeks = self.issue_duration(issue, lane_capacity)
+        if duration_weeks is None:
+            return None
 
-            added_this_round = []
-            for key in list(remaining_set):
-                deps = dependency_keys.get(key, [])
-                valid_deps = [d for d in deps if d in issue_map]
-                # Check if all valid deps are ready (in already_in_order or in remaining_order)
-                unready = [d for d in valid_deps if d not in already_in_order and d not in remaining_order]
-                if not unready:
-                    added_this_round.append(key)
-
-            if added_this_round:
-                # Sort by priority within this round
-                added_this_round.sort(key=lambda k: (priority_rank(issue_map[k].priority), -(issue_map[k].story_points or 0.0)))
-                remaining_order.extend(added_this_round)
-                for key in added_this_round:
-                    remaining_set.remove(key)
-            else:
-                # Deadlock: pick task with fewest remaining dependencies
-                # For tasks with same dep count, schedule "Blocked" status last
-                if remaining_set:
-                    def sort_key(k):
-                        deps_in_remaining = len([d for d in dependency_keys.get(k, []) if d in remaining_set])
-                        status = normalize_status(issue_map[k].status)
-                        # Blocked status should go last (higher value)
-                        status_order = 1 if status == 'blocked' else 0
-                        return (
-                            deps_in_remaining,  # Fewest deps first
-                            status_order,  # Non-blocked before blocked
-                            priority_rank(issue_map[k].priority),
-                            -(issue_map[k].story_points or 0.0)
-                        )
-                    key = min(remaining_set, key=sort_key)
-                    remaining_order.append(key)
-                    remaining_set.remove(key)
-
-        order = list(order) + remaining_order
-
-    # Track all scheduled items (including those scheduled in this loop iteration)
-    # This is needed for cyclic dependencies where task B depends on task A
-    # but both are processed in the same cycle-breaking iteration
-    all_scheduled = dict(scheduled)
-
-    for key in order:
-        issue = issue_map[key]
-        if key in scheduled or key in unschedulable:
-            continue
-        if missing_dependency.get(key):
-            unschedulable[key] = ScheduledIssue(
-                key=issue.key,
-                summary=issue.summary,
-                lane=issue.team or "Unassigned",
-                start_date=None,
-                end_date=None,
-                blocked_by=dependencies.get(issue.key, []),
-                scheduled_reason="missing_dependency",
-                assignee=issue.assignee,
+        # Assume task started 50% duration ago
+        elapsed_weeks = duration_weeks * 0.5
+        start_week = max(dep_end, self.anchor_week - elapsed_weeks)
+        duration_weeks = lane_capacity.span_weeks(start_week, duration_weeks)
+        end_week = start_week + duration_weeks
+        result = self.placed(issue, lane, start_week, end_week, duration_weeks, "in_progress", progress_pct=0.5)
+
+        # Mark assignee/slot as occupied until end_date
+        assignee_until = None
+        if issue.assignee:
+            lane_capacity.assignee_available_at[issue.assignee] = end_week
+            assignee_until = end_week
+        return PlacementStep("in_progress", lane, result, True, assignee_until=assignee_until)
+
+    def place_scheduled(self, issue: Issue) -> PlacementStep:
+        key = issue.key
+        if self.missing_dependency.get(key):
+            return PlacementStep(
+                "scheduled", None, self.unplaced(issue, issue.team or "Unassigned", "missing_dependency"), False,
             )
-            continue
 
-        lane = issue.team or "Unassigned"
-        if config.lane_mode == "assignee":
-            lane = issue.assignee or issue.team or "Unassigned"
-        lane_capacity = capacities[lane]
+        lane = self.lane_for(issue)
+        lane_capacity = self.capacities[lane]
         status = normalize_status(issue.status)
         # Active Sprint anchor_date clamps TODO-like statuses (Accepted, To Do, Blocked, etc.) to TODAY
         # Done/Killed stay at sprint start; In-Progress centered around TODAY
-        min_start_week = anchor_week if status not in DONE_STATUSES and status not in IN_PROGRESS_STATUSES else 0.0
-        # Calculate minimum start based on dependencies (dependents must start after prerequisites end)
-        dep_end = 0.0
-        for dep in dependency_keys.get(key, []):
-            # Check in all_scheduled (includes tasks scheduled in this iteration)
-            dep_issue = all_scheduled.get(dep)
-            if dep_issue and dep_issue.duration_weeks is not None:
-                dep_end = max(dep_end, dep_issue.duration_weeks + (dep_issue.start_date - config.start_date).days / 7.0)
+        min_start_week = self.anchor_week if status not in DONE_STATUSES and status not in IN_PROGRESS_STATUSES else 0.0
+        # Calculate minimum start based on dependencies (dependents must start after prerequisites end),
+        # including tasks placed earlier in this pass (cycle-broken pairs)
+        dep_end = self.dependency_end(key)
 
-        duration_weeks = compute_duration_weeks(
-            issue.story_points,
-            config.sp_to_weeks,
-            lane_capacity.capacity_factor,
-        )
+        duration_weeks = self.issue_duration(issue, lane_capacity)
         if duration_weeks is None:
-            unschedulable[key] = ScheduledIssue(
-                key=issue.key,
-                summary=issue.summary,
-                lane=lane,
-                start_date=None,
-                end_date=None,
-                blocked_by=dependencies.get(issue.key, []),
-                scheduled_reason="missing_story_points",
-                assignee=issue.assignee,
-            )
-            continue
+            return PlacementStep("scheduled", lane, self.unplaced(issue, lane, "missing_story_points"), False)
 
+        slot_index = None
+        slot_until = None
         # Check if issue has assignee and handle per-assignee capacity
         issue_assignee = issue.assignee
         if issue_assignee:
@@ -329,102 +348,138 @@ def schedule_issues(
                 assignee_ready = lane_capacity.assignee_available_at[issue_assignee]
                 # Final start: max(dependencies, assignee availability, anchor date)
                 start_week = max(dep_end, assignee_ready, min_start_week)
+                duration_weeks = lane_capacity.span_weeks(start_week, duration_weeks)
             else:
                 # Assignee is free, find an available slot
-                slot_index = min(range(len(lane_capacity.available_at)), key=lambda i: lane_capacity.available_at[i])
-                slot_ready = lane_capacity.available_at[slot_index]
+                slot_ready, slot_index = lane_capacity.claim_slot()
                 # Final start: max(dependencies, slot availability, anchor date)
                 start_week = max(dep_end, slot_ready, min_start_week)
+                duration_weeks = lane_capacity.span_weeks(start_week, duration_weeks)
                 # Assign this slot to the assignee
                 lane_capacity.assignee_slots[issue_assignee] = slot_index
                 # Mark slot as occupied
-                lane_capacity.available_at[slot_index] = start_week + duration_weeks
+                slot_until = start_week + duration_weeks
+                lane_capacity.occupy_slot(slot_index, slot_until)
 
             # Update assignee availability
             end_week = start_week + duration_weeks
             lane_capacity.assignee_available_at[issue_assignee] = end_week
         else:
             # Unassigned task: use any available slot
-            slot_index = min(range(len(lane_capacity.available_at)), key=lambda i: lane_capacity.available_at[i])
-            slot_ready = lane_capacity.available_at[slot_index]
+            slot_ready, slot_index = lane_capacity.claim_slot()
             # Final start: max(dependencies, slot availability, anchor date)
             start_week = max(dep_end, slot_ready, min_start_week)
+            duration_weeks = lane_capacity.span_weeks(start_week, duration_weeks)
             end_week = start_week + duration_weeks
-            lane_capacity.available_at[slot_index] = end_week
-
-        start_date = config.start_date + timedelta(weeks=start_week)
-        end_date = config.start_date + timedelta(weeks=end_week)
-        scheduled_issue = ScheduledIssue(
-            key=issue.key,
-            summary=issue.summary,
-            lane=lane,
-            start_date=start_date,
-            end_date=end_date,
-            blocked_by=dependencies.get(issue.key, []),
-            scheduled_reason="scheduled",
-            duration_weeks=duration_weeks,
-            assignee=issue.assignee,
+            slot_until = end_week
+            lane_capacity.occupy_slot(slot_index, end_week)
+
+        result = self.placed(issue, lane, start_week, end_week, duration_weeks, "scheduled")
+        return PlacementStep(
+            "scheduled", lane, result, True,
+            slot_index=slot_index,
+            slot_until=slot_until,
+            assignee_until=end_week if issue_assignee else None,
         )
-        scheduled[key] = scheduled_issue
-        all_scheduled[key] = scheduled_issue  # Also track in iteration map
-
-    # Post-pass: schedule incomplete tasks after all regular work.
-    # They consume assignee time slots (the work happened) and are placed
-    # sequentially after the assignee's last scheduled task, extending past
-    # sprint end to show the sprint overflowed.
-    incomplete_issues = [
-        issue for issue in issues
-        if normalize_status(issue.status) == INCOMPLETE_STATUS
-        and issue.key not in scheduled
-        and issue.key not in unschedulable
-    ]
-    for issue in incomplete_issues:
-        lane = issue.team or "Unassigned"
-        if config.lane_mode == "assignee":
-            lane = issue.assignee or issue.team or "Unassigned"
-        lane_capacity = capacities.get(lane)
+
+    def place_incomplete(self, issue: Issue) -> Optional[PlacementStep]:
+        lane = self.lane_for(issue)
+        lane_capacity = self.capacities.get(lane)
         if not lane_capacity:
-            continue
-        duration_weeks = compute_duration_weeks(
-            issue.story_points,
-            config.sp_to_weeks,
-            lane_capacity.capacity_factor,
-        )
+            return None
+        duration_weeks = self.issue_duration(issue, lane_capacity)
         if duration_weeks is None:
-            unschedulable[issue.key] = ScheduledIssue(
-                key=issue.key,
-                summary=issue.summary,
-                lane=lane,
-                start_date=None,
-                end_date=None,
-                blocked_by=dependencies.get(issue.key, []),
-                scheduled_reason="missing_story_points",
-                assignee=issue.assignee,
-            )
-            continue
+            return PlacementStep("incomplete", lane, self.unplaced(issue, lane, "missing_story_points"), False)
         issue_assignee = issue.assignee
         if issue_assignee and issue_assignee in lane_capacity.assignee_available_at:
             start_week = lane_capacity.assignee_available_at[issue_assignee]
         else:
             # No prior work for this assignee — start at anchor
-            anchor = config.anchor_date or config.start_date
-            start_week = max(0.0, (anchor - config.start_date).days / 7.0)
+            start_week = self.anchor_week
+        duration_weeks = lane_capacity.span_weeks(start_week, duration_weeks)
         end_week = start_week + duration_weeks
-        start_date = config.start_date + timedelta(weeks=start_week)
-        end_date = config.start_date + timedelta(weeks=end_week)
         if issue_assignee:
             lane_capacity.assignee_available_at[issue_assignee] = end_week
-        scheduled[issue.key] = ScheduledIssue(
-            key=issue.key,
-            summary=issue.summary,
-            lane=lane,
-            start_date=start_date,
-            end_date=end_date,
-            blocked_by=dependencies.get(issue.key, []),
-            scheduled_reason="incomplete",
-            duration_weeks=duration_weeks,
-            assignee=issue.assignee,
+        result = self.placed(issue, lane, start_week, end_week, duration_weeks, "incomplete")
+        return PlacementStep(
+            "incomplete", lane, result, True, assignee_until=end_week if issue_assignee else None,
         )
 
-    all_results = {**scheduled, **unschedulable}
-    return list(all_results.values()), scheduled
+    def run(self) -> Tuple[List[ScheduledIssue], Dict[str, ScheduledIssue]]:
+        issues = self.issues
+        config = self.config
+        for issue in issues:
+            if not issue.story_points:
+                self.unschedulable[issue.key] = self.unplaced(issue, issue.team or "Unassigned", "missing_story_points")
+
+        # Handle completed tasks
+        for issue in issues:
+            status = normalize_status(issue.status)
+            if status in DONE_STATUSES:
+                self.scheduled[issue.key] = ScheduledIssue(
+                    key=issue.key,
+                    summary=issue.summary,
+                    lane=issue.team or "Unassigned",
+                    start_date=config.start_date,
+                    end_date=config.start_date,
+                    blocked_by=self.dependencies.get(issue.key, []),
+                    scheduled_reason="already_done",
+                    duration_weeks=0.0,
+                    assignee=issue.assignee,
+                )
+
+        # Handle in-progress tasks (schedule before "to do")
+        for issue in issues:
+            if issue.key in self.scheduled or issue.key in self.unschedulable:
+                continue
+            if normalize_status(issue.status) in IN_PROGRESS_STATUSES:
+                self.place("in_progress", issue)
+
+        order = topo_sort(self.issue_map, self.dependency_keys)
+
+        # Handle tasks in circular dependencies (not in topo order)
+        order_set = set(order)
+        remaining_keys = list(dict.fromkeys(
+            issue.key for issue in issues
+            if issue.key not in order_set and issue.key not in self.scheduled and issue.key not in self.unschedulable
+        ))
+        if remaining_keys:
+            order = list(order) + order_cyclic_remainder(
+                remaining_keys, self.issue_map, self.dependency_keys, order_set | set(self.scheduled.keys()),
+            )
+
+        for key in order:
+            if key in self.scheduled or key in self.unschedulable:
+                continue
+            self.place("scheduled", self.issue_map[key])
+
+        # Post-pass: schedule incomplete tasks after all regular work.
+        # They consume assignee time slots (the work happened) and are placed
+        # sequentially after the assignee's last scheduled task, extending past
+        # sprint end to show the sprint overflowed.
+        incomplete_issues = [
+            issue for issue in issues
+            if normalize_status(issue.status) == INCOMPLETE_STATUS
+            and issue.key not in self.scheduled
+            and issue.key not in self.unschedulable
+        ]
+        for issue in incomplete_issues:
+            self.place("incomplete", issue)
+
+        all_results = {**self.scheduled, **self.unschedulable}
+        return list(all_results.values()), self.scheduled
+
+
+def schedule_issues(
+    issues: List[Issue],
+    dependencies: Dict[str, List[str]],
+    config: ScenarioConfig,
+    duration_scale: Optional[Dict[str, float]] = None,
+) -> Tuple[List[ScheduledIssue], Dict[str, ScheduledIssue]]:
+    """``duration_scale`` multiplies individual issue durations (forecast samples)."""
+    if config.engine == "numpy" and not config.weekly_capacity:
+        from .vectorized import numpy_available, schedule_issues_vectorized
+
+        if numpy_available():
+            return schedule_issues_vectorized(issues, dependencies, config, duration_scale)
+    return ScheduleRun(issues, dependencies, config, duration_scale).run()
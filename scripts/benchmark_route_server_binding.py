@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Measure the per-request cost of reaching jira_server from a route blueprint.
+
+Blueprints used to copy every attribute of ``jira_server`` into their module
+globals from a ``before_request`` hook. They now read ``server.NAME`` through
+the facade in ``backend.routes``, bound once at registration. This times one
+namespace copy (what each request paid before) against a request's worth of
+facade reads on the real module.
+
+    python scripts/benchmark_route_server_binding.py --reads 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import timeit
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def copy_server_globals(server, target_globals):
+    """The removed ``bind_server_globals``, kept here as the baseline."""
+    for name, value in server.__dict__.items():
+        if name.startswith("__") or name in {"bp", "bind_server_globals", "get_jira_server"}:
+            continue
+        target_globals[name] = value
+    target_globals["_jira_server_module"] = server
+
+
+def measure(reads: int, number: int) -> dict:
+    os.environ.setdefault("JIRA_AUTH_MODE", "basic")
+    os.environ.setdefault("CONFIG_STORAGE_BACKEND", "jsonfile")
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.insert(0, str(REPO_ROOT))
+    import jira_server
+    from backend.routes import server
+
+    names = [name for name in vars(jira_server) if not name.startswith("_")][:reads]
+    target_globals = {}
+
+    def facade_reads():
+        for name in names:
+            getattr(server, name)
+
+    copy_seconds = min(timeit.repeat(lambda: copy_server_globals(jira_server, target_globals), number=number, repeat=5))
+    facade_seconds = min(timeit.repeat(facade_reads, number=number, repeat=5))
+    return {
+        "serverAttributes": len(vars(jira_server)),
+        "readsPerRequest": len(names),
+        "copyPerRequestMicros": round(copy_seconds / number * 1e6, 2),
+        "facadePerRequestMicros": round(facade_seconds / number * 1e6, 2),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reads", type=int, default=20, help="server attributes a request reads")
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args(argv)
+    print(json.dumps(measure(args.reads, args.number)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
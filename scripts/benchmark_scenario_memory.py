@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Measure memory of a synthetic POST /api/scenario.
+
+Jira is replaced by a generated snapshot decoded from JSON on every call, so
+strings are fresh objects and the payload is released after the request, as
+with a real response. The scenario runs in a
+fresh interpreter and reports the traced Python heap peak, what stays
+allocated afterwards (the cached scenario), and the peak RSS growth over the
+imported app.
+
+    python scripts/benchmark_scenario_memory.py --issues 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+TEAMS = [f"Team {index}" for index in range(12)]
+STATUSES = ["To Do", "To Do", "Accepted", "In Progress", "In Review", "Done", "Blocked"]
+PRIORITIES = ["Blocker", "High", "Medium", "Medium", "Low"]
+
+
+def build_snapshot(issue_count: int, seed: int = 7) -> dict:
+    """JSON bodies for the Jira fetchers the scenario endpoint calls."""
+    rng = random.Random(seed)
+    assignees = [f"Person {index}" for index in range(max(1, issue_count // 40))]
+    epics = [f"EPIC-{index}" for index in range(max(1, issue_count // 25))]
+    issues = []
+    for index in range(issue_count):
+        team = rng.choice(TEAMS)
+        issues.append({
+            "key": f"PROD-{index}",
+            "fields": {
+                "summary": f"Synthetic issue {index} for scenario memory benchmark {rng.random():.12f}",
+                "customfield_team": {"id": f"team-{TEAMS.index(team)}", "name": team},
+                "customfield_epic": rng.choice(epics),
+                "assignee": {"displayName": rng.choice(assignees)},
+                "issuetype": {"name": rng.choice(["Story", "Task", "Bug"])},
+                "customfield_10004": rng.choice([1, 2, 3, 5, 8]),
+                "priority": {"name": rng.choice(PRIORITIES)},
+                "status": {"name": rng.choice(STATUSES)},
+                "timetracking": {"timeSpentSeconds": rng.choice([None, 28800, 57600])},
+            },
+        })
+    dependencies = {}
+    for index in range(1, issue_count):
+        if rng.random() < 0.3:
+            prereq = f"PROD-{rng.randrange(index)}"
+            dependent = f"PROD-{index}"
+            dependencies.setdefault(dependent, []).append({
+                "key": prereq, "prereqKey": prereq, "dependentKey": dependent, "category": "dependency",
+            })
+    epic_issues = [{"key": key, "fields": {"summary": f"Synthetic epic {key}"}} for key in epics]
+    return {
+        "fetch_issues_by_jql": json.dumps(issues),
+        "fetch_issues_by_keys": json.dumps(epic_issues),
+        "collect_dependencies": json.dumps(dependencies),
+    }
+
+
+def measure(issue_count: int) -> dict:
+    import tracemalloc
+    from contextlib import ExitStack
+    from unittest.mock import patch
+
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.insert(0, str(REPO_ROOT))
+    import jira_server
+
+    responses = build_snapshot(issue_count)
+    client = jira_server.app.test_client()
+    baseline_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    tracemalloc.start()
+    fakes = {
+        "resolve_team_field_id": lambda *args, **kwargs: "customfield_team",
+        "resolve_epic_link_field_id": lambda *args, **kwargs: "customfield_epic",
+        "get_story_points_field_id": lambda *args, **kwargs: "customfield_10004",
+        "fetch_capacity_team_sizes": lambda *args, **kwargs: ({}, {}),
+    }
+    for name, text in responses.items():
+        # Decoded per call, so the raw Jira payload is garbage once the request is done.
+        fakes[name] = lambda *args, _text=text, **kwargs: json.loads(_text)
+    with ExitStack() as stack:
+        stack.enter_context(patch.object(jira_server, "JIRA_AUTH_MODE", "basic"))
+        for name, fake in fakes.items():
+            # Plain functions, not mocks: mocks would record (and keep) every call.
+            stack.enter_context(patch.object(jira_server, name, fake))
+        response = client.post("/api/scenario", json={"filters": {"sprint": "2026Q2"}, "config": {}})
+        retained, _ = tracemalloc.get_traced_memory()
+    _, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    if response.status_code != 200:
+        raise SystemExit(f"scenario failed: {response.status_code} {response.get_data(as_text=True)[:200]}")
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        "issues": issue_count,
+        "tracedPeakMiB": round(traced_peak / 2 ** 20, 1),
+        "retainedMiB": round(retained / 2 ** 20, 1),
+        "rssGrowthMiB": round((peak_rss - baseline_rss) / 1024, 1),
+        "peakRssMiB": round(peak_rss / 1024, 1),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--issues", type=int, default=10000)
+    parser.add_argument("--inline", action="store_true", help="measure in this process instead of a fresh one")
+    args = parser.parse_args(argv)
+    if args.inline:
+        print(json.dumps(measure(args.issues)))
+        return 0
+    env = {**os.environ, "JIRA_AUTH_MODE": "basic", "CONFIG_STORAGE_BACKEND": "jsonfile"}
+    result = subprocess.run(
+        [sys.executable, __file__, "--issues", str(args.issues), "--inline"],
+        env=env, cwd=REPO_ROOT, capture_output=True, text=True, check=False,
+    )
+    if result.returncode != 0:
+        sys.stderr.write(result.stderr)
+        return result.returncode
+    print(result.stdout.strip().splitlines()[-1])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
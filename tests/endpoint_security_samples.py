@@ -7,11 +7,13 @@ ROUTE_SAMPLES = {
     "/api/epm/projects/<path:project_id>/rollup": "/api/epm/projects/home-project-1/rollup",
     "/api/me/views/<view_id>": "/api/me/views/view-1",
     "/api/scenario/drafts/<draft_id>/events": "/api/scenario/drafts/draft-1/events",
+    "/api/scenario/drafts/<draft_id>/events/join": "/api/scenario/drafts/draft-1/events/join",
     "/api/scenario/drafts/<draft_id>/events/stream": "/api/scenario/drafts/draft-1/events/stream",
     "/api/scenario/drafts/<draft_id>/locks": "/api/scenario/drafts/draft-1/locks",
     "/api/scenario/drafts/<draft_id>/presence": "/api/scenario/drafts/draft-1/presence",
     "/api/scenario/drafts/<draft_id>/reload-from-jira": "/api/scenario/drafts/draft-1/reload-from-jira",
     "/api/scenario/drafts/<draft_id>/rollback": "/api/scenario/drafts/draft-1/rollback",
+    "/api/scenario/drafts/<draft_id>/versions": "/api/scenario/drafts/draft-1/versions",
     "/api/scenario/drafts/<draft_id>/versions/<int:version_number>": "/api/scenario/drafts/draft-1/versions/1",
     "/api/scenario/drafts/<draft_id>/writeback": "/api/scenario/drafts/draft-1/writeback",
     "/api/scenario/drafts/<draft_id>/writeback/preview": "/api/scenario/drafts/draft-1/writeback/preview",
@@ -15,7 +15,7 @@ BACKEND_EPM_ROUTES_PATH = REPO_ROOT / "backend" / "routes" / "epm_routes.py"
 BACKEND_ENG_ROUTES_PATH = REPO_ROOT / "backend" / "routes" / "eng_routes.py"
 BACKEND_SETTINGS_ROUTES_PATH = REPO_ROOT / "backend" / "routes" / "settings_routes.py"
 BACKEND_ROUTE_GROUPS = {
-    "scenario": (REPO_ROOT / "backend" / "routes" / "scenario_routes.py", ("/api/scenario", "/api/scenario/overrides")),
+    "scenario": (REPO_ROOT / "backend" / "routes" / "scenario_routes.py", ("/api/scenario", "/api/scenario/overrides", "/api/scenario/reschedule", "/api/scenario/compare")),
     "stats": (REPO_ROOT / "backend" / "routes" / "stats_routes.py", ("/api/stats", "/api/stats/burnout", "/api/stats/epic-cohort", "/api/stats/excluded-capacity-source")),
     "capacity": (REPO_ROOT / "backend" / "routes" / "capacity_routes.py", ("/api/capacity", "/api/planned-capacity")),
     "export": (REPO_ROOT / "backend" / "routes" / "export_routes.py", ("/api/export-excel",)),
@@ -41,6 +41,7 @@ APP_ROUTE_EPM_PATTERN = re.compile(
 )
 ENG_ROUTE_PATHS = (
     "/api/dependencies",
+    "/api/dependencies/graph",
     "/api/issues/lookup",
     "/api/issues/subtasks",
     "/api/missing-info",
@@ -111,6 +112,20 @@ class BackendRouteSourceGuardTests(unittest.TestCase):
         with patch.dict(sys.modules, {"__main__": main_module, "jira_server": named_module}):
             self.assertIs(get_jira_server(), main_module)
 
+    def test_route_server_facade_reads_live_server_attributes(self):
+        import jira_server
+        from backend.routes import eng_routes, server
+
+        sentinel = object()
+        with patch.object(jira_server, "oauth_session_data", return_value=sentinel):
+            self.assertIs(server.oauth_session_data(), sentinel)
+            self.assertIs(eng_routes.server.oauth_session_data(), sentinel)
+        self.assertIs(server.oauth_session_data, jira_server.oauth_session_data)
+        self.assertNotIn("oauth_session_data", vars(eng_routes))
+
+        hook_names = [hook.__name__ for hooks in jira_server.app.before_request_funcs.values() for hook in hooks]
+        self.assertNotIn("_sync_server_globals", hook_names)
+
     def test_package_7d_route_blueprint_modules_exist(self):
         missing = [
             str(path.relative_to(REPO_ROOT))
@@ -292,7 +307,7 @@ class BackendRouteSourceGuardTests(unittest.TestCase):
         route_source = BACKEND_ENG_ROUTES_PATH.read_text(encoding="utf8")
 
         self.assertIn("def get_tasks_with_team_name():", route_source)
-        self.assertIn("return fetch_tasks(include_team_name=True)", route_source)
+        self.assertIn("return server.fetch_tasks(include_team_name=True)", route_source)
 
     def test_eng_task_endpoint_reports_server_timing_header(self):
         import jira_server
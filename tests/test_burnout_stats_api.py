@@ -28,6 +28,7 @@ class TestBurnoutStatsApi(unittest.TestCase):
         app = jira_server.app
         app.testing = True
         self.client = app.test_client()
+        jira_server.JIRA_CHANGELOGS.clear()
 
     def test_burnout_uses_changelog_and_event_date_state(self):
         calls = []
@@ -90,6 +91,44 @@ class TestBurnoutStatsApi(unittest.TestCase):
         self.assertIn('status CHANGED TO ("Done","Killed","Incomplete")', request_payload.get('jql', ''))
         self.assertIn('Sprint in ("2026Q1")', request_payload.get('jql', ''))
 
+    def test_repeat_burnout_reuses_cached_changelogs_for_unchanged_issues(self):
+        calls = []
+        issue = {
+            'key': 'TECH-25400',
+            'fields': {
+                'updated': '2026-03-05T23:30:00.000+0000',
+                'assignee': None,
+                'customfield_30101': {'id': 'T1', 'name': 'Team A'}
+            },
+            'changelog': {
+                'histories': [
+                    {
+                        'id': '10',
+                        'created': '2026-03-05T10:00:00.000+0000',
+                        'items': [{'field': 'status', 'fromString': 'In Progress', 'toString': 'Done'}]
+                    }
+                ]
+            }
+        }
+
+        def fake_search(payload):
+            calls.append(payload)
+            returned = dict(issue) if 'changelog' in (payload.get('expand') or []) else {'key': issue['key'], 'fields': dict(issue['fields'])}
+            return DummyResponse({'issues': [returned], 'total': 1})
+
+        with patch.object(jira_server, 'jira_search_request', side_effect=fake_search), \
+             patch.object(jira_server, 'load_sprints_cache', return_value=None), \
+             patch.object(jira_server, 'resolve_team_field_id', return_value='customfield_30101'):
+            first = self.client.get('/api/stats/burnout?sprint=2026Q1&team=T1')
+            second = self.client.get('/api/stats/burnout?sprint=2026Q1&team=T1')
+
+        self.assertEqual(first.status_code, 200, first.get_data(as_text=True))
+        self.assertEqual(second.get_json()['data']['events'], first.get_json()['data']['events'])
+        self.assertEqual(len(second.get_json()['data']['events']), 1)
+        self.assertEqual(len(calls), 2)
+        self.assertIn('changelog', calls[0].get('expand', []))
+        self.assertNotIn('expand', calls[1])
+
     def test_burnout_team_filter_applies_to_events(self):
         issue = {
             'key': 'TECH-25314',
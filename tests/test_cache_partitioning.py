@@ -56,7 +56,7 @@ class TestCachePartitioning(unittest.TestCase):
         jira_server.EPM_PROJECTS_CACHE['projects'] = {'data': {}}
         jira_server.EPM_ISSUES_CACHE['issues'] = {'data': {}}
         jira_server.EPM_ROLLUP_CACHE['rollup'] = {'data': {}}
-        jira_server.SCENARIO_CACHE['data'] = {'ok': True}
+        jira_server.SCENARIO_CACHE.put('scenario', 'digest', {'ok': True})
         jira_server.PROJECTS_CACHE['data'] = [{'key': 'ABC'}]
         jira_server.PROJECTS_CACHE['timestamp'] = 123
         jira_server.COMPONENTS_CACHE['data'] = [{'name': 'Component'}]
@@ -77,7 +77,7 @@ class TestCachePartitioning(unittest.TestCase):
         self.assertEqual(jira_server.EPM_PROJECTS_CACHE, {})
         self.assertEqual(jira_server.EPM_ISSUES_CACHE, {})
         self.assertEqual(jira_server.EPM_ROLLUP_CACHE, {})
-        self.assertIsNone(jira_server.SCENARIO_CACHE['data'])
+        self.assertIsNone(jira_server.SCENARIO_CACHE.latest('scenario'))
         self.assertIsNone(jira_server.PROJECTS_CACHE['data'])
         self.assertIsNone(jira_server.COMPONENTS_CACHE['data'])
         self.assertEqual(jira_server.EPICS_SEARCH_CACHE, {})
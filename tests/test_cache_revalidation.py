@@ -0,0 +1,74 @@
+import threading
+import unittest
+
+from backend.services.cache_revalidation import (
+    CACHE_EXPIRED,
+    CACHE_FRESH,
+    CACHE_STALE,
+    classify_cache_entry,
+    resolve_hard_ttl_seconds,
+    revalidate_in_background,
+)
+from backend.services.single_flight import SingleFlight
+
+
+class TestCacheRevalidation(unittest.TestCase):
+    def test_classifies_entries_against_soft_and_hard_ttl(self):
+        entry = {'timestamp': 100, 'data': {}}
+
+        self.assertEqual(classify_cache_entry(entry, 60, 180, now=150), CACHE_FRESH)
+        self.assertEqual(classify_cache_entry(entry, 60, 180, now=200), CACHE_STALE)
+        self.assertEqual(classify_cache_entry(entry, 60, 180, now=280), CACHE_EXPIRED)
+        self.assertEqual(classify_cache_entry(entry, 60, 0, now=200), CACHE_EXPIRED)
+        self.assertEqual(classify_cache_entry(None, 60, 180, now=100), CACHE_EXPIRED)
+
+    def test_hard_ttl_defaults_to_multiple_and_never_drops_below_soft(self):
+        self.assertEqual(resolve_hard_ttl_seconds('HARD_TTL', 300, environ={}), 900)
+        self.assertEqual(resolve_hard_ttl_seconds('HARD_TTL', 300, environ={'HARD_TTL': '600'}), 600)
+        self.assertEqual(resolve_hard_ttl_seconds('HARD_TTL', 300, environ={'HARD_TTL': '0'}), 300)
+        self.assertEqual(resolve_hard_ttl_seconds('HARD_TTL', 300, environ={'HARD_TTL': 'soon'}), 900)
+
+    def test_starts_one_background_refresh_per_key(self):
+        flights = SingleFlight(wait_seconds=5)
+        release = threading.Event()
+        finished = threading.Event()
+        calls = []
+
+        def refresh():
+            calls.append(1)
+            release.wait(5)
+            finished.set()
+
+        self.assertTrue(revalidate_in_background(flights, ('tasks', 'k'), refresh))
+        self.assertFalse(revalidate_in_background(flights, ('tasks', 'k'), refresh))
+        release.set()
+        finished.wait(5)
+        for _ in range(100):
+            if flights.stats()['inflight'] == 0:
+                break
+            threading.Event().wait(0.01)
+
+        self.assertEqual(calls, [1])
+        self.assertEqual(flights.stats()['inflight'], 0)
+
+    def test_failed_refresh_releases_the_key(self):
+        flights = SingleFlight(wait_seconds=5)
+        done = threading.Event()
+
+        def refresh():
+            done.set()
+            raise RuntimeError('jira down')
+
+        with self.assertLogs('backend.services.cache_revalidation', level='ERROR'):
+            revalidate_in_background(flights, 'k', refresh)
+            done.wait(5)
+            for _ in range(100):
+                if flights.stats()['inflight'] == 0:
+                    break
+                threading.Event().wait(0.01)
+
+        self.assertTrue(flights.join('k').leader)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+from unittest.mock import Mock
+
+from backend.services.changelog_cache import ChangelogCache
+
+
+def _history(history_id, created, to_status='Done'):
+    return {'id': history_id, 'created': created, 'items': [{'field': 'status', 'toString': to_status}]}
+
+
+def _page(values, is_last=True, total=None, status_code=200):
+    response = Mock()
+    response.status_code = status_code
+    payload = {'values': values, 'isLast': is_last}
+    if total is not None:
+        payload['total'] = total
+    response.json.return_value = payload
+    return response
+
+
+class TestChangelogCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = ChangelogCache({})
+        self.cache.resolve('site', 'A-1', updated='t1', embedded={'histories': [
+            _history('2', '2026-01-02T00:00:00.000+0000'), _history('1', '2026-01-01T00:00:00.000+0000'),
+        ]})
+
+    def test_matching_updated_is_served_without_jira(self):
+        fetch_page = Mock()
+
+        histories = self.cache.resolve('site', 'A-1', updated='t1', fetch_page=fetch_page)
+
+        self.assertEqual([history['id'] for history in histories], ['1', '2'])
+        fetch_page.assert_not_called()
+        self.assertIsNone(self.cache.resolve('other-site', 'A-1', updated='t1'))
+
+    def test_moved_updated_fetches_only_entries_after_the_cached_count(self):
+        fetch_page = Mock(return_value=_page([_history('3', '2026-01-03T00:00:00.000+0000')]))
+
+        histories = self.cache.resolve('site', 'A-1', updated='t2', fetch_page=fetch_page)
+
+        fetch_page.assert_called_once_with(2)
+        self.assertEqual([history['id'] for history in histories], ['1', '2', '3'])
+        self.assertTrue(self.cache.is_fresh('site', 'A-1', 't2'))
+
+    def test_truncated_embedded_changelog_pages_the_rest_and_keeps_first_copy(self):
+        cache = ChangelogCache({})
+        fetch_page = Mock(return_value=_page([
+            _history('1', '2026-01-01T00:00:00.000+0000', to_status='Killed'),
+            _history('2', '2026-01-02T00:00:00.000+0000'),
+        ]))
+
+        histories = cache.resolve('site', 'A-2', updated='t1', fetch_page=fetch_page, embedded={
+            'histories': [_history('1', '2026-01-01T00:00:00.000+0000')], 'total': 2,
+        })
+
+        fetch_page.assert_called_once_with(1)
+        self.assertEqual([history['items'][0]['toString'] for history in histories], ['Done', 'Done'])
+
+    def test_shrunk_history_is_refetched_from_the_start(self):
+        fetch_page = Mock(side_effect=[_page([], total=1), _page([_history('9', '2026-02-01T00:00:00.000+0000')])])
+
+        histories = self.cache.resolve('site', 'A-1', updated='t3', fetch_page=fetch_page)
+
+        self.assertEqual([call.args[0] for call in fetch_page.call_args_list], [2, 0])
+        self.assertEqual([history['id'] for history in histories], ['9'])
+
+    def test_failed_extension_returns_none_and_keeps_the_old_entry(self):
+        histories = self.cache.resolve('site', 'A-1', updated='t2', fetch_page=Mock(return_value=_page([], status_code=503)))
+
+        self.assertIsNone(histories)
+        self.assertTrue(self.cache.is_fresh('site', 'A-1', 't1'))
+
+    def test_note_query_reports_repeats_until_cleared(self):
+        self.assertFalse(self.cache.note_query('site', 'jql'))
+        self.assertTrue(self.cache.note_query('site', 'jql'))
+        self.cache.clear()
+        self.assertFalse(self.cache.note_query('site', 'jql'))
+        self.assertFalse(self.cache.known('site', 'A-1'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -29,7 +29,31 @@ LEGACY_ENTRYPOINT_LINE_BUDGETS = {
     # diagnostics hook (jep.static_diagnostics) scoped to document/frontend-dist requests,
     # to identify the real owner of a reported repeated-request burst (+37 lines); remove
     # once the navigation owner is identified, per the hook's own removal-criterion comment.
-    "jira_server.py": 6236,
+    # perf/bounded-process-caches swaps the unbounded response-cache dicts for named
+    # ProcessCache instances in place; only the register_process_cache import is new (+1).
+    # perf/single-flight coalesces identical concurrent Jira fetches (fetch_tasks leader/
+    # follower join, stats/burnout/cohort/excluded-capacity fetcher wrapping) (+17).
+    # perf/stale-while-revalidate adds soft/hard TTL settings for the tasks, missing-info
+    # and EPM rollup caches and the fetch_tasks stale-serve + background refresh path (+16).
+    # perf/incremental-task-sync adds the fetch_tasks updated>= delta refresh against the cached
+    # snapshot and reuses epic details for epics whose children did not change (+22).
+    # perf/issue-store adds the opt-in write-through issue store and its read-through branch in
+    # the fetch_issues_by_keys/_by_jql wrappers (+19).
+    # perf/changelog-cache routes burnout, cohort and Project Track changelogs through the
+    # append-only changelog cache; _fetch_full_issue_changelog folds into it (+17).
+    # perf/scenario-forecast adds the optional config.forecast block to /api/scenario and
+    # registers the forecast cache and process pool (+9).
+    # perf/incremental-reschedule adds config.incremental schedule sessions and
+    # POST /api/scenario/reschedule (+19).
+    # perf/scenario-compare splits the scenario body into build_scenario_result so
+    # POST /api/scenario/compare can share one Jira snapshot across variants (+50).
+    # perf/capacity-aware-scenario fetches team sizes and planned capacity on the
+    # Jira fan-out next to the issue search (+25).
+    # perf/dependency-graph-index records collect_dependencies reads in the per-site
+    # dependency graph and widens scenario context by config.context_depth (+25).
+    # perf/scenario-result-cache versions cached /api/scenario results by a light
+    # 'updated'-only search of the scenario scope (+10).
+    "jira_server.py": 6410,
     # feature/eng-epic-sort-and-track adds the epic Sort dropdown wiring (engEpicSort state,
     # analytics handler, sorted epicGroups, EngView props) and the title-row priority chevron
     # plus Product Track indicator in renderEpicBlock.
@@ -272,6 +272,97 @@ class TestCreateStoriesAlertPayloads(unittest.TestCase):
         self.assertEqual(response.status_code, 200, response.get_data(as_text=True))
         self.assertEqual(epics_fetch.call_args.args[-2], ['team_alpha_label', 'team_beta_label'])
 
+    def test_fetch_tasks_keeps_the_capped_multi_team_search_in_one_ordered_query(self):
+        app = jira_server.app
+        app.testing = True
+        client = app.test_client()
+        searched_jql = []
+
+        def fake_search(payload):
+            searched_jql.append(payload['jql'])
+            return _mock_response(200, {
+                'issues': [{'key': key, 'fields': {'summary': key}} for key in ('TEAM-B-1', 'TEAM-A-1')],
+                'names': {'customfield_team': 'Team[Team]'},
+                'total': 2,
+                'isLast': True,
+            })
+
+        with patch.object(jira_server, 'JIRA_SEARCH_SHARD_WORKERS', 2), \
+             patch.object(jira_server, 'build_base_jql', return_value='project = TEST'), \
+             patch.object(jira_server, 'resolve_team_field_id', return_value='customfield_team'), \
+             patch.object(jira_server, 'resolve_epic_link_field_id', return_value='customfield_epic_link'), \
+             patch.object(jira_server, 'get_sprint_field_id', return_value='customfield_sprint'), \
+             patch.object(jira_server, 'fetch_epic_details_bulk', return_value={}), \
+             patch.object(jira_server, 'fetch_epics_for_empty_alert', return_value=[]), \
+             patch.object(jira_server, 'fetch_story_counts_for_epics', return_value={}), \
+             patch.object(jira_server, 'fetch_story_distribution_for_epics', return_value={}), \
+             patch.object(jira_server, 'jira_search_request', side_effect=fake_search):
+            response = client.get('/api/tasks-with-team-name?sprint=123&team=all&teamIds=team-a,team-b&refresh=true')
+
+        self.assertEqual(response.status_code, 200, response.get_data(as_text=True))
+        self.assertEqual([issue['key'] for issue in response.get_json()['issues']], ['TEAM-B-1', 'TEAM-A-1'])
+        self.assertEqual(len(searched_jql), 1)
+        self.assertIn('"Team[Team]" in ("team-a", "team-b")', searched_jql[0])
+        self.assertNotIn('jira-shard-0;dur=', response.headers.get('Server-Timing', ''))
+
+    def test_fetch_tasks_refresh_merges_updated_issues_into_the_cached_snapshot(self):
+        app = jira_server.app
+        app.testing = True
+        client = app.test_client()
+        searched = []
+
+        def issue(key, summary, epic_key):
+            return {'key': key, 'fields': {'summary': summary, 'parent': {'key': epic_key, 'fields': {'issuetype': {'name': 'Epic'}}}}}
+
+        def fake_search(payload):
+            jql = payload['jql']
+            searched.append((jql, payload['fields']))
+            if 'updated >= -' in jql:
+                issues = [issue('STORY-2', 'renamed', 'EPIC-2')]
+            elif payload['fields'] == ['key']:
+                issues = [{'key': 'STORY-3'}, {'key': 'STORY-2'}, {'key': 'STORY-1'}]
+            elif jql.startswith('key in'):
+                issues = [issue('STORY-3', 'moved in', 'EPIC-3')]
+            else:
+                issues = [issue('STORY-1', 'first', 'EPIC-1'), issue('STORY-2', 'second', 'EPIC-2'), issue('STORY-4', 'gone', 'EPIC-1')]
+            return _mock_response(200, {'issues': issues, 'names': {}, 'isLast': True})
+
+        def fake_epic_details(epic_keys, *_args):
+            return {key: {'key': key, 'summary': f'{key} details'} for key in epic_keys}
+
+        url = '/api/tasks-with-team-name?sprint=123&team=all'
+        with patch.object(jira_server, 'TASKS_CACHE', {}), \
+             patch.object(jira_server, 'build_base_jql', return_value='project = TEST'), \
+             patch.object(jira_server, 'resolve_team_field_id', return_value=None), \
+             patch.object(jira_server, 'resolve_epic_link_field_id', return_value=None), \
+             patch.object(jira_server, 'get_sprint_field_id', return_value=None), \
+             patch.object(jira_server, 'fetch_epic_details_bulk', side_effect=fake_epic_details) as epic_details_fetch, \
+             patch.object(jira_server, 'fetch_epics_for_empty_alert', return_value=[]), \
+             patch.object(jira_server, 'fetch_story_counts_for_epics', return_value={}), \
+             patch.object(jira_server, 'fetch_story_distribution_for_epics', return_value={}), \
+             patch.object(jira_server, 'jira_search_request', side_effect=fake_search):
+            first = client.get(url)
+            for entry in jira_server.TASKS_CACHE.values():
+                entry['timestamp'] -= jira_server.TASKS_CACHE_HARD_TTL_SECONDS + 1
+                full_synced_at = entry['sync']['fullSyncedAt']
+            searched.clear()
+            second = client.get(url)
+            delta_sync = next(iter(jira_server.TASKS_CACHE.values()))['sync']
+
+        self.assertEqual([item['key'] for item in first.get_json()['issues']], ['STORY-1', 'STORY-2', 'STORY-4'])
+        body = second.get_json()
+        self.assertEqual([item['key'] for item in body['issues']], ['STORY-3', 'STORY-2', 'STORY-1'])
+        self.assertEqual(body['issues'][1]['fields']['summary'], 'renamed')
+        self.assertEqual(len(searched), 3)
+        self.assertIn('updated >= -', searched[0][0])
+        self.assertEqual(searched[1][1], ['key'])
+        self.assertEqual(searched[2][0], 'key in ("STORY-3")')
+        self.assertEqual(set(epic_details_fetch.call_args.args[0]), {'EPIC-2', 'EPIC-3'})
+        self.assertEqual(set(body['epics']), {'EPIC-1', 'EPIC-2', 'EPIC-3'})
+        self.assertIn('jira-delta;desc="2 changed"', second.headers.get('Server-Timing', ''))
+        self.assertEqual(delta_sync['fullSyncedAt'], full_synced_at)
+        self.assertGreaterEqual(delta_sync['syncedAt'], full_synced_at)
+
     def test_ready_to_close_fetch_scans_non_epic_child_work_and_explicit_epic_keys(self):
         app = jira_server.app
         app.testing = True
@@ -165,6 +165,21 @@ class DbAdminRoutesTests(unittest.TestCase):
         self.assertNotIn('service-token-123', str(body))
         self.assertNotIn('refresh-123', str(body))
 
+    def test_admin_can_read_pool_diagnostics(self):
+        self._install_session(account_id='admin-account', connection_id=self.admin_connection_id)
+
+        with self._env_patch(), patch.object(jira_server, 'JIRA_AUTH_MODE', 'atlassian_oauth'):
+            response = self.client.get('/api/admin/diagnostics/pools')
+
+        self.assertEqual(response.status_code, 200)
+        body = response.get_json()
+        self.assertEqual(body['httpSessions']['poolMaxsize'], jira_server.HTTP_SESSION.pool_maxsize)
+        self.assertIn('tasks', body['processCaches'])
+        self.assertIn('inflight', body['singleFlight'])
+        self.assertIn('maxWorkers', body['jiraFanout'])
+        self.assertIn('throttledWaitSeconds', body['jiraRateLimiter'])
+        self.assertIn('maxWorkers', body['scenarioForecastPool'])
+
     def test_non_admin_cannot_read_admin_users(self):
         self._install_session(account_id='normal-account', connection_id=self.normal_connection_id)
 
@@ -0,0 +1,167 @@
+import os
+import unittest
+from unittest.mock import patch
+
+import jira_server
+from backend.services.dependency_graph import DOWNSTREAM, UPSTREAM, DependencyGraph
+
+
+BLOCKS = {'name': 'Blocks', 'inward': 'is blocked by', 'outward': 'blocks'}
+
+
+def _jira_issue(key, blocks=(), updated='2026-01-05T10:00:00.000+0000', epic=None):
+    parent = {'parent': {'key': epic, 'fields': {'issuetype': {'name': 'Epic'}}}} if epic else {}
+    return {
+        'key': key,
+        'fields': {
+            **parent,
+            'summary': f'Issue {key}',
+            'status': {'name': 'To Do'},
+            'issuetype': {'name': 'Story'},
+            'customfield_10004': 1,
+            'updated': updated,
+            'issuelinks': [
+                {'type': BLOCKS, 'outwardIssue': {'key': other, 'fields': {'summary': f'Issue {other}'}}}
+                for other in blocks
+            ],
+        },
+    }
+
+
+class DependencyGraphTests(unittest.TestCase):
+    def test_edges_live_while_an_endpoint_reports_them(self):
+        graph = DependencyGraph()
+        graph.record('A-1', 't1', {('A-1', 'B-1', 'block')})
+        graph.record('B-1', 't1', {('A-1', 'B-1', 'block'), ('B-1', 'C-1', 'block')})
+
+        self.assertEqual(graph.closure('C-1', UPSTREAM), {'A-1', 'B-1'})
+        self.assertEqual(graph.dependents('A-1'), {'B-1'})
+        version = graph.version
+        self.assertFalse(graph.record('A-1', 't1', {('A-1', 'B-1', 'block')}))
+        self.assertEqual(graph.version, version)
+
+        # A-1 dropped the link; B-1 has not been re-read, so the edge stays until it is.
+        graph.record('A-1', 't2', set())
+        self.assertEqual(graph.prerequisites('B-1'), {'A-1'})
+        graph.record('B-1', 't2', {('B-1', 'C-1', 'block')})
+        self.assertEqual(graph.prerequisites('B-1'), frozenset())
+        self.assertEqual(graph.closure('C-1', UPSTREAM), {'B-1'})
+
+    def test_cycles_and_node_eviction(self):
+        graph = DependencyGraph(max_nodes=3)
+        graph.record('A-1', 't', {('A-1', 'B-1', 'dependency')})
+        graph.record('B-1', 't', {('B-1', 'C-1', 'dependency')})
+        graph.record('C-1', 't', {('C-1', 'A-1', 'block'), ('C-1', 'D-1', 'block')})
+
+        self.assertEqual(graph.cycles(), [('A-1', 'B-1', 'C-1')])
+        self.assertEqual(graph.cycle_of('B-1'), ('A-1', 'B-1', 'C-1'))
+        self.assertEqual(graph.cycle_of('D-1'), ())
+        self.assertEqual(graph.closure('A-1', DOWNSTREAM), {'B-1', 'C-1', 'D-1'})
+
+        graph.record('E-1', 't', set())
+
+        self.assertFalse(graph.known('A-1') and graph.is_fresh('A-1', 't'))
+        self.assertEqual(graph.cycles(), [])
+        self.assertEqual(graph.neighbourhood({'D-1'}, 2), {'D-1', 'C-1', 'B-1', 'A-1'})
+
+    def test_remembered_snapshots_share_the_node_bound(self):
+        graph = DependencyGraph(max_nodes=2)
+        graph.record('A-1', 't', set(), snapshot={'key': 'A-1'})
+        graph.remember([{'key': 'L-1'}, {'key': 'L-2'}])
+        graph.remember([{'key': 'L-1', 'summary': 'again'}])
+
+        self.assertIsNone(graph.snapshot('A-1'))
+        self.assertEqual(graph.snapshot('L-2'), {'key': 'L-2'})
+        self.assertEqual(graph.snapshot('L-1'), {'key': 'L-1', 'summary': 'again'})
+        self.assertEqual(graph.stats()['snapshots'], 2)
+
+
+class DependencyGraphRouteTests(unittest.TestCase):
+    def setUp(self):
+        jira_server.app.config['TESTING'] = True
+        self.client = jira_server.app.test_client()
+        env = patch.dict(os.environ, {'CONFIG_STORAGE_BACKEND': '', 'DATABASE_URL': '', 'TEST_DATABASE_URL': ''})
+        env.start()
+        self.addCleanup(env.stop)
+        for cache in (jira_server.DEPENDENCY_GRAPHS, jira_server.DEPENDENCIES_CACHE, jira_server.SCENARIO_CACHE):
+            cache.clear()
+            self.addCleanup(cache.clear)
+        self.jira = {
+            'A-1': _jira_issue('A-1', blocks=['B-1']),
+            'B-1': _jira_issue('B-1', blocks=['C-1']),
+            'C-1': _jira_issue('C-1'),
+        }
+        self.fetched = []
+
+    def _fetch_by_keys(self, keys, fields):
+        self.fetched.extend(keys)
+        return [self.jira[key] for key in keys if key in self.jira]
+
+    def _patches(self):
+        stack = [
+            patch.object(jira_server, 'JIRA_AUTH_MODE', 'basic'),
+            patch.object(jira_server, 'resolve_team_field_id', return_value=None),
+            patch.object(jira_server, 'resolve_epic_link_field_id', return_value=None),
+            patch.object(jira_server, 'get_story_points_field_id', return_value='customfield_10004'),
+            patch.object(jira_server, 'fetch_issues_by_keys', side_effect=self._fetch_by_keys),
+            patch.object(jira_server, 'fetch_issues_by_jql', return_value=[self.jira['A-1']]),
+            patch.object(jira_server, 'fetch_capacity_team_sizes', return_value=({}, {})),
+            patch.object(jira_server, 'fetch_capacity_for_sprint', return_value=({'enabled': False, 'capacities': {}}, None)),
+        ]
+        for item in stack:
+            item.start()
+            self.addCleanup(item.stop)
+
+    def test_graph_answers_multi_hop_queries_from_earlier_reads(self):
+        self._patches()
+        self.assertEqual(self.client.post('/api/dependencies', json={'keys': ['A-1', 'B-1']}).status_code, 200)
+        fetched = len(self.fetched)
+
+        response = self.client.post('/api/dependencies/graph', json={'keys': ['A-1', 'Z-9']})
+
+        self.assertEqual(response.status_code, 200, response.get_data(as_text=True))
+        body = response.get_json()
+        self.assertEqual(body['graph']['A-1']['dependents'], ['B-1'])
+        self.assertEqual(body['graph']['A-1']['downstream'], ['B-1', 'C-1'])
+        self.assertEqual(body['missing'], ['Z-9'])
+        self.assertEqual(body['issues']['C-1']['summary'], 'Issue C-1')
+        self.assertEqual(len(self.fetched), fetched)
+
+    def test_scenario_context_depth_expands_from_the_graph(self):
+        self._patches()
+        self.client.post('/api/dependencies', json={'keys': ['B-1']})
+        payload = {'filters': {'sprint': '2026Q2', 'search': 'A-1'}, 'config': {'start_date': '2026-01-05'}}
+
+        one_hop = self.client.post('/api/scenario', json=payload).get_json()
+        two_hops = self.client.post('/api/scenario', json={**payload, 'config': {**payload['config'], 'context_depth': 2}}).get_json()
+
+        self.assertEqual(one_hop['focus_set']['context_issue_keys'], ['B-1'])
+        self.assertEqual(two_hops['focus_set']['context_issue_keys'], ['B-1', 'C-1'])
+        self.assertIn({'from': 'B-1', 'to': 'C-1', 'type': 'block'}, two_hops['dependencies'])
+
+    def test_compare_keeps_epic_fetches_out_of_context_issue_snapshots(self):
+        self.jira['B-1'] = _jira_issue('B-1', blocks=['C-1'], epic='E-1')
+        self.jira['C-1'] = _jira_issue('C-1', epic='E-2')
+        self.jira['E-1'] = _jira_issue('E-1')
+        self.jira['E-2'] = _jira_issue('E-2')
+        self._patches()
+        self.client.post('/api/dependencies', json={'keys': ['B-1']})
+        payload = {
+            'filters': {'sprint': '2026Q2', 'search': 'A-1'},
+            'config': {'start_date': '2026-01-05', 'context_depth': 2},
+            'variants': [{'name': 'base'}, {'name': 'wip', 'config': {'wip_limit': 1}}],
+        }
+
+        response = self.client.post('/api/scenario/compare', json=payload)
+
+        self.assertEqual(response.status_code, 200, response.get_data(as_text=True))
+        with jira_server.app.test_request_context('/api/scenario/compare'):
+            graph = jira_server.dependency_graph_for(jira_server.current_request_auth_context())
+        for key in ('B-1', 'C-1'):
+            self.assertTrue(all(isinstance(name, str) for name in graph.snapshot(key)), graph.snapshot(key))
+        graph_response = self.client.post('/api/dependencies/graph', json={'keys': ['B-1', 'C-1']})
+        self.assertEqual(graph_response.status_code, 200, graph_response.get_data(as_text=True))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,10 @@
 import threading
 import unittest
+from unittest.mock import patch
 
 import jira_server
 from backend.epm.rollup import EpmRollupDependencies, build_per_project_rollup
+from backend.services.single_flight import SingleFlight
 from tests.auth_mode_test_utils import force_basic_auth_mode
 
 
@@ -129,6 +131,35 @@ class BuildPerProjectRollupTests(unittest.TestCase):
             'STORY-1',
         )
 
+    def test_serves_stale_rollup_and_rebuilds_it_in_the_background(self):
+        project = {'id': 'proj-s', 'label': 'synthetic_label_alpha', 'resolvedLinkage': {'labels': ['synthetic_label_alpha'], 'epicKeys': []}}
+        deps, cache, fetch_calls = self.make_deps(project, [[], []])
+        clock = {'now': 1000.0}
+        deps.now = lambda: clock['now']
+        deps.cache_hard_ttl_seconds = 900
+        deps.single_flight = SingleFlight(wait_seconds=5)
+
+        build_per_project_rollup('proj-s', 'backlog', '', deps)
+        clock['now'] = 1400.0
+        with patch('backend.services.cache_revalidation.threading.Thread') as thread_cls:
+            payload, status, headers = build_per_project_rollup('proj-s', 'backlog', '', deps)
+            refresh = thread_cls.call_args.kwargs['target']
+
+        self.assertEqual(status, 200)
+        self.assertTrue(payload['emptyRollup'])
+        self.assertEqual(headers, {'Server-Timing': 'cache-stale;dur=1'})
+        self.assertEqual(len(fetch_calls), 1)
+
+        refresh()
+        self.assertEqual(len(fetch_calls), 2)
+        self.assertEqual(next(iter(cache.values()))['timestamp'], 1400.0)
+        self.assertEqual(deps.single_flight.stats()['inflight'], 0)
+
+        clock['now'] = 2400.0
+        _payload, _status, headers = build_per_project_rollup('proj-s', 'backlog', '', deps)
+        self.assertNotIn('cache', headers['Server-Timing'].split(';')[0])
+        self.assertEqual(len(fetch_calls), 3)
+
     def test_active_rollup_keeps_story_from_sprint_filtered_child_query_without_sprint_field(self):
         project = {'id': 'proj-sprint', 'label': 'synthetic_label_alpha', 'resolvedLinkage': {'labels': ['synthetic_label_alpha'], 'epicKeys': []}}
         q1 = [self.make_issue('EPIC-1', 'Epic', labels=['synthetic_label_alpha'])]
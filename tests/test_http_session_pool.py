@@ -0,0 +1,102 @@
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from requests import Session
+
+from backend.services.http_session_pool import JiraSessionPool
+
+
+class _FakeClock:
+    def __init__(self, start=0.0):
+        self.value = float(start)
+
+    def __call__(self):
+        return self.value
+
+
+class TestJiraSessionPool(unittest.TestCase):
+    def test_reuses_one_sized_session_per_site(self):
+        pool = JiraSessionPool(pool_connections=2, pool_maxsize=12)
+
+        first = pool.session_for('https://example.atlassian.net/rest/api/3/myself')
+        second = pool.session_for('https://EXAMPLE.atlassian.net/rest/api/3/search/jql')
+        other = pool.session_for('https://api.atlassian.com/ex/jira/cloud/rest/api/3/myself')
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+        adapter = first.get_adapter('https://example.atlassian.net/')
+        self.assertEqual(adapter._pool_connections, 2)
+        self.assertEqual(adapter._pool_maxsize, 12)
+        stats = pool.stats()
+        self.assertEqual(stats['sessionsOpened'], 2)
+        self.assertEqual(stats['sites']['https://example.atlassian.net']['requests'], 2)
+
+    def test_shared_sessions_do_not_keep_cookies(self):
+        pool = JiraSessionPool()
+        session = pool.session_for('https://example.atlassian.net/')
+
+        self.assertEqual(session.cookies.get_policy().allowed_domains(), ())
+
+    def test_idle_sessions_are_closed_on_next_access(self):
+        clock = _FakeClock()
+        pool = JiraSessionPool(idle_seconds=10, clock=clock)
+        idle = pool.session_for('https://idle.example.com/')
+        clock.value = 5
+        pool.session_for('https://busy.example.com/')
+
+        clock.value = 12
+        with patch.object(idle, 'close') as close:
+            pool.session_for('https://busy.example.com/')
+
+        close.assert_called_once_with()
+        self.assertEqual(sorted(pool.stats()['sites']), ['https://busy.example.com'])
+        self.assertEqual(pool.stats()['sessionsReaped'], 1)
+
+    def test_request_methods_route_through_site_session(self):
+        pool = JiraSessionPool()
+        with patch.object(Session, 'request', return_value='ok') as request:
+            self.assertEqual(pool.get('https://example.atlassian.net/rest', params={'a': 1}), 'ok')
+            pool.post('https://example.atlassian.net/token', data={})
+            pool.request('PUT', 'https://example.atlassian.net/rest', json={})
+
+        self.assertEqual([call.args[0] for call in request.call_args_list], ['GET', 'POST', 'PUT'])
+        self.assertEqual(pool.stats()['sessionsOpened'], 1)
+
+    def test_concurrent_requests_per_site_are_capped_at_pool_maxsize(self):
+        pool = JiraSessionPool(pool_maxsize=2)
+        lock = threading.Lock()
+        state = {'active': 0, 'peak': 0}
+
+        def fake_request(self, method, url, **kwargs):
+            with lock:
+                state['active'] += 1
+                state['peak'] = max(state['peak'], state['active'])
+            time.sleep(0.02)
+            with lock:
+                state['active'] -= 1
+            return 'ok'
+
+        with patch.object(Session, 'request', fake_request):
+            threads = [threading.Thread(target=pool.get, args=('https://example.atlassian.net/rest',)) for _ in range(6)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(state['peak'], 2)
+        self.assertEqual(pool.stats()['sites']['https://example.atlassian.net']['inFlight'], 0)
+
+    def test_from_env_reads_pool_sizes(self):
+        pool = JiraSessionPool.from_env({
+            'JIRA_HTTP_POOL_CONNECTIONS': '3',
+            'JIRA_HTTP_POOL_MAXSIZE': '24',
+            'JIRA_HTTP_POOL_IDLE_SECONDS': 'nope',
+        })
+
+        self.assertEqual((pool.pool_connections, pool.pool_maxsize, pool.idle_seconds), (3, 24, 300.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import os
+import re
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+from backend.services.issue_store import IssueStore
+
+
+class FakeJira:
+    """Answers ``key in (...)`` and plain JQL searches from ``issues``, honouring ``fields``."""
+
+    def __init__(self, issues):
+        self.issues = issues
+        self.payloads = []
+
+    def __call__(self, payload):
+        self.payloads.append(payload)
+        match = re.match(r'key in \((.*)\)$', payload['jql'])
+        keys = [key.strip('"') for key in match.group(1).split(',')] if match else list(self.issues)
+        response = Mock()
+        response.status_code = 200
+        response.json.return_value = {
+            'isLast': True,
+            'issues': [
+                {'id': str(index), 'key': key, 'fields': {
+                    name: value for name, value in self.issues[key].items() if name in payload['fields']
+                }}
+                for index, key in enumerate(keys) if key in self.issues
+            ],
+        }
+        return response
+
+    def field_requests(self):
+        return [payload['fields'] for payload in self.payloads]
+
+
+class TestIssueStore(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.store = IssueStore.from_env(
+            {'JIRA_ISSUE_STORE_ENABLED': 'true', 'JIRA_ISSUE_STORE_PATH': os.path.join(self.tmpdir.name, 'issues.db')},
+            local_file_state=True,
+        )
+        self.jira = FakeJira({
+            'A-1': {'updated': 't1', 'summary': 'one', 'status': 'To Do'},
+            'A-2': {'updated': 't1', 'summary': 'two', 'status': 'Done'},
+        })
+
+    def test_store_is_opt_in_and_needs_a_backend(self):
+        self.assertIsNone(IssueStore.from_env({}, local_file_state=True))
+        self.assertIsNone(IssueStore.from_env({'JIRA_ISSUE_STORE_ENABLED': 'true'}, local_file_state=False))
+
+    def test_unchanged_issues_are_served_from_the_store(self):
+        first = self.store.search('site', 'project = A', ['summary'], search_request=self.jira)
+        self.jira.payloads.clear()
+        second = self.store.search('site', 'project = A', ['summary'], search_request=self.jira)
+
+        self.assertEqual(second.issues, first.issues)
+        self.assertEqual([issue['fields'] for issue in second.issues], [{'summary': 'one'}, {'summary': 'two'}])
+        self.assertEqual(self.jira.field_requests(), [['updated']])
+        self.assertEqual(self.store.stats()['served'], 2)
+
+    def test_only_issues_with_a_newer_updated_are_refetched(self):
+        self.store.search('site', 'project = A', ['summary'], search_request=self.jira)
+        self.jira.issues['A-2'] = {'updated': 't2', 'summary': 'two v2', 'status': 'Done'}
+        self.jira.payloads.clear()
+
+        result = self.store.search('site', 'project = A', ['summary'], search_request=self.jira)
+
+        self.assertEqual(result.issues[1]['fields'], {'summary': 'two v2'})
+        self.assertEqual(self.jira.payloads[1]['jql'], 'key in ("A-2")')
+
+    def test_field_sets_widen_and_narrower_requests_are_covered(self):
+        self.store.search('site', 'project = A', ['summary'], search_request=self.jira)
+        self.store.search('site', 'project = A', ['status'], search_request=self.jira)
+        self.jira.payloads.clear()
+
+        result = self.store.fetch_by_keys('site', ['A-1'], ['summary', 'status'],
+                                          search_request=self.jira, log_warning_fn=Mock())
+
+        self.assertEqual(result[0]['fields'], {'summary': 'one', 'status': 'To Do'})
+        self.assertEqual(self.jira.field_requests(), [['updated']])
+
+    def test_sites_are_partitioned_and_jira_membership_wins(self):
+        self.store.search('site-a', 'project = A', ['summary'], search_request=self.jira)
+        del self.jira.issues['A-1']
+        self.jira.payloads.clear()
+
+        result = self.store.search('site-b', 'project = A', ['summary'], search_request=self.jira)
+
+        self.assertEqual([issue['key'] for issue in result.issues], ['A-2'])
+        self.assertEqual(self.jira.payloads[1]['jql'], 'key in ("A-2")')
+
+
+if __name__ == '__main__':
+    unittest.main()
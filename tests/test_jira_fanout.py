@@ -0,0 +1,83 @@
+import threading
+import time
+import unittest
+
+from backend.services.jira_fanout import JiraFanout
+
+
+class TestJiraFanout(unittest.TestCase):
+    def test_results_follow_submission_order_and_respect_max_parallel(self):
+        fanout = JiraFanout(max_workers=8)
+        lock = threading.Lock()
+        state = {'active': 0, 'peak': 0}
+
+        def work(value, delay):
+            with lock:
+                state['active'] += 1
+                state['peak'] = max(state['peak'], state['active'])
+            time.sleep(delay)
+            with lock:
+                state['active'] -= 1
+            return value * 10
+
+        calls = [(index, work, (index, 0.02 if index % 2 else 0.01)) for index in range(8)]
+        outcome = fanout.run(calls, max_parallel=3)
+
+        self.assertEqual(list(outcome.results.items()), [(index, index * 10) for index in range(8)])
+        self.assertEqual(outcome.timed_out, [])
+        self.assertLessEqual(state['peak'], 3)
+
+    def test_timeout_budget_returns_finished_calls_and_lists_the_rest(self):
+        fanout = JiraFanout(max_workers=2)
+        release = threading.Event()
+
+        def slow():
+            release.wait(2)
+            return 'slow'
+
+        started = time.monotonic()
+        outcome = fanout.run(
+            [('fast', lambda: 'fast', ()), ('slow', slow, ()), ('queued', lambda: 'queued', ())],
+            max_parallel=2,
+            timeout=0.2,
+        )
+        release.set()
+
+        self.assertLess(time.monotonic() - started, 1.5)
+        self.assertEqual(outcome.results.get('fast'), 'fast')
+        self.assertIn('slow', outcome.timed_out)
+        self.assertEqual(fanout.stats()['timedOut'], len(outcome.timed_out))
+
+    def test_worker_errors_propagate(self):
+        fanout = JiraFanout(max_workers=2)
+
+        def boom():
+            raise ValueError('jira down')
+
+        with self.assertRaises(ValueError):
+            fanout.run([('a', lambda: 1, ()), ('b', boom, ())], max_parallel=2)
+
+    def test_from_env_follows_the_per_site_connection_cap_unless_overridden(self):
+        self.assertEqual(JiraFanout.from_env({}).max_workers, 16)
+        self.assertEqual(JiraFanout.from_env({'JIRA_HTTP_POOL_MAXSIZE': '48'}).max_workers, 48)
+        self.assertEqual(
+            JiraFanout.from_env({'JIRA_HTTP_POOL_MAXSIZE': '48', 'JIRA_FANOUT_WORKERS': '8'}).max_workers,
+            8,
+        )
+        self.assertEqual(JiraFanout.from_env({'JIRA_FANOUT_WORKERS': '0'}).max_workers, 16)
+
+    def test_nested_fanout_runs_inline_instead_of_waiting_on_the_shared_pool(self):
+        fanout = JiraFanout(max_workers=1)
+
+        def outer(value):
+            inner = fanout.run([(n, lambda n=n: n + value, ()) for n in range(3)], max_parallel=4)
+            return sum(inner.results.values())
+
+        outcome = fanout.run([(1, outer, (1,)), (2, outer, (2,))], max_parallel=2, timeout=5)
+
+        self.assertEqual(outcome.results, {1: 6, 2: 9})
+        self.assertEqual(fanout.stats()['inlineRuns'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,4 @@
+import threading
 import unittest
 
 from backend import jira_client
@@ -119,5 +120,74 @@ class TestJiraIssueFetchHelpers(unittest.TestCase):
         }, 'ctx-2'))
 
 
+    def test_build_team_jql_shards_swaps_team_clause_per_chunk(self):
+        jql = 'project = SYN AND "Team[Team]" in ("t1", "t2", "t3") AND Sprint = 7 ORDER BY rank'
+
+        shards = jira_client.build_team_jql_shards(jql, ['t1', 't2', 't3'], shard_count=2)
+
+        self.assertEqual([shard.label for shard in shards], ['teams 1/2', 'teams 2/2'])
+        self.assertEqual(shards[0].jql, 'project = SYN AND "Team[Team]" in ("t1", "t2") AND Sprint = 7 ORDER BY rank')
+        self.assertEqual(shards[1].jql, 'project = SYN AND "Team[Team]" = "t3" AND Sprint = 7 ORDER BY rank')
+        self.assertEqual(
+            [(shard.jql, shard.max_results) for shard in jira_client.build_team_jql_shards(jql, ['t1', 't2', 't3'], shard_count=2, max_results=50)],
+            [(jql, 50)],
+        )
+        self.assertEqual(
+            [shard.jql for shard in jira_client.build_team_jql_shards('project = SYN', ['t1', 't2'], shard_count=4)],
+            ['project = SYN'],
+        )
+
+    def test_run_sharded_jql_search_merges_shards_in_order_and_dedupes_keys(self):
+        pages = {
+            'a': [FakeResponse(200, {'issues': [{'key': 'SYN-1'}], 'nextPageToken': 'a2', 'isLast': False, 'total': 2}),
+                  FakeResponse(200, {'issues': [{'key': 'SYN-2'}], 'isLast': True, 'total': 2})],
+            'b': [FakeResponse(200, {'issues': [{'key': 'SYN-2'}, {'key': 'SYN-3'}], 'isLast': True, 'total': 2,
+                                     'names': {'customfield_1': 'Team[Team]'}})],
+        }
+        calls = []
+        threads = set()
+
+        def search_request(payload):
+            calls.append((payload['jql'], payload.get('nextPageToken')))
+            threads.add(threading.current_thread().name.split('_')[0])
+            return pages[payload['jql']].pop(0)
+
+        result = jira_client.run_sharded_jql_search(
+            [jira_client.JqlShard('first', 'a'), jira_client.JqlShard('second', 'b')],
+            ['summary'],
+            search_request=search_request,
+            max_workers=2,
+        )
+
+        self.assertIsNone(result.error)
+        self.assertEqual([issue['key'] for issue in result.issues], ['SYN-1', 'SYN-2', 'SYN-3'])
+        self.assertEqual(result.total, 4)
+        self.assertEqual(result.names, {'customfield_1': 'Team[Team]'})
+        self.assertCountEqual(calls, [('a', None), ('a', 'a2'), ('b', None)])
+        self.assertEqual(threads, {'jira-fanout'})
+        timing = result.server_timing()
+        self.assertEqual(len(timing), 2)
+        self.assertTrue(timing[0].startswith('jira-shard-0;dur='))
+        self.assertTrue(timing[1].endswith(';desc="second"'))
+
+    def test_run_sharded_jql_search_reports_first_failing_shard_and_truncation(self):
+        def search_request(payload):
+            if payload['jql'] == 'bad':
+                return FakeResponse(502, {'error': 'upstream'})
+            return FakeResponse(200, {'issues': [{'key': 'SYN-1'}], 'nextPageToken': 'more', 'isLast': False})
+
+        result = jira_client.run_sharded_jql_search(
+            [jira_client.JqlShard('ok', 'good', max_results=1), jira_client.JqlShard('broken', 'bad')],
+            ['summary'],
+            search_request=search_request,
+            max_workers=1,
+        )
+
+        self.assertEqual(result.error.status_code, 502)
+        self.assertEqual(result.error_shard.jql, 'bad')
+        self.assertTrue(result.truncated)
+        self.assertEqual(result.server_timing(prefix='x')[1].split(';')[0], 'x-1')
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -235,5 +235,165 @@ class TestJiraResilience(unittest.TestCase):
         self.assertIn('temporarily unavailable', str(data.get('message', '')).lower())
 
 
+    def test_retry_after_429_is_paced_by_the_shared_limiter(self):
+        clock = _FakeClock()
+        throttled = _mock_response(429)
+        throttled.headers = {'Retry-After': '2'}
+        ok = _mock_response(200, {'ok': True})
+        ok.headers = {}
+        session = Mock()
+        session.get.side_effect = [throttled, ok]
+        breaker = jira_server.JiraCircuitBreaker(failure_threshold=3, open_seconds=30)
+        limiter = jira_server._jira_client.JiraRateLimiter(10, clock=clock.now, sleep_fn=clock.sleep)
+
+        response = jira_server.resilient_jira_get(
+            'http://jira.example/search',
+            session=session,
+            breaker=breaker,
+            limiter=limiter,
+            now_fn=clock.now,
+            sleep_fn=clock.sleep,
+            rand_fn=lambda: 0.0,
+            max_attempts=3,
+            max_elapsed_seconds=10,
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(clock.sleeps, [2.0])
+        stats = limiter.stats()
+        self.assertEqual(stats['rateLimitedResponses'], 1)
+        self.assertEqual(stats['throttledWaitSeconds'], 2.0)
+
+    def test_429_without_retry_after_keeps_the_exponential_backoff(self):
+        clock = _FakeClock()
+        throttled = _mock_response(429)
+        throttled.headers = {}
+        ok = _mock_response(200, {'ok': True})
+        ok.headers = {}
+        session = Mock()
+        session.get.side_effect = [throttled, throttled, throttled, ok]
+        breaker = jira_server.JiraCircuitBreaker(failure_threshold=5, open_seconds=30)
+        # No sleep_fn on the limiter: its waits must go through the caller's sleep_fn.
+        limiter = jira_server._jira_client.JiraRateLimiter(10, clock=clock.now)
+
+        response = jira_server.resilient_jira_get(
+            'http://jira.example/search',
+            session=session,
+            breaker=breaker,
+            limiter=limiter,
+            now_fn=clock.now,
+            sleep_fn=clock.sleep,
+            rand_fn=lambda: 0.0,
+            max_attempts=4,
+            base_delay_seconds=0.5,
+            max_delay_seconds=3,
+            max_elapsed_seconds=10,
+        )
+
+        self.assertEqual(response.status_code, 200)
+        backoff = [seconds for seconds in clock.sleeps if seconds >= 0.5]
+        self.assertEqual(backoff, [0.5, 1.0, 2.0])
+        self.assertEqual(limiter.stats()['rateLimitedResponses'], 3)
+
+    def test_retry_after_beyond_the_retry_budget_fails_fast(self):
+        clock = _FakeClock()
+        throttled = _mock_response(429)
+        throttled.headers = {'Retry-After': '60'}
+        session = Mock()
+        session.get.return_value = throttled
+        breaker = jira_server.JiraCircuitBreaker(failure_threshold=3, open_seconds=30)
+        limiter = jira_server._jira_client.JiraRateLimiter(10, clock=clock.now, sleep_fn=clock.sleep)
+
+        response = jira_server.resilient_jira_get(
+            'http://jira.example/search',
+            session=session,
+            breaker=breaker,
+            limiter=limiter,
+            now_fn=clock.now,
+            sleep_fn=clock.sleep,
+            rand_fn=lambda: 0.0,
+            max_attempts=3,
+            max_elapsed_seconds=10,
+        )
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(session.get.call_count, 1)
+        self.assertEqual(clock.sleeps, [])
+        self.assertEqual(response.json().get('upstreamStatus'), 429)
+
+
+    def test_jira_request_gives_up_when_the_limiter_wait_exceeds_its_timeout(self):
+        clock = _FakeClock()
+        limiter = jira_server._jira_client.JiraRateLimiter(10, clock=clock.now, sleep_fn=clock.sleep)
+        limiter.record_throttle(120)
+
+        with patch.object(jira_server, 'JIRA_RATE_LIMITER', limiter), \
+             patch.object(jira_server.HTTP_SESSION, 'request') as http_request:
+            response = jira_server.current_jira_request('GET', '/rest/api/3/issue/PROD-1/transitions', timeout=30)
+
+        self.assertEqual(response.status_code, 503)
+        self.assertIn('rate limiting', response.json()['message'])
+        http_request.assert_not_called()
+        self.assertEqual(clock.sleeps, [])
+        self.assertEqual(limiter.stats()['rejectedOverBudget'], 1)
+
+
+class TestJiraRateLimiter(unittest.TestCase):
+    def _limiter(self, clock, **kwargs):
+        from backend.jira_client import JiraRateLimiter
+        return JiraRateLimiter(clock=clock.now, sleep_fn=clock.sleep, **kwargs)
+
+    def test_empty_bucket_spaces_callers_by_the_current_rate(self):
+        clock = _FakeClock()
+        limiter = self._limiter(clock, max_rate=4, burst=2)
+
+        waits = [limiter.acquire() for _ in range(4)]
+
+        self.assertEqual(waits, [0.0, 0.0, 0.25, 0.25])
+        self.assertEqual(limiter.stats()['throttledWaits'], 2)
+
+    def test_throttle_halves_rate_once_per_cooldown_and_recovers_additively(self):
+        clock = _FakeClock()
+        limiter = self._limiter(clock, max_rate=8, recovery_per_second=2)
+
+        limiter.record_throttle()
+        limiter.record_throttle()
+        self.assertEqual(limiter.stats()['ratePerSecond'], 4.0)
+
+        clock.value += 1.5
+        self.assertEqual(limiter.stats()['ratePerSecond'], 7.0)
+        clock.value += 10
+        self.assertEqual(limiter.stats()['ratePerSecond'], 8.0)
+
+    def test_retry_after_pauses_every_caller(self):
+        clock = _FakeClock()
+        limiter = self._limiter(clock, max_rate=100)
+
+        response = _mock_response(503)
+        response.headers = {'Retry-After': '3'}
+        self.assertEqual(limiter.observe(response), 3.0)
+
+        self.assertIsNone(limiter.acquire(max_wait=1))
+        self.assertEqual(limiter.acquire(), 3.0)
+        self.assertEqual(limiter.stats()['rejectedOverBudget'], 1)
+
+    def test_parse_retry_after_accepts_seconds_and_http_dates(self):
+        from backend.jira_client import parse_retry_after_seconds
+
+        self.assertEqual(parse_retry_after_seconds('5'), 5.0)
+        self.assertEqual(parse_retry_after_seconds('Wed, 21 Oct 2015 07:28:10 GMT', now=1445412480), 10.0)
+        self.assertIsNone(parse_retry_after_seconds('soon'))
+        self.assertIsNone(parse_retry_after_seconds(Mock()))
+
+    def test_zero_rate_disables_pacing(self):
+        clock = _FakeClock()
+        limiter = self._limiter(clock, max_rate=0)
+
+        limiter.record_throttle(30)
+
+        self.assertEqual(limiter.acquire(), 0.0)
+        self.assertEqual(clock.sleeps, [])
+
+
 if __name__ == '__main__':
     unittest.main()
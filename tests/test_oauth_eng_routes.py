@@ -304,6 +304,29 @@ class OAuthEngRouteTests(unittest.TestCase):
         self.assertEqual(response.get_json(), {"issues": [{"key": "PROD-1"}], "epics": [], "count": 1})
         self.assertEqual(response.headers.get("Server-Timing"), "cache;dur=1")
 
+    def test_missing_info_serves_stale_entry_and_schedules_refresh(self):
+        stored_at = time.time()
+        install_oauth_session(self.client, stored_at=stored_at)
+        auth_context = _local_oauth_context(stored_at=stored_at)
+        cache_key = build_jira_home_process_cache_key(auth_context, "missing-info", "2026Q2", "team-alpha", "Comp A")
+        jira_server.MISSING_INFO_CACHE[cache_key] = {
+            "timestamp": time.time() - jira_server.MISSING_INFO_CACHE_TTL_SECONDS - 1,
+            "data": {"issues": [{"key": "PROD-1"}], "epics": [], "count": 1},
+        }
+
+        with patch.object(jira_server, "JIRA_AUTH_MODE", "atlassian_oauth"), \
+             patch.object(jira_server, "MISSING_INFO_CACHE_HARD_TTL_SECONDS", jira_server.MISSING_INFO_CACHE_TTL_SECONDS * 3), \
+             patch.object(jira_server, "database_storage_enabled", return_value=False), \
+             patch.object(jira_server, "revalidate_in_background") as mock_revalidate, \
+             patch.object(jira_server, "resolve_team_field_id", side_effect=AssertionError("stale hit should not resolve Jira fields")):
+            response = self.client.get("/api/missing-info?sprint=2026Q2&teamIds=team-alpha&components=Comp%20A")
+
+        self.assertEqual(response.status_code, 200, response.get_data(as_text=True))
+        self.assertEqual(response.get_json()["issues"], [{"key": "PROD-1"}])
+        self.assertEqual(response.headers.get("Server-Timing"), "cache-stale;dur=1")
+        mock_revalidate.assert_called_once()
+        self.assertEqual(mock_revalidate.call_args.args[1], ("missing-info", cache_key))
+
     def test_dependencies_requires_oauth_csrf_header(self):
         with patch.object(jira_server, "JIRA_AUTH_MODE", "atlassian_oauth"):
             response = self.client.post("/api/dependencies", json={"keys": ["PROD-1"]})
@@ -1479,19 +1502,16 @@ class MissingWriteJiraWorkScopeHelperTests(unittest.TestCase):
     def test_skips_recheck_for_db_backed_context(self):
         db_context = SimpleNamespace(auth_connection_id="db-connection-42")
         with patch.object(jira_server, "oauth_session_data", side_effect=AssertionError("must not check local session for a DB-backed context")):
-            eng_routes.bind_server_globals(eng_routes.__dict__)
             self.assertFalse(eng_routes._missing_write_jira_work_scope(db_context))
 
     def test_flags_local_context_missing_write_scope(self):
         local_context = SimpleNamespace(auth_connection_id="local-oauth-connection:session-1")
         with patch.object(jira_server, "oauth_session_data", return_value={"scope": "read:me read:jira-work"}):
-            eng_routes.bind_server_globals(eng_routes.__dict__)
             self.assertTrue(eng_routes._missing_write_jira_work_scope(local_context))
 
     def test_local_context_with_write_scope_is_not_missing(self):
         local_context = SimpleNamespace(auth_connection_id="local-oauth-connection:session-1")
         with patch.object(jira_server, "oauth_session_data", return_value={"scope": "read:me write:jira-work"}):
-            eng_routes.bind_server_globals(eng_routes.__dict__)
             self.assertFalse(eng_routes._missing_write_jira_work_scope(local_context))
 
 
@@ -1,3 +1,5 @@
+import random
+import time
 import unittest
 from datetime import date
 
@@ -84,6 +86,59 @@ class PlanningSchedulerTests(unittest.TestCase):
         unscheduled = next(item for item in scheduled if item.key == "A")
         self.assertEqual(unscheduled.scheduled_reason, "missing_dependency")
 
+    def test_unassigned_work_takes_the_earliest_free_slot(self):
+        config = ScenarioConfig(
+            start_date=self.config.start_date,
+            quarter_end_date=self.config.quarter_end_date,
+            sp_to_weeks=1.0,
+            team_sizes={"Alpha": 1},
+            sickleave_buffer=0.0,
+            wip_limit=2,
+            lane_mode="team",
+        )
+        issues = [
+            Issue(key="A", summary="A", issue_type="Story", team="Alpha", assignee=None, story_points=3, priority="High", status="To Do"),
+            Issue(key="B", summary="B", issue_type="Story", team="Alpha", assignee=None, story_points=1, priority="High", status="To Do"),
+            Issue(key="C", summary="C", issue_type="Story", team="Alpha", assignee=None, story_points=1, priority="Low", status="To Do"),
+        ]
+        _, scheduled_map = schedule_issues(issues, {}, config)
+        self.assertEqual(scheduled_map["C"].start_date, scheduled_map["B"].end_date)
+
+    def test_cycle_breaking_releases_fewest_remaining_dependencies_first(self):
+        issues = [
+            Issue(key="A", summary="A", issue_type="Story", team="Alpha", assignee=None, story_points=1, priority="Low", status="To Do"),
+            Issue(key="B", summary="B", issue_type="Story", team="Alpha", assignee=None, story_points=1, priority="Medium", status="To Do"),
+            Issue(key="C", summary="C", issue_type="Story", team="Alpha", assignee=None, story_points=1, priority="High", status="To Do"),
+        ]
+        dependencies = {"A": ["B"], "B": ["A", "C"], "C": ["B"]}
+        _, scheduled_map = schedule_issues(issues, dependencies, self.config)
+        ordered = sorted(scheduled_map.values(), key=lambda item: item.start_date)
+        self.assertEqual([item.key for item in ordered], ["C", "B", "A"])
+
+    def test_dense_cyclic_graph_schedules_every_issue(self):
+        rnd = random.Random(7)
+        issues = [
+            Issue(key=f"K-{index}", summary="s", issue_type="Story", team=rnd.choice(["Alpha", "Beta"]), assignee=None,
+                  story_points=rnd.randint(1, 5), priority=rnd.choice(["High", "Low"]), status="To Do")
+            for index in range(5000)
+        ]
+        dependencies = {}
+        for _ in range(40000):
+            dependencies.setdefault(f"K-{rnd.randrange(5000)}", []).append(f"K-{rnd.randrange(5000)}")
+        config = ScenarioConfig(
+            start_date=self.config.start_date,
+            quarter_end_date=self.config.quarter_end_date,
+            team_sizes={"Alpha": 4, "Beta": 4},
+            wip_limit=3,
+        )
+
+        started = time.perf_counter()
+        results, scheduled_map = schedule_issues(issues, dependencies, config)
+
+        self.assertLess(time.perf_counter() - started, 10.0)
+        self.assertEqual(len(results), 5000)
+        self.assertEqual(len(scheduled_map), 5000)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+from datetime import date, timedelta
+
+from planning.analysis import compute_slack, critical_chains
+from planning.models import Issue, ScenarioConfig, ScheduledIssue
+from planning.scheduler import schedule_issues
+
+
+START = date(2026, 1, 5)
+
+
+def _item(key, lane, start_week, weeks, reason="scheduled"):
+    start = START + timedelta(weeks=start_week)
+    return ScheduledIssue(
+        key=key, summary=key, lane=lane, start_date=start, end_date=start + timedelta(weeks=weeks),
+        blocked_by=[], scheduled_reason=reason, duration_weeks=float(weeks),
+    )
+
+
+class PlanningAnalysisTests(unittest.TestCase):
+    def test_chain_follows_dependency_and_lane_edges_in_order(self):
+        # A-1 -> A-2 share a lane slot; B-1 waits on A-2; B-2 runs alongside.
+        scheduled = {
+            item.key: item for item in [
+                _item("A-1", "Alpha", 0, 2),
+                _item("A-2", "Alpha", 2, 1),
+                _item("B-1", "Beta", 3, 2),
+                _item("B-2", "Beta", 0, 1),
+            ]
+        }
+
+        chains = critical_chains(scheduled, {"B-1": ["A-2"]})
+
+        self.assertEqual(chains, [["A-1", "A-2", "B-1"]])
+
+    def test_every_issue_finishing_last_gets_a_chain_longest_first(self):
+        scheduled = {
+            item.key: item for item in [
+                _item("A-1", "Alpha", 0, 1),
+                _item("A-2", "Alpha", 1, 2),
+                _item("B-1", "Beta", 0, 3),
+                _item("D-1", "Alpha", 0, 0, reason="already_done"),
+            ]
+        }
+
+        self.assertEqual(critical_chains(scheduled, {"A-1": ["D-1"]}), [["A-1", "A-2"], ["B-1"]])
+        self.assertEqual(critical_chains({}, {}), [])
+
+    def test_chain_keeps_dependency_edges_under_fractional_capacity(self):
+        # With the default 10% sick-leave buffer a 1 SP issue spans 2.22 weeks, so B starts
+        # the day before A's end_date: the scheduler releases dependents from truncated days.
+        issues = [
+            Issue("C", "C", "Story", "X", None, 1, "High", "To Do"),
+            Issue("A", "A", "Story", "X", None, 1, "Low", "To Do"),
+            Issue("B", "B", "Story", "Y", None, 1, "Medium", "To Do"),
+        ]
+        dependencies = {"B": ["A"]}
+        _, scheduled = schedule_issues(issues, dependencies, ScenarioConfig(start_date=START, quarter_end_date=date(2026, 3, 31)))
+
+        self.assertEqual(scheduled["B"].start_date, scheduled["A"].end_date - timedelta(days=1))
+        self.assertEqual(critical_chains(scheduled, dependencies), [["C", "A", "B"]])
+
+    def test_slack_uses_the_earliest_start_as_origin(self):
+        scheduled = {
+            "A-1": _item("A-1", "Alpha", 1, 2),
+            "A-2": _item("A-2", "Alpha", 3, 1),
+            "U-1": ScheduledIssue(
+                key="U-1", summary="U-1", lane="Alpha", start_date=None, end_date=None,
+                blocked_by=[], scheduled_reason="missing_story_points",
+            ),
+        }
+
+        slack, critical = compute_slack(scheduled, {"A-2": ["A-1"]}, START + timedelta(weeks=5))
+
+        self.assertEqual(slack, {"A-1": 1.0, "A-2": 1.0})
+        self.assertEqual(critical, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+import os
+import unittest
+from datetime import date
+from unittest.mock import patch
+
+import jira_server
+
+from planning.capacity import LaneCapacity, scenario_capacity_settings
+from planning.models import Issue, ScenarioConfig
+from planning.scheduler import schedule_issues
+
+
+def _issue(key, story_points, team="Alpha"):
+    return Issue(
+        key=key, summary=key, issue_type="Story", team=team, assignee=None,
+        story_points=story_points, priority="Medium", status="To Do",
+    )
+
+
+class LaneCapacityTests(unittest.TestCase):
+    def setUp(self):
+        # Twelve-week horizon, one story point per week per slot.
+        self.config = ScenarioConfig(
+            start_date=date(2026, 1, 5),
+            quarter_end_date=date(2026, 3, 30),
+            sp_to_weeks=1.0,
+            team_sizes={"Alpha": 2},
+            sickleave_buffer=0.0,
+        )
+
+    def test_planned_capacity_sets_the_lane_speed(self):
+        _, nominal = schedule_issues([_issue("A-1", 4)], {}, self.config)
+        self.config.planned_capacity = {"Alpha": 48}
+        _, planned = schedule_issues([_issue("A-1", 4)], {}, self.config)
+
+        self.assertEqual(nominal["A-1"].end_date, date(2026, 2, 2))
+        self.assertEqual(planned["A-1"].end_date, date(2026, 1, 19))
+        self.assertEqual(planned["A-1"].duration_weeks, 2.0)
+
+    def test_weekly_capacity_stretches_work_over_slow_weeks(self):
+        self.config.team_sizes = {"Alpha": 1}
+        self.config.weekly_capacity = {"Alpha": [1.0, 0.0, 0.5]}
+        self.config.engine = "numpy"
+
+        _, scheduled = schedule_issues([_issue("A-1", 2), _issue("A-2", 1)], {"A-2": ["A-1"]}, self.config)
+
+        self.assertEqual(scheduled["A-1"].duration_weeks, 3.5)
+        self.assertEqual(scheduled["A-2"].start_date, date(2026, 1, 29))
+        self.assertEqual(scheduled["A-2"].duration_weeks, 1.0)
+
+        lane = LaneCapacity(lane="Alpha", slot_count=1, capacity_factor=1.0, available_at=[0.0], weekly_capacity=[0.5])
+        self.assertEqual(lane.span_weeks(-1.0, 2.0), 2.5)
+
+    def test_capacity_settings_ignore_invalid_values(self):
+        settings = scenario_capacity_settings({
+            "wip_limit": "3",
+            "sickleave_buffer": "much",
+            "vacation_weeks": {"Alpha": 2},
+            "weekly_capacity": {"Alpha": [1, "bad"], "Beta": "no"},
+        })
+
+        self.assertEqual(settings, {
+            "wip_limit": 3,
+            "sickleave_buffer": 0.0,
+            "vacation_weeks": {"Alpha": 2.0},
+            "weekly_capacity": {"Alpha": [1.0, 1.0]},
+        })
+
+
+class ScenarioCapacityRouteTests(unittest.TestCase):
+    def setUp(self):
+        jira_server.app.config["TESTING"] = True
+        self.client = jira_server.app.test_client()
+        env = patch.dict(os.environ, {"CONFIG_STORAGE_BACKEND": "", "DATABASE_URL": "", "TEST_DATABASE_URL": ""})
+        env.start()
+        self.addCleanup(env.stop)
+        jira_server.SCENARIO_CACHE.clear()
+        self.addCleanup(jira_server.SCENARIO_CACHE.clear)
+
+    def _post(self, config):
+        issue = {
+            "key": "A-1",
+            "fields": {
+                "summary": "A-1",
+                "customfield_team": {"id": "alpha", "name": "Alpha"},
+                "customfield_10004": 4,
+                "status": {"name": "To Do"},
+            },
+        }
+        planned = ({"enabled": True, "capacities": {"Alpha": 48.0}}, None)
+        with patch.object(jira_server, "JIRA_AUTH_MODE", "basic"), \
+             patch.object(jira_server, "resolve_team_field_id", return_value="customfield_team"), \
+             patch.object(jira_server, "resolve_epic_link_field_id", return_value=None), \
+             patch.object(jira_server, "get_story_points_field_id", return_value="customfield_10004"), \
+             patch.object(jira_server, "fetch_issues_by_jql", return_value=[issue]), \
+             patch.object(jira_server, "collect_dependencies", return_value={}), \
+             patch.object(jira_server, "fetch_capacity_team_sizes", return_value=({"Alpha": 2}, {"Alpha": {"watchers": 2}})), \
+             patch.object(jira_server, "fetch_capacity_for_sprint", return_value=planned) as fetch_planned:
+            response = self.client.post("/api/scenario", json={
+                "filters": {"sprint": "2026Q2"},
+                "config": {"start_date": "2026-01-05", "quarter_end_date": "2026-03-30", **config},
+            })
+        self.assertEqual(response.status_code, 200, response.get_data(as_text=True))
+        return response.get_json(), fetch_planned
+
+    def test_planned_capacity_from_jira_drives_the_schedule(self):
+        body, fetch_planned = self._post({})
+        estimated, skipped = self._post({"planned_capacity": False})
+
+        fetch_planned.assert_called_once_with("2026Q2", None, team_names=None)
+        self.assertEqual(body["issues"][0]["end"], "2026-01-19")
+        self.assertEqual(body["capacity_by_team"]["Alpha"]["plannedCapacity"], 48.0)
+        skipped.assert_not_called()
+        self.assertEqual(estimated["issues"][0]["end"], "2026-03-02")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import unittest
+from datetime import date
+from unittest.mock import patch
+
+from planning import forecast
+from planning.models import Issue, ScenarioConfig
+
+
+def _issue(key, story_points, team="Alpha", status="To Do", epic_key="EPIC-1"):
+    return Issue(
+        key=key, summary=key, issue_type="Story", team=team, assignee=None,
+        story_points=story_points, priority="Medium", status=status, epic_key=epic_key,
+    )
+
+
+def _done(team, story_points, spent_weeks):
+    return {"team": team, "sp": story_points, "status": "Done", "timeSpentSeconds": spent_weeks * forecast.WORK_WEEK_SECONDS}
+
+
+class ScenarioForecastTests(unittest.TestCase):
+    def setUp(self):
+        self.config = ScenarioConfig(
+            start_date=date(2026, 1, 5),
+            quarter_end_date=date(2026, 3, 30),
+            sp_to_weeks=1.0,
+            team_sizes={"Alpha": 1},
+            sickleave_buffer=0.0,
+        )
+        self.issues = [_issue("A-1", 2), _issue("A-2", 3), _issue("A-3", 1, epic_key="EPIC-2")]
+        self.dependencies = {"A-2": ["A-1"]}
+
+    def test_team_history_needs_enough_samples_before_it_replaces_the_pool(self):
+        history = [_done("Alpha", 2, 3)] * 5 + [_done("Beta", 1, 1)] * 2 + [{"team": "Alpha", "sp": 2, "status": "To Do"}]
+
+        pools, summary = forecast.duration_multiplier_pools(history, sp_to_weeks=1.0)
+
+        self.assertEqual(pools["Alpha"], (1.5,) * 5)
+        self.assertNotIn("Beta", pools)
+        self.assertEqual(len(pools[None]), 7)
+        self.assertEqual(summary, {"pooledSamples": 7, "teams": {"Alpha": 5}, "source": "history"})
+        self.assertEqual(forecast.duration_multiplier_pools([], 1.0)[0], {None: forecast.DEFAULT_MULTIPLIERS})
+
+    def test_constant_multiplier_reproduces_the_scaled_schedule(self):
+        pools = {None: (2.0,)}
+
+        payload = forecast.run_forecast(self.issues, self.dependencies, self.config, pools, runs=10).as_payload()
+
+        # A-1 (2w) then A-2 (3w) then A-3 (1w), each doubled, on one slot.
+        self.assertEqual(payload["issues"]["A-2"]["p50"], "2026-03-16")
+        self.assertEqual(payload["epics"]["EPIC-1"]["p95"], "2026-03-16")
+        self.assertEqual(payload["scenario"]["p50"], "2026-03-30")
+        self.assertEqual(payload["quarterEndProbability"], 1.0)
+
+    def test_percentiles_are_ordered_and_deadline_probability_reflects_overruns(self):
+        pools = {None: (1.0, 1.0, 1.0, 5.0)}
+
+        payload = forecast.run_forecast(self.issues, self.dependencies, self.config, pools, runs=400, seed=3).as_payload()
+
+        scenario = payload["scenario"]
+        self.assertLessEqual(scenario["p50"], scenario["p85"])
+        self.assertLessEqual(scenario["p85"], scenario["p95"])
+        self.assertGreater(payload["quarterEndProbability"], 0.2)
+        self.assertLess(payload["quarterEndProbability"], 0.8)
+
+    def test_results_depend_on_seed_not_on_worker_processes(self):
+        pools = {None: forecast.DEFAULT_MULTIPLIERS}
+        pool = forecast.ForecastPool(max_workers=2)
+        self.addCleanup(pool.shutdown)
+
+        inline = forecast.run_forecast(self.issues, self.dependencies, self.config, pools, runs=600, seed=9)
+        parallel = forecast.run_forecast(self.issues, self.dependencies, self.config, pools, runs=600, seed=9, pool=pool)
+
+        self.assertEqual(parallel.as_payload(), inline.as_payload())
+        self.assertTrue(pool.stats()["started"])
+
+    def test_payload_is_cached_by_content_hash(self):
+        cache = {}
+        with patch.object(forecast, "run_forecast", wraps=forecast.run_forecast) as run:
+            first = forecast.forecast_payload(self.issues, self.dependencies, self.config, [], {"runs": 20}, cache=cache)
+            second = forecast.forecast_payload(self.issues, self.dependencies, self.config, [], {"runs": 20}, cache=cache)
+            forecast.forecast_payload(self.issues, {}, self.config, [], {"runs": 20}, cache=cache)
+
+        self.assertIs(second, first)
+        self.assertEqual(run.call_count, 2)
+        self.assertEqual(first["runs"], 20)
+
+    def test_invalid_runs_and_seed_fall_back_to_defaults(self):
+        with patch.object(forecast, "DEFAULT_RUNS", 10):
+            payload = forecast.forecast_payload(
+                self.issues, self.dependencies, self.config, [], {"runs": "many", "seed": float("inf")},
+            )
+
+        self.assertEqual((payload["runs"], payload["seed"]), (10, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+import os
+import random
+import unittest
+from datetime import date
+from unittest.mock import patch
+
+import jira_server
+
+from planning.incremental import ScheduleSession
+from planning.models import Issue, ScenarioConfig
+from planning.scheduler import schedule_issues
+from tests.test_planning_vectorized import TEAMS, _random_scenario
+
+
+def _issue(key, story_points, team="Alpha"):
+    return Issue(
+        key=key, summary=key, issue_type="Story", team=team, assignee=None,
+        story_points=story_points, priority="Medium", status="To Do",
+    )
+
+
+def _random_edit(rng, issues):
+    key = rng.choice(issues).key
+    field = rng.choice(["story_points", "team", "excluded"])
+    if field == "story_points":
+        return {key: {"story_points": rng.choice([None, 1, 2, 5, 8])}}
+    if field == "team":
+        return {key: {"team": rng.choice(TEAMS)}}
+    return {key: {"excluded": rng.random() < 0.6}}
+
+
+class IncrementalRescheduleTests(unittest.TestCase):
+    def setUp(self):
+        self.config = ScenarioConfig(
+            start_date=date(2026, 1, 5),
+            quarter_end_date=date(2026, 3, 30),
+            sp_to_weeks=1.0,
+            team_sizes={"Alpha": 1, "Beta": 1},
+            sickleave_buffer=0.0,
+        )
+
+    def test_random_edits_match_a_full_schedule(self):
+        rng = random.Random(21)
+        for _ in range(80):
+            issues, dependencies, config = _random_scenario(rng, rng.randint(1, 50))
+            session = ScheduleSession(issues, dependencies, config)
+            for _ in range(3):
+                session.apply(_random_edit(rng, issues))
+
+                self.assertEqual(session.results, schedule_issues(session.current_issues(), dependencies, config))
+
+    def test_only_the_edited_lane_and_dependency_cone_are_replaced(self):
+        issues = [_issue("A-1", 5), _issue("A-2", 1), _issue("B-1", 3, team="Beta"), _issue("B-2", 1, team="Beta")]
+        session = ScheduleSession(issues, {"B-2": ["A-2"]}, self.config)
+
+        diff = session.apply({"A-2": {"story_points": 3}})
+
+        self.assertEqual(sorted(diff.changed), ["A-2", "B-2"])
+        self.assertEqual((diff.replaced, diff.reused), (2, 2))
+        before, after = diff.changed["B-2"]
+        self.assertEqual((before.start_date, after.start_date), (date(2026, 2, 16), date(2026, 3, 2)))
+        self.assertEqual(session.summary()["late_items"], [])
+
+    def test_excluded_issue_is_removed_and_restored(self):
+        issues = [_issue("A-1", 2), _issue("A-2", 1)]
+        session = ScheduleSession(issues, {"A-2": ["A-1"]}, self.config)
+        original = session.results
+
+        removed = session.apply({"A-1": {"excluded": True}})
+        restored = session.apply({"A-1": {"excluded": False}})
+
+        self.assertIsNone(removed.changed["A-1"][1])
+        self.assertEqual(removed.changed["A-2"][1].scheduled_reason, "missing_dependency")
+        self.assertEqual(sorted(restored.changed), ["A-1", "A-2"])
+        self.assertEqual(session.results, original)
+
+    def test_unsupported_edits_are_rejected_before_anything_changes(self):
+        session = ScheduleSession([_issue("A-1", 2)], {}, self.config)
+
+        with self.assertRaises(ValueError):
+            session.apply({"A-1": {"story_points": 3}, "A-2": {"priority": "High"}})
+
+        self.assertEqual(session.edits, {})
+
+
+class RescheduleRouteTests(unittest.TestCase):
+    def setUp(self):
+        jira_server.app.config["TESTING"] = True
+        self.client = jira_server.app.test_client()
+        self.addCleanup(jira_server.SCENARIO_SESSIONS.clear)
+        env = patch.dict(os.environ, {"CONFIG_STORAGE_BACKEND": "", "DATABASE_URL": "", "TEST_DATABASE_URL": ""})
+        env.start()
+        self.addCleanup(env.stop)
+
+    def test_reschedule_applies_changes_to_a_stored_session(self):
+        config = ScenarioConfig(start_date=date(2026, 1, 5), quarter_end_date=date(2026, 1, 19), team_sizes={"Alpha": 1})
+        session = ScheduleSession([_issue("A-1", 1)], {}, config)
+        jira_server.SCENARIO_SESSIONS["session-1"] = session
+
+        with patch.object(jira_server, "JIRA_AUTH_MODE", "basic"):
+            response = self.client.post(
+                "/api/scenario/reschedule",
+                json={"scheduleSessionId": "session-1", "changes": {"A-1": {"story_points": 5}}},
+            )
+            invalid = self.client.post(
+                "/api/scenario/reschedule",
+                json={"scheduleSessionId": "session-1", "changes": {"A-1": {"status": "Done"}}},
+            )
+            missing = self.client.post("/api/scenario/reschedule", json={"scheduleSessionId": "unknown"})
+
+        self.assertEqual(response.status_code, 200, response.get_data(as_text=True))
+        body = response.get_json()
+        self.assertEqual([item["key"] for item in body["changed"]], ["A-1"])
+        self.assertEqual(body["summary"]["late_items"], ["A-1"])
+        self.assertFalse(body["summary"]["deadline_met"])
+        self.assertEqual(invalid.status_code, 400)
+        self.assertEqual(missing.status_code, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
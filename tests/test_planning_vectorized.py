@@ -0,0 +1,129 @@
+import random
+import unittest
+from datetime import date, timedelta
+from pathlib import Path
+
+from planning.analysis import compute_slack
+from planning.models import Issue, ScenarioConfig
+from planning.scheduler import schedule_issues
+from planning.vectorized import numpy_available
+
+if numpy_available():
+    import numpy as np
+
+    from planning.vectorized import batch_slack, schedule_batch, timedelta_days
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+TEAMS = ["Alpha", "Beta", "Gamma", None]
+ASSIGNEES = ["ann", "bob", "cid", None, None]
+STATUSES = ["To Do", "To Do", "Accepted", "Blocked", "In Progress", "In Review", "Done", "Killed", "Incomplete"]
+PRIORITIES = ["Blocker", "High", "Medium", "Low", None]
+
+
+def _random_scenario(rng, size):
+    issues = [
+        Issue(
+            key=f"K-{index}",
+            summary=f"Issue {index}",
+            issue_type="Story",
+            team=rng.choice(TEAMS),
+            assignee=rng.choice(ASSIGNEES),
+            story_points=rng.choice([None, 0, 0.5, 1, 2, 3, 5, 8, 13]),
+            priority=rng.choice(PRIORITIES),
+            status=rng.choice(STATUSES),
+        )
+        for index in range(size)
+    ]
+    dependencies = {}
+    for issue in issues:
+        deps = [f"K-{rng.randrange(size)}" for _ in range(rng.choice([0, 0, 1, 2, 3]))]
+        if rng.random() < 0.05:
+            deps.append("MISSING-1")
+        if deps:
+            dependencies[issue.key] = deps
+    config = ScenarioConfig(
+        start_date=date(2026, 1, 5),
+        quarter_end_date=date(2026, 3, 31),
+        anchor_date=rng.choice([None, date(2026, 1, 19), date(2026, 2, 3)]),
+        sp_to_weeks=rng.choice([0.5, 1.0, 2.0]),
+        team_sizes={"Alpha": 2, "Beta": 1, "Gamma": 3},
+        vacation_weeks={"Alpha": 1.5},
+        sickleave_buffer=rng.choice([0.0, 0.1]),
+        wip_limit=rng.choice([1, 2]),
+        lane_mode=rng.choice(["team", "assignee"]),
+    )
+    return issues, dependencies, config
+
+
+def _with_engine(config, engine):
+    return ScenarioConfig(**{**config.__dict__, "engine": engine})
+
+
+@unittest.skipUnless(numpy_available(), "NumPy is not installed")
+class VectorizedEngineParityTests(unittest.TestCase):
+    def test_timedelta_days_matches_date_arithmetic(self):
+        rng = random.Random(7)
+        weeks = [rng.uniform(-20, 60) for _ in range(5000)] + [n / 7.0 for n in range(-50, 400)]
+
+        expected = [(timedelta(weeks=value)).days for value in weeks]
+
+        self.assertEqual(timedelta_days(np.array(weeks)).astype(int).tolist(), expected)
+
+    def test_random_scenarios_match_the_python_engine(self):
+        rng = random.Random(12)
+        for _ in range(150):
+            issues, dependencies, config = _random_scenario(rng, rng.randint(1, 60))
+
+            expected = schedule_issues(issues, dependencies, config)
+            actual = schedule_issues(issues, dependencies, _with_engine(config, "numpy"))
+
+            self.assertEqual(actual, expected)
+            self.assertEqual(
+                compute_slack(actual[1], dependencies, config.quarter_end_date, engine="numpy"),
+                compute_slack(expected[1], dependencies, config.quarter_end_date),
+            )
+
+    def test_batch_rows_match_individual_runs(self):
+        issues, dependencies, config = _random_scenario(random.Random(3), 80)
+        variants = [_with_engine(config, "numpy") for _ in range(4)]
+        for variant, scale in zip(variants, [0.5, 1.0, 1.5, 3.0]):
+            variant.sp_to_weeks = config.sp_to_weeks * scale
+        durations = np.vstack([schedule_batch(issues, dependencies, variant).duration_weeks for variant in variants])
+
+        batch = schedule_batch(issues, dependencies, config, durations=durations)
+        keys, slack_rows = batch_slack(batch, dependencies, config.quarter_end_date, config.start_date)
+
+        for row, variant in enumerate(variants):
+            _, expected = schedule_issues(issues, dependencies, _with_engine(variant, "python"))
+            expected_slack, _ = compute_slack(expected, dependencies, config.quarter_end_date)
+            self.assertEqual(keys, list(expected))
+            for column, key in enumerate(keys):
+                index = batch.column[key]
+                self.assertEqual(config.start_date + timedelta(weeks=batch.start_weeks[row, index]), expected[key].start_date)
+                self.assertEqual(config.start_date + timedelta(weeks=batch.end_weeks[row, index]), expected[key].end_date)
+                self.assertEqual(slack_rows[row, column], expected_slack[key])
+
+
+class EngineSelectionTests(unittest.TestCase):
+    def test_numpy_engine_falls_back_without_numpy(self):
+        issues, dependencies, config = _random_scenario(random.Random(5), 20)
+
+        self.assertEqual(
+            schedule_issues(issues, dependencies, _with_engine(config, "numpy"))[1],
+            schedule_issues(issues, dependencies, config)[1],
+        )
+
+    def test_ci_installs_numpy_so_the_engine_tests_run(self):
+        optional = (REPO_ROOT / "requirements-optional.txt").read_text(encoding="utf8")
+
+        self.assertRegex(optional, r"(?m)^numpy==")
+        for workflow in ("verify-frontend-build.yml", "release-latest.yml"):
+            with self.subTest(workflow=workflow):
+                text = (REPO_ROOT / ".github" / "workflows" / workflow).read_text(encoding="utf8")
+                self.assertIn("-r requirements-optional.txt", text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+import unittest
+
+from backend.services import process_cache
+from backend.services.process_cache import ProcessCache, register_process_cache
+
+
+class _FakeClock:
+    def __init__(self, start=0.0):
+        self.value = float(start)
+
+    def __call__(self):
+        return self.value
+
+
+def _fixed_size(_value):
+    return 10
+
+
+class TestProcessCache(unittest.TestCase):
+    def test_behaves_like_the_legacy_cache_dict(self):
+        cache = ProcessCache('test', ttl_seconds=60, size_fn=_fixed_size)
+        cache['a'] = {'timestamp': 1, 'data': {'ok': True}}
+
+        self.assertIn('a', cache)
+        self.assertEqual(cache.get('a')['data'], {'ok': True})
+        self.assertIsNone(cache.get('missing'))
+        self.assertEqual(cache, {'a': {'timestamp': 1, 'data': {'ok': True}}})
+        cache.clear()
+        self.assertEqual(cache, {})
+        self.assertEqual(len(cache), 0)
+
+    def test_evicts_least_recently_used_entry_when_entry_budget_is_full(self):
+        cache = ProcessCache('test', ttl_seconds=60, max_entries=2, size_fn=_fixed_size)
+        cache['a'] = 1
+        cache['b'] = 2
+        cache.get('a')
+        cache['c'] = 3
+
+        self.assertEqual(sorted(cache), ['a', 'c'])
+        self.assertEqual(cache.stats()['evictions'], 1)
+
+    def test_evicts_until_byte_budget_fits_and_rejects_oversized_entries(self):
+        cache = ProcessCache('test', ttl_seconds=60, max_bytes=25, size_fn=lambda value: len(value))
+        cache['a'] = 'x' * 10
+        cache['b'] = 'y' * 10
+        cache['c'] = 'z' * 10
+
+        self.assertEqual(sorted(cache), ['b', 'c'])
+        self.assertEqual(cache.stats()['bytes'], 20)
+
+        cache['huge'] = 'h' * 100
+        self.assertNotIn('huge', cache)
+        self.assertEqual(cache.stats()['rejected'], 1)
+
+    def test_counts_hits_and_misses_against_the_ttl(self):
+        clock = _FakeClock()
+        cache = ProcessCache('test', ttl_seconds=10, clock=clock, size_fn=_fixed_size)
+        cache['a'] = 1
+
+        cache.get('a')
+        clock.value = 11
+        cache.get('a')
+        cache.get('b')
+
+        stats = cache.stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 2)
+
+    def test_sweep_drops_only_entries_older_than_ttl(self):
+        clock = _FakeClock()
+        cache = ProcessCache('test', ttl_seconds=10, clock=clock, size_fn=_fixed_size)
+        cache['old'] = 1
+        clock.value = 8
+        cache['new'] = 2
+        clock.value = 12
+
+        self.assertEqual(cache.sweep_expired(), 1)
+        self.assertEqual(list(cache), ['new'])
+        self.assertEqual(cache.stats()['expirations'], 1)
+        self.assertEqual(cache.stats()['bytes'], 10)
+
+    def test_register_applies_namespace_env_limits_over_defaults(self):
+        cache = register_process_cache(
+            'unit-test-ns',
+            ttl_seconds=5,
+            max_entries=3,
+            environ={'PROCESS_CACHE_UNIT_TEST_NS_MAX_ENTRIES': '7', 'PROCESS_CACHE_MAX_BYTES': '1234'},
+        )
+
+        self.assertEqual(cache.max_entries, 7)
+        self.assertEqual(cache.max_bytes, 1234)
+        self.assertIn('unit-test-ns', process_cache.process_cache_stats())
+
+    def test_estimate_counts_shared_objects_once(self):
+        shared = {'summary': 'x' * 1000}
+        single = process_cache.estimate_payload_bytes({'a': shared})
+        double = process_cache.estimate_payload_bytes({'a': shared, 'b': shared})
+
+        self.assertLess(double - single, 200)
+
+    def test_server_response_caches_are_bounded_process_caches(self):
+        import jira_server
+        from backend.routes import eng_routes
+
+        for name in (
+            'TASKS_CACHE',
+            'MISSING_INFO_CACHE',
+            'DEPENDENCIES_CACHE',
+            'EPIC_COHORT_CACHE',
+            'EXCLUDED_CAPACITY_STATS_SOURCE_CACHE',
+            'EXCLUDED_CAPACITY_EPIC_SUMMARY_CACHE',
+            'EPM_PROJECTS_CACHE',
+            'EPM_ISSUES_CACHE',
+            'EPM_ROLLUP_CACHE',
+        ):
+            with self.subTest(name=name):
+                self.assertIsInstance(getattr(jira_server, name), ProcessCache)
+        self.assertIsInstance(eng_routes.SUBTASKS_CACHE, ProcessCache)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -123,6 +123,7 @@ class TrackPhaseDurationRouteTests(unittest.TestCase):
         self._env_patcher.start()
         self.client = jira_server.app.test_client()
         install_oauth_session(self.client)
+        jira_server.JIRA_CHANGELOGS.clear()
 
     def tearDown(self):
         jira_server.OAUTH_TOKEN_STORE.clear()
@@ -303,6 +304,52 @@ class TrackPhaseDurationRouteTests(unittest.TestCase):
         # Dedup keeps the first (embedded) occurrence, so 'Committed' must NOT appear.
         self.assertNotIn("Committed", durations)
 
+    def test_repeat_request_extends_cached_changelog_instead_of_expanding(self):
+        first = self._issue_response(
+            'TECH-4',
+            created='2026-01-01T00:00:00.000+0000',
+            track_value='Flexible',
+            histories=[{'id': '1', 'created': '2026-01-11T00:00:00.000+0000', 'items': [
+                {'fieldId': 'customfield_35024', 'fromString': None, 'toString': 'Flexible'}]}],
+        )
+        first.json()['fields']['updated'] = '2026-01-11T00:00:00.000+0000'
+        second = FakeResponse(200, {'key': 'TECH-4', 'fields': {
+            'created': '2026-01-01T00:00:00.000+0000',
+            'summary': 'Synthetic TECH-4',
+            'updated': '2026-01-21T00:00:00.000+0000',
+            'customfield_35024': {'value': 'Committed'},
+        }})
+        new_entries = FakeResponse(200, {'isLast': True, 'values': [
+            {'id': '2', 'created': '2026-01-21T00:00:00.000+0000', 'items': [
+                {'fieldId': 'customfield_35024', 'fromString': 'Flexible', 'toString': 'Committed'}]},
+        ]})
+        responses = {'first': first}
+
+        def fake_get(path, **kwargs):
+            return new_entries if path.endswith('/changelog') else responses['first']
+
+        def post():
+            return self.client.post(
+                "/api/stats/project-track-phase-durations",
+                headers={"X-Requested-With": "jira-execution-planner"},
+                json={"epicKeys": ["TECH-4"]},
+            )
+
+        with patch.object(jira_server, "JIRA_AUTH_MODE", "atlassian_oauth"), \
+             patch.object(jira_server, "get_project_track_field_id", return_value="customfield_35024"), \
+             patch.object(jira_server, "current_jira_get", side_effect=fake_get) as mock_get:
+            self.assertEqual(post().status_code, 200)
+            responses['first'] = second
+            mock_get.reset_mock()
+            response = post()
+
+        self.assertEqual(response.status_code, 200, response.get_data(as_text=True))
+        issue_call, changelog_call = mock_get.call_args_list
+        self.assertNotIn('expand', issue_call.kwargs['params'])
+        self.assertEqual(changelog_call.kwargs['params']['startAt'], 1)
+        epic = response.get_json()['epics'][0]
+        self.assertEqual([(tx['from'], tx['to']) for tx in epic['transitions']], [(None, 'Flexible'), ('Flexible', 'Committed')])
+
     def test_route_requires_epic_keys(self):
         with patch.object(jira_server, "JIRA_AUTH_MODE", "atlassian_oauth"):
             response = self.client.post(
@@ -0,0 +1,123 @@
+import os
+import unittest
+from unittest.mock import Mock, patch
+
+import jira_server
+from backend.services.scenario_compare import compare_payload, run_scenario_builds, variant_configs
+
+
+def _jira_issue(key, team, story_points, status='To Do'):
+    return {
+        'key': key,
+        'fields': {
+            'summary': key,
+            'customfield_team': {'id': team.lower(), 'name': team},
+            'issuetype': {'name': 'Story'},
+            'customfield_10004': story_points,
+            'priority': {'name': 'Medium'},
+            'status': {'name': status},
+        },
+    }
+
+
+class RecordingPool:
+    def __init__(self):
+        self.calls = []
+
+    def map(self, fn, argument_tuples):
+        argument_tuples = list(argument_tuples)
+        self.calls.append(len(argument_tuples))
+        return [fn(*arguments) for arguments in argument_tuples]
+
+
+class ScenarioCompareServiceTests(unittest.TestCase):
+    def test_variants_override_the_base_config(self):
+        variants = variant_configs({
+            'config': {'wip_limit': 1, 'sp_to_weeks': 2, 'incremental': True},
+            'variants': [{'name': 'base'}, {'config': {'wip_limit': 3}}],
+        })
+
+        self.assertEqual(variants, [
+            ('base', {'wip_limit': 1, 'sp_to_weeks': 2}),
+            ('variant-2', {'wip_limit': 3, 'sp_to_weeks': 2}),
+        ])
+        for payload in ({}, {'variants': []}, {'variants': ['x']}, {'variants': [{'name': 'a'}, {'name': 'a'}]}):
+            with self.assertRaises(ValueError):
+                variant_configs(payload)
+
+    def test_builds_are_scheduled_together_and_resumed(self):
+        def build(label):
+            schedule = yield [], {}, label
+            return {'label': label, 'schedule': schedule}
+
+        pool = RecordingPool()
+        with patch('backend.services.scenario_compare.schedule_issues', side_effect=lambda issues, deps, config: config.upper()):
+            results = run_scenario_builds([build('a'), build('b')], pool=pool)
+
+        self.assertEqual(results, [{'label': 'a', 'schedule': 'A'}, {'label': 'b', 'schedule': 'B'}])
+        self.assertEqual(pool.calls, [2])
+
+    def test_summaries_report_end_date_deltas_against_the_first_variant(self):
+        def result(ends, late):
+            return {
+                'summary': {'deadline_met': not late, 'late_items': late, 'unschedulable': [], 'bottleneck_lanes': ['Alpha']},
+                'issues': [{'key': key, 'end': end} for key, end in ends.items()],
+            }
+
+        variants = [('base', {}), ('slow', {})]
+        payload = compare_payload(variants, [
+            result({'A-1': '2026-01-12', 'A-2': '2026-01-19'}, []),
+            result({'A-1': '2026-01-12', 'A-2': '2026-02-02'}, ['A-2']),
+        ], full=['slow'])
+
+        base, slow = payload['variants']
+        self.assertEqual(payload['baseVariant'], 'base')
+        self.assertEqual((base['endDateDeltaDays'], base['issueEndDeltaDays']), (0, {}))
+        self.assertEqual(slow['endDate'], '2026-02-02')
+        self.assertEqual(slow['endDateDeltaDays'], 14)
+        self.assertEqual(slow['issueEndDeltaDays'], {'A-2': 14})
+        self.assertFalse(slow['deadlineMet'])
+        self.assertNotIn('result', base)
+        self.assertIn('result', slow)
+
+
+class ScenarioCompareRouteTests(unittest.TestCase):
+    def setUp(self):
+        jira_server.app.config['TESTING'] = True
+        self.client = jira_server.app.test_client()
+        env = patch.dict(os.environ, {'CONFIG_STORAGE_BACKEND': '', 'DATABASE_URL': '', 'TEST_DATABASE_URL': ''})
+        env.start()
+        self.addCleanup(env.stop)
+
+    def test_jira_is_fetched_once_for_all_variants(self):
+        fetch = Mock(return_value=[_jira_issue('A-1', 'Alpha', 2), _jira_issue('A-2', 'Alpha', 2), _jira_issue('B-1', 'Beta', 1)])
+        dependencies = Mock(return_value={})
+        payload = {
+            'filters': {'sprint': '2026Q2'},
+            'config': {'start_date': '2026-01-05', 'quarter_end_date': '2026-03-30'},
+            'variants': [{'name': 'base'}, {'name': 'later', 'config': {'start_date': '2026-02-16'}}],
+            'full': True,
+        }
+        with patch.object(jira_server, 'JIRA_AUTH_MODE', 'basic'), \
+             patch.object(jira_server, 'resolve_team_field_id', return_value='customfield_team'), \
+             patch.object(jira_server, 'resolve_epic_link_field_id', return_value=None), \
+             patch.object(jira_server, 'get_story_points_field_id', return_value='customfield_10004'), \
+             patch.object(jira_server, 'fetch_issues_by_jql', fetch), \
+             patch.object(jira_server, 'collect_dependencies', dependencies), \
+             patch.object(jira_server, 'fetch_capacity_team_sizes', return_value=({}, {})):
+            response = self.client.post('/api/scenario/compare', json=payload)
+            invalid = self.client.post('/api/scenario/compare', json={'variants': []})
+
+        self.assertEqual(response.status_code, 200, response.get_data(as_text=True))
+        self.assertEqual((fetch.call_count, dependencies.call_count), (1, 1))
+        base, later = response.get_json()['variants']
+        self.assertEqual((base['name'], base['endDate'], base['deadlineMet']), ('base', '2026-03-02', True))
+        self.assertEqual((later['endDate'], later['endDateDeltaDays']), ('2026-04-13', 42))
+        self.assertEqual(later['issueEndDeltaDays'], {'A-1': 42, 'A-2': 42, 'B-1': 42})
+        self.assertEqual(later['lateItems'], ['A-2'])
+        self.assertEqual(later['result']['config']['start_date'], '2026-02-16')
+        self.assertEqual(invalid.status_code, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
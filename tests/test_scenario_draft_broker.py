@@ -0,0 +1,69 @@
+import unittest
+
+from backend.scenario_draft_broker import (
+    NOTIFY_PAYLOAD_LIMIT,
+    DraftEventBroker,
+    PostgresDraftEventBroker,
+    ScenarioDraftStreamLimit,
+    SUBSCRIPTION_QUEUE_SIZE,
+    stream_limits,
+)
+
+
+class DraftEventBrokerTests(unittest.TestCase):
+    def test_streams_are_capped_per_draft_and_per_process(self):
+        broker = DraftEventBroker()
+        limits = {'max_streams': 2, 'max_streams_per_draft': 1}
+        first = broker.subscribe('d-1', **limits)
+
+        with self.assertRaisesRegex(ScenarioDraftStreamLimit, 'this scenario draft'):
+            broker.subscribe('d-1', **limits)
+        second = broker.subscribe('d-2', **limits)
+        with self.assertRaisesRegex(ScenarioDraftStreamLimit, 'on this server'):
+            broker.subscribe('d-3', **limits)
+
+        second.close()
+        second.close()
+        broker.subscribe('d-3', **limits)
+        self.assertEqual(broker.stream_count('d-1'), 1)
+        first.close()
+        self.assertEqual(broker.stream_count('d-1'), 0)
+
+    def test_committed_messages_reach_only_the_drafts_streams(self):
+        broker = DraftEventBroker()
+        limits = stream_limits({})
+        watching = broker.subscribe('d-1', **limits)
+        other = broker.subscribe('d-2', **limits)
+
+        broker.publish_committed([('d-1', {'kind': 'event', 'eventNumber': 1})])
+        for number in range(SUBSCRIPTION_QUEUE_SIZE + 1):
+            broker.deliver('d-2', {'kind': 'event', 'eventNumber': number})
+
+        self.assertEqual(watching.get(0), {'kind': 'event', 'eventNumber': 1})
+        self.assertIsNone(watching.get(0))
+        self.assertFalse(watching.lagged)
+        self.assertTrue(other.lagged)
+        self.assertEqual(limits, {'max_streams': 4, 'max_streams_per_draft': 10})
+
+    def test_postgres_notifications_drop_event_bodies_over_the_payload_limit(self):
+        broker = PostgresDraftEventBroker('postgresql+psycopg://planner@db/planner')
+        payloads = []
+        broker.deliver = lambda draft_id, message: payloads.append((draft_id, message))
+        big = {'kind': 'event', 'eventNumber': 7, 'event': {'payload': 'x' * NOTIFY_PAYLOAD_LIMIT}}
+
+        class Session:
+            def execute(self, statement):
+                channel, payload = statement.compile().params.values()
+                broker._dispatch(payload)
+
+        self.assertTrue(broker.notify_in_transaction(Session(), [('d-1', {'kind': 'event', 'eventNumber': 6, 'event': {}}), ('d-1', big)]))
+        broker.publish_committed([('d-1', big)])
+
+        self.assertEqual(payloads, [
+            ('d-1', {'kind': 'event', 'eventNumber': 6, 'event': {}}),
+            ('d-1', {'kind': 'event', 'eventNumber': 7}),
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,8 @@
+import io
 import os
 import tempfile
 import unittest
-from contextlib import ExitStack
+from contextlib import ExitStack, redirect_stdout
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from types import SimpleNamespace
@@ -13,6 +14,7 @@ from sqlalchemy import create_engine, inspect
 from sqlalchemy.exc import IntegrityError
 
 from backend import scenario_drafts
+from backend.admin import compact_scenario_draft_events
 from backend.db import engine as db_engine
 from backend.db import models
 from backend.scenario_drafts import (
@@ -20,9 +22,15 @@ from backend.scenario_drafts import (
     acquire_lock,
     append_event,
     block_writeback,
+    compact_events,
+    compact_stale_events,
+    flush_presence,
     get_active_presence,
     get_events_after,
+    get_events_page,
+    join_events,
     preview_writeback,
+    record_presence,
     reload_from_jira,
     rollback_to_version,
     save_draft,
@@ -144,6 +152,7 @@ class ScenarioDraftCollaborationServiceTests(unittest.TestCase):
         self.draft_id = self._seed_draft()
 
     def tearDown(self):
+        scenario_drafts.PRESENCE_REGISTRY.clear()
         db_engine.dispose_engines()
         self._tmpdir.cleanup()
 
@@ -232,6 +241,79 @@ class ScenarioDraftCollaborationServiceTests(unittest.TestCase):
             with self.assertRaises(IntegrityError):
                 session.commit()
 
+    def test_compaction_prunes_old_events_and_joins_from_snapshot(self):
+        for index in range(3):
+            append_event(self.context, self.draft_id, event_type='issue_move', draft_revision=3, payload={'n': index})
+        acquire_lock(
+            self.context,
+            self.draft_id,
+            resource_type='issue',
+            resource_id='ENG-1',
+            holder_display_name='First User',
+        )
+        with self.factory() as session:
+            session.query(models.ScenarioDraftEvent).filter(models.ScenarioDraftEvent.event_number < 3).update(
+                {'created_at': datetime.now(timezone.utc) - timedelta(days=2)}
+            )
+            updated_at = session.get(models.ScenarioDraft, self.draft_id).updated_at
+            session.commit()
+
+        self.assertEqual(compact_events(self.context, self.draft_id), 2)
+        self.assertEqual(compact_events(self.context, self.draft_id), 0)
+
+        with self.factory() as session:
+            draft = session.get(models.ScenarioDraft, self.draft_id)
+            self.assertEqual(draft.compacted_event_number, 2)
+            self.assertEqual(draft.updated_at, updated_at)
+        joined = get_events_page(self.context, self.draft_id, since_event_number=0)
+        self.assertEqual(joined['snapshot']['eventNumber'], 3)
+        self.assertEqual(joined['snapshot']['activeDraft']['draftRevision'], 3)
+        self.assertEqual([lock['resourceId'] for lock in joined['snapshot']['locks']], ['ENG-1'])
+        self.assertEqual((joined['events'], joined['nextSince'], joined['isLast']), ([], 3, True))
+        caught_up = get_events_page(self.context, self.draft_id, since_event_number=2)
+        self.assertNotIn('snapshot', caught_up)
+        self.assertEqual([event['eventNumber'] for event in caught_up['events']], [3])
+
+        event = append_event(self.context, self.draft_id, event_type='issue_move', draft_revision=3, payload={})
+        joined = join_events(self.context, self.draft_id)
+        self.assertEqual(joined['snapshot']['eventNumber'], 4)
+        self.assertEqual(event['eventNumber'], 4)
+
+    def test_admin_sweep_compacts_quiet_drafts(self):
+        for index in range(2):
+            append_event(self.context, self.draft_id, event_type='issue_move', draft_revision=3, payload={'n': index})
+        with self.factory() as session:
+            session.query(models.ScenarioDraftEvent).filter(models.ScenarioDraftEvent.event_number == 1).update(
+                {'created_at': datetime.now(timezone.utc) - timedelta(days=2)}
+            )
+            session.commit()
+
+        self.assertEqual(
+            compact_stale_events(SimpleNamespace(workspace_id='other-workspace', database_url=self.database_url)),
+            {},
+        )
+        output = io.StringIO()
+        with redirect_stdout(output):
+            self.assertEqual(compact_scenario_draft_events.main(['--database-url', self.database_url]), 0)
+
+        self.assertEqual(output.getvalue().strip(), 'Compacted 1 events across 1 scenario drafts')
+        self.assertEqual(compact_stale_events(self.context), {})
+        with self.factory() as session:
+            self.assertEqual(session.get(models.ScenarioDraft, self.draft_id).compacted_event_number, 1)
+
+    def test_writers_compact_every_interval_without_reusing_event_numbers(self):
+        context = SimpleNamespace(**vars(self.context), environ={'SCENARIO_DRAFT_EVENT_RETENTION_HOURS': '0'})
+
+        with patch.object(scenario_drafts, 'EVENT_COMPACTION_INTERVAL', 3):
+            numbers = [
+                append_event(context, self.draft_id, event_type='issue_move', draft_revision=3, payload={})['eventNumber']
+                for _ in range(4)
+            ]
+
+        self.assertEqual(numbers, [1, 2, 3, 4])
+        self.assertEqual([event['eventNumber'] for event in get_events_after(context, self.draft_id, after_event_number=0)], [4])
+        self.assertEqual(get_events_page(context, self.draft_id, since_event_number=1)['snapshot']['eventNumber'], 4)
+
     def test_append_event_ignores_spoofed_draft_revision(self):
         saved = save_draft(self.context, 'scope-event-spoof', 'Event spoof', {})
         draft_id = saved['activeDraft']['draftId']
@@ -383,14 +465,63 @@ class ScenarioDraftCollaborationServiceTests(unittest.TestCase):
         self.assertEqual(active[0]['userId'], self.user_id)
         self.assertEqual(active[0]['mode'], 'editing')
 
+        self.assertEqual(flush_presence(), 1)
         with self.factory() as session:
-            self.assertEqual(
-                session.query(models.ScenarioDraftPresence).filter_by(
-                    scenario_draft_id=self.draft_id,
-                    user_id=self.user_id,
-                ).count(),
-                1,
-            )
+            rows = session.query(models.ScenarioDraftPresence).filter_by(
+                scenario_draft_id=self.draft_id,
+                user_id=self.user_id,
+            ).all()
+            self.assertEqual([(row.mode, row.cursor_payload) for row in rows], [('editing', {'issueKey': 'ENG-2'})])
+
+    def test_presence_heartbeats_and_reads_stay_in_memory_until_flushed(self):
+        now = datetime(2026, 5, 19, 12, 0, tzinfo=timezone.utc)
+        upsert_presence(self.context, self.draft_id, display_name='First User', cursor_payload={}, mode='viewing', now=now)
+        get_active_presence(self.context, self.draft_id, now=now)
+
+        with patch('backend.scenario_drafts.db_engine.session_scope', side_effect=AssertionError('database used')):
+            for second in range(1, 6):
+                upsert_presence(
+                    self.context,
+                    self.draft_id,
+                    display_name='First User',
+                    cursor_payload={},
+                    mode='viewing',
+                    now=now + timedelta(seconds=second),
+                )
+            active = get_active_presence(self.context, self.draft_id, now=now + timedelta(seconds=32))
+
+        self.assertEqual([item['lastSeenAt'] for item in active], [(now + timedelta(seconds=5)).isoformat()])
+        with self.factory() as session:
+            self.assertEqual(session.query(models.ScenarioDraftPresence).one().last_seen_at.replace(tzinfo=timezone.utc), now)
+        self.assertEqual(flush_presence(), 1)
+        self.assertEqual(flush_presence(), 0)
+        with self.factory() as session:
+            self.assertEqual(session.query(models.ScenarioDraftPresence).one().last_seen_at.replace(tzinfo=timezone.utc), now + timedelta(seconds=5))
+        with self.assertRaises(scenario_drafts.ScenarioDraftNotFound):
+            get_active_presence(SimpleNamespace(workspace_id='other-workspace', database_url=self.database_url), self.draft_id)
+
+    def test_record_presence_reports_joins_and_mode_or_cursor_changes(self):
+        now = datetime(2026, 5, 19, 12, 0, tzinfo=timezone.utc)
+
+        def beat(seconds, mode='viewing', cursor=None):
+            return record_presence(
+                self.context,
+                self.draft_id,
+                display_name='First User',
+                cursor_payload=cursor or {},
+                mode=mode,
+                now=now + timedelta(seconds=seconds),
+            )[1]
+
+        self.assertTrue(beat(0))
+        self.assertFalse(beat(5))
+        self.assertTrue(beat(10, cursor={'issueKey': 'ENG-1'}))
+        self.assertTrue(beat(15, mode='editing', cursor={'issueKey': 'ENG-1'}))
+        flush_presence()
+        # A write-through heartbeat with nothing in memory compares with the stored row.
+        scenario_drafts.PRESENCE_REGISTRY.clear()
+        self.assertFalse(beat(20, mode='editing', cursor={'issueKey': 'ENG-1'}))
+        self.assertTrue(beat(60, mode='editing', cursor={'issueKey': 'ENG-1'}))
 
     def test_presence_rows_at_exact_ttl_boundary_are_expired(self):
         now = datetime(2026, 5, 19, 12, 0, tzinfo=timezone.utc)
@@ -418,6 +549,8 @@ class ScenarioDraftCollaborationServiceTests(unittest.TestCase):
             now=now,
         )
 
+        # Forget the first heartbeat so the second one writes through and meets the race.
+        scenario_drafts.PRESENCE_REGISTRY.clear()
         original_presence_for_user = scenario_drafts._presence_for_user
         calls = []
 
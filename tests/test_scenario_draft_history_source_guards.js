@@ -8,6 +8,7 @@ const repoRoot = path.join(__dirname, '..');
 const frontendSrcPath = path.join(repoRoot, 'frontend', 'src');
 const dashboardPath = path.join(frontendSrcPath, 'dashboard.jsx');
 const scenarioApiPath = path.join(frontendSrcPath, 'api', 'scenarioApi.js');
+const scenarioDraftEventStreamPath = path.join(frontendSrcPath, 'scenario', 'useScenarioDraftEventStream.js');
 const legacyScenarioOverridesRoute = ['/api', 'scenario', 'overrides'].join('/');
 
 function listSourceFiles(root) {
@@ -48,7 +49,7 @@ test('frontend source has no legacy scenario overrides route strings', () => {
 test('scenario draft polling helper returns data without mutating realtime state', () => {
     const dashboardSource = readSource(dashboardPath);
     const helperMatch = dashboardSource.match(/const pollScenarioDraftEvents = [\s\S]*?requestScenarioDraftEvents[\s\S]*?;\n\n\s*const saveScenarioDraftVersion/);
-    const pollingEffectMatch = dashboardSource.match(/React\.useEffect\(\(\) => \{\n\s*if \(!scenarioActiveDraftReady\)[\s\S]*?window\.setInterval\(poll, 5000\);[\s\S]*?\n\s*\}, \[scenarioActiveDraftReady, scenarioActiveDraftId, scenarioScopeKey, scenarioDraftLastEventNumber\]\);/);
+    const pollingEffectMatch = dashboardSource.match(/React\.useEffect\(\(\) => \{\n\s*if \(!scenarioActiveDraftReady\)[\s\S]*?window\.setInterval\(poll, 5000\);[\s\S]*?\n\s*\}, \[scenarioActiveDraftReady, scenarioActiveDraftId, scenarioScopeKey, scenarioDraftLastEventNumber, scenarioDraftStreamOpen\]\);/);
 
     assert.ok(helperMatch, 'Expected pollScenarioDraftEvents helper to exist.');
     assert.ok(pollingEffectMatch, 'Expected scenario draft polling effect to exist.');
@@ -120,6 +121,9 @@ test('dirty scenario draft reruns are blocked before loading new scenario data',
     const dirtyGuardIndex = dashboardSource.indexOf('if (scenarioHasUnsavedChanges) {');
     const scenarioFetchIndex = dashboardSource.indexOf('requestScenarioRun(BACKEND_URL, buildScenarioPayload(),');
     const setScenarioDataIndex = dashboardSource.indexOf('setScenarioData(data);');
+    const payloadBuilder = dashboardSource.slice(dashboardSource.indexOf('const buildScenarioPayload = () => {'), scenarioFetchIndex);
+
+    assert.doesNotMatch(payloadBuilder, /refresh:/, 'Scenario runs must use the server result cache; its digest already tracks Jira updates.');
 
     assert.ok(dirtyGuardIndex > -1, 'Expected runScenario to guard any dirty draft changes with derived dirty state.');
     assert.ok(scenarioFetchIndex > -1, 'Expected runScenario scenario fetch to exist.');
@@ -432,3 +436,30 @@ test('history reload and rollback use inline dialog controls and guarded rollbac
     assert.ok(rollbackHelperSource.includes('targetVersionNumber,'), 'Rollback payload must send targetVersionNumber.');
     assert.ok(rollbackHelperSource.includes('baseDraftRevision'), 'Rollback payload must send baseDraftRevision.');
 });
+
+test('scenario draft event stream stays open per draft and replaces polling while healthy', () => {
+    const dashboardSource = readSource(dashboardPath);
+    const streamSource = readSource(scenarioDraftEventStreamPath);
+    const streamStart = streamSource.indexOf('new window.EventSource(');
+    const streamEffectStart = streamSource.lastIndexOf('React.useEffect(', streamStart);
+    const streamEffect = streamSource.slice(streamEffectStart, streamSource.indexOf(']);', streamStart) + 3);
+    const hookCall = dashboardSource.indexOf('useScenarioDraftEventStream({');
+    const pollStart = dashboardSource.indexOf('pollScenarioDraftEvents(expectedDraftId,');
+    const pollEffect = dashboardSource.slice(dashboardSource.lastIndexOf('React.useEffect(', pollStart), dashboardSource.indexOf(']);', pollStart) + 3);
+
+    assert.ok(streamEffectStart > -1 && pollStart > -1, 'Expected the draft event stream and polling effects to exist.');
+    assert.ok(hookCall > -1 && hookCall < pollStart, 'The stream hook must run before the polling effect reads its open state.');
+    assert.equal(
+        streamEffect.slice(streamEffect.lastIndexOf('}, [')).includes('lastEventNumber'),
+        false,
+        'New events must not reopen the stream; the browser resumes it with Last-Event-ID.',
+    );
+    assert.ok(streamEffect.includes('lastEventNumberRef.current'), 'The stream must open from the latest event number without depending on it.');
+    assert.ok(dashboardSource.includes('lastEventNumberRef: scenarioDraftLastEventNumberRef,'), 'The dashboard must pass its latest event number ref to the stream.');
+    assert.ok(streamEffect.includes("addEventListener('presence.heartbeat'"), 'Stream presence frames must update presence.');
+    assert.ok(streamEffect.includes("addEventListener('draft.snapshot'"), 'Stream snapshot frames must replace draft state.');
+    assert.ok(streamEffect.includes('window.EventSource.CLOSED'), 'Only a stream the browser gave up on may be reopened by the client.');
+    assert.equal(streamEffect.includes('source.close();\n            }\n        };\n        return'), false, 'onerror must not close a reconnecting stream.');
+    assert.ok(pollEffect.includes('if (scenarioDraftStreamOpen) return undefined;'), 'Polling must stop while the stream is open.');
+    assert.ok(pollEffect.includes('setScenarioDraftStreamAvailable(data.streamAvailable);'), 'Polling must learn whether the server offers the stream.');
+});
@@ -0,0 +1,90 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from backend.scenario_draft_presence import PresenceRegistry
+
+
+NOW = datetime(2026, 5, 19, 12, 0, tzinfo=timezone.utc)
+SCOPE = ('sqlite://', 'workspace-1')
+
+
+class FakeClock:
+    def __init__(self):
+        self.value = 100.0
+
+    def __call__(self):
+        return self.value
+
+
+def _presence(user_id, seconds, mode='viewing'):
+    return {
+        'presenceId': f'p-{user_id}',
+        'userId': user_id,
+        'displayName': user_id,
+        'cursorPayload': {},
+        'mode': mode,
+        'lastSeenAt': (NOW + timedelta(seconds=seconds)).isoformat(),
+    }
+
+
+class PresenceRegistryTests(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.writes = []
+        self.failing = False
+        self.registry = PresenceRegistry(self._write, ttl_seconds=30, flush_interval=0, clock=self.clock)
+
+    def _write(self, database_url, rows):
+        if self.failing:
+            raise RuntimeError('database unavailable')
+        self.writes.append((database_url, sorted((presence['userId'], seen) for presence, seen in rows)))
+
+    def _heartbeat(self, user_id, seconds, mode='viewing'):
+        return self.registry.heartbeat(
+            SCOPE, 'd-1', user_id,
+            display_name=user_id, cursor_payload={}, mode=mode,
+            last_seen_at=NOW + timedelta(seconds=seconds),
+        )
+
+    def test_heartbeats_write_through_until_verified_and_again_after_verify_window(self):
+        self.assertIsNone(self._heartbeat('u-1', 0))
+        self.registry.remember(SCOPE, 'd-1', _presence('u-1', 0), NOW)
+
+        self.assertEqual(self._heartbeat('u-1', 5, mode='editing')['mode'], 'editing')
+        self.clock.value += 30
+        self.assertIsNone(self._heartbeat('u-1', 35))
+
+    def test_flush_batches_dirty_rows_and_retries_failures(self):
+        for user_id in ('u-1', 'u-2'):
+            self.registry.remember(SCOPE, 'd-1', _presence(user_id, 0), NOW)
+            self._heartbeat(user_id, 5)
+
+        self.failing = True
+        with self.assertLogs('backend.scenario_draft_presence', level='WARNING'):
+            self.assertEqual(self.registry.flush(), 0)
+        self._heartbeat('u-1', 6)
+        self.failing = False
+
+        self.assertEqual(self.registry.flush(), 2)
+        self.assertEqual(self.writes, [('sqlite://', [('u-1', NOW + timedelta(seconds=6)), ('u-2', NOW + timedelta(seconds=5))])])
+        self.assertEqual(self.registry.flush(), 0)
+
+    def test_reads_reload_after_the_refresh_window_and_keep_newer_local_rows(self):
+        self.assertIsNone(self.registry.active(SCOPE, 'd-1', NOW))
+        self.registry.remember(SCOPE, 'd-1', _presence('u-1', 0), NOW)
+        self._heartbeat('u-1', 10, mode='editing')
+
+        loaded = self.registry.load(SCOPE, 'd-1', [(_presence('u-1', 0), NOW), (_presence('u-2', 8), NOW + timedelta(seconds=8))], NOW)
+
+        self.assertEqual([(item['userId'], item['mode']) for item in loaded], [('u-1', 'editing'), ('u-2', 'viewing')])
+        self.assertEqual(len(self.registry.active(SCOPE, 'd-1', NOW + timedelta(seconds=9))), 1)
+        self.clock.value += 5
+        self.assertIsNone(self.registry.active(SCOPE, 'd-1', NOW))
+
+        self.registry.flush()
+        self.registry.forget_expired(NOW + timedelta(seconds=10))
+        self.assertIsNone(self._heartbeat('u-1', 11))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
 import os
+import queue
 import tempfile
 import threading
 import time
@@ -12,7 +13,8 @@ from backend.auth.context import RequestAuthContext
 from backend.auth.csrf import issue_csrf_token
 from backend.db import engine as db_engine
 from backend.db import models
-from backend.scenario_drafts import acquire_lock, append_event, save_draft
+from backend import scenario_drafts
+from backend.scenario_drafts import acquire_lock, append_event, compact_events, save_draft
 import jira_server
 
 
@@ -23,6 +25,39 @@ FULL_SCOPE = (
 )
 
 
+class _StreamReader:
+    def __init__(self, client, path, headers):
+        self.frames = queue.Queue()
+        self.opened = threading.Event()
+        self.stopped = threading.Event()
+        self.response = None
+        self._thread = threading.Thread(target=self._run, args=(client, path, headers), daemon=True)
+        self._thread.start()
+
+    def _run(self, client, path, headers):
+        self.response = client.get(path, headers=headers or {}, buffered=False)
+        self.opened.set()
+        try:
+            for chunk in self.response.response:
+                self.frames.put(chunk.decode() if isinstance(chunk, bytes) else chunk)
+                if self.stopped.is_set():
+                    break
+        finally:
+            self.response.close()
+
+    def read(self, count):
+        frames = []
+        while len(frames) < count:
+            frame = self.frames.get(timeout=5)
+            if not frame.startswith(': heartbeat'):
+                frames.append(frame)
+        return frames
+
+    def stop(self):
+        self.stopped.set()
+        self._thread.join(5)
+
+
 class ScenarioDraftRouteTests(unittest.TestCase):
     def setUp(self):
         jira_server.app.config['TESTING'] = True
@@ -47,6 +82,7 @@ class ScenarioDraftRouteTests(unittest.TestCase):
         self._install_session('session-1', 'account-1', self.connection_id)
 
     def tearDown(self):
+        scenario_drafts.PRESENCE_REGISTRY.clear()
         db_engine.dispose_engines()
         jira_server.OAUTH_TOKEN_STORE.clear()
         jira_server.OAUTH_REFRESH_LOCKS.clear()
@@ -326,6 +362,24 @@ class ScenarioDraftRouteTests(unittest.TestCase):
         self.assertEqual(response.get_json()['overrides'], {'ENG-1': {'end': '2026-05-21'}})
         self.assertEqual(response.get_json()['versionNumber'], 1)
 
+    def test_list_versions_pages_metadata(self):
+        saved = save_draft(self.context, 'scope-version-list', 'Versions', {'ENG-1': {'end': '2026-05-21'}})
+        draft_id = saved['activeDraft']['draftId']
+        save_draft(self.context, 'scope-version-list', 'Versions 2', {'ENG-1': {'end': '2026-05-22'}}, base_draft_revision=1)
+
+        with self._env_patch(), patch.object(jira_server, 'JIRA_AUTH_MODE', 'atlassian_oauth'), self._route_patch():
+            newest = self.client.get(f'/api/scenario/drafts/{draft_id}/versions?limit=1')
+            older = self.client.get(f'/api/scenario/drafts/{draft_id}/versions?before=2')
+            invalid = self.client.get(f'/api/scenario/drafts/{draft_id}/versions?before=x')
+
+        self.assertEqual(newest.status_code, 200, newest.get_data(as_text=True))
+        self.assertEqual([version['versionNumber'] for version in newest.get_json()['versions']], [2])
+        self.assertEqual(newest.get_json()['nextBefore'], 2)
+        self.assertNotIn('overrides', newest.get_json()['versions'][0])
+        self.assertEqual([version['versionNumber'] for version in older.get_json()['versions']], [1])
+        self.assertTrue(older.get_json()['isLast'])
+        self.assertEqual(invalid.status_code, 400)
+
     def test_get_version_rejects_other_workspace_draft(self):
         saved = save_draft(self.other_context, 'scope-other', 'Other', {})
         with self._env_patch(), patch.object(jira_server, 'JIRA_AUTH_MODE', 'atlassian_oauth'), self._route_patch():
@@ -496,6 +550,13 @@ class ScenarioDraftRouteTests(unittest.TestCase):
         self.assertEqual(body['events'], [])
         self.assertEqual(body['nextSince'], 1)
         self.assertTrue(body['isLast'])
+        self.assertFalse(body['streamAvailable'])
+
+        with self._env_patch(), patch.dict(os.environ, {'SCENARIO_DRAFT_SSE_ENABLED': 'true'}), \
+             patch.object(jira_server, 'JIRA_AUTH_MODE', 'atlassian_oauth'), self._route_patch():
+            advertised = self.client.get(f'/api/scenario/drafts/{draft_id}/events?since=1')
+
+        self.assertTrue(advertised.get_json()['streamAvailable'])
 
     def test_sse_route_is_disabled_by_default_and_available_when_enabled(self):
         saved = save_draft(self.context, 'scope-sse', 'SSE', {})
@@ -504,15 +565,75 @@ class ScenarioDraftRouteTests(unittest.TestCase):
 
         with self._env_patch(), patch.object(jira_server, 'JIRA_AUTH_MODE', 'atlassian_oauth'), self._route_patch():
             disabled = self.client.get(f'/api/scenario/drafts/{draft_id}/events/stream?since=0')
-        with self._env_patch(), patch.dict(os.environ, {'SCENARIO_DRAFT_SSE_ENABLED': 'true'}, clear=False), \
+        with self._env_patch(), patch.dict(os.environ, self._sse_env(), clear=False), \
              patch.object(jira_server, 'JIRA_AUTH_MODE', 'atlassian_oauth'), self._route_patch():
-            enabled = self.client.get(f'/api/scenario/drafts/{draft_id}/events/stream?since=0')
+            enabled = self._open_stream(f'/api/scenario/drafts/{draft_id}/events/stream?since=0')
+            frames = enabled.read(3)
+            enabled.stop()
 
         self.assertEqual(disabled.status_code, 404)
         self.assertEqual(disabled.get_json()['error'], 'scenario_draft_sse_disabled')
-        self.assertEqual(enabled.status_code, 200, enabled.get_data(as_text=True))
-        self.assertIn('text/event-stream', enabled.content_type)
-        self.assertIn('event: test.event', enabled.get_data(as_text=True))
+        self.assertEqual(enabled.response.status_code, 200)
+        self.assertIn('text/event-stream', enabled.response.content_type)
+        self.assertTrue(frames[0].startswith('retry: '))
+        self.assertIn('event: draft.saved', frames[1])
+        self.assertIn('event: test.event', frames[2])
+
+    def test_sse_stream_pushes_new_events_and_resumes_from_last_event_id(self):
+        saved = save_draft(self.context, 'scope-sse-live', 'SSE', {})
+        draft_id = saved['activeDraft']['draftId']
+        path = f'/api/scenario/drafts/{draft_id}/events/stream'
+
+        with self._env_patch(), patch.dict(os.environ, self._sse_env(SCENARIO_DRAFT_SSE_MAX_STREAMS_PER_DRAFT='1'), clear=False), \
+             patch.object(jira_server, 'JIRA_AUTH_MODE', 'atlassian_oauth'), self._route_patch():
+            live = self._open_stream(path, headers={'Last-Event-ID': '1'})
+            live.read(1)
+            over_cap = self.client.get(path)
+            append_event(self.context, draft_id, event_type='test.live', draft_revision=1, payload={'n': 2})
+            pushed = live.read(1)
+            live.stop()
+            append_event(self.context, draft_id, event_type='test.missed', draft_revision=1, payload={'n': 3})
+            resumed = self._open_stream(path, headers={'Last-Event-ID': '2'})
+            replayed = resumed.read(2)
+            resumed.stop()
+
+        self.assertEqual(over_cap.status_code, 429)
+        self.assertEqual(over_cap.get_json()['error'], 'scenario_draft_stream_limit')
+        self.assertTrue(pushed[0].startswith('id: 2\nevent: test.live\n'))
+        self.assertTrue(replayed[1].startswith('id: 3\nevent: test.missed\n'))
+
+    def test_join_and_stream_start_from_snapshot_after_compaction(self):
+        saved = save_draft(self.context, 'scope-join', 'Join', {'ENG-1': {'start': '2026-05-18'}})
+        draft_id = saved['activeDraft']['draftId']
+        append_event(self.context, draft_id, event_type='test.old', draft_revision=1, payload={})
+        compact_events(self.context, draft_id, now=datetime.now(timezone.utc) + timedelta(days=2))
+        append_event(self.context, draft_id, event_type='test.new', draft_revision=1, payload={})
+
+        with self._env_patch(), patch.dict(os.environ, self._sse_env(), clear=False), \
+             patch.object(jira_server, 'JIRA_AUTH_MODE', 'atlassian_oauth'), self._route_patch():
+            joined = self.client.get(f'/api/scenario/drafts/{draft_id}/events/join')
+            stream = self._open_stream(f'/api/scenario/drafts/{draft_id}/events/stream', headers={'Last-Event-ID': '1'})
+            frames = stream.read(2)
+            append_event(self.context, draft_id, event_type='test.live', draft_revision=1, payload={})
+            frames += stream.read(1)
+            stream.stop()
+
+        self.assertEqual(joined.status_code, 200, joined.get_data(as_text=True))
+        body = joined.get_json()
+        self.assertEqual(body['snapshot']['eventNumber'], 3)
+        self.assertEqual(body['snapshot']['activeDraft']['overrides'], {'ENG-1': {'start': '2026-05-18'}})
+        self.assertEqual((body['events'], body['nextSince']), ([], 3))
+        self.assertTrue(frames[1].startswith('id: 3\nevent: draft.snapshot\n'))
+        self.assertTrue(frames[2].startswith('id: 4\nevent: test.live\n'))
+
+    def _sse_env(self, **extra):
+        return {'SCENARIO_DRAFT_SSE_ENABLED': 'true', 'SCENARIO_DRAFT_SSE_HEARTBEAT_SECONDS': '1', **extra}
+
+    def _open_stream(self, path, headers=None):
+        # Each stream runs on its own thread, as it would under a threaded server.
+        stream = _StreamReader(self.client, path, headers)
+        self.assertTrue(stream.opened.wait(5), 'stream did not open')
+        return stream
 
     def test_presence_requires_csrf_and_emits_event_without_revision_change(self):
         saved = save_draft(self.context, 'scope-presence', 'Presence', {})
@@ -533,6 +654,26 @@ class ScenarioDraftRouteTests(unittest.TestCase):
         self.assertEqual(events.get_json()['events'][-1]['eventType'], 'presence.updated')
         self.assertEqual(save_draft(self.context, 'scope-presence', 'Presence 2', {}, base_draft_revision=1)['activeDraft']['draftRevision'], 2)
 
+    def test_presence_heartbeats_only_log_events_when_mode_or_cursor_changes(self):
+        saved = save_draft(self.context, 'scope-presence-quiet', 'Presence', {})
+        draft_id = saved['activeDraft']['draftId']
+        url = f'/api/scenario/drafts/{draft_id}/presence'
+
+        with self._env_patch(), patch.object(jira_server, 'JIRA_AUTH_MODE', 'atlassian_oauth'), self._route_patch():
+            joined = self.client.post(url, json={'cursorPayload': {}, 'mode': 'viewing'}, headers=self._csrf_headers())
+            heartbeat = self.client.post(url, json={'cursorPayload': {}, 'mode': 'viewing'}, headers=self._csrf_headers())
+            editing = self.client.post(url, json={'cursorPayload': {}, 'mode': 'editing'}, headers=self._csrf_headers())
+            events = self.client.get(f'/api/scenario/drafts/{draft_id}/events?since=0')
+
+        self.assertIn('event', joined.get_json())
+        self.assertNotIn('event', heartbeat.get_json())
+        self.assertEqual([item['mode'] for item in heartbeat.get_json()['activePresence']], ['viewing'])
+        self.assertEqual(editing.get_json()['event']['payload']['presence']['mode'], 'editing')
+        self.assertEqual(
+            [event['eventType'] for event in events.get_json()['events']],
+            ['draft.saved', 'presence.updated', 'presence.updated'],
+        )
+
     def test_presence_ignores_spoofed_display_name_and_draft_revision(self):
         saved = save_draft(self.context, 'scope-presence-spoof', 'Presence', {})
         draft_id = saved['activeDraft']['draftId']
@@ -1,3 +1,4 @@
+import json
 import os
 from types import SimpleNamespace
 import tempfile
@@ -8,7 +9,7 @@ from unittest.mock import patch
 
 from alembic import command
 from alembic.config import Config
-from sqlalchemy import create_engine, event, inspect
+from sqlalchemy import create_engine, event, inspect, text
 from sqlalchemy.exc import IntegrityError
 
 from backend.auth.context import RequestAuthContext
@@ -20,6 +21,7 @@ from backend.scenario_drafts import (
     ScenarioDraftValidationError,
     get_active_draft,
     get_version,
+    list_versions,
     rollback_to_version,
     save_draft,
     scenario_source_hash,
@@ -102,6 +104,51 @@ class ScenarioDraftMigrationTests(unittest.TestCase):
                 engine.dispose()
 
 
+    def test_version_delta_migration_restores_full_overrides_on_downgrade(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            database_url = f"sqlite+pysqlite:///{os.path.join(tmpdir, 'scenario-draft-deltas-migration.db')}"
+            config = migration_config(database_url)
+            command.upgrade(config, 'head')
+            engine = create_engine(database_url, future=True)
+            insert = text(
+                "insert into scenario_draft_versions "
+                "(id, scenario_draft_id, version_number, draft_revision, name, scope_payload, overrides, "
+                "is_checkpoint, overrides_delta, override_count, created_at, source) "
+                "values (:id, 'draft-1', :number, :number, 'Draft', '{}', :overrides, :checkpoint, :delta, 1, "
+                "'2026-10-17 00:00:00', 'user')"
+            )
+            try:
+                with engine.begin() as connection:
+                    connection.execute(insert, [
+                        {'id': 'v1', 'number': 1, 'overrides': '{"ENG-1": {"start": "2026-05-18"}}', 'checkpoint': True, 'delta': None},
+                        {
+                            'id': 'v2',
+                            'number': 2,
+                            'overrides': '{}',
+                            'checkpoint': False,
+                            'delta': '[{"op": "replace", "path": "/ENG-1", "value": {"start": "2026-05-19"}}]',
+                        },
+                    ])
+            finally:
+                engine.dispose()
+
+            command.downgrade(config, '20261017_0007')
+            engine = create_engine(database_url, future=True)
+            try:
+                with engine.connect() as connection:
+                    rows = connection.execute(
+                        text('select overrides from scenario_draft_versions order by version_number')
+                    ).scalars().all()
+                version_columns = {column['name'] for column in inspect(engine).get_columns('scenario_draft_versions')}
+            finally:
+                engine.dispose()
+            self.assertEqual(
+                [json.loads(row) for row in rows],
+                [{'ENG-1': {'start': '2026-05-18'}}, {'ENG-1': {'start': '2026-05-19'}}],
+            )
+            self.assertNotIn('overrides_delta', version_columns)
+
+
 class ScenarioDraftModelTests(unittest.TestCase):
     def setUp(self):
         self._tmpdir = tempfile.TemporaryDirectory()
@@ -569,6 +616,74 @@ class ScenarioDraftServiceTests(unittest.TestCase):
         self.assertEqual(rolled_back['versions'][2]['source'], 'rollback')
         self.assertEqual(rolled_back['versions'][2]['changeNote'], 'rollback to version 1')
 
+    def test_versions_store_checkpoints_and_deltas_and_replay_on_demand(self):
+        overrides = {f'ENG-{index}': {'start': '2026-05-18'} for index in range(1, 6)}
+        expected = {}
+        saved = save_draft(self.context, 'scope-deltas', 'Deltas', overrides)
+        expected[1] = dict(overrides)
+        for revision in range(1, 25):
+            overrides = dict(overrides, **{f'ENG-{revision % 5 + 1}': {'start': f'2026-06-{revision:02d}'}})
+            if revision == 10:
+                overrides.pop('ENG-5')
+            saved = save_draft(self.context, 'scope-deltas', 'Deltas', overrides, base_draft_revision=revision)
+            expected[revision + 1] = dict(overrides)
+        draft_id = saved['activeDraft']['draftId']
+
+        with self.factory() as session:
+            rows = session.query(models.ScenarioDraftVersion).filter_by(scenario_draft_id=draft_id).order_by(
+                models.ScenarioDraftVersion.version_number
+            ).all()
+            checkpoints = [row.version_number for row in rows if row.is_checkpoint]
+            delta_row = rows[1]
+            self.assertEqual(checkpoints, [1, 21])
+            self.assertEqual(delta_row.overrides, {})
+            self.assertEqual(
+                delta_row.overrides_delta,
+                [{'op': 'replace', 'path': '/ENG-2', 'value': {'start': '2026-06-01'}}],
+            )
+            self.assertEqual(rows[10].override_count, 4)
+
+        self.assertEqual(len(saved['versions']), 25)
+        self.assertNotIn('overrides', saved['versions'][0])
+        self.assertIsNone(saved['versionsNextBefore'])
+        for version_number in (1, 2, 11, 20, 21, 25):
+            version = get_version(self.context, draft_id, version_number)
+            self.assertEqual(version['overrides'], expected[version_number])
+            self.assertEqual(version['overrideCount'], len(expected[version_number]))
+
+        rolled_back = rollback_to_version(self.context, draft_id, target_version_number=11, base_draft_revision=25)
+
+        self.assertEqual(rolled_back['activeDraft']['overrides'], expected[11])
+        self.assertEqual(get_version(self.context, draft_id, 26)['overrides'], expected[11])
+
+    def test_list_versions_pages_metadata_newest_first(self):
+        saved = save_draft(self.context, 'scope-pages', 'Pages', {'ENG-1': {'start': '2026-05-18'}})
+        for revision in range(1, 5):
+            saved = save_draft(
+                self.context,
+                'scope-pages',
+                'Pages',
+                {'ENG-1': {'start': f'2026-05-{18 + revision}'}},
+                base_draft_revision=revision,
+            )
+        draft_id = saved['activeDraft']['draftId']
+
+        newest = list_versions(self.context, draft_id, limit=2)
+        older = list_versions(self.context, draft_id, before_version_number=newest['nextBefore'], limit=2)
+        oldest = list_versions(self.context, draft_id, before_version_number=older['nextBefore'], limit=2)
+
+        self.assertEqual([version['versionNumber'] for version in newest['versions']], [4, 5])
+        self.assertEqual([version['versionNumber'] for version in older['versions']], [2, 3])
+        self.assertEqual([version['versionNumber'] for version in oldest['versions']], [1])
+        self.assertEqual((newest['isLast'], oldest['isLast'], oldest['nextBefore']), (False, True, None))
+        self.assertNotIn('overrides', newest['versions'][0])
+        self.assertNotIn('scopePayload', newest['versions'][0])
+        self.assertEqual(newest['versions'][0]['overrideCount'], 1)
+        with self.assertRaises(ScenarioDraftNotFound):
+            list_versions(self._context(self.other_workspace_id, self.other_user_id), draft_id)
+        with self.assertRaises(ScenarioDraftValidationError):
+            list_versions(self.context, draft_id, before_version_number='-1')
+
     def test_scope_payload_rejects_membership_shaped_fields_recursively(self):
         invalid_payloads = [
             {'members': ['account-1']},
@@ -700,7 +815,11 @@ class ScenarioDraftServiceTests(unittest.TestCase):
         self.assertEqual(imported['activeDraft']['draftRevision'], 1)
         self.assertEqual(imported['versions'][0]['source'], 'legacy_json')
         self.assertEqual(imported['versions'][0]['versionNumber'], 1)
-        self.assertEqual(imported['versions'][0]['overrides'], {'ENG-1': {'start': '2026-05-18'}})
+        self.assertNotIn('overrides', imported['versions'][0])
+        self.assertEqual(
+            get_version(explicit_context, imported['activeDraft']['draftId'], 1)['overrides'],
+            {'ENG-1': {'start': '2026-05-18'}},
+        )
 
     def test_legacy_import_partial_env_inherits_process_environment_policy(self):
         calls = []
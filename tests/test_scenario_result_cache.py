@@ -0,0 +1,132 @@
+import os
+import unittest
+from unittest.mock import Mock, patch
+
+import jira_server
+from backend.services.process_cache import ProcessCache
+from backend.services.scenario_cache import ScenarioResultCache, jira_snapshot_version, scenario_cache_digest
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class ScenarioResultCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = ScenarioResultCache(
+            ProcessCache('scenario-results-test', ttl_seconds=60, max_entries=10),
+            max_per_partition=2, ttl_seconds=60, clock=self.clock,
+        )
+
+    def test_digest_ignores_key_order_but_not_values(self):
+        self.assertEqual(
+            scenario_cache_digest({'filters': {'sprint': 'Q1', 'teams': ['a']}, 'config': {}}, 0),
+            scenario_cache_digest({'config': {}, 'filters': {'teams': ['a'], 'sprint': 'Q1'}}, 0),
+        )
+        self.assertNotEqual(scenario_cache_digest({'config': {}}, 0), scenario_cache_digest({'config': {}}, 1))
+        self.assertNotEqual(scenario_cache_digest({'config': {'wip': 1}}, 0), scenario_cache_digest({'config': {'wip': 2}}, 0))
+
+    def test_jira_snapshot_version_follows_issue_updates_not_order(self):
+        a = {'key': 'A-1', 'fields': {'updated': '2026-04-01T10:00:00.000+0000'}}
+        b = {'key': 'A-2', 'fields': {'updated': '2026-04-01T11:00:00.000+0000'}}
+        edited = {'key': 'A-1', 'fields': {'updated': '2026-04-02T09:00:00.000+0000'}}
+        self.assertEqual(jira_snapshot_version([a, b]), jira_snapshot_version([b, a]))
+        self.assertNotEqual(jira_snapshot_version([a, b]), jira_snapshot_version([edited, b]))
+        self.assertNotEqual(jira_snapshot_version([a, b]), jira_snapshot_version([a]))
+
+    def test_each_partition_keeps_its_most_recently_used_results(self):
+        self.cache.put('ann', 'a', {'n': 1})
+        self.cache.put('ann', 'b', {'n': 2})
+        self.cache.put('bob', 'a', {'n': 3})
+        self.assertEqual(self.cache.get('ann', 'a'), {'n': 1})
+
+        self.cache.put('ann', 'c', {'n': 4})
+
+        self.assertIsNone(self.cache.get('ann', 'b'))
+        self.assertEqual(self.cache.get('ann', 'a'), {'n': 1})
+        self.assertEqual(self.cache.get('bob', 'a'), {'n': 3})
+        self.assertEqual(self.cache.latest('ann'), {'n': 1})
+        self.assertEqual(self.cache.stats()['partitions'], 2)
+
+    def test_expired_results_are_misses_and_clear_bumps_the_snapshot_version(self):
+        self.cache.put('ann', 'a', {'n': 1})
+        self.clock.now += 61
+        self.assertIsNone(self.cache.get('ann', 'a'))
+        self.assertIsNone(self.cache.latest('ann'))
+
+        digest = self.cache.digest({'config': {}})
+        self.cache.clear()
+
+        self.assertNotEqual(self.cache.digest({'config': {}}), digest)
+        self.assertEqual(len(self.cache.store), 0)
+
+
+class ScenarioRouteCacheTests(unittest.TestCase):
+    def setUp(self):
+        jira_server.app.config['TESTING'] = True
+        self.client = jira_server.app.test_client()
+        env = patch.dict(os.environ, {'CONFIG_STORAGE_BACKEND': '', 'DATABASE_URL': '', 'TEST_DATABASE_URL': ''})
+        env.start()
+        self.addCleanup(env.stop)
+        jira_server.SCENARIO_CACHE.clear()
+        self.addCleanup(jira_server.SCENARIO_CACHE.clear)
+
+    def _post(self, payload, fetch):
+        with patch.object(jira_server, 'JIRA_AUTH_MODE', 'basic'), \
+             patch.object(jira_server, 'resolve_team_field_id', return_value='customfield_team'), \
+             patch.object(jira_server, 'resolve_epic_link_field_id', return_value=None), \
+             patch.object(jira_server, 'fetch_issues_by_jql', fetch), \
+             patch.object(jira_server, 'collect_dependencies', return_value={}), \
+             patch.object(jira_server, 'fetch_capacity_team_sizes', return_value=({}, {})):
+            response = self.client.post('/api/scenario', json=payload)
+        self.assertEqual(response.status_code, 200, response.get_data(as_text=True))
+        return response.get_json()
+
+    @staticmethod
+    def _full_fetches(fetch):
+        return [c for c in fetch.call_args_list if c.args[1] != ['updated']]
+
+    def test_identical_inputs_are_served_from_cache_until_refresh(self):
+        fetch = Mock(return_value=[])
+        first = {'filters': {'sprint': '2026Q2'}, 'config': {'wip_limit': 1}}
+        second = {'filters': {'sprint': '2026Q2'}, 'config': {'wip_limit': 2}}
+
+        original = self._post(first, fetch)
+        self._post(second, fetch)
+        toggled_back = self._post(first, fetch)
+        self.assertEqual(len(self._full_fetches(fetch)), 2)
+        self.assertEqual(toggled_back, original)
+
+        self._post({**first, 'refresh': True}, fetch)
+        self.assertEqual(len(self._full_fetches(fetch)), 3)
+
+        with patch.object(jira_server, 'JIRA_AUTH_MODE', 'basic'):
+            latest = self.client.get('/api/scenario').get_json()
+        self.assertEqual(latest['data']['config']['wip_limit'], 1)
+
+    def test_a_jira_edit_in_scope_misses_the_cache(self):
+        stamp = {'updated': '2026-04-01T10:00:00.000+0000'}
+
+        def fetch(jql, fields_list, *args, **kwargs):
+            if fields_list == ['updated']:
+                return [{'key': 'A-1', 'fields': dict(stamp)}]
+            return []
+
+        fetch = Mock(side_effect=fetch)
+        payload = {'filters': {'sprint': '2026Q2'}, 'config': {'wip_limit': 1}}
+        self._post(payload, fetch)
+        self._post(payload, fetch)
+        self.assertEqual(len(self._full_fetches(fetch)), 1)
+
+        stamp['updated'] = '2026-04-01T10:05:00.000+0000'
+        self._post(payload, fetch)
+        self.assertEqual(len(self._full_fetches(fetch)), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import threading
+import unittest
+from unittest.mock import patch
+
+from backend.services import single_flight
+from backend.services.single_flight import SingleFlight, coalesce_for_context
+
+
+class TestSingleFlight(unittest.TestCase):
+    def test_concurrent_callers_share_one_leader_call(self):
+        flights = SingleFlight(wait_seconds=5)
+        release = threading.Event()
+        calls = []
+        results = []
+
+        def fetch():
+            calls.append(1)
+            release.wait(5)
+            return {'issues': [1, 2]}
+
+        def worker():
+            results.append(flights.do('tasks:k', fetch))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        while flights.stats()['followers'] < 3:
+            threading.Event().wait(0.01)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{'issues': [1, 2]}] * 4)
+        self.assertEqual(flights.stats(), {'inflight': 0, 'leaders': 1, 'followers': 3, 'timeouts': 0})
+
+    def test_leader_error_is_raised_in_followers(self):
+        flights = SingleFlight(wait_seconds=5)
+        leader = flights.join('k')
+        follower_errors = []
+
+        def follower():
+            try:
+                flights.do('k', lambda: 'unused')
+            except RuntimeError as error:
+                follower_errors.append(str(error))
+
+        thread = threading.Thread(target=follower)
+        thread.start()
+        while flights.stats()['followers'] < 1:
+            threading.Event().wait(0.01)
+        leader.done(error=RuntimeError('jira down'))
+        thread.join(5)
+
+        self.assertEqual(follower_errors, ['jira down'])
+
+    def test_join_and_wait_blocks_followers_until_leader_is_done(self):
+        flights = SingleFlight(wait_seconds=5)
+        leader = flights.join_and_wait('k')
+        self.assertTrue(leader.leader)
+        observed = []
+
+        def follower():
+            flight = flights.join_and_wait('k')
+            observed.append(flight.leader)
+            flight.done()
+
+        thread = threading.Thread(target=follower)
+        thread.start()
+        thread.join(0.05)
+        self.assertTrue(thread.is_alive())
+        leader.done()
+        thread.join(5)
+
+        self.assertEqual(observed, [False])
+        self.assertTrue(flights.join('k').leader)
+
+    def test_follower_runs_fetch_itself_after_wait_timeout(self):
+        flights = SingleFlight(wait_seconds=0.01)
+        flights.join('k')
+
+        self.assertEqual(flights.do('k', lambda: 'own'), 'own')
+        self.assertEqual(flights.stats()['timeouts'], 1)
+
+    def test_coalesce_bypasses_contexts_without_partitioned_cache(self):
+        flights = SingleFlight()
+        with patch.object(single_flight, 'jira_home_partitioned_process_cache_enabled', return_value=False):
+            self.assertEqual(coalesce_for_context(flights, object(), ('stats', 'k'), lambda: 'direct'), 'direct')
+        self.assertEqual(flights.stats()['leaders'], 0)
+
+        with patch.object(single_flight, 'jira_home_partitioned_process_cache_enabled', return_value=True), \
+                patch.object(single_flight, 'build_jira_home_process_cache_key', return_value='ctx:stats:k'):
+            self.assertEqual(coalesce_for_context(flights, object(), ('stats', 'k'), lambda: 'shared'), 'shared')
+        self.assertEqual(flights.stats()['leaders'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import unittest
+from unittest.mock import Mock
+
+from backend.services import task_sync
+
+
+def _add_clause(jql, clause):
+    return f'{jql} AND {clause}'
+
+
+def _response(issues, status_code=200):
+    response = Mock()
+    response.status_code = status_code
+    response.json.return_value = {'issues': issues, 'isLast': True}
+    return response
+
+
+class TestTaskSync(unittest.TestCase):
+    def _snapshot(self, synced_at=1000.0):
+        return task_sync.build_task_sync_snapshot(
+            'project = TEST', ['summary'], [{'key': 'A-1', 'fields': {'summary': 'a'}}], {}, {'EPIC-1': {}}, synced_at,
+        )
+
+    def test_snapshot_is_only_reused_for_the_same_query_within_the_full_sync_window(self):
+        entry = {'sync': self._snapshot()}
+
+        self.assertIsNotNone(task_sync.usable_task_sync_snapshot(entry, 'project = TEST', ['summary'], 1500, 900))
+        self.assertIsNone(task_sync.usable_task_sync_snapshot(entry, 'project = OTHER', ['summary'], 1500, 900))
+        self.assertIsNone(task_sync.usable_task_sync_snapshot(entry, 'project = TEST', ['summary', 'status'], 1500, 900))
+        self.assertIsNone(task_sync.usable_task_sync_snapshot(entry, 'project = TEST', ['summary'], 1900, 900))
+        self.assertIsNone(task_sync.usable_task_sync_snapshot({'data': {}}, 'project = TEST', ['summary'], 1500, 900))
+
+    def test_delta_snapshots_keep_the_full_sync_age(self):
+        full = self._snapshot(synced_at=1000.0)
+        delta = task_sync.build_task_sync_snapshot(
+            'project = TEST', ['summary'], full['issues'], {}, full['epicDetails'], 1800.0, full_synced_at=full['fullSyncedAt'],
+        )
+
+        self.assertEqual((delta['syncedAt'], delta['fullSyncedAt']), (1800.0, 1000.0))
+        self.assertIsNone(task_sync.usable_task_sync_snapshot({'sync': delta}, 'project = TEST', ['summary'], 1900, 900))
+        self.assertIsNotNone(task_sync.usable_task_sync_snapshot({'sync': delta}, 'project = TEST', ['summary'], 1850, 900))
+
+    def test_delta_window_is_relative_minutes_including_skew(self):
+        jql = task_sync.build_delta_jql('project = TEST', 1000.0, 1130.0, 120, _add_clause)
+
+        self.assertEqual(jql, 'project = TEST AND updated >= -5m')
+
+    def test_snapshot_copies_issue_fields_so_request_decoration_does_not_leak(self):
+        issue = {'key': 'A-1', 'fields': {'summary': 'a'}}
+        snapshot = task_sync.build_task_sync_snapshot('jql', [], [issue], {}, {}, 0)
+        issue['fields']['teamName'] = 'decorated'
+
+        self.assertNotIn('teamName', snapshot['issues'][0]['fields'])
+
+    def test_merge_follows_scope_order_and_reports_missing_keys(self):
+        merged, changed, missing = task_sync.merge_task_delta(
+            [{'key': 'A-1', 'fields': {'v': 1}}, {'key': 'A-2', 'fields': {'v': 1}}],
+            [{'key': 'A-2', 'fields': {'v': 2}}],
+            ['A-3', 'A-2'],
+        )
+
+        self.assertEqual(merged, [{'key': 'A-2', 'fields': {'v': 2}}])
+        self.assertEqual(changed, {'A-2'})
+        self.assertEqual(missing, ['A-3'])
+
+    def test_epic_details_are_reused_unless_children_changed(self):
+        reused, to_fetch = task_sync.split_epic_details(
+            {'EPIC-1': {'k': 1}, 'EPIC-2': {'k': 2}, 'EPIC-OLD': {}}, {'EPIC-1', 'EPIC-2', 'EPIC-3'}, {'EPIC-2'},
+        )
+
+        self.assertEqual(reused, {'EPIC-1': {'k': 1}})
+        self.assertEqual(to_fetch, {'EPIC-2', 'EPIC-3'})
+
+    def test_delta_sync_falls_back_when_a_query_fails(self):
+        search = Mock(side_effect=[_response([]), _response([], status_code=500)])
+
+        result = task_sync.run_task_delta_sync(
+            self._snapshot(), 'project = TEST', ['summary'],
+            search_request=search, add_clause_to_jql=_add_clause, max_results=250, now=1060.0,
+        )
+
+        self.assertIsNone(result)
+        self.assertEqual(search.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()